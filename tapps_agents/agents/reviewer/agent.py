@@ -733,6 +733,40 @@ class ReviewerAgent(BaseAgent, ExpertSupportMixin):
             # Re-raise to allow retry logic to handle it
             raise
     
+    async def _run_scorer(
+        self,
+        scorer: Any,
+        file_path: Path,
+        code: str,
+        language: Any,
+        analysis: Any,
+    ) -> dict[str, Any]:
+        """
+        Run score_file() on the configured scoring backend.
+
+        The 'process' backend scores in warm worker processes so CPU-bound
+        scorers are not serialized by the GIL; if the pool breaks, scoring
+        falls back to a thread.
+        """
+        from .scorer_registry import ScorerRegistry
+
+        reviewer_config = self.config.agents.reviewer if self.config else None
+        if reviewer_config is not None and reviewer_config.scoring_backend == "process":
+            import pickle
+            from concurrent.futures.process import BrokenProcessPool
+
+            from .scoring_pool import get_scoring_pool
+
+            pool = get_scoring_pool(self.config, reviewer_config.scoring_workers)
+            try:
+                return await pool.score(scorer, file_path, code, language)
+            except (BrokenProcessPool, pickle.PicklingError) as e:
+                logger.warning(f"Scoring process pool failed ({e}); scoring in thread")
+
+        return await asyncio.to_thread(
+            ScorerRegistry.run_scorer, scorer, file_path, code, analysis
+        )
+
     async def _review_file_internal(
         self,
         file_path: Path,
@@ -981,9 +1015,11 @@ class ReviewerAgent(BaseAgent, ExpertSupportMixin):
         # Calculate scores based on file type with timeout protection
         if include_scoring:
             from ...core.language_detector import Language
+            from .scorer_registry import ScorerRegistry
             from .scoring import ScorerFactory
 
             language = detection_result.language
+            analysis = None
             reviewer_config = self.config.agents.reviewer if self.config else None
             tool_timeout = reviewer_config.tool_timeout if reviewer_config else 30.0
             
@@ -1009,6 +1045,10 @@ class ReviewerAgent(BaseAgent, ExpertSupportMixin):
                 else:
                     # Use ScorerFactory to get appropriate scorer for the language
                     scorer = ScorerFactory.get_scorer(language, self.config)
+                    # Parse once per file; shared by every scorer and issue extractor below
+                    analysis = ScorerRegistry.create_analysis_context(
+                        file_path, code, language
+                    )
                     # Apply adaptive weights to scorer if available
                     if self.adaptive_scorer and self.adaptive_scoring_enabled and hasattr(scorer, 'weights'):
                         try:
@@ -1016,9 +1056,9 @@ class ReviewerAgent(BaseAgent, ExpertSupportMixin):
                             scorer.weights = adaptive_weights_config
                         except Exception as e:
                             logger.debug(f"Failed to apply adaptive weights to scorer: {e}")
-                    # Run scoring in thread with timeout
+                    # Run scoring in a thread or worker process with timeout
                     scores = await asyncio.wait_for(
-                        asyncio.to_thread(scorer.score_file, file_path, code),
+                        self._run_scorer(scorer, file_path, code, language, analysis),
                         timeout=tool_timeout,
                     )
             except TimeoutError:
@@ -1138,7 +1178,9 @@ class ReviewerAgent(BaseAgent, ExpertSupportMixin):
             # Phase 2 (P0): Add maintainability issues to output (outside include_explanations block)
             if include_scoring and self.scorer:
                 try:
-                    maintainability_issues = self.scorer.get_maintainability_issues(code, file_path)
+                    maintainability_issues = self.scorer.get_maintainability_issues(
+                        code, file_path, analysis=analysis
+                    )
                     # Always include maintainability_issues (even if empty) for consistency
                     result["maintainability_issues"] = maintainability_issues
                     result["maintainability_issues_summary"] = {
@@ -1168,7 +1210,9 @@ class ReviewerAgent(BaseAgent, ExpertSupportMixin):
             # Phase 4 (P1): Add performance issues to output (outside include_explanations block)
             if include_scoring and self.scorer:
                 try:
-                    performance_issues = self.scorer.get_performance_issues(code, file_path)
+                    performance_issues = self.scorer.get_performance_issues(
+                        code, file_path, analysis=analysis
+                    )
                     # Always include performance_issues (even if empty) for consistency
                     result["performance_issues"] = performance_issues
                     result["performance_issues_summary"] = {
@@ -0,0 +1,150 @@
+"""
+File Analysis Context - Shared per-file parse results for scorers
+
+Builds the expensive per-file artifacts (AST, token stream, line table,
+radon complexity blocks) once per file so that every scorer plugin scoring
+the same source reuses them instead of re-parsing it.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import io
+import tokenize
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from ...core.language_detector import Language
+
+# Key under which the shared context travels in strategy ``context`` dicts
+ANALYSIS_CONTEXT_KEY = "analysis_context"
+
+
+class FileAnalysisContext:
+    """
+    Lazily-computed, read-only analysis artifacts for a single source file.
+
+    Each artifact is computed at most once; scorers must treat the returned
+    objects (notably the AST) as immutable since they are shared.
+    """
+
+    def __init__(
+        self,
+        file_path: Path | None,
+        code: str,
+        language: Language = Language.PYTHON,
+    ):
+        """
+        Initialize analysis context.
+
+        Args:
+            file_path: Path to the file (optional, informational)
+            code: Source code content
+            language: Detected language of the source
+        """
+        self.file_path = file_path
+        self.code = code
+        self.language = language
+        self.parse_count = 0
+        self._syntax_error: SyntaxError | None = None
+
+    def matches(self, code: str) -> bool:
+        """Return True if this context was built from ``code``."""
+        return self.code is code or self.code == code
+
+    def as_scorer_context(self) -> dict[str, Any]:
+        """Wrap this context in the dict shape accepted by scoring strategies."""
+        return {ANALYSIS_CONTEXT_KEY: self}
+
+    @cached_property
+    def content_hash(self) -> str:
+        """SHA-256 of the source content."""
+        return hashlib.sha256(self.code.encode("utf-8", errors="replace")).hexdigest()
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Line table (``code.splitlines()``)."""
+        return self.code.splitlines()
+
+    @cached_property
+    def tree(self) -> ast.Module | None:
+        """Parsed Python AST, or None for non-Python sources and syntax errors."""
+        if self.language != Language.PYTHON:
+            return None
+        self.parse_count += 1
+        try:
+            return ast.parse(self.code)
+        except SyntaxError as e:
+            self._syntax_error = e
+            return None
+
+    @property
+    def syntax_error(self) -> SyntaxError | None:
+        """SyntaxError raised while parsing, if any."""
+        _ = self.tree
+        return self._syntax_error
+
+    @cached_property
+    def tokens(self) -> list[tokenize.TokenInfo] | None:
+        """Token stream, or None if the source cannot be tokenized."""
+        try:
+            return list(tokenize.generate_tokens(io.StringIO(self.code).readline))
+        except (tokenize.TokenError, SyntaxError):
+            return None
+
+    @cached_property
+    def cc_blocks(self) -> list[Any] | None:
+        """Radon cyclomatic complexity blocks, or None if unavailable."""
+        tree = self.tree
+        if tree is None:
+            return None
+        try:
+            from radon.complexity import cc_visit_ast
+        except ImportError:
+            return None
+        return cc_visit_ast(tree)
+
+    def parse(self) -> ast.Module:
+        """
+        Return the shared AST, raising SyntaxError like ``ast.parse`` would.
+
+        Raises:
+            SyntaxError: If the source does not parse
+        """
+        tree = self.tree
+        if tree is None:
+            if self._syntax_error is not None:
+                raise SyntaxError(*self._syntax_error.args)
+            raise SyntaxError(f"Cannot parse {self.language.value} source as Python")
+        return tree
+
+
+def get_analysis_context(
+    context: dict[str, Any] | None, code: str
+) -> FileAnalysisContext | None:
+    """
+    Extract a shared analysis context from a strategy ``context`` dict.
+
+    Returns None if absent or if it was built from different source code.
+    """
+    if not context:
+        return None
+    analysis = context.get(ANALYSIS_CONTEXT_KEY)
+    if isinstance(analysis, FileAnalysisContext) and analysis.matches(code):
+        return analysis
+    return None
+
+
+def parse_python(code: str, context: dict[str, Any] | None = None) -> ast.Module:
+    """
+    Parse Python code, reusing the shared AST from ``context`` when present.
+
+    Raises:
+        SyntaxError: If the source does not parse
+    """
+    analysis = get_analysis_context(context, code)
+    if analysis is not None and analysis.language == Language.PYTHON:
+        return analysis.parse()
+    return ast.parse(code)
@@ -3,6 +3,7 @@ Reviewer Result Cache - Cache reviewer command results based on file content has
 
 2025 Performance Pattern: Result caching for reviewer commands (score, review, lint).
 Provides 90%+ speedup for unchanged files by caching results based on file content hash.
+Entry metadata is kept in a SQLite index (see cache_index.py).
 
 References:
 - docs/PERFORMANCE_OPTIMIZATION_RECOMMENDATIONS_2025.md
@@ -15,10 +16,14 @@ import hashlib
 import json
 import logging
 import os
-from datetime import UTC, datetime
+import sqlite3
+import time
 from pathlib import Path
 from typing import Any
 
+from ...core.ast_parser import ASTParser
+from .cache_index import IndexEntry, ReviewerCacheIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,11 +34,18 @@ class ReviewerResultCache:
     Semantics:
     - Cache key: file_path + content_hash (SHA-256 of file body) + command + version.
       Key format: {file_path}:{content_hash}:{command}:{version}.
-    - TTL: Entries expire after ttl_seconds (default 3600). Expired entries are
+    - Dependencies: For Python files, each entry records the content hash of
+      every local module in the file's import closure. An entry misses if any
+      of them changed, and a changed file drops all of its dependents.
+    - TTL: Entries expire after ttl_seconds (default 7 days). Expired entries are
       treated as miss on get.
     - Version invalidation: Bumping CACHE_VERSION invalidates all existing entries
       (new keys no longer match).
-    - Thread-safe: Uses atomic file writes (write to temp then rename).
+    - Metadata lives in a WAL-mode SQLite index (index.sqlite3), so saves are
+      O(1) and several reviewer processes can share one cache directory.
+    - Unchanged files (same mtime and size as when last hashed) are not re-read.
+    - LRU eviction keeps at most max_entries results and max_size_bytes on disk.
+    - Result files are written atomically (write to temp then rename).
 
     Example:
         cache = ReviewerResultCache()
@@ -51,22 +63,33 @@ class ReviewerResultCache:
     # Default cache version (increment to invalidate all caches)
     CACHE_VERSION = "1.0.0"
     
-    # Default TTL in seconds (1 hour)
-    DEFAULT_TTL = 3600
+    # Default TTL in seconds (7 days; dependency tracking keeps hits valid)
+    DEFAULT_TTL = 7 * 24 * 3600
+
+    # Files whose imports are tracked
+    DEPENDENCY_SUFFIXES = frozenset({".py", ".pyi"})
+
+    # Default eviction bounds
+    DEFAULT_MAX_ENTRIES = 10000
+    DEFAULT_MAX_SIZE_BYTES = 100 * 1024 * 1024
     
     def __init__(
         self,
         cache_dir: Path | None = None,
         ttl_seconds: int = DEFAULT_TTL,
         enabled: bool = True,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
     ):
         """
         Initialize the reviewer result cache.
         
         Args:
             cache_dir: Directory for cache files (default: .tapps-agents/cache/reviewer)
-            ttl_seconds: Time-to-live for cache entries in seconds (default: 3600)
+            ttl_seconds: Time-to-live for cache entries in seconds (default: 7 days)
             enabled: Whether caching is enabled (default: True)
+            max_entries: Maximum cached results before LRU eviction
+            max_size_bytes: Maximum total size of cached results before LRU eviction
         """
         if cache_dir is None:
             # Use project root detection instead of current working directory
@@ -77,10 +100,20 @@ class ReviewerResultCache:
         self.cache_dir = cache_dir
         self.ttl_seconds = ttl_seconds
         self.enabled = enabled
-        
-        # Metadata file tracks cache entries and their file hashes
-        self.metadata_file = self.cache_dir / "metadata.json"
-        self._metadata: dict[str, dict[str, Any]] | None = None
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        
+        # SQLite index of cache entries and file stats
+        self.index = ReviewerCacheIndex(self.cache_dir / "index.sqlite3")
+        # Pre-index metadata file, imported into the index on first use
+        self.legacy_metadata_file = self.cache_dir / "metadata.json"
+        self._migrated = False
+
+        # Import resolution, memoized per (path, content hash)
+        self._parser: ASTParser | None = None
+        self._direct_deps: dict[tuple[str, str], list[Path]] = {}
+        # Fast-path hits already vetted by the index: path -> (mtime_ns, size, hash)
+        self._trusted_stats: dict[str, tuple[int, int, str]] = {}
         
         # Statistics
         self._hits = 0
@@ -89,61 +122,136 @@ class ReviewerResultCache:
         # Create cache directory
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-    
-    @property
-    def metadata(self) -> dict[str, dict[str, Any]]:
-        """Load and return cache metadata."""
-        if self._metadata is None:
-            self._metadata = self._load_metadata()
-        return self._metadata
-    
-    def _load_metadata(self) -> dict[str, dict[str, Any]]:
-        """Load cache metadata from file."""
-        if not self.metadata_file.exists():
-            return {}
-        
-        try:
-            content = self.metadata_file.read_text(encoding="utf-8")
-            return json.loads(content)
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning(f"Failed to load cache metadata: {e}")
-            return {}
-    
-    def _save_metadata(self) -> None:
-        """Save cache metadata to file (atomic write)."""
-        if self._metadata is None:
-            return
-        
-        try:
-            # Atomic write: write to temp file, then rename
-            temp_file = self.metadata_file.with_suffix(".tmp")
-            temp_file.write_text(
-                json.dumps(self._metadata, indent=2),
-                encoding="utf-8"
-            )
-            temp_file.replace(self.metadata_file)
-        except OSError as e:
-            logger.warning(f"Failed to save cache metadata: {e}")
+
+    def _get_index(self) -> ReviewerCacheIndex:
+        """Return the index, importing a legacy metadata.json once."""
+        if not self._migrated:
+            self._migrated = True
+            if self.legacy_metadata_file.exists():
+                imported = self.index.import_json_metadata(
+                    self.legacy_metadata_file, self._get_cache_file
+                )
+                logger.info(f"Imported {imported} reviewer cache entries into SQLite index")
+        return self.index
+
+    @staticmethod
+    def _normalize_path(file_path: Path) -> str:
+        """Return the resolved, forward-slash path used in keys and the index."""
+        return str(file_path.resolve()).replace("\\", "/")
     
     def _file_hash(self, file_path: Path) -> str:
         """
         Compute file content hash.
         
         Uses SHA-256 truncated to 16 characters for reasonable uniqueness
-        while keeping cache keys manageable.
+        while keeping cache keys manageable. If the file's mtime and size
+        match the index's record, the recorded hash is returned without
+        reading the file.
         """
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            logger.warning(f"Failed to hash file {file_path}: {e}")
+            return ""
+
+        normalized_path = self._normalize_path(file_path)
+        if self.enabled:
+            trusted = self._trusted_stats.get(normalized_path)
+            if trusted is not None and trusted[:2] == (stat.st_mtime_ns, stat.st_size):
+                return trusted[2]
+            try:
+                known = self._get_index().get_file_hash(
+                    normalized_path, stat.st_mtime_ns, stat.st_size
+                )
+                if known is not None:
+                    if len(self._trusted_stats) >= self.max_entries:
+                        self._trusted_stats.clear()
+                    self._trusted_stats[normalized_path] = (
+                        stat.st_mtime_ns, stat.st_size, known
+                    )
+                    return known
+            except sqlite3.Error as e:
+                logger.debug(f"Cache index lookup failed for {file_path}: {e}")
+
         try:
             content = file_path.read_bytes()
-            return hashlib.sha256(content).hexdigest()[:16]
         except OSError as e:
             logger.warning(f"Failed to hash file {file_path}: {e}")
             return ""
+        file_hash = hashlib.sha256(content).hexdigest()[:16]
+
+        if self.enabled:
+            try:
+                previous = self._get_index().record_file_hash(
+                    normalized_path, stat.st_mtime_ns, stat.st_size, file_hash
+                )
+                if previous is not None and previous != file_hash:
+                    self._invalidate_dependents(normalized_path, file_hash)
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to record file hash for {file_path}: {e}")
+        return file_hash
+
+    def _invalidate_dependents(self, dep_path: str, current_hash: str | None = None) -> int:
+        """
+        Drop entries whose import closure recorded another hash for dep_path.
+
+        Closures are transitive, so this covers indirect dependents too.
+        """
+        keys = self._get_index().dependents(dep_path, current_hash)
+        if keys:
+            self._remove_entries(keys)
+            logger.debug(f"Invalidated {len(keys)} cache entries depending on {dep_path}")
+        return len(keys)
+
+    def _import_closure(self, file_path: Path) -> dict[str, str]:
+        """
+        Return {normalized path: content hash} for the file's local import closure.
+
+        Non-Python files have no tracked dependencies.
+        """
+        if file_path.suffix not in self.DEPENDENCY_SUFFIXES:
+            return {}
+        if self._parser is None:
+            self._parser = ASTParser()
+
+        root = file_path.resolve()
+        closure: dict[str, str] = {}
+        seen = {root}
+        queue = [root]
+        while queue:
+            current = queue.pop()
+            current_hash = self._file_hash(current)
+            if current != root:
+                closure[self._normalize_path(current)] = current_hash
+            memo_key = (str(current), current_hash)
+            deps = self._direct_deps.get(memo_key)
+            if deps is None:
+                deps = self._parser.resolve_local_imports(current, use_cache=False)
+                if len(self._direct_deps) >= self.max_entries:
+                    self._direct_deps.clear()
+                self._direct_deps[memo_key] = deps
+            for dep in deps:
+                if dep not in seen:
+                    seen.add(dep)
+                    queue.append(dep)
+        return closure
+
+    def _deps_unchanged(self, cache_key: str) -> bool:
+        """Check that every file in an entry's import closure is unchanged."""
+        for dep_path, dep_hash in self._get_index().get_deps(cache_key).items():
+            path = Path(dep_path)
+            current = self._file_hash(path) if path.exists() else ""
+            if current != dep_hash:
+                logger.debug(f"Cache invalidated for {cache_key} ({dep_path} changed)")
+                return False
+        return True
     
     def _make_cache_key(
         self,
         file_path: Path,
         command: str,
         version: str,
+        file_hash: str | None = None,
     ) -> str:
         """
         Create cache key from file path, content hash, command, and version.
@@ -151,8 +259,9 @@ class ReviewerResultCache:
         Format: {normalized_path}:{content_hash}:{command}:{version}
         """
         # Normalize path for consistent keys
-        normalized_path = str(file_path.resolve()).replace("\\", "/")
-        file_hash = self._file_hash(file_path)
+        normalized_path = self._normalize_path(file_path)
+        if file_hash is None:
+            file_hash = self._file_hash(file_path)
         
         return f"{normalized_path}:{file_hash}:{command}:{version}"
     
@@ -161,38 +270,56 @@ class ReviewerResultCache:
         # Use hash of cache key for filename (to handle long paths)
         key_hash = hashlib.sha256(cache_key.encode()).hexdigest()[:32]
         return self.cache_dir / f"{key_hash}.json"
+
+    def _remove_entries(self, cache_keys: list[str]) -> None:
+        """Delete index entries and their result files."""
+        self._get_index().delete(cache_keys)
+        self._unlink_results(cache_keys)
+
+    def _unlink_results(self, cache_keys: list[str]) -> None:
+        for key in cache_keys:
+            try:
+                self._get_cache_file(key).unlink(missing_ok=True)
+            except OSError:
+                pass
     
     def _is_cache_valid(self, cache_key: str) -> bool:
         """
-        Check if cache entry is valid (not expired, file unchanged).
+        Check if cache entry is valid (present and not expired).
+
+        The key embeds the content hash, so a changed file produces a
+        different key; no re-hash is needed here.
         """
-        if cache_key not in self.metadata:
+        entry = self._get_index().get(cache_key)
+        if entry is None:
             return False
         
-        entry = self.metadata[cache_key]
-        
-        # Check TTL
-        cached_at = entry.get("cached_at", "")
-        if cached_at:
-            try:
-                cached_time = datetime.fromisoformat(cached_at.replace("Z", "+00:00"))
-                age_seconds = (datetime.now(UTC) - cached_time).total_seconds()
-                if age_seconds > self.ttl_seconds:
-                    logger.debug(f"Cache expired for {cache_key} (age: {age_seconds:.0f}s)")
-                    return False
-            except ValueError:
-                pass
-        
-        # Check file hash (content-based invalidation)
-        file_path = Path(entry.get("file_path", ""))
-        if file_path.exists():
-            current_hash = self._file_hash(file_path)
-            cached_hash = entry.get("file_hash", "")
-            if current_hash != cached_hash:
-                logger.debug(f"Cache invalidated for {cache_key} (file changed)")
-                return False
+        age_seconds = time.time() - entry.cached_at
+        if age_seconds > self.ttl_seconds:
+            logger.debug(f"Cache expired for {cache_key} (age: {age_seconds:.0f}s)")
+            return False
         
         return True
+
+    def _read_entry(self, cache_key: str) -> dict[str, Any] | None:
+        """Return the stored result for a valid key and mark it recently used."""
+        if not self._is_cache_valid(cache_key):
+            return None
+        if not self._deps_unchanged(cache_key):
+            self._remove_entries([cache_key])
+            return None
+        cache_file = self._get_cache_file(cache_key)
+        try:
+            result = json.loads(cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            # Evicted by another process between index lookup and read
+            self._get_index().delete([cache_key])
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load cache entry {cache_file.name}: {e}")
+            return None
+        self._get_index().touch(cache_key)
+        return result
     
     async def get_cached_result(
         self,
@@ -217,52 +344,37 @@ class ReviewerResultCache:
         if not file_path.exists():
             return None
         
-        # Try current version first
-        cache_key = self._make_cache_key(file_path, command, version)
-        
-        # Check if cache is valid
-        if self._is_cache_valid(cache_key):
-            cache_file = self._get_cache_file(cache_key)
-            if cache_file.exists():
-                try:
-                    content = cache_file.read_text(encoding="utf-8")
-                    result = json.loads(content)
-                    self._hits += 1
-                    logger.debug(f"Cache hit for {file_path} ({command})")
-                    return result
-                except (json.JSONDecodeError, OSError) as e:
-                    logger.warning(f"Failed to load cache for {file_path}: {e}")
-        
-        # Backward compatibility: Check for cache entries with package version
-        # (old cache entries may have been saved with package version instead of cache version)
         try:
-            from ... import __version__ as package_version
+            # Hash once; both keys below share it
+            file_hash = self._file_hash(file_path)
+            cache_key = self._make_cache_key(file_path, command, version, file_hash)
+            result = self._read_entry(cache_key)
+            if result is not None:
+                self._hits += 1
+                logger.debug(f"Cache hit for {file_path} ({command})")
+                return result
+
+            # Backward compatibility: Check for cache entries with package version
+            # (old cache entries may have been saved with package version instead of cache version)
+            try:
+                from ... import __version__ as package_version
+            except ImportError:
+                # Package version not available, skip backward compatibility check
+                package_version = version
             if package_version != version:
-                old_cache_key = self._make_cache_key(file_path, command, package_version)
-                if self._is_cache_valid(old_cache_key):
-                    cache_file = self._get_cache_file(old_cache_key)
-                    if cache_file.exists():
-                        try:
-                            content = cache_file.read_text(encoding="utf-8")
-                            result = json.loads(content)
-                            # Migrate to new cache key format
-                            await self.save_result(file_path, command, version, result)
-                            # Remove old cache entry
-                            if old_cache_key in self.metadata:
-                                self.metadata.pop(old_cache_key, None)
-                                try:
-                                    cache_file.unlink(missing_ok=True)
-                                except OSError:
-                                    pass
-                                self._save_metadata()
-                            self._hits += 1
-                            logger.debug(f"Cache hit for {file_path} ({command}) - migrated from package version")
-                            return result
-                        except (json.JSONDecodeError, OSError) as e:
-                            logger.warning(f"Failed to load old cache for {file_path}: {e}")
-        except ImportError:
-            # Package version not available, skip backward compatibility check
-            pass
+                old_cache_key = self._make_cache_key(
+                    file_path, command, package_version, file_hash
+                )
+                result = self._read_entry(old_cache_key)
+                if result is not None:
+                    # Migrate to new cache key format, then remove old entry
+                    await self.save_result(file_path, command, version, result)
+                    self._remove_entries([old_cache_key])
+                    self._hits += 1
+                    logger.debug(f"Cache hit for {file_path} ({command}) - migrated from package version")
+                    return result
+        except sqlite3.Error as e:
+            logger.warning(f"Reviewer cache index unavailable: {e}")
         
         self._misses += 1
         return None
@@ -289,35 +401,50 @@ class ReviewerResultCache:
         if not file_path.exists():
             return
         
-        cache_key = self._make_cache_key(file_path, command, version)
         file_hash = self._file_hash(file_path)
+        cache_key = self._make_cache_key(file_path, command, version, file_hash)
         
-        # Save result to cache file
+        # Save result to cache file (atomic: concurrent readers never see partial JSON)
         cache_file = self._get_cache_file(cache_key)
+        payload = json.dumps(result, indent=2, default=str)
         try:
-            cache_file.write_text(
-                json.dumps(result, indent=2, default=str),
-                encoding="utf-8"
-            )
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temp_file.write_text(payload, encoding="utf-8")
+            temp_file.replace(cache_file)
         except OSError as e:
             logger.warning(f"Failed to save cache for {file_path}: {e}")
             return
         
-        # Update metadata
-        self.metadata[cache_key] = {
-            "file_path": str(file_path.resolve()),
-            "file_hash": file_hash,
-            "command": command,
-            "version": version,
-            "cached_at": datetime.now(UTC).isoformat() + "Z",
-        }
-        self._save_metadata()
+        now = time.time()
+        try:
+            deps = self._import_closure(file_path)
+            index = self._get_index()
+            index.put(
+                IndexEntry(
+                    cache_key=cache_key,
+                    file_path=self._normalize_path(file_path),
+                    file_hash=file_hash,
+                    command=command,
+                    version=version,
+                    cached_at=now,
+                    last_access=now,
+                    size=len(payload.encode("utf-8")),
+                ),
+                deps,
+            )
+            evicted = index.evict_lru(self.max_entries, self.max_size_bytes)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to index cache entry for {file_path}: {e}")
+            return
+        if evicted:
+            self._unlink_results(evicted)
+            logger.debug(f"Evicted {len(evicted)} reviewer cache entries (LRU)")
         
         logger.debug(f"Cached result for {file_path} ({command})")
     
     def invalidate_file(self, file_path: Path) -> int:
         """
-        Invalidate all cache entries for a file.
+        Invalidate all cache entries for a file and for files importing it.
         
         Returns:
             Number of entries invalidated
@@ -325,23 +452,11 @@ class ReviewerResultCache:
         if not self.enabled:
             return 0
         
-        normalized_path = str(file_path.resolve()).replace("\\", "/")
-        keys_to_remove = [
-            key for key in self.metadata
-            if key.startswith(normalized_path + ":")
-        ]
-        
-        for key in keys_to_remove:
-            self.metadata.pop(key, None)
-            cache_file = self._get_cache_file(key)
-            try:
-                cache_file.unlink(missing_ok=True)
-            except OSError:
-                pass
-        
-        if keys_to_remove:
-            self._save_metadata()
-        
+        normalized_path = self._normalize_path(file_path)
+        index = self._get_index()
+        keys_to_remove = set(index.keys_for_file(normalized_path))
+        keys_to_remove.update(index.dependents(normalized_path))
+        self._remove_entries(sorted(keys_to_remove))
         return len(keys_to_remove)
     
     def clear(self) -> int:
@@ -354,21 +469,11 @@ class ReviewerResultCache:
         if not self.enabled:
             return 0
         
-        count = len(self.metadata)
-        
-        # Remove cache files
-        for key in self.metadata:
-            cache_file = self._get_cache_file(key)
-            try:
-                cache_file.unlink(missing_ok=True)
-            except OSError:
-                pass
-        
-        # Clear metadata
-        self._metadata = {}
-        self._save_metadata()
-        
-        return count
+        index = self._get_index()
+        keys = index.all_keys()
+        index.clear()
+        self._unlink_results(keys)
+        return len(keys)
     
     def get_stats(self) -> dict[str, Any]:
         """
@@ -379,12 +484,16 @@ class ReviewerResultCache:
         """
         total_requests = self._hits + self._misses
         hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0.0
+        entries, size_bytes = self._get_index().totals() if self.enabled else (0, 0)
         
         return {
             "enabled": self.enabled,
             "cache_dir": str(self.cache_dir),
             "ttl_seconds": self.ttl_seconds,
-            "entries": len(self.metadata),
+            "entries": entries,
+            "size_bytes": size_bytes,
+            "max_entries": self.max_entries,
+            "max_size_bytes": self.max_size_bytes,
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": f"{hit_rate:.1f}%",
@@ -392,7 +501,7 @@ class ReviewerResultCache:
     
     def prune_expired(self) -> int:
         """
-        Remove expired cache entries.
+        Remove expired entries and entries whose file or dependencies changed.
         
         Returns:
             Number of entries pruned
@@ -400,22 +509,21 @@ class ReviewerResultCache:
         if not self.enabled:
             return 0
         
-        keys_to_remove = [
-            key for key in self.metadata
-            if not self._is_cache_valid(key)
-        ]
-        
-        for key in keys_to_remove:
-            self.metadata.pop(key, None)
-            cache_file = self._get_cache_file(key)
-            try:
-                cache_file.unlink(missing_ok=True)
-            except OSError:
-                pass
-        
-        if keys_to_remove:
-            self._save_metadata()
-        
+        index = self._get_index()
+        keys_to_remove = set(index.expired_keys(time.time() - self.ttl_seconds))
+
+        current_hashes: dict[str, str] = {}
+        records = index.file_hashes() + index.all_deps()
+        for key, file_path, file_hash in records:
+            if key in keys_to_remove:
+                continue
+            if file_path not in current_hashes:
+                path = Path(file_path)
+                current_hashes[file_path] = self._file_hash(path) if path.exists() else ""
+            if current_hashes[file_path] != file_hash:
+                keys_to_remove.add(key)
+        
+        self._remove_entries(sorted(keys_to_remove))
         return len(keys_to_remove)
 
 
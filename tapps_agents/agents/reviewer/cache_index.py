@@ -0,0 +1,385 @@
+"""
+Reviewer Cache Index - SQLite metadata index for ReviewerResultCache.
+
+Replaces the single metadata.json (fully rewritten on every save, last writer
+wins across processes) with a WAL-mode SQLite database:
+
+- O(1) indexed upserts/lookups instead of O(N) JSON rewrites
+- Safe concurrent access from several reviewer processes (WAL + busy timeout)
+- LRU eviction bounded by entry count and total result size
+- mtime+size fast path so unchanged files are not re-read and re-hashed
+- Per-entry import closure snapshots for dependency-aware invalidation
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+# A file modified within this window of being hashed may change again within
+# the same mtime tick without its mtime moving ("racily clean" in git terms);
+# such stat records are never trusted. Generous for 2s-resolution filesystems.
+RACY_WINDOW_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    cache_key   TEXT PRIMARY KEY,
+    file_path   TEXT NOT NULL,
+    file_hash   TEXT NOT NULL,
+    command     TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    cached_at   REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_file ON entries(file_path);
+CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access);
+CREATE TABLE IF NOT EXISTS file_stats (
+    file_path   TEXT PRIMARY KEY,
+    mtime_ns    INTEGER NOT NULL,
+    size        INTEGER NOT NULL,
+    file_hash   TEXT NOT NULL,
+    recorded_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entry_deps (
+    cache_key   TEXT NOT NULL,
+    dep_path    TEXT NOT NULL,
+    dep_hash    TEXT NOT NULL,
+    PRIMARY KEY (cache_key, dep_path)
+);
+CREATE INDEX IF NOT EXISTS idx_entry_deps_dep ON entry_deps(dep_path);
+"""
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """One cached result's metadata."""
+
+    cache_key: str
+    file_path: str
+    file_hash: str
+    command: str
+    version: str
+    cached_at: float
+    last_access: float
+    size: int
+
+
+class ReviewerCacheIndex:
+    """
+    WAL-mode SQLite index of reviewer cache entries.
+
+    One connection per instance, serialized by a lock; other processes use
+    their own connections and SQLite arbitrates between them.
+    """
+
+    def __init__(self, db_path: Path, busy_timeout: float = 30.0):
+        """
+        Initialize index (the database is opened on first use).
+
+        Args:
+            db_path: SQLite database file
+            busy_timeout: Seconds to wait on a lock held by another process
+        """
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.busy_timeout,
+                isolation_level=None,  # explicit transactions only
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = self._connect()
+            # IMMEDIATE takes the write lock up front so concurrent writers
+            # queue on busy_timeout instead of failing mid-transaction
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    # ------------------------------------------------------------------ files
+
+    def get_file_hash(self, file_path: str, mtime_ns: int, size: int) -> str | None:
+        """
+        Return the recorded content hash if the file's stat is unchanged.
+
+        Records taken within RACY_WINDOW_NS of the file's mtime are ignored.
+        """
+        rows = self._query(
+            "SELECT mtime_ns, size, file_hash, recorded_ns FROM file_stats WHERE file_path = ?",
+            (file_path,),
+        )
+        if not rows:
+            return None
+        rec_mtime, rec_size, file_hash, recorded_ns = rows[0]
+        if rec_mtime != mtime_ns or rec_size != size:
+            return None
+        if recorded_ns - mtime_ns < RACY_WINDOW_NS:
+            return None
+        return file_hash
+
+    def record_file_hash(
+        self, file_path: str, mtime_ns: int, size: int, file_hash: str
+    ) -> str | None:
+        """
+        Remember a file's content hash for its current stat.
+
+        Returns:
+            The previously recorded hash, if any
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT file_hash FROM file_stats WHERE file_path = ?", (file_path,)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO file_stats VALUES (?, ?, ?, ?, ?)",
+                (file_path, mtime_ns, size, file_hash, time.time_ns()),
+            )
+        return row[0] if row else None
+
+    # ---------------------------------------------------------------- entries
+
+    def get(self, cache_key: str) -> IndexEntry | None:
+        """Return the entry for a cache key, if present."""
+        rows = self._query("SELECT * FROM entries WHERE cache_key = ?", (cache_key,))
+        return IndexEntry(*rows[0]) if rows else None
+
+    def touch(self, cache_key: str) -> None:
+        """Mark an entry as recently used (LRU)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE entries SET last_access = ? WHERE cache_key = ?",
+                (time.time(), cache_key),
+            )
+
+    def put(self, entry: IndexEntry, deps: dict[str, str] | None = None) -> None:
+        """
+        Insert or replace an entry.
+
+        Args:
+            entry: Entry metadata
+            deps: Content hash of each file in the entry's import closure
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM entry_deps WHERE cache_key = ?", (entry.cache_key,))
+            if deps:
+                conn.executemany(
+                    "INSERT INTO entry_deps VALUES (?, ?, ?)",
+                    [(entry.cache_key, path, h) for path, h in deps.items()],
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.cache_key,
+                    entry.file_path,
+                    entry.file_hash,
+                    entry.command,
+                    entry.version,
+                    entry.cached_at,
+                    entry.last_access,
+                    entry.size,
+                ),
+            )
+
+    def delete(self, cache_keys: list[str]) -> None:
+        """Delete entries by key."""
+        if not cache_keys:
+            return
+        with self._transaction() as conn:
+            self._delete_keys(conn, cache_keys)
+
+    @staticmethod
+    def _delete_keys(conn: sqlite3.Connection, cache_keys: list[str]) -> None:
+        params = [(k,) for k in cache_keys]
+        conn.executemany("DELETE FROM entries WHERE cache_key = ?", params)
+        conn.executemany("DELETE FROM entry_deps WHERE cache_key = ?", params)
+
+    def get_deps(self, cache_key: str) -> dict[str, str]:
+        """Return the import closure snapshot (path -> hash) of an entry."""
+        return dict(
+            self._query(
+                "SELECT dep_path, dep_hash FROM entry_deps WHERE cache_key = ?",
+                (cache_key,),
+            )
+        )
+
+    def dependents(self, dep_path: str, current_hash: str | None = None) -> list[str]:
+        """
+        Return keys whose import closure includes ``dep_path``.
+
+        Args:
+            dep_path: Normalized path of the upstream file
+            current_hash: If given, only keys that recorded a different hash
+        """
+        if current_hash is None:
+            sql, params = "SELECT cache_key FROM entry_deps WHERE dep_path = ?", (dep_path,)
+        else:
+            sql = "SELECT cache_key FROM entry_deps WHERE dep_path = ? AND dep_hash != ?"
+            params = (dep_path, current_hash)
+        return [row[0] for row in self._query(sql, params)]
+
+    def all_deps(self) -> list[tuple[str, str, str]]:
+        """Return (cache_key, dep_path, dep_hash) for every closure edge."""
+        return self._query("SELECT cache_key, dep_path, dep_hash FROM entry_deps")
+
+    def keys_for_file(self, file_path: str) -> list[str]:
+        """Return all cache keys recorded for a file."""
+        return [
+            row[0]
+            for row in self._query(
+                "SELECT cache_key FROM entries WHERE file_path = ?", (file_path,)
+            )
+        ]
+
+    def expired_keys(self, cutoff: float) -> list[str]:
+        """Return keys cached before ``cutoff`` (epoch seconds)."""
+        return [
+            row[0]
+            for row in self._query(
+                "SELECT cache_key FROM entries WHERE cached_at < ?", (cutoff,)
+            )
+        ]
+
+    def file_hashes(self) -> list[tuple[str, str, str]]:
+        """Return (cache_key, file_path, file_hash) for every entry."""
+        return self._query("SELECT cache_key, file_path, file_hash FROM entries")
+
+    def all_keys(self) -> list[str]:
+        """Return every cache key."""
+        return [row[0] for row in self._query("SELECT cache_key FROM entries")]
+
+    def totals(self) -> tuple[int, int]:
+        """Return (entry count, total result bytes)."""
+        count, size = self._query("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries")[0]
+        return int(count), int(size)
+
+    def evict_lru(self, max_entries: int, max_bytes: int) -> list[str]:
+        """
+        Delete least-recently-used entries until both bounds hold.
+
+        Returns:
+            Evicted cache keys (caller removes their result files)
+        """
+        with self._transaction() as conn:
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            if count <= max_entries and total <= max_bytes:
+                return []
+            evicted: list[str] = []
+            for key, size in conn.execute(
+                "SELECT cache_key, size FROM entries ORDER BY last_access ASC"
+            ).fetchall():
+                if count <= max_entries and total <= max_bytes:
+                    break
+                evicted.append(key)
+                count -= 1
+                total -= size
+            self._delete_keys(conn, evicted)
+            return evicted
+
+    def clear(self) -> None:
+        """Delete all entries and file stats."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM entry_deps")
+            conn.execute("DELETE FROM file_stats")
+
+    # -------------------------------------------------------------- migration
+
+    def import_json_metadata(
+        self, metadata_file: Path, result_file_for: Callable[[str], Path]
+    ) -> int:
+        """
+        Import entries from a legacy metadata.json and remove it.
+
+        Args:
+            metadata_file: Legacy metadata file
+            result_file_for: Maps a cache key to its result file
+
+        Returns:
+            Number of entries imported
+        """
+        try:
+            metadata = json.loads(metadata_file.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Skipping unreadable cache metadata {metadata_file}: {e}")
+            return 0
+
+        rows = []
+        for cache_key, entry in metadata.items():
+            if not isinstance(entry, dict):
+                continue
+            try:
+                # Legacy timestamps look like "2025-01-01T00:00:00+00:00Z"
+                cached_at = datetime.fromisoformat(
+                    str(entry.get("cached_at", "")).removesuffix("Z")
+                ).timestamp()
+            except ValueError:
+                continue
+            try:
+                size = result_file_for(cache_key).stat().st_size
+            except OSError:
+                continue  # Result file gone: nothing to index
+            rows.append(
+                (
+                    cache_key,
+                    str(entry.get("file_path", "")).replace("\\", "/"),
+                    entry.get("file_hash", ""),
+                    entry.get("command", ""),
+                    entry.get("version", ""),
+                    cached_at,
+                    cached_at,
+                    size,
+                )
+            )
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        with suppress(OSError):
+            metadata_file.unlink()
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from ...core.language_detector import Language
+from .analysis_context import parse_python
 
 # Constants for maintainability scoring
 MI_EXCELLENT_THRESHOLD = 80.0  # Maintainability Index threshold for excellent code
@@ -67,7 +68,7 @@ class PythonMaintainabilityStrategy(MaintainabilityStrategy):
                 base_score = min(mi_score / MI_SCALE_FACTOR, 10.0)
             except ImportError:
                 # Fallback to heuristic-based scoring
-                base_score = self._heuristic_score(code)
+                base_score = self._heuristic_score(code, context)
 
             # Apply context-aware adjustments
             adjustments = self._analyze_patterns(code, file_path)
@@ -94,7 +95,7 @@ class PythonMaintainabilityStrategy(MaintainabilityStrategy):
         code_lines = code.splitlines()
 
         try:
-            tree = ast.parse(code)
+            tree = parse_python(code, context)
         except SyntaxError:
             return [MaintainabilityIssue(
                 issue_type="syntax_error",
@@ -230,7 +231,7 @@ class PythonMaintainabilityStrategy(MaintainabilityStrategy):
                 max_depth = max(max_depth, child_depth)
         return max_depth
 
-    def _heuristic_score(self, code: str) -> float:
+    def _heuristic_score(self, code: str, context: dict[str, Any] | None = None) -> float:
         """Heuristic-based scoring when radon is not available."""
         lines = code.split("\n")
         total_lines = len(lines)
@@ -250,7 +251,7 @@ class PythonMaintainabilityStrategy(MaintainabilityStrategy):
 
         # Negative factors
         long_lines = sum(1 for line in lines if len(line) > MAX_LINE_LENGTH)
-        nesting_depth = self._calculate_nesting_depth(code)
+        nesting_depth = self._calculate_nesting_depth(code, context)
         function_count = len(re.findall(r"def\s+\w+\s*\(", code))
         avg_function_length = total_lines / max(function_count, 1)
 
@@ -297,10 +298,10 @@ class PythonMaintainabilityStrategy(MaintainabilityStrategy):
 
         return adjustments
 
-    def _calculate_nesting_depth(self, code: str) -> int:
+    def _calculate_nesting_depth(self, code: str, context: dict[str, Any] | None = None) -> int:
         """Calculate maximum nesting depth in code."""
         try:
-            tree = ast.parse(code)
+            tree = parse_python(code, context)
             max_depth = 0
 
             def visit_node(node: ast.AST, depth: int = 0) -> None:
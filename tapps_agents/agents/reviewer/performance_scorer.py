@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from ...core.language_detector import Language
+from .analysis_context import parse_python
 
 
 class PerformanceStrategy(ABC):
@@ -59,7 +60,7 @@ class PythonPerformanceStrategy(PerformanceStrategy):
         optimizations = []
 
         try:
-            tree = ast.parse(code)
+            tree = parse_python(code, context)
 
             # Check for caching patterns
             for node in ast.walk(tree):
@@ -6,11 +6,14 @@ language-specific scorers, making it easy to add support for new languages
 without modifying core code.
 """
 
+import inspect
 import logging
+from pathlib import Path
 from typing import Any
 
 from ...core.config import ProjectConfig
 from ...core.language_detector import Language
+from .analysis_context import FileAnalysisContext
 from .scoring import BaseScorer
 
 logger = logging.getLogger(__name__)
@@ -38,6 +41,9 @@ class ScorerRegistry:
     
     # Track initialization state for lazy registration
     _initialized: bool = False
+
+    # Cache of scorer classes whose score_file() accepts an ``analysis`` kwarg
+    _accepts_analysis: dict[type[BaseScorer], bool] = {}
     
     @classmethod
     def register(
@@ -302,6 +308,63 @@ class ScorerRegistry:
                 # Last resort: try with language
                 return scorer_class(language=language)
     
+    @classmethod
+    def create_analysis_context(
+        cls, file_path: Path, code: str, language: Language
+    ) -> FileAnalysisContext:
+        """
+        Build the shared per-file analysis context handed to scorer plugins.
+
+        Args:
+            file_path: Path to the file being scored
+            code: File content
+            language: Detected language
+
+        Returns:
+            FileAnalysisContext whose artifacts are computed lazily, once
+        """
+        return FileAnalysisContext(file_path, code, language)
+
+    @classmethod
+    def run_scorer(
+        cls,
+        scorer: BaseScorer,
+        file_path: Path,
+        code: str,
+        analysis: FileAnalysisContext | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run a scorer, handing it the shared analysis context if it accepts one.
+
+        Scorers opt in by declaring an ``analysis`` parameter on score_file();
+        older plugins keep the two-argument signature and are called as before.
+
+        Args:
+            scorer: Scorer instance (from get_scorer)
+            file_path: Path to the file being scored
+            code: File content
+            analysis: Shared analysis context for this file
+
+        Returns:
+            Scores dictionary from the scorer
+        """
+        if analysis is not None and cls._scorer_accepts_analysis(type(scorer)):
+            return scorer.score_file(file_path, code, analysis=analysis)  # type: ignore[call-arg]
+        return scorer.score_file(file_path, code)
+
+    @classmethod
+    def _scorer_accepts_analysis(cls, scorer_class: type[BaseScorer]) -> bool:
+        """Check (and cache) whether scorer_class.score_file takes ``analysis``."""
+        accepts = cls._accepts_analysis.get(scorer_class)
+        if accepts is None:
+            try:
+                params = inspect.signature(scorer_class.score_file).parameters
+                accepts = "analysis" in params
+            except (TypeError, ValueError):
+                accepts = False
+            cls._accepts_analysis[scorer_class] = accepts
+        return accepts
+
     @classmethod
     def list_registered_languages(cls) -> list[Language]:
         """
@@ -11,14 +11,16 @@ import sys
 from pathlib import Path
 from typing import Any, Protocol
 
-logger = logging.getLogger(__name__)
-
 from ...core.config import ProjectConfig, ScoringWeightsConfig
 from ...core.language_detector import Language
 from ...core.subprocess_utils import wrap_windows_cmd_shim
+from .analysis_context import FileAnalysisContext, parse_python
 from .score_constants import ComplexityConstants, SecurityConstants
+from .tools.tool_memo import ToolRun, get_tool_result_memo
 from .validation import validate_code_input
 
+logger = logging.getLogger(__name__)
+
 # Import analysis libraries
 try:
     from radon.complexity import cc_visit
@@ -103,7 +105,13 @@ class BaseScorer:
     """
 
     def score_file(self, file_path: Path, code: str) -> dict[str, Any]:
-        """Score a file and return quality metrics. Subclasses must implement."""
+        """
+        Score a file and return quality metrics. Subclasses must implement.
+
+        Subclasses may accept an optional ``analysis: FileAnalysisContext``
+        keyword; ScorerRegistry.run_scorer() then hands them the shared
+        per-file parse results instead of letting them re-parse the source.
+        """
         raise NotImplementedError("Subclasses must implement score_file")
 
     @staticmethod
@@ -193,11 +201,49 @@ class CodeScorer(BaseScorer):
         self.duplication_threshold = duplication_threshold
         self.min_duplication_lines = min_duplication_lines
         self.weights = weights  # Will use defaults if None
+        # Stateless helpers reused across files (previously rebuilt per call)
+        self._maintainability_scorer: Any = None
+        self._performance_scorer: Any = None
+        self._score_validator: Any = None
+        # Score and issue list for ruff/mypy read the same memoized run
+        self._tool_memo = get_tool_result_memo()
 
-    def score_file(self, file_path: Path, code: str) -> dict[str, Any]:
+    def _get_maintainability_scorer(self) -> Any:
+        if self._maintainability_scorer is None:
+            from .maintainability_scorer import MaintainabilityScorer
+
+            self._maintainability_scorer = MaintainabilityScorer()
+        return self._maintainability_scorer
+
+    def _get_performance_scorer(self) -> Any:
+        if self._performance_scorer is None:
+            from .performance_scorer import PerformanceScorer
+
+            self._performance_scorer = PerformanceScorer()
+        return self._performance_scorer
+
+    def _get_score_validator(self) -> Any:
+        if self._score_validator is None:
+            from .score_validator import ScoreValidator
+
+            self._score_validator = ScoreValidator()
+        return self._score_validator
+
+    def score_file(
+        self,
+        file_path: Path,
+        code: str,
+        analysis: FileAnalysisContext | None = None,
+    ) -> dict[str, Any]:
         """
         Calculate scores for a code file.
 
+        Args:
+            file_path: Path to the file
+            code: File content
+            analysis: Optional shared analysis context (built if not provided);
+                the source is parsed at most once across all scorers.
+
         Returns:
             {
                 "complexity_score": float (0-10),
@@ -207,6 +253,10 @@ class CodeScorer(BaseScorer):
                 "metrics": {...}
             }
         """
+        if analysis is None or not analysis.matches(code):
+            analysis = FileAnalysisContext(file_path, code, Language.PYTHON)
+        scorer_context = analysis.as_scorer_context()
+
         metrics: dict[str, float] = {}
         scores: dict[str, Any] = {
             "complexity_score": 0.0,
@@ -223,7 +273,7 @@ class CodeScorer(BaseScorer):
         }
 
         # Complexity Score (0-10, lower is better)
-        scores["complexity_score"] = self._calculate_complexity(code)
+        scores["complexity_score"] = self._calculate_complexity(code, analysis)
         metrics["complexity"] = float(scores["complexity_score"])
 
         # Security Score (0-10, higher is better)
@@ -231,7 +281,7 @@ class CodeScorer(BaseScorer):
         metrics["security"] = float(scores["security_score"])
 
         # Maintainability Score (0-10, higher is better)
-        scores["maintainability_score"] = self._calculate_maintainability(code)
+        scores["maintainability_score"] = self._calculate_maintainability(code, analysis)
         metrics["maintainability"] = float(scores["maintainability_score"])
 
         # Test Coverage Score (0-10, higher is better)
@@ -240,12 +290,8 @@ class CodeScorer(BaseScorer):
 
         # Performance Score (0-10, higher is better)
         # Phase 3.2: Use context-aware performance scorer
-        from ...core.language_detector import Language
-        from .performance_scorer import PerformanceScorer
-
-        performance_scorer = PerformanceScorer()
-        scores["performance_score"] = performance_scorer.calculate(
-            code, Language.PYTHON, file_path, context=None
+        scores["performance_score"] = self._get_performance_scorer().calculate(
+            code, Language.PYTHON, file_path, context=scorer_context
         )
         metrics["performance"] = float(scores["performance_score"])
 
@@ -314,11 +360,7 @@ class CodeScorer(BaseScorer):
         ) * 10  # Scale from 0-10 weighted sum to 0-100
 
         # Phase 3.3: Validate all scores before returning
-        from ...core.language_detector import Language
-        from .score_validator import ScoreValidator
-
-        validator = ScoreValidator()
-        validation_results = validator.validate_all_scores(
+        validation_results = self._get_score_validator().validate_all_scores(
             scores, language=Language.PYTHON, context=None
         )
 
@@ -344,7 +386,9 @@ class CodeScorer(BaseScorer):
         merged = {**scores, **validated_scores}
         return merged
 
-    def _calculate_complexity(self, code: str) -> float:
+    def _calculate_complexity(
+        self, code: str, analysis: FileAnalysisContext | None = None
+    ) -> float:
         """Calculate cyclomatic complexity (0-10 scale)"""
         # Validate input
         validate_code_input(code, method_name="_calculate_complexity")
@@ -353,8 +397,13 @@ class CodeScorer(BaseScorer):
             return 5.0  # Default neutral score
 
         try:
-            tree = ast.parse(code)
-            complexities = cc_visit(tree)
+            if analysis is not None and analysis.matches(code):
+                analysis.parse()  # Raises SyntaxError like ast.parse
+                complexities = analysis.cc_blocks
+                if complexities is None:
+                    complexities = cc_visit(analysis.parse())
+            else:
+                complexities = cc_visit(ast.parse(code))
 
             if not complexities:
                 return 1.0
@@ -397,6 +446,21 @@ class CodeScorer(BaseScorer):
                 SecurityConstants.MAX_SCORE - (issues * SecurityConstants.INSECURE_PATTERN_PENALTY)
             )
 
+        if file_path is not None:
+            result = self._tool_memo.get_or_run(
+                file_path, "bandit", lambda: self._invoke_bandit(file_path)
+            )
+        else:
+            result = self._invoke_bandit(file_path)
+        if not result.ok:
+            return 4.0  # Could not assess; use lower default than neutral
+
+        # Score: 10 - (high*3 + medium*1)
+        score = 10.0 - (result.payload["high"] * 3.0 + result.payload["medium"] * 1.0)
+        return max(0.0, score)
+
+    def _invoke_bandit(self, file_path: Path | None) -> ToolRun:
+        """Run bandit on one file; payload holds high/medium severity counts."""
         try:
             # Use bandit for proper security analysis
             # BanditManager expects a BanditConfig, not a dict. Passing a dict can raise ValueError,
@@ -416,38 +480,43 @@ class CodeScorer(BaseScorer):
 
             # Count high/medium severity issues
             issues = b_mgr.get_issue_list()
-            high_severity = sum(1 for i in issues if i.severity == bandit.HIGH)
-            medium_severity = sum(1 for i in issues if i.severity == bandit.MEDIUM)
-
-            # Score: 10 - (high*3 + medium*1)
-            score = 10.0 - (high_severity * 3.0 + medium_severity * 1.0)
-            return max(0.0, score)
+            return ToolRun(
+                returncode=0,
+                payload={
+                    "high": sum(1 for i in issues if i.severity == bandit.HIGH),
+                    "medium": sum(1 for i in issues if i.severity == bandit.MEDIUM),
+                },
+            )
         except (FileNotFoundError, PermissionError, ValueError) as e:
             logger.warning("Security scoring failed for %s: %s", file_path, e)
-            return 4.0  # Could not assess; use lower default than neutral
+            return ToolRun(returncode=None, error="error")
         except Exception as e:
             logger.warning(
                 "Unexpected error during security scoring for %s: %s",
                 file_path, e, exc_info=True,
             )
-            return 4.0  # Could not assess; use lower default than neutral
+            return ToolRun(returncode=None, error="error")
 
-    def _calculate_maintainability(self, code: str) -> float:
+    def _calculate_maintainability(
+        self, code: str, analysis: FileAnalysisContext | None = None
+    ) -> float:
         """
         Calculate maintainability index (0-10 scale, higher is better).
         
         Phase 3.1: Enhanced with context-aware scoring using MaintainabilityScorer.
         Phase 2 (P0): Maintainability issues are captured separately via get_maintainability_issues().
         """
-        from ...core.language_detector import Language
-        from .maintainability_scorer import MaintainabilityScorer
-
         # Use context-aware maintainability scorer
-        scorer = MaintainabilityScorer()
-        return scorer.calculate(code, Language.PYTHON, file_path=None, context=None)
+        context = analysis.as_scorer_context() if analysis is not None else None
+        return self._get_maintainability_scorer().calculate(
+            code, Language.PYTHON, file_path=None, context=context
+        )
 
     def get_maintainability_issues(
-        self, code: str, file_path: Path | None = None
+        self,
+        code: str,
+        file_path: Path | None = None,
+        analysis: FileAnalysisContext | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get specific maintainability issues (Phase 2 - P0).
@@ -457,15 +526,15 @@ class CodeScorer(BaseScorer):
         Args:
             code: Source code content
             file_path: Optional path to the file
+            analysis: Optional shared analysis context from score_file()
             
         Returns:
             List of maintainability issues with details
         """
-        from ...core.language_detector import Language
-        from .maintainability_scorer import MaintainabilityScorer
-
-        scorer = MaintainabilityScorer()
-        return scorer.get_issues(code, Language.PYTHON, file_path=file_path, context=None)
+        context = analysis.as_scorer_context() if analysis is not None else None
+        return self._get_maintainability_scorer().get_issues(
+            code, Language.PYTHON, file_path=file_path, context=context
+        )
 
     def _calculate_test_coverage(self, file_path: Path) -> float:
         """
@@ -634,7 +703,10 @@ class CodeScorer(BaseScorer):
         return BaseScorer._find_project_root(file_path)
 
     def get_performance_issues(
-        self, code: str, file_path: Path | None = None
+        self,
+        code: str,
+        file_path: Path | None = None,
+        analysis: FileAnalysisContext | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get specific performance issues with line numbers (Phase 4 - P1).
@@ -644,19 +716,18 @@ class CodeScorer(BaseScorer):
         Args:
             code: Source code content
             file_path: Optional path to the file
+            analysis: Optional shared analysis context from score_file()
             
         Returns:
             List of performance issues with line numbers
         """
-        import ast
-
         from .issue_tracking import PerformanceIssue
 
         issues: list[PerformanceIssue] = []
-        code.splitlines()
+        context = analysis.as_scorer_context() if analysis is not None else None
 
         try:
-            tree = ast.parse(code)
+            tree = parse_python(code, context)
         except SyntaxError:
             return [PerformanceIssue(
                 issue_type="syntax_error",
@@ -827,24 +898,15 @@ class CodeScorer(BaseScorer):
 
         return max_depth
 
-    def _calculate_linting_score(self, file_path: Path) -> float:
-        """
-        Calculate linting score using Ruff (0-10 scale, higher is better).
-
-        Phase 6: Modern Quality Analysis - Ruff Integration
-
-        Returns:
-            Linting score (0-10), where 10 = no issues, 0 = many issues
-        """
-        if not self.has_ruff:
-            return 5.0  # Neutral score if Ruff not available
-
-        # Only check Python files
-        if file_path.suffix != ".py":
-            return 10.0  # Perfect score for non-Python files (can't lint)
+    def _run_ruff(self, file_path: Path) -> ToolRun:
+        """Run ruff once per (file content, ruff version); shared by score and issues."""
+        return self._tool_memo.get_or_run(
+            file_path, "ruff", lambda: self._invoke_ruff(file_path)
+        )
 
+    def _invoke_ruff(self, file_path: Path) -> ToolRun:
+        """Launch ruff check with JSON output."""
         try:
-            # Run ruff check with JSON output
             result = subprocess.run(  # nosec B603
                 [
                     sys.executable,
@@ -861,61 +923,88 @@ class CodeScorer(BaseScorer):
                 timeout=30,  # 30 second timeout
                 cwd=file_path.parent if file_path.parent.exists() else None,
             )
+            return ToolRun(
+                returncode=result.returncode,
+                stdout=result.stdout or "",
+                stderr=result.stderr or "",
+            )
+        except subprocess.TimeoutExpired:
+            return ToolRun(returncode=None, error="timeout")
+        except FileNotFoundError:
+            # Ruff not found in PATH
+            return ToolRun(returncode=None, error="not_found")
+        except Exception as e:
+            logger.debug("ruff failed for %s: %s", file_path, e)
+            return ToolRun(returncode=None, error="error")
 
-            # Parse JSON output
-            if result.returncode == 0 and not result.stdout.strip():
-                # No issues found
+    def _calculate_linting_score(self, file_path: Path) -> float:
+        """
+        Calculate linting score using Ruff (0-10 scale, higher is better).
+
+        Phase 6: Modern Quality Analysis - Ruff Integration
+
+        Returns:
+            Linting score (0-10), where 10 = no issues, 0 = many issues
+        """
+        if not self.has_ruff:
+            return 5.0  # Neutral score if Ruff not available
+
+        # Only check Python files
+        if file_path.suffix != ".py":
+            return 10.0  # Perfect score for non-Python files (can't lint)
+
+        result = self._run_ruff(file_path)
+        if not result.ok:
+            return 5.0  # Neutral on timeout / missing ruff / other errors
+
+        # Parse JSON output
+        if result.returncode == 0 and not result.stdout.strip():
+            # No issues found
+            return 10.0
+
+        try:
+            # Ruff JSON format: list of diagnostic objects
+            diagnostics = (
+                json_lib.loads(result.stdout) if result.stdout.strip() else []
+            )
+
+            if not diagnostics:
                 return 10.0
 
-            try:
-                # Ruff JSON format: list of diagnostic objects
-                diagnostics = (
-                    json_lib.loads(result.stdout) if result.stdout.strip() else []
-                )
-
-                if not diagnostics:
-                    return 10.0
-
-                # Count issues by severity
-                # Ruff severity levels: E (Error), W (Warning), F (Fatal), I (Info)
-                error_count = sum(
-                    1
-                    for d in diagnostics
-                    if d.get("code", {}).get("name", "").startswith("E")
-                )
-                warning_count = sum(
-                    1
-                    for d in diagnostics
-                    if d.get("code", {}).get("name", "").startswith("W")
-                )
-                fatal_count = sum(
-                    1
-                    for d in diagnostics
-                    if d.get("code", {}).get("name", "").startswith("F")
-                )
-
-                # Calculate score: Start at 10, deduct points
-                # Errors (E): -2 points each
-                # Fatal (F): -3 points each
-                # Warnings (W): -0.5 points each
-                score = 10.0
-                score -= error_count * 2.0
-                score -= fatal_count * 3.0
-                score -= warning_count * 0.5
-
-                return max(0.0, min(10.0, score))
+            # Count issues by severity
+            # Ruff severity levels: E (Error), W (Warning), F (Fatal), I (Info)
+            error_count = sum(
+                1
+                for d in diagnostics
+                if d.get("code", {}).get("name", "").startswith("E")
+            )
+            warning_count = sum(
+                1
+                for d in diagnostics
+                if d.get("code", {}).get("name", "").startswith("W")
+            )
+            fatal_count = sum(
+                1
+                for d in diagnostics
+                if d.get("code", {}).get("name", "").startswith("F")
+            )
 
-            except json_lib.JSONDecodeError:
-                # If JSON parsing fails, check stderr for errors
-                if result.stderr:
-                    return 5.0  # Neutral on parsing error
-                return 10.0  # No output = no issues
+            # Calculate score: Start at 10, deduct points
+            # Errors (E): -2 points each
+            # Fatal (F): -3 points each
+            # Warnings (W): -0.5 points each
+            score = 10.0
+            score -= error_count * 2.0
+            score -= fatal_count * 3.0
+            score -= warning_count * 0.5
 
-        except subprocess.TimeoutExpired:
-            return 5.0  # Neutral on timeout
-        except FileNotFoundError:
-            # Ruff not found in PATH
-            return 5.0
+            return max(0.0, min(10.0, score))
+
+        except json_lib.JSONDecodeError:
+            # If JSON parsing fails, check stderr for errors
+            if result.stderr:
+                return 5.0  # Neutral on parsing error
+            return 10.0  # No output = no issues
         except Exception:
             # Any other error
             return 5.0
@@ -932,69 +1021,40 @@ class CodeScorer(BaseScorer):
         if not self.has_ruff or file_path.suffix != ".py":
             return []
 
-        try:
-            result = subprocess.run(  # nosec B603
-                [
-                    sys.executable,
-                    "-m",
-                    "ruff",
-                    "check",
-                    "--output-format=json",
-                    str(file_path),
-                ],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=30,
-                cwd=file_path.parent if file_path.parent.exists() else None,
-            )
-
-            if result.returncode == 0 and not result.stdout.strip():
-                return []
+        result = self._run_ruff(file_path)
+        if not result.ok:
+            return []
 
-            try:
-                diagnostics = (
-                    json_lib.loads(result.stdout) if result.stdout.strip() else []
-                )
-                return diagnostics
-            except json_lib.JSONDecodeError:
-                return []
+        if result.returncode == 0 and not result.stdout.strip():
+            return []
 
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+        try:
+            diagnostics = (
+                json_lib.loads(result.stdout) if result.stdout.strip() else []
+            )
+            return diagnostics
+        except json_lib.JSONDecodeError:
             return []
 
-    def _calculate_type_checking_score(self, file_path: Path) -> float:
-        """
-        Calculate type checking score using mypy (0-10 scale, higher is better).
+    def _run_mypy(self, file_path: Path) -> ToolRun:
+        """Run mypy once per (file content, mypy version); shared by score and errors."""
+        return self._tool_memo.get_or_run(
+            file_path, "mypy", lambda: self._invoke_mypy(file_path)
+        )
 
-        Phase 6.2: Modern Quality Analysis - mypy Integration
-        Phase 5 (P1): Fixed to actually run mypy and return real scores (not static 5.0).
-        ENH-002-S2: Prefer ScopedMypyExecutor (--follow-imports=skip, <10s) with fallback to full mypy.
+    def _invoke_mypy(self, file_path: Path) -> ToolRun:
         """
-        if not self.has_mypy:
-            logger.debug("mypy not available - returning neutral score")
-            return 5.0  # Neutral score if mypy not available
+        Launch mypy for a single file.
 
-        # Only check Python files
-        if file_path.suffix != ".py":
-            return 10.0  # Perfect score for non-Python files (can't type check)
-
-        # ENH-002-S2: Try scoped mypy first (faster)
+        ENH-002-S2: Prefer ScopedMypyExecutor (--follow-imports=skip, <10s) with
+        fallback to full mypy. A usable scoped result is returned as the payload.
+        """
         try:
             from .tools.scoped_mypy import ScopedMypyExecutor
             executor = ScopedMypyExecutor()
-            result = executor.run_scoped_sync(file_path, timeout=10)
-            if result.files_checked == 1 or result.issues:
-                error_count = len(result.issues)
-                if error_count == 0:
-                    return 10.0
-                score = 10.0 - (error_count * 0.5)
-                logger.debug(
-                    "mypy (scoped) found %s errors for %s, score: %s/10",
-                    error_count, file_path, score,
-                )
-                return max(0.0, min(10.0, score))
+            scoped = executor.run_scoped_sync(file_path, timeout=10)
+            if scoped.files_checked == 1 or scoped.issues:
+                return ToolRun(returncode=0 if scoped.success else 1, payload=scoped)
         except Exception as e:
             logger.debug("scoped mypy not used, falling back to full mypy: %s", e)
 
@@ -1017,36 +1077,76 @@ class CodeScorer(BaseScorer):
                 timeout=30,
                 cwd=file_path.parent if file_path.parent.exists() else None,
             )
-            if result.returncode == 0:
-                logger.debug("mypy found no errors for %s", file_path)
-                return 10.0
-            output = result.stdout.strip()
-            if not output:
-                logger.debug("mypy returned non-zero but no output for %s", file_path)
-                return 10.0
-            error_lines = [
-                line
-                for line in output.split("\n")
-                if "error:" in line.lower() and file_path.name in line
-            ]
-            error_count = len(error_lines)
-            if error_count == 0:
-                logger.debug("mypy returned non-zero but no parseable errors for %s", file_path)
-                return 10.0
-            score = 10.0 - (error_count * 0.5)
-            logger.debug("mypy found %s errors for %s, score: %s/10", error_count, file_path, score)
-            return max(0.0, min(10.0, score))
+            return ToolRun(
+                returncode=result.returncode,
+                stdout=result.stdout or "",
+                stderr=result.stderr or "",
+            )
         except subprocess.TimeoutExpired:
             logger.warning("mypy timed out for %s", file_path)
-            return 5.0
+            return ToolRun(returncode=None, error="timeout")
         except FileNotFoundError:
             logger.debug("mypy not found in PATH for %s", file_path)
-            self.has_mypy = False
-            return 5.0
+            return ToolRun(returncode=None, error="not_found")
         except Exception as e:
             logger.warning("mypy failed for %s: %s", file_path, e, exc_info=True)
+            return ToolRun(returncode=None, error="error")
+
+    def _calculate_type_checking_score(self, file_path: Path) -> float:
+        """
+        Calculate type checking score using mypy (0-10 scale, higher is better).
+
+        Phase 6.2: Modern Quality Analysis - mypy Integration
+        Phase 5 (P1): Fixed to actually run mypy and return real scores (not static 5.0).
+        ENH-002-S2: Prefer ScopedMypyExecutor (--follow-imports=skip, <10s) with fallback to full mypy.
+        """
+        if not self.has_mypy:
+            logger.debug("mypy not available - returning neutral score")
+            return 5.0  # Neutral score if mypy not available
+
+        # Only check Python files
+        if file_path.suffix != ".py":
+            return 10.0  # Perfect score for non-Python files (can't type check)
+
+        result = self._run_mypy(file_path)
+
+        if result.payload is not None:
+            error_count = len(result.payload.issues)
+            if error_count == 0:
+                return 10.0
+            score = 10.0 - (error_count * 0.5)
+            logger.debug(
+                "mypy (scoped) found %s errors for %s, score: %s/10",
+                error_count, file_path, score,
+            )
+            return max(0.0, min(10.0, score))
+
+        if result.error == "not_found":
+            self.has_mypy = False
+            return 5.0
+        if not result.ok:
             return 5.0
 
+        if result.returncode == 0:
+            logger.debug("mypy found no errors for %s", file_path)
+            return 10.0
+        output = result.stdout.strip()
+        if not output:
+            logger.debug("mypy returned non-zero but no output for %s", file_path)
+            return 10.0
+        error_lines = [
+            line
+            for line in output.split("\n")
+            if "error:" in line.lower() and file_path.name in line
+        ]
+        error_count = len(error_lines)
+        if error_count == 0:
+            logger.debug("mypy returned non-zero but no parseable errors for %s", file_path)
+            return 10.0
+        score = 10.0 - (error_count * 0.5)
+        logger.debug("mypy found %s errors for %s, score: %s/10", error_count, file_path, score)
+        return max(0.0, min(10.0, score))
+
     def get_mypy_errors(self, file_path: Path) -> list[dict[str, Any]]:
         """
         Get detailed mypy type checking errors for a file.
@@ -1057,73 +1157,49 @@ class CodeScorer(BaseScorer):
         if not self.has_mypy or file_path.suffix != ".py":
             return []
 
-        try:
-            from .tools.scoped_mypy import ScopedMypyExecutor
-            executor = ScopedMypyExecutor()
-            result = executor.run_scoped_sync(file_path, timeout=10)
-            if result.files_checked == 1 or result.issues:
-                return [
-                    {
-                        "filename": str(i.file_path),
-                        "line": i.line,
-                        "message": i.message,
-                        "error_code": i.error_code,
-                        "severity": i.severity,
-                    }
-                    for i in result.issues
-                ]
-        except Exception:
-            pass
+        result = self._run_mypy(file_path)
 
-        try:
-            result = subprocess.run(  # nosec B603
-                [
-                    sys.executable,
-                    "-m",
-                    "mypy",
-                    "--show-error-codes",
-                    "--no-error-summary",
-                    "--no-incremental",
-                    str(file_path),
-                ],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=30,
-                cwd=file_path.parent if file_path.parent.exists() else None,
-            )
-            if result.returncode == 0 or not result.stdout.strip():
-                return []
-            errors = []
-            for line in result.stdout.strip().split("\n"):
-                if "error:" not in line.lower():
-                    continue
-                parts = line.split(":", 3)
-                if len(parts) >= 4:
-                    filename = parts[0]
-                    try:
-                        line_num = int(parts[1])
-                    except ValueError:
-                        continue
-                    error_msg = parts[3].strip()
-                    error_code = None
-                    if "[" in error_msg and "]" in error_msg:
-                        start = error_msg.rfind("[")
-                        end = error_msg.rfind("]")
-                        if start < end:
-                            error_code = error_msg[start + 1 : end]
-                            error_msg = error_msg[:start].strip()
-                    errors.append({
-                        "filename": filename,
-                        "line": line_num,
-                        "message": error_msg,
-                        "error_code": error_code,
-                        "severity": "error",
-                    })
-            return errors
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+        if result.payload is not None:
+            return [
+                {
+                    "filename": str(i.file_path),
+                    "line": i.line,
+                    "message": i.message,
+                    "error_code": i.error_code,
+                    "severity": i.severity,
+                }
+                for i in result.payload.issues
+            ]
+
+        if not result.ok or result.returncode == 0 or not result.stdout.strip():
             return []
+        errors = []
+        for line in result.stdout.strip().split("\n"):
+            if "error:" not in line.lower():
+                continue
+            parts = line.split(":", 3)
+            if len(parts) >= 4:
+                filename = parts[0]
+                try:
+                    line_num = int(parts[1])
+                except ValueError:
+                    continue
+                error_msg = parts[3].strip()
+                error_code = None
+                if "[" in error_msg and "]" in error_msg:
+                    start = error_msg.rfind("[")
+                    end = error_msg.rfind("]")
+                    if start < end:
+                        error_code = error_msg[start + 1 : end]
+                        error_msg = error_msg[:start].strip()
+                errors.append({
+                    "filename": filename,
+                    "line": line_num,
+                    "message": error_msg,
+                    "error_code": error_code,
+                    "severity": "error",
+                })
+        return errors
 
     def _format_ruff_issues(self, diagnostics: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
@@ -1269,6 +1345,12 @@ class CodeScorer(BaseScorer):
         if not self.has_jscpd:
             return 5.0  # Neutral score if jscpd not available
 
+        # Use the per-file share of a project-wide jscpd run if a batch primed one
+        primed = self._tool_memo.get(file_path, "jscpd") if file_path.is_file() else None
+        if primed is not None and primed.ok:
+            duplication_pct = primed.payload.get("percentage", 0.0)
+            return max(0.0, min(10.0, 10.0 - (duplication_pct / 10.0)))
+
         # jscpd works best on directories or multiple files
         # For single file analysis, we'll analyze the file directly
         try:
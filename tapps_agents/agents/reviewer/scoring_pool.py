@@ -0,0 +1,235 @@
+"""
+Scoring Process Pool - Optional multi-process backend for CPU-bound scoring.
+
+Radon, AST walks, bandit tests and the maintainability/performance scorers
+are pure Python, so running score_file() in threads serializes on the GIL.
+ScoringProcessPool runs it in warm worker processes instead: each worker
+builds its scorers and loads bandit's plugin set once, then scores files
+for the lifetime of the pool. Results travel back as plain dicts.
+
+Tool runs already memoized in the parent (e.g. primed by a batch run) are
+sent along with the file, and runs the worker performs are returned, so
+neither side launches ruff/mypy/bandit twice for the same content.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ...core.language_detector import Language
+from .tools.tool_memo import ToolRun, get_tool_result_memo
+
+if TYPE_CHECKING:
+    from ...core.config import ProjectConfig
+    from .scoring import BaseScorer
+
+logger = logging.getLogger(__name__)
+
+# Worker-process state, populated by _init_worker()
+_worker_config: ProjectConfig | None = None
+_worker_scorers: dict[tuple[type, Language], tuple[BaseScorer, Any]] = {}
+
+
+def _init_worker(config: ProjectConfig | None) -> None:
+    """Preload scorers, radon and bandit's plugins in a fresh worker."""
+    global _worker_config
+    _worker_config = config
+    from .scoring import CodeScorer
+
+    _get_worker_scorer(CodeScorer, Language.PYTHON)
+    try:
+        import radon.complexity
+        import radon.metrics  # noqa: F401
+        from bandit.core import config as bandit_config
+        from bandit.core import extension_loader  # noqa: F401 - loads plugins
+
+        bandit_config.BanditConfig()
+    except ImportError:
+        pass
+
+
+def _get_worker_scorer(scorer_class: type, language: Language) -> BaseScorer:
+    """Return this worker's scorer instance for (class, language)."""
+    key = (scorer_class, language)
+    entry = _worker_scorers.get(key)
+    if entry is None:
+        from .scorer_registry import ScorerRegistry
+
+        scorer = ScorerRegistry._instantiate_scorer(scorer_class, language, _worker_config)
+        entry = (scorer, getattr(scorer, "weights", None))
+        _worker_scorers[key] = entry
+    return entry[0]
+
+
+def _to_compact(value: Any) -> Any:
+    """Reduce a scores structure to builtin types for cheap pickling."""
+    if isinstance(value, dict):
+        return {str(k): _to_compact(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_compact(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Path):
+        return str(value)
+    return str(value)
+
+
+def _score_in_worker(
+    scorer_class: type,
+    language_value: str,
+    file_path: str,
+    code: str,
+    weights: Any,
+    tool_runs: dict[str, ToolRun],
+) -> tuple[dict[str, Any], dict[str, ToolRun]]:
+    """Score one file inside a worker process."""
+    from .scorer_registry import ScorerRegistry
+
+    language = Language(language_value)
+    path = Path(file_path)
+    scorer = _get_worker_scorer(scorer_class, language)
+    if hasattr(scorer, "weights"):
+        # Adaptive weights from the parent; otherwise the worker's defaults
+        scorer.weights = (
+            weights if weights is not None else _worker_scorers[(scorer_class, language)][1]
+        )
+
+    memo = get_tool_result_memo()
+    for tool, run in tool_runs.items():
+        memo.put(path, tool, run)
+
+    analysis = ScorerRegistry.create_analysis_context(path, code, language)
+    scores = ScorerRegistry.run_scorer(scorer, path, code, analysis)
+    new_runs = {
+        tool: run for tool, run in memo.runs_for(path).items() if tool not in tool_runs
+    }
+    return _to_compact(scores), new_runs
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+class ScoringProcessPool:
+    """
+    Pool of warm worker processes running score_file().
+
+    Example:
+        >>> pool = get_scoring_pool(config)
+        >>> scores = await pool.score(scorer, file_path, code, Language.PYTHON)
+    """
+
+    def __init__(self, max_workers: int | None = None, config: ProjectConfig | None = None):
+        """
+        Initialize pool (processes start on first use).
+
+        Args:
+            max_workers: Worker processes (default: CPU count)
+            config: Project configuration handed to worker scorers
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.config = config
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: fork is unsafe with the threads asyncio and tool
+                # executors start, and matches Windows/macOS behavior
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.config,),
+                )
+            return self._executor
+
+    def warm_up(self) -> None:
+        """Start all workers now rather than on the first files scored."""
+        executor = self._get_executor()
+        futures = [executor.submit(_noop) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result()
+
+    async def score(
+        self,
+        scorer: BaseScorer,
+        file_path: Path,
+        code: str,
+        language: Language,
+    ) -> dict[str, Any]:
+        """
+        Score a file in a worker process.
+
+        Args:
+            scorer: Parent-side scorer; its class and weights are used in the worker
+            file_path: Path to the file
+            code: File content
+            language: Detected language
+
+        Returns:
+            Scores dictionary (builtin types only)
+
+        Raises:
+            BrokenProcessPool: If a worker died; the pool is reset for next use
+        """
+        memo = get_tool_result_memo()
+        tool_runs = memo.runs_for(file_path)
+        loop = asyncio.get_running_loop()
+        try:
+            scores, new_runs = await loop.run_in_executor(
+                self._get_executor(),
+                _score_in_worker,
+                type(scorer),
+                language.value,
+                str(file_path),
+                code,
+                getattr(scorer, "weights", None),
+                tool_runs,
+            )
+        except BrokenProcessPool:
+            self._reset()
+            raise
+        for tool, run in new_runs.items():
+            memo.put(file_path, tool, run)
+        return scores
+
+    def _reset(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool: ScoringProcessPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_scoring_pool(
+    config: ProjectConfig | None = None, max_workers: int | None = None
+) -> ScoringProcessPool:
+    """Return the process-wide scoring pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ScoringProcessPool(max_workers=max_workers, config=config)
+                atexit.register(_pool.shutdown)
+    return _pool
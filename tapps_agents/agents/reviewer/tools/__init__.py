@@ -2,6 +2,7 @@
 Quality Tools - Parallel execution and tool runners for ReviewerAgent.
 """
 
+from .batch_tools import BatchToolRunner
 from .parallel_executor import (
     ParallelToolExecutor,
     ToolExecutionConfig,
@@ -22,8 +23,14 @@ from .scoped_mypy import (
     ScopedMypyConfig,
     ScopedMypyExecutor,
 )
+from .tool_memo import (
+    ToolResultMemo,
+    ToolRun,
+    get_tool_result_memo,
+)
 
 __all__ = [
+    "BatchToolRunner",
     "GroupedRuffIssues",
     "MypyIssue",
     "MypyResult",
@@ -37,5 +44,8 @@ __all__ = [
     "ScopedMypyExecutor",
     "ToolExecutionConfig",
     "ToolResult",
+    "ToolResultMemo",
+    "ToolRun",
     "ToolStatus",
+    "get_tool_result_memo",
 ]
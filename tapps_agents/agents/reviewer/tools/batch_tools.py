@@ -0,0 +1,310 @@
+"""
+Batch Tool Runner - Project-wide quality tool runs for reviewer batch commands.
+
+Reviewing N files one at a time launches ruff, mypy, bandit and jscpd N times
+each. BatchToolRunner runs each tool once over all targets, splits the output
+back per file, and primes the ToolResultMemo that CodeScorer reads from, so the
+subsequent per-file score_file() calls hit the memo instead of spawning tools.
+
+Files a batch run cannot account for (tool failure, file skipped) are simply
+not primed; CodeScorer falls back to its per-file invocation for those.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import subprocess  # nosec B404 - fixed args, no shell
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .scoped_mypy import ScopedMypyExecutor
+from .tool_memo import ToolResultMemo, ToolRun, get_tool_result_memo
+
+logger = logging.getLogger(__name__)
+
+ALL_BATCH_TOOLS = ("ruff", "mypy", "bandit", "jscpd")
+
+# Keep command lines well under Windows' 32k character limit
+MAX_FILES_PER_INVOCATION = 200
+
+
+def _chunks(items: list[Path], size: int) -> Iterable[list[Path]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _common_root(files: list[Path]) -> Path:
+    try:
+        return Path(os.path.commonpath([str(f.resolve().parent) for f in files]))
+    except ValueError:
+        # Different drives on Windows
+        return Path.cwd()
+
+
+class BatchToolRunner:
+    """
+    Run ruff, mypy, bandit and jscpd once per batch and prime the tool memo.
+
+    Example:
+        >>> runner = BatchToolRunner.from_scorer(reviewer.scorer)
+        >>> runner.prime(files, tools=("ruff", "mypy"))
+        {'ruff': 120, 'mypy': 118}
+    """
+
+    def __init__(
+        self,
+        memo: ToolResultMemo | None = None,
+        *,
+        ruff_enabled: bool = True,
+        mypy_enabled: bool = True,
+        bandit_enabled: bool = True,
+        jscpd_enabled: bool = True,
+        min_duplication_lines: int = 5,
+        timeout: float = 600.0,
+        mypy_cache_dir: Path | None = None,
+    ):
+        """
+        Initialize batch runner.
+
+        Args:
+            memo: Memo to prime (defaults to the process-wide memo)
+            ruff_enabled: Run ruff
+            mypy_enabled: Run mypy
+            bandit_enabled: Run bandit
+            jscpd_enabled: Run jscpd
+            min_duplication_lines: jscpd --min-lines
+            timeout: Timeout in seconds for each batch tool invocation
+            mypy_cache_dir: Incremental mypy cache directory
+                (default: .tapps-agents/cache/mypy under the project root)
+        """
+        self.memo = memo or get_tool_result_memo()
+        self.enabled = {
+            "ruff": ruff_enabled,
+            "mypy": mypy_enabled,
+            "bandit": bandit_enabled,
+            "jscpd": jscpd_enabled,
+        }
+        self.min_duplication_lines = min_duplication_lines
+        self.timeout = timeout
+        self.mypy_cache_dir = mypy_cache_dir
+
+    @classmethod
+    def from_scorer(cls, scorer: Any, **kwargs: Any) -> BatchToolRunner:
+        """Build a runner matching a CodeScorer's tool availability and memo."""
+        kwargs.setdefault("memo", getattr(scorer, "_tool_memo", None))
+        kwargs.setdefault("ruff_enabled", getattr(scorer, "has_ruff", False))
+        kwargs.setdefault("mypy_enabled", getattr(scorer, "has_mypy", False))
+        kwargs.setdefault("bandit_enabled", getattr(scorer, "has_bandit", False))
+        kwargs.setdefault("jscpd_enabled", getattr(scorer, "has_jscpd", False))
+        kwargs.setdefault(
+            "min_duplication_lines", getattr(scorer, "min_duplication_lines", 5)
+        )
+        return cls(**kwargs)
+
+    def prime(
+        self, files: list[Path], tools: Iterable[str] = ALL_BATCH_TOOLS
+    ) -> dict[str, int]:
+        """
+        Run each requested tool once over ``files`` and prime the memo.
+
+        Args:
+            files: Files that are about to be reviewed
+            tools: Subset of ("ruff", "mypy", "bandit", "jscpd")
+
+        Returns:
+            Mapping of tool name to number of files primed
+        """
+        python_files = [f for f in files if f.suffix == ".py" and f.is_file()]
+        runners = {
+            "ruff": (self.run_ruff, python_files),
+            "mypy": (self.run_mypy, python_files),
+            "bandit": (self.run_bandit, python_files),
+            "jscpd": (self.run_jscpd, [f for f in files if f.is_file()]),
+        }
+        primed: dict[str, int] = {}
+        for tool in tools:
+            if not self.enabled.get(tool) or tool not in runners:
+                continue
+            run_tool, targets = runners[tool]
+            if len(targets) < 2:
+                continue  # Nothing to gain over the per-file path
+            start = time.monotonic()
+            try:
+                results = run_tool(targets)
+            except Exception as e:
+                logger.warning("Batch %s run failed, falling back to per-file: %s", tool, e)
+                continue
+            primed[tool] = sum(
+                1 for path, run in results.items() if self.memo.put(path, tool, run)
+            )
+            logger.debug(
+                "Batch %s primed %s/%s files in %.2fs",
+                tool, primed[tool], len(targets), time.monotonic() - start,
+            )
+        return primed
+
+    def run_ruff(self, files: list[Path]) -> dict[Path, ToolRun]:
+        """Run ``ruff check --output-format=json`` once per chunk of files."""
+        results: dict[Path, ToolRun] = {}
+        for chunk in _chunks(files, MAX_FILES_PER_INVOCATION):
+            try:
+                proc = subprocess.run(  # nosec B603
+                    [sys.executable, "-m", "ruff", "check", "--output-format=json"]
+                    + [str(f.resolve()) for f in chunk],
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    timeout=self.timeout,
+                    cwd=_common_root(chunk),
+                )
+                diagnostics = json.loads(proc.stdout) if proc.stdout.strip() else []
+            except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError) as e:
+                logger.debug("Batch ruff chunk failed: %s", e)
+                continue
+            if not isinstance(diagnostics, list):
+                continue
+
+            by_file: dict[Path, list[dict[str, Any]]] = {f.resolve(): [] for f in chunk}
+            for diag in diagnostics:
+                filename = diag.get("filename") if isinstance(diag, dict) else None
+                if filename:
+                    bucket = by_file.get(Path(filename).resolve())
+                    if bucket is not None:
+                        bucket.append(diag)
+            for f in chunk:
+                diags = by_file[f.resolve()]
+                # Same shape a single-file `ruff check` run would produce
+                results[f] = ToolRun(
+                    returncode=1 if diags else 0,
+                    stdout=json.dumps(diags) if diags else "",
+                )
+        return results
+
+    def run_mypy(self, files: list[Path]) -> dict[Path, ToolRun]:
+        """Run scoped, incremental mypy once per chunk of files."""
+        executor = ScopedMypyExecutor()
+        cache_dir = self.mypy_cache_dir
+        if cache_dir is None:
+            # Same project-root detection as ReviewerResultCache; never create
+            # .tapps-agents next to reviewed sources
+            from ....core.path_validator import PathValidator
+
+            cache_dir = PathValidator().project_root / ".tapps-agents" / "cache" / "mypy"
+        results: dict[Path, ToolRun] = {}
+        for chunk in _chunks(files, MAX_FILES_PER_INVOCATION):
+            root = _common_root(chunk)
+            per_file = executor.run_batch_sync(
+                chunk,
+                timeout=int(self.timeout),
+                cache_dir=cache_dir,
+                cwd=root,
+            )
+            if per_file is None:
+                continue
+            for f, mypy_result in per_file.items():
+                results[f] = ToolRun(
+                    returncode=0 if mypy_result.success else 1, payload=mypy_result
+                )
+        return results
+
+    def run_bandit(self, files: list[Path]) -> dict[Path, ToolRun]:
+        """Run bandit once with a single BanditManager over all files."""
+        import bandit
+        from bandit.core import config as bandit_config
+        from bandit.core import manager
+
+        b_mgr = manager.BanditManager(
+            config=bandit_config.BanditConfig(),
+            agg_type="file",
+            debug=False,
+            verbose=False,
+            quiet=True,
+            profile=None,
+            ignore_nosec=False,
+        )
+        b_mgr.discover_files([str(f) for f in files], False)
+        b_mgr.run_tests()
+
+        skipped = {Path(fname).resolve() for fname, _reason in b_mgr.skipped}
+        counts: dict[Path, dict[str, int]] = {
+            f.resolve(): {"high": 0, "medium": 0} for f in files
+        }
+        for issue in b_mgr.get_issue_list():
+            bucket = counts.get(Path(issue.fname).resolve())
+            if bucket is None:
+                continue
+            if issue.severity == bandit.HIGH:
+                bucket["high"] += 1
+            elif issue.severity == bandit.MEDIUM:
+                bucket["medium"] += 1
+        return {
+            f: ToolRun(returncode=0, payload=counts[f.resolve()])
+            for f in files
+            if f.resolve() not in skipped
+        }
+
+    def run_jscpd(self, files: list[Path]) -> dict[Path, ToolRun]:
+        """Run jscpd once over the files' common directory tree."""
+        jscpd_path = shutil.which("jscpd")
+        if jscpd_path:
+            cmd = [jscpd_path]
+        else:
+            npx_path = shutil.which("npx")
+            if not npx_path:
+                return {}
+            cmd = [npx_path, "--yes", "jscpd"]
+
+        from ....core.subprocess_utils import wrap_windows_cmd_shim
+
+        root = _common_root(files)
+        wanted = {f.resolve(): f for f in files}
+        with tempfile.TemporaryDirectory(prefix="tapps-jscpd-") as output_dir:
+            cmd.extend(
+                [
+                    str(root),
+                    "--min-lines",
+                    str(self.min_duplication_lines),
+                    "--reporters",
+                    "json",
+                    "--output",
+                    output_dir,
+                    "--silent",
+                ]
+            )
+            try:
+                subprocess.run(  # nosec B603 - fixed args
+                    wrap_windows_cmd_shim(cmd),
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    timeout=self.timeout,
+                    cwd=root,
+                )
+                report_file = Path(output_dir) / "jscpd-report.json"
+                if not report_file.exists():
+                    return {}
+                report = json.loads(report_file.read_text(encoding="utf-8"))
+            except (subprocess.TimeoutExpired, FileNotFoundError, json.JSONDecodeError) as e:
+                logger.debug("Batch jscpd failed: %s", e)
+                return {}
+
+        results: dict[Path, ToolRun] = {}
+        formats = report.get("statistics", {}).get("formats", {})
+        for fmt_stats in formats.values():
+            for source, stats in fmt_stats.get("sources", {}).items():
+                target = wanted.get((root / source).resolve())
+                if target is not None:
+                    results[target] = ToolRun(
+                        returncode=0,
+                        payload={"percentage": float(stats.get("percentage", 0.0))},
+                    )
+        return results
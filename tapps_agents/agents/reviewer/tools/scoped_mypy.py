@@ -282,3 +282,129 @@ class ScopedMypyExecutor:
             return MypyResult(
                 issues=(), duration_seconds=0.0, files_checked=0, success=False
             )
+
+    def get_batch_flags(self, cache_dir: Path | None = None) -> list[str]:
+        """
+        Return mypy flags for a project-wide batch run.
+
+        Same scoping as single-file runs, but incremental: the cache directory
+        persists between batch runs so unchanged modules are not re-checked.
+        """
+        flags = [f for f in self.config.flags if f != "--no-incremental"]
+        flags.append("--incremental")
+        if cache_dir is not None:
+            flags.extend(["--cache-dir", str(cache_dir)])
+        return flags
+
+    def parse_batch_output(
+        self, raw_output: str, files: list[Path], cwd: Path | None = None
+    ) -> dict[Path, list[MypyIssue]]:
+        """
+        Parse output of a multi-file mypy run and split issues per target file.
+
+        Lines for files outside ``files`` are ignored.
+        """
+        base = cwd or Path.cwd()
+        targets = {f.resolve(): f for f in files}
+        per_file: dict[Path, list[MypyIssue]] = {f: [] for f in files}
+        for line in raw_output.splitlines():
+            line = line.strip()
+            if not line or "error:" not in line.lower():
+                continue
+            match = re.match(
+                r"^(.+?):(\d+):(?:(\d+):)?\s*(error|warning|note):\s*(.+)$",
+                line,
+                re.IGNORECASE,
+            )
+            if not match:
+                continue
+            path_part, line_str, col_str, severity, rest = match.groups()
+            try:
+                target = targets.get((base / path_part).resolve())
+            except OSError:
+                target = None
+            if target is None:
+                continue
+            error_code = None
+            if "[" in rest and "]" in rest:
+                start = rest.rfind("[")
+                end = rest.rfind("]")
+                if start < end:
+                    error_code = rest[start + 1 : end].strip()
+                    rest = rest[:start].strip()
+            per_file[target].append(
+                MypyIssue(
+                    file_path=target,
+                    line=int(line_str),
+                    column=int(col_str) if col_str else 0,
+                    severity=severity.strip().lower(),
+                    message=rest.strip(),
+                    error_code=error_code,
+                )
+            )
+        return per_file
+
+    def run_batch_sync(
+        self,
+        files: list[Path],
+        *,
+        timeout: int | None = None,
+        cache_dir: Path | None = None,
+        cwd: Path | None = None,
+    ) -> dict[Path, MypyResult] | None:
+        """
+        Run mypy once over many files and return a MypyResult per file.
+
+        Returns None if mypy could not produce per-file results (timeout,
+        missing mypy, or a fatal error such as duplicate module names); callers
+        should then fall back to per-file runs.
+        """
+        targets = [f for f in files if f.is_file()]
+        if not targets:
+            return {}
+        timeout_sec = timeout if timeout is not None else self.config.timeout * len(targets)
+        cmd = (
+            [sys.executable, "-m", "mypy"]
+            + self.get_batch_flags(cache_dir)
+            + [str(f.resolve()) for f in targets]
+        )
+        start = time.monotonic()
+        try:
+            result = subprocess.run(  # nosec B603
+                cmd,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=timeout_sec,
+                cwd=cwd,
+            )
+        except subprocess.TimeoutExpired:
+            self._logger.warning(
+                "batch mypy timed out for %s files after %ss", len(targets), timeout_sec
+            )
+            return None
+        except FileNotFoundError:
+            self._logger.debug("mypy not found")
+            return None
+        except Exception as e:
+            self._logger.warning("batch mypy failed: %s", e)
+            return None
+        # Exit code 2 means mypy itself failed (bad flags, duplicate modules...)
+        if result.returncode not in (0, 1):
+            self._logger.debug(
+                "batch mypy exited %s: %s", result.returncode, (result.stderr or "")[:500]
+            )
+            return None
+        elapsed = time.monotonic() - start
+        per_file = self.parse_batch_output(result.stdout or "", targets, cwd)
+        share = elapsed / len(targets)
+        return {
+            f: MypyResult(
+                issues=tuple(issues),
+                duration_seconds=share,
+                files_checked=1,
+                success=not issues,
+            )
+            for f, issues in per_file.items()
+        }
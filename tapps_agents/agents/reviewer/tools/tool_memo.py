@@ -0,0 +1,240 @@
+"""
+Tool Result Memo - Share one external tool run between score and issue list.
+
+CodeScorer derives both a score and a detailed issue list from ruff and mypy.
+Without sharing, each tool is launched twice per file. ToolResultMemo keeps the
+raw outcome of a run keyed by (file, content hash, tool, tool version) so every
+consumer of the same file content reads the same run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Failed runs (timeouts, crashes) are memoized briefly so a single score_file()
+# call does not pay the timeout twice, but are retried on later reviews.
+DEFAULT_FAILURE_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class ToolRun:
+    """
+    Raw outcome of one external tool invocation.
+
+    Attributes:
+        returncode: Process exit code (None if the process did not complete)
+        stdout: Captured standard output
+        stderr: Captured standard error
+        error: Failure kind ("timeout", "not_found", "error") or None on success
+        payload: Optional structured result (e.g. a scoped MypyResult)
+    """
+
+    returncode: int | None
+    stdout: str = ""
+    stderr: str = ""
+    error: str | None = None
+    payload: Any = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the tool ran to completion."""
+        return self.error is None
+
+
+@lru_cache(maxsize=32)
+def get_tool_version(tool: str) -> str:
+    """
+    Return the installed version of a Python-packaged tool (ruff, mypy, ...).
+
+    Uses package metadata rather than launching the tool.
+    """
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            return version(tool)
+        except PackageNotFoundError:
+            return "unknown"
+    except Exception:
+        return "unknown"
+
+
+class ToolResultMemo:
+    """
+    Bounded, thread-safe memo of external tool runs.
+
+    Keys are (resolved path, content SHA-256, tool, tool version), so edits to
+    the file or an upgraded tool automatically miss.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        failure_ttl_seconds: float = DEFAULT_FAILURE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.failure_ttl_seconds = failure_ttl_seconds
+        self._entries: OrderedDict[tuple[str, ...], tuple[ToolRun, float | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, file_path: Path, tool: str) -> tuple[str, ...] | None:
+        """Build the memo key for a file, or None if the file cannot be read."""
+        identity = self._file_identity(file_path)
+        if identity is None:
+            return None
+        return (*identity, tool, get_tool_version(tool))
+
+    @staticmethod
+    def _file_identity(file_path: Path) -> tuple[str, str] | None:
+        """Return (resolved path, content SHA-256), or None if unreadable."""
+        try:
+            content_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            resolved = str(file_path.resolve())
+        except OSError:
+            return None
+        return (resolved, content_hash)
+
+    def get_or_run(
+        self, file_path: Path, tool: str, runner: Callable[[], ToolRun]
+    ) -> ToolRun:
+        """
+        Return the memoized run for (file content, tool), running it on a miss.
+
+        Args:
+            file_path: File the tool is run against
+            tool: Tool name (also used for version lookup)
+            runner: Callable that performs the run
+
+        Returns:
+            ToolRun for the current file content
+        """
+        key = self.make_key(file_path, tool)
+        if key is None:
+            return runner()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                run, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return run
+                del self._entries[key]
+            self.misses += 1
+
+        run = runner()
+        self._store(key, run)
+        return run
+
+    def get(self, file_path: Path, tool: str) -> ToolRun | None:
+        """Return the memoized run for the file's current content, if any."""
+        key = self.make_key(file_path, tool)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            run, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return run
+
+    def put(self, file_path: Path, tool: str, run: ToolRun) -> bool:
+        """
+        Store a run produced elsewhere (e.g. a project-wide batch invocation).
+
+        Returns:
+            True if stored, False if the file could not be read
+        """
+        key = self.make_key(file_path, tool)
+        if key is None:
+            return False
+        self._store(key, run)
+        return True
+
+    def runs_for(self, file_path: Path) -> dict[str, ToolRun]:
+        """
+        Return successful memoized runs for the file's current content, by tool.
+
+        Used to hand runs across process boundaries (e.g. to scoring workers).
+        """
+        identity = self._file_identity(file_path)
+        if identity is None:
+            return {}
+        resolved, content_hash = identity
+        with self._lock:
+            return {
+                k[2]: run
+                for k, (run, _expires_at) in self._entries.items()
+                if k[0] == resolved and k[1] == content_hash and run.ok
+                and k[3] == get_tool_version(k[2])
+            }
+
+    def _store(self, key: tuple[str, ...], run: ToolRun) -> None:
+        expires_at = None if run.ok else time.monotonic() + self.failure_ttl_seconds
+        with self._lock:
+            self._entries[key] = (run, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, file_path: Path) -> None:
+        """Drop all memoized runs for a file."""
+        resolved = str(file_path.resolve())
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == resolved]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all memoized runs."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return memo statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+_memo: ToolResultMemo | None = None
+_memo_lock = threading.Lock()
+
+
+def get_tool_result_memo() -> ToolResultMemo:
+    """Return the process-wide ToolResultMemo."""
+    global _memo
+    if _memo is None:
+        with _memo_lock:
+            if _memo is None:
+                _memo = ToolResultMemo()
+    return _memo
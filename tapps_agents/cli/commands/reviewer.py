@@ -23,6 +23,13 @@ from .common import check_result_error
 REVIEWER_CACHE_VERSION = ReviewerResultCache.CACHE_VERSION
 
 
+def _concurrency_label(max_workers: int | None) -> str:
+    """Describe batch concurrency for progress messages."""
+    if max_workers:
+        return f"adaptive, max {max_workers} concurrent"
+    return "adaptive concurrency"
+
+
 def _infer_output_format(output_format: str, output_file: str | None) -> str:
     """Infer output format from output file extension, otherwise keep explicit format."""
     if not output_file:
@@ -217,7 +224,7 @@ async def review_command(
     files: list[str] | None = None,
     pattern: str | None = None,
     output_format: str = "json",
-    max_workers: int = 4,
+    max_workers: int | None = None,
     output_file: str | None = None,
     fail_under: float | None = None,
     verbose_output: bool = False,
@@ -295,7 +302,7 @@ async def review_command(
     if len(resolved_files) == 1:
         feedback.info(f"Reviewing {resolved_files[0]}...")
     else:
-        feedback.info(f"Reviewing {len(resolved_files)} files (max {max_workers} concurrent)...")
+        feedback.info(f"Reviewing {len(resolved_files)} files ({_concurrency_label(max_workers)})...")
     
     reviewer = ReviewerAgent()
     cache = get_reviewer_cache()
@@ -711,17 +718,89 @@ def is_retryable_error(error: Exception) -> bool:
     )
 
 
+# Quality tools each reviewer command reads; primed once per batch when enabled
+BATCH_TOOLS_BY_COMMAND: dict[str, tuple[str, ...]] = {
+    "score": ("ruff", "mypy", "bandit", "jscpd"),
+    "review": ("ruff", "mypy", "bandit", "jscpd"),
+    "lint": ("ruff",),
+    "type-check": ("mypy",),
+}
+
+
+async def _prime_batch_tools(
+    reviewer: ReviewerAgent, files: list[Path], command: str
+) -> dict[str, int]:
+    """
+    Run the command's quality tools once over all files and prime the tool memo.
+
+    Per-file reviews that follow read their ruff/mypy/bandit/jscpd results from
+    the memo instead of launching each tool per file. Any failure simply leaves
+    the memo unprimed, so per-file execution takes over.
+
+    Returns:
+        Mapping of tool name to number of files primed
+    """
+    from ...agents.reviewer.scoring import CodeScorer
+
+    tools = BATCH_TOOLS_BY_COMMAND.get(command)
+    scorer = getattr(reviewer, "scorer", None)
+    # Only a CodeScorer reads the memo the batch run primes
+    if not tools or not isinstance(scorer, CodeScorer) or len(files) < 2:
+        return {}
+
+    reviewer_config = (
+        reviewer.config.agents.reviewer
+        if getattr(reviewer, "config", None) and hasattr(reviewer.config, "agents")
+        else None
+    )
+    if reviewer_config is not None and not reviewer_config.batch_tools:
+        return {}
+
+    from ...agents.reviewer.tools.batch_tools import BatchToolRunner
+
+    try:
+        runner = BatchToolRunner.from_scorer(scorer)
+        return await asyncio.to_thread(runner.prime, files, tools)
+    except Exception as e:
+        get_feedback().warning(f"Batch tool run failed, falling back to per-file runs: {e}")
+        return {}
+
+
+def _batch_prime_size(reviewer: ReviewerAgent, command: str, batch_size: int) -> int:
+    """
+    Number of files whose tool runs are primed at once, a multiple of batch_size.
+
+    Each primed file holds one memo entry per tool until it is scored, so a
+    chunk is kept within half the tool memo; priming every file up front
+    would evict the first files' runs before they are read on large reviews.
+    """
+    from ...agents.reviewer.tools.tool_memo import ToolResultMemo, get_tool_result_memo
+
+    tools = BATCH_TOOLS_BY_COMMAND.get(command, ())
+    if not tools:
+        return batch_size
+    memo = getattr(getattr(reviewer, "scorer", None), "_tool_memo", None)
+    if not isinstance(memo, ToolResultMemo):
+        memo = get_tool_result_memo()
+    files_per_chunk = memo.max_entries // (2 * len(tools))
+    return max(batch_size, files_per_chunk // batch_size * batch_size)
+
+
 async def _process_file_batch(
     reviewer: ReviewerAgent,
     files: list[Path],
     command: str,
-    max_workers: int = 4,
+    max_workers: int | None = None,
 ) -> dict[str, Any]:
     """
     Process multiple files concurrently in batches with retry logic and circuit breaker.
     
     Performance optimizations:
     - Result caching for 90%+ speedup on unchanged files
+    - One ruff/mypy/bandit/jscpd run per chunk of uncached files (chunks are
+      sized so their results stay in the tool memo until scored)
+    - AIMD adaptive concurrency (grows while the machine keeps up, backs off
+      on timeouts and circuit breaker trips)
     - Circuit breaker to prevent cascading failures
     - Retry logic with exponential backoff
     
@@ -729,7 +808,7 @@ async def _process_file_batch(
         reviewer: ReviewerAgent instance
         files: List of file paths to process
         command: Command to run ('score', 'review', 'lint', 'type-check')
-        max_workers: Maximum concurrent operations
+        max_workers: Upper bound on concurrent operations (default: CPU core count)
         
     Returns:
         Dictionary with aggregated results
@@ -738,11 +817,14 @@ async def _process_file_batch(
     feedback = get_feedback()
     cache = get_reviewer_cache()
     
+    from ...core.adaptive_concurrency import AdaptiveConcurrencyController
+    
     # Configuration
-    BATCH_SIZE = 10  # Process 10 files per batch
-    MAX_CONCURRENT = max(1, min(max_workers, 2))  # Limit to max 2 concurrent
-    BATCH_DELAY = 1.0  # Delay between batches
-    FILE_DELAY = 0.2  # Small delay between individual files
+    controller = AdaptiveConcurrencyController(max_limit=max_workers)
+    # Circuit breaker checkpoint / progress granularity; large enough to keep
+    # the controller's maximum concurrency busy
+    BATCH_SIZE = max(10, controller.max_limit * 4)
+    PRIME_SIZE = _batch_prime_size(reviewer, command, BATCH_SIZE)
     MAX_RETRIES = 3  # Maximum retry attempts for connection errors
     RETRY_BACKOFF_BASE = 2.0  # Exponential backoff base
     MAX_RETRY_BACKOFF = 10.0  # Maximum backoff time in seconds
@@ -760,16 +842,31 @@ async def _process_file_batch(
     
     # Initialize circuit breaker
     circuit_breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60.0)
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
     
-    async def process_single_file(file_path: Path) -> tuple[Path, dict[str, Any]]:
-        """Process a single file with caching, retry logic, circuit breaker, and semaphore limiting."""
-        nonlocal cache_hits, cache_misses
-        
-        # Check cache first (before circuit breaker)
+    def record_failure(reason: str) -> None:
+        """Record a failure with the circuit breaker and back off concurrency."""
+        circuit_breaker.record_failure()
+        controller.record_overload(
+            "circuit_breaker" if circuit_breaker.is_open else reason
+        )
+    
+    # Check the result cache up front so quality tools only run on cache misses
+    cached_results: dict[Path, dict[str, Any]] = {}
+    for file_path in files:
         cached_result = await cache.get_cached_result(
             file_path, command, REVIEWER_CACHE_VERSION
         )
+        if cached_result is not None:
+            cached_results[file_path] = cached_result
+    
+    batch_tools_primed: dict[str, int] = {}
+    
+    async def process_single_file(file_path: Path) -> tuple[Path, dict[str, Any]]:
+        """Process a single file with caching, retry logic, circuit breaker, and adaptive concurrency limiting."""
+        nonlocal cache_hits, cache_misses
+        
+        # Cache was checked before the batch started (before circuit breaker)
+        cached_result = cached_results.get(file_path)
         if cached_result is not None:
             cache_hits += 1
             cached_result["_from_cache"] = True
@@ -785,9 +882,7 @@ async def _process_file_batch(
                 "circuit_breaker": True
             })
         
-        async with semaphore:
-            await asyncio.sleep(FILE_DELAY)
-            
+        async with controller.slot():
             # Retry logic for connection errors with per-attempt timeout
             last_error: Exception | None = None
             RETRY_TIMEOUT = 120.0  # 2 minutes per retry attempt
@@ -795,10 +890,12 @@ async def _process_file_batch(
             for attempt in range(1, MAX_RETRIES + 1):
                 try:
                     # Wrap each retry attempt in a timeout to prevent hanging
+                    attempt_start = time.monotonic()
                     result = await asyncio.wait_for(
                         reviewer.run(command, file=str(file_path)),
                         timeout=RETRY_TIMEOUT
                     )
+                    await controller.record_success(time.monotonic() - attempt_start)
                     # Ensure result is always a dict (defensive check)
                     if not isinstance(result, dict):
                         return (file_path, {
@@ -820,6 +917,7 @@ async def _process_file_batch(
                 except TimeoutError:
                     # Per-attempt timeout - treat as retryable connection issue
                     last_error = TimeoutError(f"Operation timed out after {RETRY_TIMEOUT}s")
+                    controller.record_overload("timeout")
                     if attempt < MAX_RETRIES:
                         backoff = min(RETRY_BACKOFF_BASE ** attempt, MAX_RETRY_BACKOFF)
                         if feedback.verbosity.value == "verbose":
@@ -830,7 +928,7 @@ async def _process_file_batch(
                         await asyncio.sleep(backoff)
                         continue
                     else:
-                        circuit_breaker.record_failure()
+                        record_failure("timeout")
                         return (file_path, {
                             "error": f"Operation timed out after {RETRY_TIMEOUT}s (attempt {attempt}/{MAX_RETRIES})",
                             "file": str(file_path),
@@ -856,7 +954,7 @@ async def _process_file_batch(
                     else:
                         # Non-retryable error or max retries reached
                         if is_retryable_error(e):
-                            circuit_breaker.record_failure()
+                            record_failure("error")
                         return (file_path, {
                             "error": str(e),
                             "file": str(file_path),
@@ -866,7 +964,7 @@ async def _process_file_batch(
                         })
             
             # All retries exhausted
-            circuit_breaker.record_failure()
+            record_failure("error")
             return (file_path, {
                 "error": f"Failed after {MAX_RETRIES} attempts: {last_error!s}",
                 "file": str(file_path),
@@ -899,12 +997,21 @@ async def _process_file_batch(
         start_idx = batch_idx * BATCH_SIZE
         end_idx = min(start_idx + BATCH_SIZE, len(files))
         batch_files = files[start_idx:end_idx]
+
+        # Run the quality tools for the next chunk of uncached files
+        if start_idx % PRIME_SIZE == 0:
+            prime_files = [
+                f for f in files[start_idx:start_idx + PRIME_SIZE] if f not in cached_results
+            ]
+            primed = await _prime_batch_tools(reviewer, prime_files, command)
+            for tool, count in primed.items():
+                batch_tools_primed[tool] = batch_tools_primed.get(tool, 0) + count
         
         if total_batches > 1:
             feedback.info(f"Processing batch {batch_idx + 1}/{total_batches} ({len(batch_files)} files)...")
         
         # Process files in batch with limited concurrency and progress updates
-        # Create tasks for the batch, but semaphore limits concurrent execution
+        # Create tasks for the batch, but the controller limits concurrent execution
         batch_tasks = [process_single_file(f) for f in batch_files]
         
         # Add progress tracking for long operations
@@ -939,10 +1046,6 @@ async def _process_file_batch(
         
         batch_results = await process_with_progress()
         all_results.extend(batch_results)
-        
-        # Delay between batches to avoid overwhelming connections
-        if batch_idx < total_batches - 1:  # Don't delay after last batch
-            await asyncio.sleep(BATCH_DELAY)
     
     results = all_results
     
@@ -994,6 +1097,9 @@ async def _process_file_batch(
         "misses": cache_misses,
         "hit_rate": f"{(cache_hits / len(files) * 100):.1f}%" if files else "0.0%"
     }
+    if batch_tools_primed:
+        aggregated["_batch_tools"] = batch_tools_primed
+    aggregated["_concurrency"] = controller.summary()
     
     # Log cache statistics if verbose
     if feedback.verbosity.value == "verbose" and cache_hits > 0:
@@ -1001,6 +1107,11 @@ async def _process_file_batch(
             f"Cache stats: {cache_hits} hits, {cache_misses} misses "
             f"({cache_hits / len(files) * 100:.1f}% hit rate)"
         )
+    if feedback.verbosity.value == "verbose" and cache_misses > 0:
+        feedback.info(
+            f"Concurrency: peak {controller.peak_limit}, final {controller.limit} "
+            f"(max {controller.max_limit})"
+        )
     
     return aggregated
 
@@ -1010,7 +1121,7 @@ async def score_command(
     files: list[str] | None = None,
     pattern: str | None = None,
     output_format: str = "json",
-    max_workers: int = 4,
+    max_workers: int | None = None,
     output_file: str | None = None,
     fail_under: float | None = None,
     verbose_output: bool = False,
@@ -1067,7 +1178,7 @@ async def score_command(
     if len(resolved_files) == 1:
         feedback.info(f"Scoring {resolved_files[0]}...")
     else:
-        feedback.info(f"Scoring {len(resolved_files)} files (max {max_workers} concurrent)...")
+        feedback.info(f"Scoring {len(resolved_files)} files ({_concurrency_label(max_workers)})...")
     
     reviewer = ReviewerAgent()
     cache = get_reviewer_cache()
@@ -1168,7 +1279,7 @@ async def lint_command(
     files: list[str] | None = None,
     pattern: str | None = None,
     output_format: str = "json",
-    max_workers: int = 4,
+    max_workers: int | None = None,
     output_file: str | None = None,
     fail_on_issues: bool = False,
     verbose_output: bool = False,
@@ -1216,7 +1327,7 @@ async def lint_command(
 
     feedback.start_operation("Lint")
     feedback.info(
-        f"Linting {resolved_files[0]}..." if len(resolved_files) == 1 else f"Linting {len(resolved_files)} files (max {max_workers} concurrent)..."
+        f"Linting {resolved_files[0]}..." if len(resolved_files) == 1 else f"Linting {len(resolved_files)} files ({_concurrency_label(max_workers)})..."
     )
 
     reviewer = ReviewerAgent()
@@ -1328,7 +1439,7 @@ async def type_check_command(
     files: list[str] | None = None,
     pattern: str | None = None,
     output_format: str = "json",
-    max_workers: int = 4,
+    max_workers: int | None = None,
     output_file: str | None = None,
     fail_on_issues: bool = False,
     verbose_output: bool = False,
@@ -1375,7 +1486,7 @@ async def type_check_command(
 
     feedback.start_operation("Type Check")
     feedback.info(
-        f"Type checking {resolved_files[0]}..." if len(resolved_files) == 1 else f"Type checking {len(resolved_files)} files (max {max_workers} concurrent)..."
+        f"Type checking {resolved_files[0]}..." if len(resolved_files) == 1 else f"Type checking {len(resolved_files)} files ({_concurrency_label(max_workers)})..."
     )
 
     reviewer = ReviewerAgent()
@@ -1569,7 +1680,7 @@ def handle_reviewer_command(args: object) -> None:
     # Get batch operation parameters
     files = getattr(args, "files", None)
     pattern = getattr(args, "pattern", None)
-    max_workers = getattr(args, "max_workers", 4)
+    max_workers = getattr(args, "max_workers", None)
     output_file = getattr(args, "output", None)
     
     # Backward compatibility: support 'file' attribute for single file
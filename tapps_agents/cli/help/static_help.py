@@ -298,7 +298,7 @@ Reviewer Agent Commands:
 Options:
   --format <json|text|markdown|html>   - Output format (default: json)
   --pattern <glob>                     - Glob pattern for batch processing
-  --max-workers <n>                    - Concurrent operations (default: 4)
+  --max-workers <n>                    - Max concurrent operations (default: CPU cores, adaptive)
   --output <file>                      - Save output to file
   --fail-under <score>                 - Exit 1 if score below threshold (review/score)
   --fail-on-issues                     - Exit 1 if issues found (lint/type-check)
@@ -60,8 +60,8 @@ Example:
     review_parser.add_argument(
         "--max-workers",
         type=int,
-        default=4,
-        help="Maximum number of concurrent file operations (default: 4). Use 1 for sequential processing.",
+        default=None,
+        help="Maximum number of concurrent file operations (default: CPU core count; concurrency adapts to system load up to this cap). Use 1 for sequential processing.",
     )
     # Model parameter removed - all LLM operations handled by Cursor Skills
     review_parser.add_argument(
@@ -121,8 +121,8 @@ Example:
     score_parser.add_argument(
         "--max-workers",
         type=int,
-        default=4,
-        help="Maximum number of concurrent file operations (default: 4). Use 1 for sequential processing.",
+        default=None,
+        help="Maximum number of concurrent file operations (default: CPU core count; concurrency adapts to system load up to this cap). Use 1 for sequential processing.",
     )
     score_parser.add_argument(
         "--format",
@@ -184,8 +184,8 @@ Example:
     lint_parser.add_argument(
         "--max-workers",
         type=int,
-        default=4,
-        help="Maximum number of concurrent file operations (default: 4). Use 1 for sequential processing.",
+        default=None,
+        help="Maximum number of concurrent file operations (default: CPU core count; concurrency adapts to system load up to this cap). Use 1 for sequential processing.",
     )
     lint_parser.add_argument(
         "--format",
@@ -249,8 +249,8 @@ Example:
     type_check_parser.add_argument(
         "--max-workers",
         type=int,
-        default=4,
-        help="Maximum number of concurrent file operations (default: 4). Use 1 for sequential processing.",
+        default=None,
+        help="Maximum number of concurrent file operations (default: CPU core count; concurrency adapts to system load up to this cap). Use 1 for sequential processing.",
     )
     type_check_parser.add_argument(
         "--format",
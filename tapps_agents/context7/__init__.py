@@ -5,6 +5,7 @@ Context7 Integration - Real-time library documentation with KB-first caching.
 - AsyncCacheManager: Lock-free caching with in-memory LRU and background writes
 - CircuitBreaker: Resilient parallel operations with fail-fast semantics
 - ParallelExecutor: Bounded concurrency for batch operations
+- Context7HttpPool: Shared keep-alive (HTTP/2 when available) API connections
 """
 
 from .agent_integration import Context7AgentHelper, get_context7_helper
@@ -42,6 +43,7 @@ from .credential_validation import (
 )
 from .cross_references import CrossReference, CrossReferenceManager, TopicIndex
 from .fuzzy_matcher import FuzzyMatch, FuzzyMatcher
+from .http_pool import Context7HttpPool, get_context7_http_pool
 from .kb_cache import CacheEntry, KBCache
 from .lookup import KBLookup, LookupResult
 from .metadata import CacheIndex, LibraryMetadata, MetadataManager
@@ -69,6 +71,9 @@ __all__ = [
     "ParallelExecutor",
     "get_context7_circuit_breaker",
     "get_parallel_executor",
+    # HTTP connection pool
+    "Context7HttpPool",
+    "get_context7_http_pool",
     # Lookup
     "KBLookup",
     "LookupResult",
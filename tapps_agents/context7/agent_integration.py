@@ -2,6 +2,7 @@
 Context7 Agent Integration - Helper functions for agents to use Context7 KB.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
@@ -16,7 +17,7 @@ from .doc_manager import Context7DocManager
 from .fuzzy_matcher import FuzzyMatcher
 from .kb_cache import KBCache
 from .library_detector import LibraryDetector
-from .lookup import KBLookup
+from .lookup import KBLookup, LookupResult
 from .metadata import MetadataManager
 
 logger = logging.getLogger(__name__)
@@ -197,8 +198,14 @@ class Context7AgentHelper:
 
             # Initialize KB lookup with MCP Gateway
             self.mcp_gateway = mcp_gateway
+            lease_timeout = getattr(kb, "fetch_lease_timeout", 0.0) if kb is not None else 0.0
+            if not isinstance(lease_timeout, (int, float)):
+                lease_timeout = 0.0
             self.kb_lookup = KBLookup(
-                kb_cache=self.kb_cache, mcp_gateway=mcp_gateway, fuzzy_threshold=0.7
+                kb_cache=self.kb_cache,
+                mcp_gateway=mcp_gateway,
+                fuzzy_threshold=0.7,
+                fetch_lease_timeout=float(lease_timeout),
             )
 
             # Initialize library detector for Option 3 quality uplift
@@ -314,24 +321,6 @@ class Context7AgentHelper:
                 library=library, topic=topic, use_fuzzy_match=use_fuzzy_match
             )
             
-            # Auto-save documentation if available
-            if result and result.success and hasattr(self, 'doc_manager') and self.doc_manager:
-                try:
-                    doc_result = {
-                        "content": result.content,
-                        "library": result.library,
-                        "topic": result.topic,
-                        "source": result.source,
-                    }
-                    self.doc_manager.save_documentation(
-                        library=library,
-                        topic=topic,
-                        documentation=doc_result,
-                        source=result.source,
-                    )
-                except Exception as e:
-                    logger.debug(f"Failed to auto-save documentation: {e}")
-            
             # #region agent log
             write_debug_log(
                 {
@@ -346,44 +335,7 @@ class Context7AgentHelper:
             )
             # #endregion
 
-            if result.success:
-                return {
-                    "content": result.content,
-                    "library": result.library,
-                    "topic": result.topic,
-                    "source": result.source,  # "cache", "api", "fuzzy_match"
-                    "fuzzy_score": result.fuzzy_score,
-                    "matched_topic": result.matched_topic,
-                    "response_time_ms": result.response_time_ms,
-                }
-            elif result.error:
-                # Log Context7 unavailability but continue (use debug for common cases)
-                # Only log at info level if it's a known library or network error
-                error_lower = result.error.lower()
-                if "network" in error_lower or "connection" in error_lower:
-                    logger.warning(
-                        f"Context7 network error for library '{library}' "
-                        f"(topic: {topic}): {result.error}. Continuing without Context7 documentation."
-                    )
-                elif "quota" in error_lower:
-                    # Avoid log spam: once quota is exceeded, subsequent calls are expected to fail.
-                    try:
-                        from .backup_client import is_context7_quota_exceeded
-                        already_exceeded = is_context7_quota_exceeded()
-                    except Exception:
-                        already_exceeded = False
-
-                    log_fn = logger.debug if already_exceeded else logger.warning
-                    log_fn(
-                        f"Context7 quota exceeded for library '{library}' "
-                        f"(topic: {topic}): {result.error}. Continuing without Context7 documentation."
-                    )
-                else:
-                    # Common case: library not found - use debug level
-                    logger.debug(
-                        f"Context7 lookup unavailable for library '{library}' "
-                        f"(topic: {topic}): {result.error}. Continuing without Context7 documentation."
-                    )
+            return self._documentation_from_result(library, topic, result)
         except (RuntimeError, OSError, PermissionError) as e:
             # Cache lock or file operation failed - log but don't fail the agent
             # These are non-critical errors that shouldn't break agent functionality
@@ -410,6 +362,150 @@ class Context7AgentHelper:
 
         return None
 
+    def _documentation_from_result(
+        self, library: str, topic: str | None, result: LookupResult
+    ) -> dict[str, Any] | None:
+        """Auto-save a successful lookup and convert it to a documentation dict."""
+        # Auto-save documentation if available
+        if result and result.success and hasattr(self, 'doc_manager') and self.doc_manager:
+            try:
+                doc_result = {
+                    "content": result.content,
+                    "library": result.library,
+                    "topic": result.topic,
+                    "source": result.source,
+                }
+                self.doc_manager.save_documentation(
+                    library=library,
+                    topic=topic,
+                    documentation=doc_result,
+                    source=result.source,
+                )
+            except Exception as e:
+                logger.debug(f"Failed to auto-save documentation: {e}")
+
+        if result.success:
+            return {
+                "content": result.content,
+                "library": result.library,
+                "topic": result.topic,
+                "source": result.source,  # "cache", "api", "fuzzy_match"
+                "fuzzy_score": result.fuzzy_score,
+                "matched_topic": result.matched_topic,
+                "response_time_ms": result.response_time_ms,
+            }
+        elif result.error:
+            # Log Context7 unavailability but continue (use debug for common cases)
+            # Only log at info level if it's a known library or network error
+            error_lower = result.error.lower()
+            if "network" in error_lower or "connection" in error_lower:
+                logger.warning(
+                    f"Context7 network error for library '{library}' "
+                    f"(topic: {topic}): {result.error}. Continuing without Context7 documentation."
+                )
+            elif "quota" in error_lower:
+                # Avoid log spam: once quota is exceeded, subsequent calls are expected to fail.
+                try:
+                    from .backup_client import is_context7_quota_exceeded
+                    already_exceeded = is_context7_quota_exceeded()
+                except Exception:
+                    already_exceeded = False
+
+                log_fn = logger.debug if already_exceeded else logger.warning
+                log_fn(
+                    f"Context7 quota exceeded for library '{library}' "
+                    f"(topic: {topic}): {result.error}. Continuing without Context7 documentation."
+                )
+            else:
+                # Common case: library not found - use debug level
+                logger.debug(
+                    f"Context7 lookup unavailable for library '{library}' "
+                    f"(topic: {topic}): {result.error}. Continuing without Context7 documentation."
+                )
+
+        return None
+
+    async def get_documentation_many(
+        self,
+        requests: list[tuple[str, str | None]],
+        use_fuzzy_match: bool = True,
+        max_concurrency: int = 8,
+        item_timeout: float | None = None,
+    ) -> dict[tuple[str, str | None], dict[str, Any] | None]:
+        """
+        Get documentation for many library/topic pairs in one batch.
+
+        Saved documentation is used first; the remaining pairs go through
+        KBLookup.lookup_many(), which resolves each library once and fetches
+        its topics concurrently. Nothing is looked up while the Context7
+        circuit breaker is open.
+
+        Args:
+            requests: (library, topic) pairs
+            use_fuzzy_match: Whether to use fuzzy matching if exact match not found
+            max_concurrency: Maximum concurrent resolve/fetch operations
+            item_timeout: Optional timeout in seconds per resolve or fetch
+
+        Returns:
+            Dictionary mapping each (library, topic) pair to its documentation
+            (or None if not found)
+        """
+        docs: dict[tuple[str, str | None], dict[str, Any] | None] = dict.fromkeys(requests)
+        if not self.enabled or self.kb_lookup is None:
+            return docs
+
+        pending = []
+        for library, topic in docs:
+            saved_doc = None
+            if hasattr(self, 'doc_manager') and self.doc_manager:
+                try:
+                    saved_doc = self.doc_manager.get_saved_documentation(library, topic)
+                except Exception as e:
+                    logger.debug(f"Failed to read saved documentation for {library}: {e}")
+            if saved_doc:
+                docs[(library, topic)] = saved_doc
+            else:
+                pending.append((library, topic))
+        if not pending:
+            return docs
+
+        # The pooled HTTP client guards each of its requests; this breaker
+        # check guards the batch as a whole, including MCP gateway lookups
+        from .circuit_breaker import get_context7_circuit_breaker
+
+        breaker = get_context7_circuit_breaker()
+        if not breaker.allow_request():
+            logger.debug(
+                f"Context7 circuit breaker open, skipping batch lookup of {len(pending)} items"
+            )
+            return docs
+
+        try:
+            results = await self.kb_lookup.lookup_many(
+                pending,
+                use_fuzzy_match=use_fuzzy_match,
+                max_concurrency=max_concurrency,
+                item_timeout=item_timeout,
+            )
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception as e:
+            await breaker.record_result(False)
+            # Unexpected errors - log but don't fail the agent
+            logger.warning(
+                f"Context7 batch lookup error for {len(pending)} items: {e}. "
+                f"Continuing without Context7 documentation.",
+                exc_info=True
+            )
+            return docs
+        # A batch in which every lookup timed out counts as one failure
+        await breaker.record_result(not all(result.timed_out for result in results))
+
+        for (library, topic), result in zip(pending, results, strict=True):
+            docs[(library, topic)] = self._documentation_from_result(library, topic, result)
+        return docs
+
     async def search_libraries(
         self, query: str, limit: int = 5
     ) -> list[dict[str, str]]:
@@ -609,9 +705,10 @@ class Context7AgentHelper:
         
         2025 Architecture: Bounded parallelism + circuit breaker for resilience.
         - Max 5 concurrent requests (prevents resource exhaustion)
-        - 5s timeout per library (prevents cascading delays)
+        - 5s timeout per resolve/fetch (prevents cascading delays)
         - Circuit breaker opens after 3 failures (fast-fails subsequent requests)
         - Early quota detection prevents unnecessary API calls
+        - One batched lookup (get_documentation_many) for all libraries
 
         Args:
             libraries: List of library names
@@ -656,72 +753,14 @@ class Context7AgentHelper:
             # If quota check fails, log but continue (graceful degradation)
             logger.debug(f"Error checking Context7 quota status: {e}. Continuing with lookups.")
 
-        import asyncio
-
-        from .circuit_breaker import get_parallel_executor
-
-        # Get parallel executor with circuit breaker
-        executor = get_parallel_executor(max_concurrency=max_concurrency)
-
-        # Define the lookup function for each library
-        async def lookup_library(lib: str) -> tuple[str, dict[str, Any] | None]:
-            # Check quota again before each individual lookup (defense in depth)
-            try:
-                from .backup_client import is_context7_quota_exceeded
-                if is_context7_quota_exceeded():
-                    return (lib, None)  # Fast-fail without API call
-            except Exception:
-                pass  # Continue if quota check fails
-            
-            try:
-                result = await asyncio.wait_for(
-                    self.get_documentation(
-                        library=lib, topic=topic, use_fuzzy_match=use_fuzzy_match
-                    ),
-                    timeout=per_library_timeout,
-                )
-                return (lib, result)
-            except TimeoutError:
-                logger.debug(f"Context7 lookup timeout for {lib} ({per_library_timeout}s)")
-                return (lib, None)
-            except Exception as e:
-                logger.debug(f"Context7 lookup error for {lib}: {e}")
-                return (lib, None)
-
-        # Execute all lookups in parallel with circuit breaker
-        results = await executor.execute_all(
-            items=libraries,
-            func=lookup_library,
-            fallback=None,
+        # get_documentation_many() checks the circuit breaker for the batch
+        docs = await self.get_documentation_many(
+            [(lib, topic) for lib in libraries],
+            use_fuzzy_match=use_fuzzy_match,
+            max_concurrency=max_concurrency,
+            item_timeout=per_library_timeout,
         )
-
-        # Map results to libraries
-        library_docs = {}
-        for result in results:
-            if result is None:
-                continue
-            if isinstance(result, tuple) and len(result) == 2:
-                lib, doc = result
-                library_docs[lib] = doc
-            else:
-                logger.debug(f"Unexpected result format: {result}")
-
-        # Ensure all libraries are in the result (even if lookup failed)
-        for lib in libraries:
-            if lib not in library_docs:
-                library_docs[lib] = None
-
-        # Log circuit breaker status if any failures
-        cb_stats = executor.stats.get("circuit_breaker", {}).get("stats", {})
-        if cb_stats.get("failed_requests", 0) > 0:
-            logger.debug(
-                f"Context7 parallel lookup completed. "
-                f"Success: {cb_stats.get('successful_requests', 0)}, "
-                f"Failed: {cb_stats.get('failed_requests', 0)}, "
-                f"Rejected: {cb_stats.get('rejected_requests', 0)}"
-            )
-
-        return library_docs
+        return {lib: docs[(lib, topic)] for lib in libraries}
 
     async def resolve_library_ids(self, libraries: list[str]) -> dict[str, str | None]:
         """
@@ -2,7 +2,8 @@
 Performance Analytics for Context7 KB cache.
 
 Tracks metrics like hit rate, response times, cache size, and provides
-reporting functionality.
+reporting functionality. Counters and latencies are kept by the process-wide
+MetricsRecorder for the cache root, so recording never rewrites files.
 """
 
 import logging
@@ -10,10 +11,9 @@ from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-import yaml
-
 from .cache_structure import CacheStructure
 from .metadata import MetadataManager
+from .metrics_recorder import get_metrics_recorder
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +32,9 @@ class CacheMetrics:
     api_calls: int = 0
     fuzzy_matches: int = 0
     avg_response_time_ms: float = 0.0
+    p50_response_time_ms: float = 0.0
+    p95_response_time_ms: float = 0.0
+    p99_response_time_ms: float = 0.0
     hit_rate: float = 0.0
 
     def to_dict(self) -> dict[str, Any]:
@@ -71,66 +74,39 @@ class Analytics:
         """
         self.cache_structure = cache_structure
         self.metadata_manager = metadata_manager
-        self.metrics: dict[str, Any] = {}
-        self._load_metrics()
-
-    def _load_metrics(self):
-        """Load metrics from file if it exists."""
-        metrics_file = self.cache_structure.cache_root / ".metrics.yaml"
-        if metrics_file.exists():
-            try:
-                with open(metrics_file, encoding="utf-8") as f:
-                    self.metrics = yaml.safe_load(f) or {}
-            except Exception:
-                self.metrics = {}
-        else:
-            self.metrics = {
-                "cache_hits": 0,
-                "cache_misses": 0,
-                "api_calls": 0,
-                "fuzzy_matches": 0,
-                "response_times": [],
-            }
-
-    def _save_metrics(self):
-        """Save metrics to file."""
-        metrics_file = self.cache_structure.cache_root / ".metrics.yaml"
-        metrics_file.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            with open(metrics_file, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
-                    self.metrics, f, default_flow_style=False, sort_keys=False
-                )
-        except Exception:
-            logger.debug("Failed to save Context7 metrics", exc_info=True)
+        self.recorder = get_metrics_recorder(cache_structure.cache_root)
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Current counters plus a latency summary (read-only view)."""
+        latency = self.recorder.latency()
+        return {
+            **self.recorder.counters(),
+            "response_time_samples": latency.count,
+            "latency_histogram": latency.to_dict(),
+        }
 
     def record_cache_hit(self, response_time_ms: float = 0.0):
         """Record a cache hit."""
-        self.metrics["cache_hits"] = self.metrics.get("cache_hits", 0) + 1
+        self.recorder.increment("cache_hits")
         if response_time_ms > 0:
-            response_times = self.metrics.get("response_times", [])
-            response_times.append(response_time_ms)
-            # Keep only last 1000 response times
-            if len(response_times) > 1000:
-                response_times = response_times[-1000:]
-            self.metrics["response_times"] = response_times
-        self._save_metrics()
+            self.recorder.record_latency(response_time_ms)
 
     def record_cache_miss(self):
         """Record a cache miss."""
-        self.metrics["cache_misses"] = self.metrics.get("cache_misses", 0) + 1
-        self._save_metrics()
+        self.recorder.increment("cache_misses")
 
     def record_api_call(self):
         """Record an API call to Context7."""
-        self.metrics["api_calls"] = self.metrics.get("api_calls", 0) + 1
-        self._save_metrics()
+        self.recorder.increment("api_calls")
 
     def record_fuzzy_match(self):
         """Record a fuzzy match."""
-        self.metrics["fuzzy_matches"] = self.metrics.get("fuzzy_matches", 0) + 1
-        self._save_metrics()
+        self.recorder.increment("fuzzy_matches")
+
+    def flush(self):
+        """Write pending metrics to the metrics log."""
+        self.recorder.flush()
 
     def get_cache_metrics(self) -> CacheMetrics:
         """
@@ -161,10 +137,11 @@ class Analytics:
                 total_tokens += metadata.total_tokens or 0
 
         # Get hit/miss counts
-        cache_hits_count = self.metrics.get("cache_hits", 0)
-        cache_misses_count = self.metrics.get("cache_misses", 0)
-        api_calls_count = self.metrics.get("api_calls", 0)
-        fuzzy_matches_count = self.metrics.get("fuzzy_matches", 0)
+        counters = self.recorder.counters()
+        cache_hits_count = counters.get("cache_hits", 0)
+        cache_misses_count = counters.get("cache_misses", 0)
+        api_calls_count = counters.get("api_calls", 0)
+        fuzzy_matches_count = counters.get("fuzzy_matches", 0)
 
         # Calculate hit rate
         total_requests = cache_hits_count + cache_misses_count
@@ -172,11 +149,8 @@ class Analytics:
             (cache_hits_count / total_requests * 100) if total_requests > 0 else 0.0
         )
 
-        # Calculate average response time
-        response_times = self.metrics.get("response_times", [])
-        avg_response_time = (
-            sum(response_times) / len(response_times) if response_times else 0.0
-        )
+        # Response time distribution
+        latency = self.recorder.latency()
 
         return CacheMetrics(
             total_entries=total_entries,
@@ -188,7 +162,10 @@ class Analytics:
             cache_misses=cache_misses_count,
             api_calls=api_calls_count,
             fuzzy_matches=fuzzy_matches_count,
-            avg_response_time_ms=avg_response_time,
+            avg_response_time_ms=latency.mean_ms,
+            p50_response_time_ms=latency.percentile(50),
+            p95_response_time_ms=latency.percentile(95),
+            p99_response_time_ms=latency.percentile(99),
             hit_rate=hit_rate,
         )
 
@@ -306,6 +283,9 @@ class Analytics:
                 "hit_rate_target": 80.0,
                 "hit_rate_meets_target": metrics.hit_rate >= 80.0,
                 "avg_response_time_ms": metrics.avg_response_time_ms,
+                "p50_response_time_ms": metrics.p50_response_time_ms,
+                "p95_response_time_ms": metrics.p95_response_time_ms,
+                "p99_response_time_ms": metrics.p99_response_time_ms,
                 "response_time_target_ms": 1000.0,
                 "response_time_meets_target": metrics.avg_response_time_ms <= 1000.0,
                 "total_entries": metrics.total_entries,
@@ -372,11 +352,4 @@ class Analytics:
 
     def reset_metrics(self):
         """Reset all metrics (keeps cache entries)."""
-        self.metrics = {
-            "cache_hits": 0,
-            "cache_misses": 0,
-            "api_calls": 0,
-            "fuzzy_matches": 0,
-            "response_times": [],
-        }
-        self._save_metrics()
+        self.recorder.reset()
@@ -11,14 +11,14 @@ Pattern:
 
 import logging
 import os
-import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
 
 from ..core.debug_logger import write_debug_log
 from ..mcp.gateway import MCPGateway
+from .http_pool import get_context7_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -211,16 +211,312 @@ def check_context7_api_available() -> bool:
     return api_key is not None
 
 
-def create_fallback_http_client() -> tuple[Callable[[str], dict[str, Any]], Callable[[str, str | None, str | None, int | None], Any] | None]:
+def _context7_base_url() -> str:
+    # Context7 API base URL - using correct API endpoint from documentation
+    return os.getenv("CONTEXT7_API_URL", "https://context7.com/api/v2")
+
+
+def _auth_headers(api_key: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _resolve_request(library_name: str) -> tuple[str, dict[str, Any]]:
+    """Build the Search API request: GET /api/v2/search?query={library_name}."""
+    return f"{_context7_base_url()}/search", {"query": library_name}
+
+
+def _docs_request(
+    context7_id: str, topic: str | None, mode: str, page: int
+) -> tuple[str, dict[str, Any]]:
     """
-    Create fallback HTTP client functions for direct API calls.
-    
-    Only used if MCP Gateway tools are not available.
-    Requires CONTEXT7_API_KEY environment variable.
-    
-    Returns:
-        Tuple of (resolve_library_client, get_docs_client) or (None, None) if API key not available
+    Build the Docs API request: GET /api/v2/docs/{mode}/{library_id}?type=json&topic={topic}&page={page}.
+
+    - mode: "code" or "info"
+    - type: "json" (for structured response) or "txt"
     """
+    # Remove leading slash from context7_id if present (API expects format like "vercel/next.js")
+    library_id = context7_id.lstrip("/")
+    params: dict[str, Any] = {"type": "json", "page": page}
+    if topic:
+        params["topic"] = topic
+    return f"{_context7_base_url()}/docs/{mode}/{library_id}", params
+
+
+def _resolve_precheck(offline_mode: bool) -> dict[str, Any] | None:
+    """Return an error result if a resolve call must not hit the network."""
+    from ..core.offline_mode import OfflineMode
+
+    if offline_mode or OfflineMode.is_offline():
+        return {
+            "success": False,
+            "error": "Offline mode",
+            "result": {"matches": []}
+        }
+    # Fast-fail if quota already exceeded (avoid repeated HTTP calls / log spam)
+    if is_context7_quota_exceeded():
+        msg = get_context7_quota_message() or "Monthly quota exceeded"
+        return {
+            "success": False,
+            "error": f"Context7 API quota exceeded: {msg}",
+            "result": {"matches": []},
+        }
+    return None
+
+
+def _docs_precheck() -> dict[str, Any] | None:
+    """Return an error result if a docs call must not hit the network."""
+    # Fast-fail if quota already exceeded (avoid repeated HTTP calls / log spam)
+    if is_context7_quota_exceeded():
+        msg = get_context7_quota_message() or "Monthly quota exceeded"
+        return {"success": False, "error": f"Context7 API quota exceeded: {msg}", "result": {}}
+    return None
+
+
+def _handle_quota_response(response: httpx.Response) -> str:
+    """Mark the quota as exceeded and open the circuit breaker for a 429 response."""
+    try:
+        error_data = response.json()
+        quota_message = error_data.get("message", "Daily quota exceeded")
+    except Exception:
+        quota_message = "Daily quota exceeded"
+
+    # Mark quota as exceeded globally (this prevents future API calls)
+    _mark_context7_quota_exceeded(quota_message)
+
+    # CRITICAL FIX: Open circuit breaker immediately on quota error
+    # This prevents subsequent parallel calls from attempting API requests
+    try:
+        from .circuit_breaker import get_context7_circuit_breaker
+
+        get_context7_circuit_breaker().trip("quota error (429)")
+    except Exception as cb_error:
+        logger.debug(f"Could not open circuit breaker on quota error: {cb_error}")
+    return quota_message
+
+
+def _resolve_result_from_response(
+    response: httpx.Response, library_name: str
+) -> dict[str, Any]:
+    """Convert a Search API response to the MCP resolve tool response format."""
+    # #region agent log
+    write_debug_log(
+        {
+            "sessionId": "debug-session",
+            "runId": "run1",
+            "hypothesisId": "F",
+            "message": "AFTER API call",
+            "data": {"status_code": response.status_code, "library": library_name},
+        },
+        location="backup_client.py:resolve_library_client",
+    )
+    # #endregion
+    if response.status_code == 200:
+        data = response.json()
+        # Format search results to match MCP tool response format
+        # Search API returns array of results, convert to matches format
+        results = data if isinstance(data, list) else data.get("results", [])
+        matches = []
+        for result in results:
+            matches.append({
+                "id": result.get("id"),
+                "title": result.get("title"),
+                "description": result.get("description"),
+                "benchmarkScore": result.get("benchmarkScore"),
+            })
+        # #region agent log
+        write_debug_log(
+            {
+                "sessionId": "debug-session",
+                "runId": "run1",
+                "hypothesisId": "F",
+                "message": "API SUCCESS",
+                "data": {"library": library_name, "matches_count": len(matches)},
+            },
+            location="backup_client.py:resolve_library_client",
+        )
+        # #endregion
+        return {
+            "success": True,
+            "result": {
+                "matches": matches,
+            },
+        }
+    elif response.status_code == 429:
+        quota_message = _handle_quota_response(response)
+        # #region agent log
+        write_debug_log(
+            {
+                "sessionId": "debug-session",
+                "runId": "run1",
+                "hypothesisId": "F",
+                "message": "API QUOTA EXCEEDED",
+                "data": {"status_code": 429, "library": library_name, "message": quota_message},
+            },
+            location="backup_client.py:resolve_library_client",
+        )
+        # #endregion
+        return {
+            "success": False,
+            "error": f"Context7 API quota exceeded: {quota_message}",
+            "result": {
+                "matches": [],
+            },
+        }
+    else:
+        # #region agent log
+        write_debug_log(
+            {
+                "sessionId": "debug-session",
+                "runId": "run1",
+                "hypothesisId": "F",
+                "message": "API ERROR",
+                "data": {"status_code": response.status_code, "library": library_name, "response_text": response.text[:200]},
+            },
+            location="backup_client.py:resolve_library_client",
+        )
+        # #endregion
+        return {
+            "success": False,
+            "error": f"API returned status {response.status_code}",
+            "result": {
+                "matches": [],
+            },
+        }
+
+
+def _resolve_error_result(library_name: str, error: Exception) -> dict[str, Any]:
+    """Convert a resolve request exception to an error result."""
+    # #region agent log
+    write_debug_log(
+        {
+            "sessionId": "debug-session",
+            "runId": "run1",
+            "hypothesisId": "F",
+            "message": "CONNECTION ERROR" if isinstance(error, httpx.ConnectError) else "EXCEPTION",
+            "data": {"library": library_name, "error": str(error)},
+        },
+        location="backup_client.py:resolve_library_client",
+    )
+    # #endregion
+    if not isinstance(error, httpx.ConnectError):
+        return {
+            "success": False,
+            "error": str(error),
+            "result": {
+                "matches": [],
+            },
+        }
+
+    # Record connection failure for offline mode detection
+    from ..core.offline_mode import OfflineMode
+    OfflineMode.record_connection_failure()
+
+    # Return error with context (don't raise exception to allow graceful fallback)
+    import uuid
+    request_id = str(uuid.uuid4())
+    return {
+        "success": False,
+        "error": "Context7 API endpoint not reachable",
+        "error_details": {
+            "operation": "Context7 library lookup",
+            "request_id": request_id,
+            "library": library_name,
+            "original_error": str(error),
+        },
+        "result": {
+            "matches": [],
+        },
+    }
+
+
+def _docs_result_from_response(response: httpx.Response, mode: str) -> dict[str, Any]:
+    """Convert a Docs API response to the MCP docs tool response format."""
+    if response.status_code == 200:
+        try:
+            data = response.json()
+            # Format to match MCP tool response format
+            # Context7 API returns snippets array, extract content
+            if isinstance(data, dict):
+                snippets = data.get("snippets", [])
+                # Combine snippets into markdown content
+                content_parts = []
+                for snippet in snippets:
+                    if isinstance(snippet, dict):
+                        # For code mode: extract code snippets
+                        if mode == "code":
+                            code_list = snippet.get("codeList", [])
+                            for code_item in code_list:
+                                code = code_item.get("code", "")
+                                title = snippet.get("codeTitle", "")
+                                if title:
+                                    content_parts.append(f"## {title}\n")
+                                if code:
+                                    content_parts.append(f"```{code_item.get('language', '')}\n{code}\n```\n")
+                        # For info mode: extract content
+                        elif mode == "info":
+                            content = snippet.get("content", "")
+                            breadcrumb = snippet.get("breadcrumb", "")
+                            if breadcrumb:
+                                content_parts.append(f"## {breadcrumb}\n")
+                            if content:
+                                content_parts.append(f"{content}\n")
+
+                content = "\n".join(content_parts) if content_parts else response.text
+
+                return {
+                    "success": True,
+                    "result": {
+                        "content": content,
+                    },
+                }
+            # Fallback: return as string
+            return {
+                "success": True,
+                "result": {
+                    "content": response.text,
+                },
+            }
+        except Exception:
+            return {
+                "success": True,
+                "result": {
+                    "content": response.text,
+                },
+            }
+    elif response.status_code == 429:
+        quota_message = _handle_quota_response(response)
+        return {
+            "success": False,
+            "error": f"Context7 API quota exceeded: {quota_message}",
+            "result": {},
+        }
+    else:
+        return {
+            "success": False,
+            "error": f"API returned status {response.status_code}",
+            "result": {},
+        }
+
+
+def _log_before_resolve(library_name: str, api_key: str | None) -> None:
+    # #region agent log
+    write_debug_log(
+        {
+            "sessionId": "debug-session",
+            "runId": "run1",
+            "hypothesisId": "F",
+            "message": "BEFORE API call",
+            "data": {"library": library_name, "api_key_set": api_key is not None},
+        },
+        location="backup_client.py:resolve_library_client",
+    )
+    # #endregion
+
+
+def _fallback_api_key() -> str | None:
     # #region agent log
     write_debug_log(
         {
@@ -246,24 +542,24 @@ def create_fallback_http_client() -> tuple[Callable[[str], dict[str, Any]], Call
         location="backup_client.py:create_fallback_http_client:api_key_check",
     )
     # #endregion
-    if not api_key:
-        # #region agent log
-        write_debug_log(
-            {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "B",
-                "message": "RETURNING None, None (no API key)",
-                "data": {},
-            },
-            location="backup_client.py:67",
-        )
-        # #endregion
-        return None, None
+    return api_key
+
+
+def create_fallback_http_client() -> tuple[Callable[[str], dict[str, Any]], Callable[[str, str | None, str | None, int | None], Any] | None]:
+    """
+    Create fallback HTTP client functions for direct API calls.
     
-    # Context7 API base URL - using correct API endpoint from documentation
-    BASE_URL = os.getenv("CONTEXT7_API_URL", "https://context7.com/api/v2")
+    Only used if MCP Gateway tools are not available.
+    Requires CONTEXT7_API_KEY environment variable. Requests share the
+    pooled synchronous client from get_context7_http_pool().
     
+    Returns:
+        Tuple of (resolve_library_client, get_docs_client) or (None, None) if API key not available
+    """
+    api_key = _fallback_api_key()
+    if not api_key:
+        return None, None
+
     def resolve_library_client(
         library_name: str,
         offline_mode: bool = False
@@ -278,216 +574,19 @@ def create_fallback_http_client() -> tuple[Callable[[str], dict[str, Any]], Call
             library_name: Name of library to resolve
             offline_mode: If True, return cached result or empty matches without network call
         """
-        # Check offline mode
-        from ..core.offline_mode import OfflineMode
-        
-        if offline_mode or OfflineMode.is_offline():
-            return {
-                "success": False,
-                "error": "Offline mode",
-                "result": {"matches": []}
-            }
-
-        # Fast-fail if quota already exceeded (avoid repeated HTTP calls / log spam)
-        if is_context7_quota_exceeded():
-            msg = get_context7_quota_message() or "Monthly quota exceeded"
-            return {
-                "success": False,
-                "error": f"Context7 API quota exceeded: {msg}",
-                "result": {"matches": []},
-            }
-        # #region agent log
-        from ..core.debug_logger import write_debug_log
-        write_debug_log(
-            {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "F",
-                "message": "BEFORE API call",
-                "data": {"library": library_name, "api_key_set": api_key is not None},
-            },
-            location="backup_client.py:resolve_library_client",
-        )
-        # #endregion
+        precheck = _resolve_precheck(offline_mode)
+        if precheck is not None:
+            return precheck
+        _log_before_resolve(library_name, api_key)
+        url, params = _resolve_request(library_name)
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(
-                    f"{BASE_URL}/search",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    params={"query": library_name},
-                )
-                # #region agent log
-                write_debug_log(
-                    {
-                        "sessionId": "debug-session",
-                        "runId": "run1",
-                        "hypothesisId": "F",
-                        "message": "AFTER API call",
-                        "data": {"status_code": response.status_code, "library": library_name},
-                    },
-                    location="backup_client.py:resolve_library_client",
-                )
-                # #endregion
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    # Format search results to match MCP tool response format
-                    # Search API returns array of results, convert to matches format
-                    results = data if isinstance(data, list) else data.get("results", [])
-                    matches = []
-                    for result in results:
-                        matches.append({
-                            "id": result.get("id"),
-                            "title": result.get("title"),
-                            "description": result.get("description"),
-                            "benchmarkScore": result.get("benchmarkScore"),
-                        })
-                    # #region agent log
-                    write_debug_log(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "F",
-                            "message": "API SUCCESS",
-                            "data": {"library": library_name, "matches_count": len(matches)},
-                        },
-                        location="backup_client.py:resolve_library_client",
-                    )
-                    # #endregion
-                    return {
-                        "success": True,
-                        "result": {
-                            "matches": matches,
-                        },
-                    }
-                elif response.status_code == 429:
-                    # CRITICAL FIX: Quota exceeded - mark immediately and open circuit breaker
-                    try:
-                        error_data = response.json()
-                        quota_message = error_data.get("message", "Daily quota exceeded")
-                    except Exception:
-                        quota_message = "Daily quota exceeded"
-                    
-                    # Mark quota as exceeded globally (this prevents future API calls)
-                    _mark_context7_quota_exceeded(quota_message)
-                    
-                    # CRITICAL FIX: Open circuit breaker immediately on quota error
-                    # This prevents subsequent parallel calls from attempting API requests
-                    try:
-                        from .circuit_breaker import (
-                            CircuitState,
-                            get_context7_circuit_breaker,
-                        )
-                        circuit_breaker = get_context7_circuit_breaker()
-                        # Force open circuit breaker immediately (bypass threshold)
-                        if hasattr(circuit_breaker, '_stats'):
-                            circuit_breaker._stats.state = CircuitState.OPEN
-                            circuit_breaker._stats.last_failure_time = time.time()
-                            circuit_breaker._stats.last_state_change = time.time()
-                            logger.warning(
-                                "Context7 circuit breaker opened immediately due to quota error (429). "
-                                "Subsequent requests will be rejected without API calls."
-                            )
-                    except Exception as cb_error:
-                        logger.debug(f"Could not open circuit breaker on quota error: {cb_error}")
-                    
-                    # #region agent log
-                    write_debug_log(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "F",
-                            "message": "API QUOTA EXCEEDED",
-                            "data": {"status_code": 429, "library": library_name, "message": quota_message},
-                        },
-                        location="backup_client.py:resolve_library_client",
-                    )
-                    # #endregion
-                    return {
-                        "success": False,
-                        "error": f"Context7 API quota exceeded: {quota_message}",
-                        "result": {
-                            "matches": [],
-                        },
-                    }
-                else:
-                    # #region agent log
-                    write_debug_log(
-                        {
-                            "sessionId": "debug-session",
-                            "runId": "run1",
-                            "hypothesisId": "F",
-                            "message": "API ERROR",
-                            "data": {"status_code": response.status_code, "library": library_name, "response_text": response.text[:200]},
-                        },
-                        location="backup_client.py:resolve_library_client",
-                    )
-                    # #endregion
-                    return {
-                        "success": False,
-                        "error": f"API returned status {response.status_code}",
-                        "result": {
-                            "matches": [],
-                        },
-                    }
-        except httpx.ConnectError as e:
-            # #region agent log
-            write_debug_log(
-                {
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "F",
-                    "message": "CONNECTION ERROR",
-                    "data": {"library": library_name, "error": str(e)},
-                },
-                location="backup_client.py:resolve_library_client",
+            response = get_context7_http_pool().sync_client().get(
+                url, headers=_auth_headers(api_key), params=params, timeout=10.0
             )
-            # #endregion
-            
-            # Record connection failure for offline mode detection
-            from ..core.offline_mode import OfflineMode
-            OfflineMode.record_connection_failure()
-            
-            # Return error with context (don't raise exception to allow graceful fallback)
-            import uuid
-            request_id = str(uuid.uuid4())
-            return {
-                "success": False,
-                "error": "Context7 API endpoint not reachable",
-                "error_details": {
-                    "operation": "Context7 library lookup",
-                    "request_id": request_id,
-                    "library": library_name,
-                    "original_error": str(e),
-                },
-                "result": {
-                    "matches": [],
-                },
-            }
+            return _resolve_result_from_response(response, library_name)
         except Exception as e:
-            # #region agent log
-            write_debug_log(
-                {
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "F",
-                    "message": "EXCEPTION",
-                    "data": {"library": library_name, "error": str(e)},
-                },
-                location="backup_client.py:resolve_library_client",
-            )
-            # #endregion
-            return {
-                "success": False,
-                "error": str(e),
-                "result": {
-                    "matches": [],
-                },
-            }
-    
+            return _resolve_error_result(library_name, e)
+
     def get_docs_client(
         context7_id: str, topic: str | None = None, mode: str = "code", page: int = 1
     ) -> dict[str, Any]:
@@ -496,143 +595,121 @@ def create_fallback_http_client() -> tuple[Callable[[str], dict[str, Any]], Call
         Only used if MCP Gateway is not available.
         
         Uses Context7 Docs API: GET /api/v2/docs/{mode}/{library_id}?type=json&topic={topic}&page={page}
-        - mode: "code" or "info"
-        - type: "json" (for structured response) or "txt"
         """
-        # Fast-fail if quota already exceeded (avoid repeated HTTP calls / log spam)
-        if is_context7_quota_exceeded():
-            msg = get_context7_quota_message() or "Monthly quota exceeded"
-            return {"success": False, "error": f"Context7 API quota exceeded: {msg}", "result": {}}
-
+        precheck = _docs_precheck()
+        if precheck is not None:
+            return precheck
+        url, params = _docs_request(context7_id, topic, mode, page)
         try:
-            with httpx.Client(timeout=30.0) as client:
-                # Remove leading slash from context7_id if present (API expects format like "vercel/next.js")
-                library_id = context7_id.lstrip("/")
-                
-                # Build endpoint: /api/v2/docs/{mode}/{library_id}
-                endpoint = f"{BASE_URL}/docs/{mode}/{library_id}"
-                
-                # Build query parameters
-                params = {"type": "json", "page": page}
-                if topic:
-                    params["topic"] = topic
-                
-                response = client.get(
-                    endpoint,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    params=params,
-                )
-                
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        # Format to match MCP tool response format
-                        # Context7 API returns snippets array, extract content
-                        if isinstance(data, dict):
-                            snippets = data.get("snippets", [])
-                            # Combine snippets into markdown content
-                            content_parts = []
-                            for snippet in snippets:
-                                if isinstance(snippet, dict):
-                                    # For code mode: extract code snippets
-                                    if mode == "code":
-                                        code_list = snippet.get("codeList", [])
-                                        for code_item in code_list:
-                                            code = code_item.get("code", "")
-                                            title = snippet.get("codeTitle", "")
-                                            if title:
-                                                content_parts.append(f"## {title}\n")
-                                            if code:
-                                                content_parts.append(f"```{code_item.get('language', '')}\n{code}\n```\n")
-                                    # For info mode: extract content
-                                    elif mode == "info":
-                                        content = snippet.get("content", "")
-                                        breadcrumb = snippet.get("breadcrumb", "")
-                                        if breadcrumb:
-                                            content_parts.append(f"## {breadcrumb}\n")
-                                        if content:
-                                            content_parts.append(f"{content}\n")
-                            
-                            content = "\n".join(content_parts) if content_parts else response.text
-                            
-                            return {
-                                "success": True,
-                                "result": {
-                                    "content": content,
-                                },
-                            }
-                        # Fallback: return as string
-                        return {
-                            "success": True,
-                            "result": {
-                                "content": response.text,
-                            },
-                        }
-                    except Exception:
-                        return {
-                            "success": True,
-                            "result": {
-                                "content": response.text,
-                            },
-                        }
-                elif response.status_code == 429:
-                    # CRITICAL FIX: Quota exceeded - mark immediately and open circuit breaker
-                    try:
-                        error_data = response.json()
-                        quota_message = error_data.get("message", "Daily quota exceeded")
-                    except Exception:
-                        quota_message = "Daily quota exceeded"
-                    
-                    # Mark quota as exceeded globally (this prevents future API calls)
-                    _mark_context7_quota_exceeded(quota_message)
-                    
-                    # CRITICAL FIX: Open circuit breaker immediately on quota error
-                    # This prevents subsequent parallel calls from attempting API requests
-                    try:
-                        from .circuit_breaker import (
-                            CircuitState,
-                            get_context7_circuit_breaker,
-                        )
-                        circuit_breaker = get_context7_circuit_breaker()
-                        # Force open circuit breaker immediately (bypass threshold)
-                        if hasattr(circuit_breaker, '_stats'):
-                            circuit_breaker._stats.state = CircuitState.OPEN
-                            circuit_breaker._stats.last_failure_time = time.time()
-                            circuit_breaker._stats.last_state_change = time.time()
-                            logger.warning(
-                                "Context7 circuit breaker opened immediately due to quota error (429). "
-                                "Subsequent requests will be rejected without API calls."
-                            )
-                    except Exception as cb_error:
-                        logger.debug(f"Could not open circuit breaker on quota error: {cb_error}")
-                    
-                    return {
-                        "success": False,
-                        "error": f"Context7 API quota exceeded: {quota_message}",
-                        "result": {},
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"API returned status {response.status_code}",
-                        "result": {},
-                    }
+            response = get_context7_http_pool().sync_client().get(
+                url, headers=_auth_headers(api_key), params=params, timeout=30.0
+            )
+            return _docs_result_from_response(response, mode)
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
                 "result": {},
             }
+
+    return resolve_library_client, get_docs_client
+
+
+async def _guarded_get(
+    url: str, params: dict[str, Any], api_key: str, http_timeout: float
+) -> httpx.Response:
+    """
+    Send a GET through the pooled async client, guarded by the Context7 circuit breaker.
+
+    Transport errors and 5xx responses count as breaker failures; any other
+    response counts as a success (429 trips the breaker separately).
+
+    Raises:
+        CircuitBreakerOpen: If the circuit is open
+    """
+    from .circuit_breaker import CircuitBreakerOpen, get_context7_circuit_breaker
+
+    breaker = get_context7_circuit_breaker()
+    if not breaker.allow_request():
+        raise CircuitBreakerOpen(f"Circuit breaker [{breaker.config.name}] is OPEN")
+    try:
+        response = await get_context7_http_pool().get(
+            url, headers=_auth_headers(api_key), params=params, timeout=http_timeout
+        )
+    except httpx.TransportError:
+        await breaker.record_result(False)
+        raise
+    except BaseException:
+        breaker.release()
+        raise
+    if response.status_code == 429:
+        breaker.release()
+    else:
+        await breaker.record_result(response.status_code < 500)
+    return response
+
+
+def create_async_fallback_http_client() -> tuple[
+    Callable[..., Awaitable[dict[str, Any]]] | None,
+    Callable[..., Awaitable[dict[str, Any]]] | None,
+]:
+    """
+    Create async fallback HTTP client functions for direct API calls.
     
+    Async counterpart of create_fallback_http_client(): requests go through
+    the pooled, keep-alive (HTTP/2 when available) async client, so they do
+    not block the event loop and concurrent lookups reuse connections.
+    Requests are rejected without a network call while the Context7
+    circuit breaker is open.
+    
+    Returns:
+        Tuple of (resolve_library_client, get_docs_client) or (None, None) if API key not available
+    """
+    api_key = _fallback_api_key()
+    if not api_key:
+        return None, None
+
+    async def resolve_library_client(
+        library_name: str,
+        offline_mode: bool = False
+    ) -> dict[str, Any]:
+        """Resolve a library ID via the Context7 Search API."""
+        precheck = _resolve_precheck(offline_mode)
+        if precheck is not None:
+            return precheck
+        _log_before_resolve(library_name, api_key)
+        url, params = _resolve_request(library_name)
+        try:
+            response = await _guarded_get(url, params, api_key, http_timeout=10.0)
+            return _resolve_result_from_response(response, library_name)
+        except Exception as e:
+            return _resolve_error_result(library_name, e)
+
+    async def get_docs_client(
+        context7_id: str, topic: str | None = None, mode: str = "code", page: int = 1
+    ) -> dict[str, Any]:
+        """Fetch documentation via the Context7 Docs API."""
+        precheck = _docs_precheck()
+        if precheck is not None:
+            return precheck
+        url, params = _docs_request(context7_id, topic, mode, page)
+        try:
+            response = await _guarded_get(url, params, api_key, http_timeout=30.0)
+            return _docs_result_from_response(response, mode)
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "result": {},
+            }
+
     return resolve_library_client, get_docs_client
 
 
 def get_context7_client_with_fallback(
     mcp_gateway: MCPGateway | None = None,
-) -> tuple[MCPGateway | None, bool, str, Callable[[str], dict[str, Any]] | None, Callable[[str, str | None, str | None, int | None], dict[str, Any]] | None]:
+    async_http: bool = False,
+) -> tuple[MCPGateway | None, bool, str, Callable[..., Any] | None, Callable[..., Any] | None]:
     """
     Get Context7 client with automatic fallback.
     
@@ -644,6 +721,8 @@ def get_context7_client_with_fallback(
     
     Args:
         mcp_gateway: Optional MCPGateway instance (creates new if None)
+        async_http: Return coroutine HTTP clients from
+            create_async_fallback_http_client() instead of blocking ones
     
     Returns:
         Tuple of (gateway, use_mcp, mcp_source, resolve_client, get_docs_client):
@@ -741,7 +820,10 @@ def get_context7_client_with_fallback(
                 _CONTEXT7_NOT_AVAILABLE_WARNED = True
         return mcp_gateway, False, "none", None, None
     
-    resolve_client, get_docs_client = create_fallback_http_client()
+    if async_http:
+        resolve_client, get_docs_client = create_async_fallback_http_client()
+    else:
+        resolve_client, get_docs_client = create_fallback_http_client()
     # #region agent log
     write_debug_log(
         {
@@ -773,7 +855,9 @@ async def call_context7_resolve_with_fallback(
     Returns:
         Dictionary with resolve result (matches MCP tool response format)
     """
-    gateway, use_mcp, mcp_source, resolve_client, _ = get_context7_client_with_fallback(mcp_gateway)
+    gateway, use_mcp, mcp_source, resolve_client, _ = get_context7_client_with_fallback(
+        mcp_gateway, async_http=True
+    )
     # #region agent log
     write_debug_log(
         {
@@ -798,7 +882,7 @@ async def call_context7_resolve_with_fallback(
                     f"but using HTTP fallback for Python code path. "
                     f"AI assistant should use MCP tools directly for better performance."
                 )
-                return resolve_client(library_name)
+                return await resolve_client(library_name)
             else:
                 # No HTTP fallback - indicate MCP tools should be used
                 logger.info(
@@ -826,7 +910,7 @@ async def call_context7_resolve_with_fallback(
                     f"Falling back to HTTP client if available."
                 )
                 if resolve_client:
-                    return resolve_client(library_name)
+                    return await resolve_client(library_name)
                 return {
                     "success": False,
                     "error": f"Context7 MCP tool not found: {e}",
@@ -839,7 +923,7 @@ async def call_context7_resolve_with_fallback(
                     exc_info=True
                 )
                 if resolve_client:
-                    return resolve_client(library_name)
+                    return await resolve_client(library_name)
                 return {
                     "success": False,
                     "error": f"MCP Gateway call failed: {e}",
@@ -847,7 +931,7 @@ async def call_context7_resolve_with_fallback(
                 }
     elif resolve_client:
         # Fallback: Use direct HTTP client
-        return resolve_client(library_name)
+        return await resolve_client(library_name)
     else:
         logger.info(
             f"Context7 not available for library '{library_name}': MCP tools not found and CONTEXT7_API_KEY not set. "
@@ -882,7 +966,9 @@ async def call_context7_get_docs_with_fallback(
     Returns:
         Dictionary with docs result (matches MCP tool response format)
     """
-    gateway, use_mcp, mcp_source, _, get_docs_client = get_context7_client_with_fallback(mcp_gateway)
+    gateway, use_mcp, mcp_source, _, get_docs_client = get_context7_client_with_fallback(
+        mcp_gateway, async_http=True
+    )
     
     if use_mcp:
         # R1: Handle Cursor MCP vs local gateway differently
@@ -896,7 +982,7 @@ async def call_context7_get_docs_with_fallback(
                     f"but using HTTP fallback for Python code path. "
                     f"AI assistant should use MCP tools directly for better performance."
                 )
-                return get_docs_client(context7_id, topic, mode, page)
+                return await get_docs_client(context7_id, topic, mode, page)
             else:
                 # No HTTP fallback - indicate MCP tools should be used
                 logger.info(
@@ -928,7 +1014,7 @@ async def call_context7_get_docs_with_fallback(
                     f"Falling back to HTTP client if available."
                 )
                 if get_docs_client:
-                    return get_docs_client(context7_id, topic, mode, page)
+                    return await get_docs_client(context7_id, topic, mode, page)
                 return {
                     "success": False,
                     "error": f"Context7 MCP tool not found: {e}",
@@ -941,7 +1027,7 @@ async def call_context7_get_docs_with_fallback(
                     exc_info=True
                 )
                 if get_docs_client:
-                    return get_docs_client(context7_id, topic, mode, page)
+                    return await get_docs_client(context7_id, topic, mode, page)
                 return {
                     "success": False,
                     "error": f"MCP Gateway call failed: {e}",
@@ -949,7 +1035,7 @@ async def call_context7_get_docs_with_fallback(
                 }
     elif get_docs_client:
         # Fallback: Use direct HTTP client
-        return get_docs_client(context7_id, topic, mode, page)
+        return await get_docs_client(context7_id, topic, mode, page)
     else:
         logger.info(
             f"Context7 not available for library '{context7_id}' (topic: {topic}): "
@@ -4,6 +4,7 @@ File Locking for Context7 KB cache operations.
 Provides atomic write operations to prevent cache corruption under parallel agents.
 """
 
+import hashlib
 import logging
 import os
 import sys
@@ -192,3 +193,19 @@ def get_cache_lock_file(cache_root: Path, library: str | None = None) -> Path:
         return cache_root / ".locks" / f"{library}.lock"
     else:
         return cache_root / ".locks" / "global.lock"
+
+
+def get_fetch_lease_file(cache_root: Path, library: str, topic: str) -> Path:
+    """
+    Get lease file path for fetching one (library, topic) from upstream.
+
+    Args:
+        cache_root: Cache root directory
+        library: Library name
+        topic: Topic name
+
+    Returns:
+        Path to lease file
+    """
+    digest = hashlib.sha256(f"{library}\0{topic}".encode()).hexdigest()[:16]
+    return cache_root / ".locks" / "fetch" / f"{digest}.lock"
@@ -314,6 +314,7 @@ class CachePrewarmer:
     - Prioritizes by usage frequency
     - Background pre-warming (non-blocking)
     - Respects rate limits and circuit breaker
+    - Reuses pooled Context7 API connections across libraries
     """
     
     def __init__(
@@ -375,50 +376,46 @@ class CachePrewarmer:
         
         logger.info(f"Pre-warming cache with {len(dependencies)} libraries")
         
-        # Pre-warm in parallel with bounded concurrency
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-        
-        async def prewarm_one(dep: DependencyInfo) -> tuple[str, str]:
-            """Pre-warm single library."""
-            async with semaphore:
-                # Check if already cached
-                if skip_cached and self.helper.is_library_cached(dep.name):
-                    return (dep.name, "skipped")
-                
+        # Skip libraries that are already cached
+        to_fetch: list[str] = []
+        for dep in dependencies:
+            if skip_cached and self.helper.is_library_cached(dep.name):
+                result.libraries[dep.name] = "skipped"
+                result.skipped += 1
+            else:
+                to_fetch.append(dep.name)
+
+        # Pre-warm in one batch: each library is resolved once and fetched
+        # concurrently over the pooled Context7 client
+        if to_fetch:
+            lookups = []
+            if self.helper.kb_lookup is None:
+                logger.debug("Context7 KB lookup unavailable, cannot pre-warm")
+            else:
                 try:
-                    doc = await asyncio.wait_for(
-                        self.helper.get_documentation(dep.name, topic="overview"),
-                        timeout=self.per_library_timeout,
+                    lookups = await self.helper.kb_lookup.lookup_many(
+                        [(name, "overview") for name in to_fetch],
+                        max_concurrency=self.max_concurrent,
+                        item_timeout=self.per_library_timeout,
                     )
-                    if doc:
-                        return (dep.name, "success")
-                    else:
-                        return (dep.name, "not_found")
-                except TimeoutError:
-                    return (dep.name, "timeout")
                 except Exception as e:
-                    logger.debug(f"Pre-warm failed for {dep.name}: {e}")
-                    return (dep.name, "error")
-        
-        # Execute all pre-warms
-        tasks = [prewarm_one(dep) for dep in dependencies]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Aggregate results
-        for item in results:
-            if isinstance(item, Exception):
-                result.failed += 1
-                result.libraries["unknown"] = f"error: {item}"
-            elif isinstance(item, tuple):
-                name, status = item
+                    logger.debug(f"Pre-warm batch failed: {e}")
+            for name, lookup in zip(to_fetch, lookups, strict=False):
+                if lookup.success:
+                    status = "success"
+                elif lookup.timed_out:
+                    status = "timeout"
+                else:
+                    status = "not_found"
                 result.libraries[name] = status
                 if status == "success":
                     result.successful += 1
-                elif status == "skipped":
-                    result.skipped += 1
                 else:
                     result.failed += 1
-        
+            for name in to_fetch[len(lookups):]:
+                result.libraries[name] = "error"
+                result.failed += 1
+
         result.duration_seconds = (datetime.now(UTC) - start_time).total_seconds()
         
         logger.info(
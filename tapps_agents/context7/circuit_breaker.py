@@ -36,8 +36,13 @@ class CircuitBreakerConfig:
     success_threshold: int = 2  # Successes in half-open to close circuit
     timeout_seconds: float = 5.0  # Request timeout
     reset_timeout_seconds: float = 30.0  # Time before half-open from open
+    half_open_max_requests: int | None = None  # Concurrent half-open probes (default: success_threshold)
     name: str = "context7"
 
+    def __post_init__(self) -> None:
+        if self.half_open_max_requests is None:
+            self.half_open_max_requests = self.success_threshold
+
 
 @dataclass
 class CircuitBreakerStats:
@@ -61,7 +66,7 @@ class CircuitBreaker:
     States:
     - CLOSED: Normal operation, requests flow through
     - OPEN: Circuit tripped, requests fail fast (no actual call)
-    - HALF_OPEN: Testing recovery, limited requests allowed
+    - HALF_OPEN: Testing recovery, at most half_open_max_requests in flight
 
     Transitions:
     - CLOSED -> OPEN: When failures >= failure_threshold
@@ -73,6 +78,7 @@ class CircuitBreaker:
     def __init__(self, config: CircuitBreakerConfig | None = None):
         self.config = config or CircuitBreakerConfig()
         self._stats = CircuitBreakerStats()
+        self._half_open_in_flight = 0
         self._lock = asyncio.Lock()
 
     @property
@@ -97,6 +103,9 @@ class CircuitBreaker:
 
     async def _check_state_transition(self) -> None:
         """Check if state should transition (OPEN -> HALF_OPEN)."""
+        self._maybe_half_open()
+
+    def _maybe_half_open(self) -> None:
         if self._stats.state == CircuitState.OPEN:
             if self._stats.last_failure_time is not None:
                 elapsed = time.time() - self._stats.last_failure_time
@@ -105,13 +114,31 @@ class CircuitBreaker:
                     self._stats.consecutive_failures = 0
                     self._stats.consecutive_successes = 0
                     self._stats.last_state_change = time.time()
+                    self._half_open_in_flight = 0
                     logger.info(
                         f"Circuit breaker [{self.config.name}] transitioned to HALF_OPEN "
                         f"after {elapsed:.1f}s"
                     )
 
+    def _admit(self) -> bool:
+        """Admit a request, counting it against the half-open probe limit."""
+        self._maybe_half_open()
+        if self._stats.state == CircuitState.OPEN:
+            return False
+        if self._stats.state == CircuitState.HALF_OPEN:
+            if self._half_open_in_flight >= (self.config.half_open_max_requests or 1):
+                return False
+            self._half_open_in_flight += 1
+        return True
+
+    def release(self) -> None:
+        """Give back the half-open slot of an admitted request that recorded no outcome."""
+        if self._stats.state == CircuitState.HALF_OPEN and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+
     async def _record_success(self) -> None:
         """Record successful request."""
+        self.release()
         self._stats.total_requests += 1
         self._stats.successful_requests += 1
         self._stats.consecutive_successes += 1
@@ -128,6 +155,7 @@ class CircuitBreaker:
 
     async def _record_failure(self) -> None:
         """Record failed request."""
+        self.release()
         self._stats.total_requests += 1
         self._stats.failed_requests += 1
         self._stats.consecutive_failures += 1
@@ -177,17 +205,15 @@ class CircuitBreaker:
             CircuitBreakerOpen: If circuit is open and no fallback provided
         """
         async with self._lock:
-            await self._check_state_transition()
-
-            if self._stats.state == CircuitState.OPEN:
+            if not self._admit():
                 await self._record_rejection()
                 logger.debug(
-                    f"Circuit breaker [{self.config.name}] OPEN - fast failing"
+                    f"Circuit breaker [{self.config.name}] {self._stats.state.name} - fast failing"
                 )
                 if fallback is not None:
                     return fallback
                 raise CircuitBreakerOpen(
-                    f"Circuit breaker [{self.config.name}] is OPEN"
+                    f"Circuit breaker [{self.config.name}] is {self._stats.state.name}"
                 )
 
         # Execute with timeout
@@ -211,6 +237,10 @@ class CircuitBreaker:
                 return fallback
             raise
 
+        except asyncio.CancelledError:
+            self.release()
+            raise
+
         except Exception as e:
             async with self._lock:
                 # CRITICAL FIX: Detect quota errors and open circuit immediately
@@ -250,9 +280,45 @@ class CircuitBreaker:
                 return fallback
             raise
 
+    def allow_request(self) -> bool:
+        """
+        Check whether a request guarded outside ``call()`` may proceed.
+
+        Used by callers that report outcomes themselves via record_result()
+        (e.g. the pooled HTTP client), or via release() when a request ends
+        without an outcome. Counts a rejection when the circuit is open or
+        the half-open probe limit is reached.
+        """
+        if not self._admit():
+            self._stats.rejected_requests += 1
+            return False
+        return True
+
+    async def record_result(self, success: bool) -> None:
+        """Record the outcome of a request admitted by allow_request()."""
+        # The recorders never await, so no lock is needed (and the lock is
+        # bound to one event loop while HTTP requests may run on several)
+        if success:
+            await self._record_success()
+        else:
+            await self._record_failure()
+
+    def trip(self, reason: str = "") -> None:
+        """Open the circuit immediately, bypassing the failure threshold."""
+        now = time.time()
+        self._stats.state = CircuitState.OPEN
+        self._stats.last_failure_time = now
+        self._stats.last_state_change = now
+        logger.warning(
+            f"Circuit breaker [{self.config.name}] OPENED immediately"
+            + (f" ({reason})" if reason else "")
+            + ". Subsequent requests will be rejected without API calls."
+        )
+
     def reset(self) -> None:
         """Reset circuit breaker to initial state."""
         self._stats = CircuitBreakerStats()
+        self._half_open_in_flight = 0
         logger.info(f"Circuit breaker [{self.config.name}] reset to CLOSED")
 
 
@@ -0,0 +1,414 @@
+"""
+Fuzzy Index - Persistent trigram inverted index for Context7 fuzzy lookups.
+
+FuzzyMatcher.find_matching_entry scores the query against every
+(library, topic) pair, which means parsing index.yaml and running one
+similarity computation per pair. FuzzyIndex keeps library and topic names in
+trigram posting lists (persisted next to index.yaml as .fuzzy-index.json)
+so a query only visits names that can still reach the match threshold:
+
+- Libraries whose best possible score cannot reach the threshold are
+  skipped together with all of their topics
+- Remaining topics are filtered by an upper bound on their similarity
+  derived from shared trigrams and lengths, before any exact scoring
+
+The bound is safe for the LCS/Indel-style ratios used by FuzzyMatcher (every
+single-character insertion or deletion destroys at most N distinct n-grams),
+so pruning never drops a match that a full scan would have returned.
+
+The index is kept current incrementally by KBCache.store/delete; writes to
+index.yaml made elsewhere are detected by its stat stamp and trigger a
+rebuild.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from .metadata import CacheIndex
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+INDEX_VERSION = 1
+INDEX_FILENAME = ".fuzzy-index.json"
+
+# Slack for floating point error when comparing bounds to thresholds
+_EPSILON = 1e-9
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> set[str]:
+    """
+    Return the distinct n-grams of a lowercased, space-padded string.
+
+    Args:
+        text: Input string
+        size: N-gram length
+
+    Returns:
+        Set of n-grams (empty for an empty string)
+    """
+    if not text:
+        return set()
+    padded = f" {text.lower()} "
+    if len(padded) < size:
+        return {padded}
+    return {padded[i : i + size] for i in range(len(padded) - size + 1)}
+
+
+def similarity_upper_bound(
+    len_a: int, grams_a: int, len_b: int, grams_b: int, shared: int
+) -> float:
+    """
+    Upper bound on 2*LCS/(len_a + len_b) from n-gram overlap and lengths.
+
+    Each insertion or deletion removes at most NGRAM_SIZE distinct n-grams,
+    so the Indel distance is at least the number of unshared n-grams of
+    either string divided by NGRAM_SIZE, and at least the length difference.
+
+    Args:
+        len_a: Length of the first string
+        grams_a: Distinct n-grams of the first string
+        len_b: Length of the second string
+        grams_b: Distinct n-grams of the second string
+        shared: Distinct n-grams in both
+
+    Returns:
+        Bound between 0.0 and 1.0
+    """
+    total = len_a + len_b
+    if total == 0:
+        return 0.0
+    distance = max(
+        abs(len_a - len_b),
+        -(-(grams_a - shared) // NGRAM_SIZE),
+        -(-(grams_b - shared) // NGRAM_SIZE),
+    )
+    # Indel distance = total - 2 * LCS, so it has the parity of total
+    if (total - distance) % 2:
+        distance += 1
+    return max(0.0, 1.0 - distance / total)
+
+
+def _stat_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FuzzyIndex:
+    """
+    Trigram inverted index over the library and topic names in index.yaml.
+
+    Use get_fuzzy_index() to obtain the shared instance for a cache index.
+    """
+
+    def __init__(self, index_file: Path):
+        """
+        Initialize index (loaded or rebuilt on first use).
+
+        Args:
+            index_file: The cache's index.yaml
+        """
+        self.index_file = Path(index_file)
+        self.index_path = self.index_file.parent / INDEX_FILENAME
+        self._lock = threading.RLock()
+        self._stamp: tuple[int, int] | None = None
+        self._loaded = False
+        self._dirty = False
+        self._reset()
+
+    def _reset(self) -> None:
+        # library -> topic ids; topic ids index _topic_names/_topic_meta
+        self._libraries: dict[str, set[int]] = {}
+        self._library_meta: dict[str, tuple[int, int]] = {}
+        self._library_grams: dict[str, set[str]] = {}
+        self._topic_names: list[str] = []
+        self._topic_meta: list[tuple[int, int]] = []
+        self._topic_ids: dict[str, int] = {}
+        self._topic_grams: dict[str, set[int]] = {}
+
+    # --------------------------------------------------------------- queries
+
+    def candidate_entries(
+        self,
+        library_query: str,
+        topic_query: str,
+        threshold: float,
+        library_weight: float,
+        similarity: Callable[[str, str], float],
+    ) -> list[tuple[str, str]]:
+        """
+        Return (library, topic) pairs that may score >= threshold.
+
+        The combined score is ``library_weight * lib + (1 - library_weight) *
+        topic``; library scores are computed exactly with ``similarity`` so
+        each library gets its own minimum topic score.
+
+        Args:
+            library_query: Library name to search for
+            topic_query: Topic name to search for
+            threshold: Minimum combined score
+            library_weight: Weight of the library score
+            similarity: Exact similarity function (0.0-1.0)
+
+        Returns:
+            Candidate pairs (a superset of the pairs that match)
+        """
+        topic_weight = 1.0 - library_weight
+        min_library = (threshold - topic_weight) / library_weight
+        with self._lock:
+            self._ensure_current()
+            candidates: list[tuple[str, str]] = []
+            topic_counts: Counter[int] | None = None
+            q_len, q_grams = len(topic_query.lower()), ngrams(topic_query)
+            for library in self._library_candidates(library_query, min_library):
+                lib_score = similarity(library_query, library)
+                if lib_score < min_library - _EPSILON:
+                    continue
+                min_topic = (threshold - library_weight * lib_score) / topic_weight
+                if topic_counts is None:
+                    topic_counts = self._count(q_grams, self._topic_grams)
+                for topic_id in self._libraries[library]:
+                    length, grams = self._topic_meta[topic_id]
+                    bound = similarity_upper_bound(
+                        q_len, len(q_grams), length, grams, topic_counts.get(topic_id, 0)
+                    )
+                    if bound >= min_topic - _EPSILON:
+                        candidates.append((library, self._topic_names[topic_id]))
+            return candidates
+
+    def _library_candidates(self, query: str, min_score: float) -> list[str]:
+        q_grams = ngrams(query)
+        counts = self._count(q_grams, self._library_grams)
+        return [
+            library
+            for library, (length, grams) in self._library_meta.items()
+            if similarity_upper_bound(
+                len(query.lower()), len(q_grams), length, grams, counts.get(library, 0)
+            )
+            >= min_score - _EPSILON
+        ]
+
+    @staticmethod
+    def _count(q_grams: set[str], postings: dict[str, set[Any]]) -> Counter[Any]:
+        counts: Counter[Any] = Counter()
+        for gram in q_grams:
+            posting = postings.get(gram)
+            if posting:
+                counts.update(posting)
+        return counts
+
+    def entries(self) -> list[tuple[str, str]]:
+        """Return every indexed (library, topic) pair."""
+        with self._lock:
+            self._ensure_current()
+            return [
+                (library, self._topic_names[topic_id])
+                for library, topic_ids in self._libraries.items()
+                for topic_id in topic_ids
+            ]
+
+    # --------------------------------------------------------------- updates
+
+    @contextmanager
+    def updating(self) -> Iterator[FuzzyIndex]:
+        """
+        Apply add()/remove() calls for an index.yaml write made in the block.
+
+        If index.yaml was already out of sync with this index when the block
+        started (e.g. another process wrote it), the index is rebuilt on its
+        next use instead.
+        """
+        with self._lock:
+            before = _stat_stamp(self.index_file)
+            try:
+                yield self
+            except BaseException:
+                self._loaded = False
+                raise
+            after = _stat_stamp(self.index_file)
+            if self._loaded and before == self._stamp and after != before:
+                self._stamp = after
+                self._dirty = True
+            else:
+                # Out of sync, or the write did not happen
+                self._loaded = False
+
+    def add(self, library: str, topic: str) -> None:
+        """Index a (library, topic) pair."""
+        with self._lock:
+            if self._loaded:
+                self._add(library, topic)
+
+    def remove(self, library: str, topic: str | None = None) -> None:
+        """Unindex a topic, or a whole library if topic is None."""
+        with self._lock:
+            if not self._loaded or library not in self._libraries:
+                return
+            if topic is not None:
+                topic_id = self._topic_ids.get(topic)
+                if topic_id is not None:
+                    self._libraries[library].discard(topic_id)
+                if self._libraries[library]:
+                    return
+            # Topic ids stay allocated; unused ones disappear on rebuild
+            del self._libraries[library]
+            del self._library_meta[library]
+            for gram in ngrams(library):
+                posting = self._library_grams.get(gram)
+                if posting is not None:
+                    posting.discard(library)
+                    if not posting:
+                        del self._library_grams[gram]
+
+    def clear(self) -> None:
+        """Drop the in-memory and persisted index."""
+        with self._lock:
+            self._reset()
+            self._loaded = False
+            self._dirty = False
+            with suppress(OSError):
+                self.index_path.unlink(missing_ok=True)
+
+    def _add(self, library: str, topic: str) -> None:
+        if library not in self._libraries:
+            library_grams = ngrams(library)
+            self._libraries[library] = set()
+            self._library_meta[library] = (len(library.lower()), len(library_grams))
+            for gram in library_grams:
+                self._library_grams.setdefault(gram, set()).add(library)
+        topic_id = self._topic_ids.get(topic)
+        if topic_id is None:
+            topic_id = len(self._topic_names)
+            topic_grams = ngrams(topic)
+            self._topic_ids[topic] = topic_id
+            self._topic_names.append(topic)
+            self._topic_meta.append((len(topic.lower()), len(topic_grams)))
+            for gram in topic_grams:
+                self._topic_grams.setdefault(gram, set()).add(topic_id)
+        self._libraries[library].add(topic_id)
+
+    # ----------------------------------------------------------- persistence
+
+    def _ensure_current(self) -> None:
+        stamp = _stat_stamp(self.index_file)
+        if self._loaded and stamp == self._stamp:
+            return
+        if not self._load(stamp):
+            self._rebuild(stamp)
+
+    def _rebuild(self, stamp: tuple[int, int] | None) -> None:
+        """Rebuild from index.yaml (stamp taken before reading it)."""
+        self._reset()
+        data: dict[str, Any] = {}
+        if stamp is not None:
+            try:
+                with open(self.index_file, encoding="utf-8") as f:
+                    data = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError) as e:
+                logger.debug(f"Failed to read cache index for fuzzy index: {e}")
+        for library, lib_data in CacheIndex.from_dict(data).libraries.items():
+            for topic in (lib_data or {}).get("topics", {}) or {}:
+                self._add(str(library), str(topic))
+        self._stamp = stamp
+        self._loaded = True
+        self._dirty = True
+        self.save()
+
+    def _load(self, stamp: tuple[int, int] | None) -> bool:
+        """Load the persisted index if it matches index.yaml's stamp."""
+        if stamp is None:
+            return False
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION or tuple(data.get("source") or ()) != stamp:
+                return False
+            self._reset()
+            self._topic_names = [str(name) for name in data["topics"]]
+            self._topic_meta = [(int(n), int(g)) for n, g in data["topic_meta"]]
+            self._topic_ids = {name: i for i, name in enumerate(self._topic_names)}
+            self._topic_grams = {g: set(ids) for g, ids in data["topic_grams"].items()}
+            self._libraries = {lib: set(ids) for lib, ids in data["libraries"].items()}
+            self._library_grams = {g: set(libs) for g, libs in data["library_grams"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            self._reset()
+            return False
+        for library in self._libraries:
+            self._library_meta[library] = (len(library.lower()), len(ngrams(library)))
+        self._stamp = stamp
+        self._loaded = True
+        self._dirty = False
+        return True
+
+    def save(self) -> bool:
+        """
+        Persist the index if it has unsaved changes.
+
+        Returns:
+            True if nothing was pending or the index was written
+        """
+        with self._lock:
+            if not self._loaded or not self._dirty or self._stamp is None:
+                return True
+            data = {
+                "version": INDEX_VERSION,
+                "ngram_size": NGRAM_SIZE,
+                "source": list(self._stamp),
+                "libraries": {lib: sorted(ids) for lib, ids in self._libraries.items()},
+                "topics": self._topic_names,
+                "topic_meta": self._topic_meta,
+                "topic_grams": {g: sorted(ids) for g, ids in self._topic_grams.items()},
+                "library_grams": {g: sorted(libs) for g, libs in self._library_grams.items()},
+            }
+            temp_file = self.index_path.with_name(f"{INDEX_FILENAME}.{os.getpid()}.tmp")
+            try:
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                temp_file.replace(self.index_path)
+            except OSError as e:
+                logger.debug(f"Failed to save fuzzy index: {e}")
+                return False
+            self._dirty = False
+            return True
+
+
+_indexes: dict[Path, FuzzyIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_fuzzy_index(index_file: Path) -> FuzzyIndex:
+    """Return the process-wide FuzzyIndex for a cache's index.yaml."""
+    key = Path(index_file).resolve()
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = FuzzyIndex(key)
+                _indexes[key] = index
+    return index
+
+
+def save_all_fuzzy_indexes() -> None:
+    """Persist every index with unsaved changes (registered at exit)."""
+    for index in list(_indexes.values()):
+        with suppress(Exception):  # best effort at interpreter exit
+            index.save()
+
+
+atexit.register(save_all_fuzzy_indexes)
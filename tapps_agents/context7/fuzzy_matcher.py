@@ -5,12 +5,21 @@ Provides fuzzy matching capabilities to handle variations in library/topic queri
 improving cache hit rates when exact matches aren't available.
 """
 
+from __future__ import annotations
+
 import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .fuzzy_index import FuzzyIndex
 
 logger = logging.getLogger(__name__)
 
+# Weights of the library and topic scores in find_matching_entry
+LIBRARY_WEIGHT = 0.6
+TOPIC_WEIGHT = 0.4
+
 # Known language associations for common libraries
 LIBRARY_LANGUAGE_HINTS: dict[str, str] = {
     "react": "javascript", "vue": "javascript", "angular": "javascript",
@@ -84,6 +93,9 @@ class FuzzyMatcher:
         """
         Simple string similarity using longest common subsequence.
 
+        The LCS length is computed bit-parallel (see _lcs_length), so this
+        fallback stays fast without rapidfuzz installed.
+
         Args:
             s1: First string
             s2: Second string
@@ -100,21 +112,7 @@ class FuzzyMatcher:
         if s1_lower == s2_lower:
             return 1.0
 
-        # Calculate longest common subsequence
-        def lcs_length(a: str, b: str) -> int:
-            m, n = len(a), len(b)
-            dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-            for i in range(1, m + 1):
-                for j in range(1, n + 1):
-                    if a[i - 1] == b[j - 1]:
-                        dp[i][j] = dp[i - 1][j - 1] + 1
-                    else:
-                        dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-
-            return dp[m][n]
-
-        lcs = lcs_length(s1_lower, s2_lower)
+        lcs = _lcs_length(s1_lower, s2_lower)
         max_len = max(len(s1_lower), len(s2_lower))
 
         return lcs / max_len if max_len > 0 else 0.0
@@ -252,7 +250,7 @@ class FuzzyMatcher:
             topic_score = self._calculate_similarity(topic_query, topic)
 
             # Combined score (weighted average: 60% library, 40% topic)
-            combined_score = (lib_score * 0.6) + (topic_score * 0.4)
+            combined_score = (lib_score * LIBRARY_WEIGHT) + (topic_score * TOPIC_WEIGHT)
 
             if combined_score >= self.threshold:
                 match_type = "both"
@@ -286,6 +284,49 @@ class FuzzyMatcher:
         matches.sort(key=lambda x: x.score, reverse=True)
         return matches[:max_results]
 
+    def find_matching_entry_indexed(
+        self,
+        library_query: str,
+        topic_query: str,
+        index: FuzzyIndex,
+        max_results: int = 5,
+        project_language: str | None = None,
+    ) -> list[FuzzyMatch]:
+        """
+        Like find_matching_entry, but over the entries of a FuzzyIndex.
+
+        The index narrows the entries to those that can still reach the
+        threshold before any exact scoring; results are the same as a full
+        scan of all entries.
+
+        Args:
+            library_query: Library name to search for
+            topic_query: Topic name to search for
+            index: FuzzyIndex of the cache
+            max_results: Maximum number of results to return
+            project_language: See find_matching_entry
+
+        Returns:
+            List of FuzzyMatch objects, sorted by combined score (highest first)
+        """
+        if not library_query or not topic_query:
+            return []
+
+        candidates = index.candidate_entries(
+            library_query,
+            topic_query,
+            threshold=self.threshold,
+            library_weight=LIBRARY_WEIGHT,
+            similarity=self._calculate_similarity,
+        )
+        return self.find_matching_entry(
+            library_query,
+            topic_query,
+            candidates,
+            max_results=max_results,
+            project_language=project_language,
+        )
+
     def is_match(self, query: str, candidate: str) -> bool:
         """
         Check if a candidate string matches the query above the threshold.
@@ -398,6 +439,29 @@ class FuzzyMatcher:
         return out[:max_results]
 
 
+def _lcs_length(a: str, b: str) -> int:
+    """Length of the longest common subsequence (bit-parallel).
+
+    Uses the bit-vector algorithm of Allison-Dix / Hyyro: one machine-word
+    style update per character of ``b`` on an integer holding one bit per
+    character of ``a``, i.e. O(len(b)) big-int operations instead of an
+    O(len(a) * len(b)) Python-level DP matrix.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+    masks: dict[str, int] = {}
+    for i, ch in enumerate(a):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    full = (1 << len(a)) - 1
+    v = full
+    for ch in b:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(a) - v.bit_count()
+
+
 def _infer_library_language(library_name: str) -> str | None:
     """Infer the programming language a library belongs to from its name.
 
@@ -0,0 +1,210 @@
+"""
+Shared HTTP connection pool for Context7 API calls.
+
+Resolve and docs requests reuse keep-alive (and, when the optional ``h2``
+package is installed, HTTP/2) connections instead of opening a new client
+and TLS handshake per call. Async requests go through one pooled
+``httpx.AsyncClient`` per event loop - normally one per process - with a
+per-host concurrency limit; synchronous callers share one ``httpx.Client``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_MAX_PER_HOST = 8
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = 30.0
+
+
+@dataclass
+class _LoopState:
+    """Pooled client and per-host semaphores bound to one event loop."""
+
+    client: httpx.AsyncClient
+    host_limits: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+    closer: AsyncGenerator[None] | None = None
+
+
+class Context7HttpPool:
+    """
+    Pooled HTTP clients for the Context7 backup path.
+
+    httpx async clients cannot be shared across event loops, so a client is
+    created lazily for each loop that uses the pool (workflow steps running
+    their own ``asyncio.run`` get their own). A client used through get()
+    is closed when its loop shuts down its async generators, which
+    ``asyncio.run`` does before closing the loop; close() closes the
+    clients of loops that are still open.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        sync_transport: httpx.BaseTransport | None = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_connections: Maximum open connections per client
+            max_keepalive_connections: Maximum idle connections kept alive
+            max_per_host: Maximum concurrent async requests per host
+            keepalive_expiry: Seconds an idle connection is kept
+            http2: Enable HTTP/2 (default: when ``h2`` is installed)
+            transport: Optional async transport (e.g. httpx.MockTransport)
+            sync_transport: Optional sync transport
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_per_host = max_per_host
+        self.http2 = H2_AVAILABLE if http2 is None else http2
+        self._transport = transport
+        self._sync_transport = sync_transport
+        self._lock = threading.Lock()
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopState
+        ] = weakref.WeakKeyDictionary()
+        self._sync_client: httpx.Client | None = None
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        return {
+            "limits": self.limits,
+            "http2": self.http2,
+            "timeout": DEFAULT_TIMEOUT,
+        }
+
+    def _loop_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.get(loop)
+            if state is None or state.client.is_closed:
+                client = httpx.AsyncClient(
+                    transport=self._transport, **self._client_kwargs()
+                )
+                state = _LoopState(client=client)
+                self._loops[loop] = state
+            return state
+
+    async def _close_at_loop_shutdown(
+        self, client: httpx.AsyncClient
+    ) -> AsyncGenerator[None]:
+        # Suspended at the yield until the loop finalizes its async generators
+        try:
+            yield
+        finally:
+            await client.aclose()
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client for the running event loop."""
+        return self._loop_state().client
+
+    def sync_client(self) -> httpx.Client:
+        """Return the pooled client shared by synchronous callers."""
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(
+                    transport=self._sync_transport, **self._client_kwargs()
+                )
+            return self._sync_client
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a GET request through the pooled async client.
+
+        Waits for a per-host slot first, so bursts (e.g. cache pre-warming)
+        queue locally instead of opening more connections than the host
+        limit allows.
+
+        Args:
+            url: Request URL
+            **kwargs: Passed to ``httpx.AsyncClient.get``
+
+        Returns:
+            HTTP response
+        """
+        state = self._loop_state()
+        if state.closer is None:
+            state.closer = self._close_at_loop_shutdown(state.client)
+            await state.closer.__anext__()
+        host = httpx.URL(url).host
+        semaphore = state.host_limits.get(host)
+        if semaphore is None:
+            semaphore = state.host_limits.setdefault(
+                host, asyncio.Semaphore(self.max_per_host)
+            )
+        async with semaphore:
+            return await state.client.get(url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._loops.pop(loop, None)
+        if state is not None:
+            await state.client.aclose()
+
+    def close(self) -> None:
+        """
+        Close the synchronous client and the async client of every open loop.
+
+        Each async client is closed on its own loop: scheduled on a loop that
+        is running (without waiting for it) and run to completion on an idle
+        one. Clients of loops that are already closed are dropped.
+        """
+        with self._lock:
+            client, self._sync_client = self._sync_client, None
+            states = list(self._loops.items())
+            self._loops.clear()
+        if client is not None:
+            client.close()
+        for loop, state in states:
+            if state.client.is_closed or loop.is_closed():
+                continue
+            try:
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(state.client.aclose(), loop)
+                else:
+                    loop.run_until_complete(state.client.aclose())
+            except Exception as e:
+                logger.debug(f"Failed to close pooled Context7 client: {e}")
+
+
+_pool: Context7HttpPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_context7_http_pool() -> Context7HttpPool:
+    """Get the process-wide Context7 HTTP pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = Context7HttpPool()
+                logger.debug(
+                    f"Context7 HTTP pool created (http2={_pool.http2})"
+                )
+    return _pool
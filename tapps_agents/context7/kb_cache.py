@@ -1,22 +1,38 @@
 """
 KB Cache - Main cache manager for Context7 knowledge base.
+
+Parsed entries are kept in a bounded, process-wide LRU validated by the
+doc file's mtime and size, so repeat hits skip the read and markdown parse.
 """
 
 from __future__ import annotations
 
+import os
 import re
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from .cache_locking import cache_lock, get_cache_lock_file
 from .cache_structure import CacheStructure
+from .fuzzy_index import FuzzyIndex, get_fuzzy_index
 from .metadata import MetadataManager
 
 # Maximum file size for cache reads (10 MB)
 MAX_CACHE_FILE_SIZE = 10 * 1024 * 1024
 
+# Hot tier bounds (parsed entries held in memory)
+HOT_TIER_MAX_ENTRIES = 256
+HOT_TIER_MAX_BYTES = 32 * 1024 * 1024
+
+# A file rewritten within this window of being read may change again within
+# the same mtime tick; such reads are not trusted until the window passes.
+HOT_TIER_RACY_WINDOW_NS = 2_000_000_000
+
 
 @dataclass
 class CacheEntry:
@@ -165,6 +181,74 @@ class CacheEntry:
         )
 
 
+class _HotEntryTier:
+    """
+    Bounded LRU of parsed CacheEntry objects keyed by doc file path.
+
+    An entry is served only while the file's (mtime_ns, size) still match
+    the values seen when it was loaded.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[int, int, int, CacheEntry]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, mtime_ns: int, size: int) -> CacheEntry | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            item_mtime, item_size, loaded_ns, entry = item
+            if (item_mtime, item_size) != (mtime_ns, size) or (
+                loaded_ns - mtime_ns < HOT_TIER_RACY_WINDOW_NS
+            ):
+                self._pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, mtime_ns: int, size: int, entry: CacheEntry) -> None:
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (mtime_ns, size, time.time_ns(), entry)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def discard_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _pop(self, key: str) -> None:
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._bytes -= item[1]
+
+
+_hot_tier = _HotEntryTier(HOT_TIER_MAX_ENTRIES, HOT_TIER_MAX_BYTES)
+
+
 class KBCache:
     """Main KB cache manager for Context7 documentation."""
 
@@ -211,6 +295,11 @@ class KBCache:
             self.metadata_manager = metadata_manager
             raise
 
+    @property
+    def fuzzy_index(self) -> FuzzyIndex:
+        """Trigram index of cached (library, topic) names for fuzzy lookups."""
+        return get_fuzzy_index(self.cache_structure.index_file)
+
     def get(
         self, library: str, topic: str, ttl_seconds: int | None = None
     ) -> CacheEntry | None:
@@ -227,20 +316,26 @@ class KBCache:
             CacheEntry if found and not expired, None otherwise
         """
         doc_file = self.cache_structure.get_library_doc_file(library, topic)
-        if not doc_file.exists():
+        try:
+            stat = doc_file.stat()
+        except OSError:
             return None
 
         try:
             # Check file size before reading to prevent OOM
-            if doc_file.stat().st_size > MAX_CACHE_FILE_SIZE:
+            if stat.st_size > MAX_CACHE_FILE_SIZE:
                 import logging
                 logging.getLogger(__name__).warning(
                     f"Cache file {doc_file} exceeds size limit "
-                    f"({doc_file.stat().st_size} > {MAX_CACHE_FILE_SIZE}), skipping"
+                    f"({stat.st_size} > {MAX_CACHE_FILE_SIZE}), skipping"
                 )
                 return None
-            content = doc_file.read_text(encoding="utf-8")
-            entry = CacheEntry.from_markdown(library, topic, content)
+            hot_key = str(doc_file)
+            entry = _hot_tier.get(hot_key, stat.st_mtime_ns, stat.st_size)
+            if entry is None:
+                content = doc_file.read_text(encoding="utf-8")
+                entry = CacheEntry.from_markdown(library, topic, content)
+                _hot_tier.put(hot_key, stat.st_mtime_ns, stat.st_size, entry)
 
             # TTL expiry check
             if ttl_seconds is not None and entry.is_expired(ttl_seconds):
@@ -250,12 +345,11 @@ class KBCache:
                 )
                 return None
 
-            # Update metadata (increment hits, update last accessed)
-            self.metadata_manager.update_library_metadata(
-                library, topic=topic, increment_hits=True
-            )
+            # Count the hit (buffered; meta.yaml is written on flush)
+            self.metadata_manager.record_hit(library)
 
-            return entry
+            # Copy so callers cannot mutate the shared hot-tier entry
+            return replace(entry)
         except Exception:
             return None
 
@@ -350,6 +444,7 @@ class KBCache:
 
                 # Write markdown file
                 doc_file = self.cache_structure.get_library_doc_file(library, topic)
+                _hot_tier.discard(str(doc_file))
                 doc_file.write_text(entry.to_markdown(), encoding="utf-8")
 
                 # Update metadata (non-critical, continue if fails)
@@ -364,9 +459,11 @@ class KBCache:
 
                 # Update cache index (non-critical, continue if fails)
                 try:
-                    self.metadata_manager.update_cache_index(
-                        library, topic, context7_id=context7_id
-                    )
+                    with self.fuzzy_index.updating() as fuzzy_index:
+                        self.metadata_manager.update_cache_index(
+                            library, topic, context7_id=context7_id
+                        )
+                        fuzzy_index.add(library, topic)
                 except Exception as e:
                     import logging
                     logger = logging.getLogger(__name__)
@@ -416,23 +513,29 @@ class KBCache:
         """
         if topic:
             doc_file = self.cache_structure.get_library_doc_file(library, topic)
+            _hot_tier.discard(str(doc_file))
             if doc_file.exists():
                 doc_file.unlink()
-                self.metadata_manager.update_cache_index(library, topic, remove=True)
+                with self.fuzzy_index.updating() as fuzzy_index:
+                    self.metadata_manager.update_cache_index(library, topic, remove=True)
+                    fuzzy_index.remove(library, topic)
                 return True
             return False
         else:
             lib_dir = self.cache_structure.get_library_dir(library)
+            _hot_tier.discard_prefix(str(lib_dir) + os.sep)
             if lib_dir.exists():
                 import shutil
 
                 shutil.rmtree(lib_dir)
 
                 # Remove from index
-                index = self.metadata_manager.load_cache_index()
-                if library in index.libraries:
-                    del index.libraries[library]
-                    self.metadata_manager.save_cache_index(index)
+                with self.fuzzy_index.updating() as fuzzy_index:
+                    index = self.metadata_manager.load_cache_index()
+                    if library in index.libraries:
+                        del index.libraries[library]
+                        self.metadata_manager.save_cache_index(index)
+                    fuzzy_index.remove(library)
                 return True
             return False
 
@@ -458,6 +561,8 @@ class KBCache:
         """
         import shutil
 
+        _hot_tier.clear()
+
         # Delete all library directories
         for library_dir in self.cache_structure.cache_root.iterdir():
             if library_dir.is_dir() and library_dir.name != "metadata":
@@ -468,3 +573,4 @@ class KBCache:
 
         index = CacheIndex(version="1.0", last_updated=None, total_entries=0, libraries={})
         self.metadata_manager.save_cache_index(index)
+        self.fuzzy_index.clear()
@@ -4,17 +4,22 @@ KB-First Lookup - Context7 documentation lookup with KB-first caching.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from ..core.tracing import Tracer, get_tracer
+from .cache_locking import CacheLock, get_fetch_lease_file
 from .fuzzy_matcher import FuzzyMatcher
 from .kb_cache import CacheEntry, KBCache
+from .single_flight import SingleFlight
 
 if TYPE_CHECKING:
     from ..mcp.gateway import MCPGateway
+    from .analytics import Analytics
 
 
 logger = logging.getLogger(__name__)
@@ -36,6 +41,7 @@ class LookupResult:
     fuzzy_score: float | None = None
     matched_topic: str | None = None
     warning: str | None = None  # P1 Improvement: Warning message for stale data
+    timed_out: bool = False  # Resolve or fetch exceeded the batch item timeout
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -51,9 +57,14 @@ class LookupResult:
             "fuzzy_score": self.fuzzy_score,
             "matched_topic": self.matched_topic,
             "warning": self.warning,
+            "timed_out": self.timed_out,
         }
 
 
+# Concurrent cache misses for the same (cache root, library, topic)
+_fetch_flights: SingleFlight[LookupResult] = SingleFlight()
+
+
 class KBLookup:
     """KB-first lookup workflow for Context7 documentation."""
 
@@ -64,6 +75,7 @@ class KBLookup:
         resolve_library_func: Callable[[str], Any] | None = None,
         get_docs_func: Callable[[str, str | None], Any] | None = None,
         fuzzy_threshold: float = 0.7,
+        fetch_lease_timeout: float = 0.0,
     ):
         """
         Initialize KB-first lookup.
@@ -74,15 +86,33 @@ class KBLookup:
             resolve_library_func: Optional function to resolve library name to Context7 ID (via MCP)
             get_docs_func: Optional function to get docs from Context7 API (via MCP)
             fuzzy_threshold: Fuzzy matching threshold (0.0-1.0)
+            fetch_lease_timeout: Seconds to wait for another process fetching
+                the same entry (cross-process lease; 0 disables)
         """
         self.kb_cache = kb_cache
         self.mcp_gateway = mcp_gateway
         self.resolve_library_func = resolve_library_func
         self.get_docs_func = get_docs_func
         self.fuzzy_matcher = FuzzyMatcher(threshold=fuzzy_threshold)
+        self.fetch_lease_timeout = fetch_lease_timeout
         # Initialize staleness policy manager and refresh queue (lazy-loaded)
         self._staleness_policy_manager = None
         self._refresh_queue = None
+        self._analytics: Analytics | None = None
+
+    def _get_analytics(self) -> Analytics:
+        """Return this lookup's Analytics (backed by the process-wide recorder)."""
+        if self._analytics is None:
+            from .analytics import Analytics
+
+            self._analytics = Analytics(
+                self.kb_cache.cache_structure, self.kb_cache.metadata_manager
+            )
+        return self._analytics
+
+    @property
+    def _tracer(self) -> Tracer:
+        return get_tracer()
 
     async def _process_refresh_queue_async(self, max_items: int = 1) -> None:
         """
@@ -201,42 +231,31 @@ class KBLookup:
             
             # Try fuzzy match for stale data
             if self.fuzzy_matcher:
-                from .metadata import MetadataManager
-                metadata_manager = MetadataManager(self.kb_cache.cache_structure)
-                index = metadata_manager.load_cache_index()
-                
-                available_entries = []
-                for lib_name, lib_data in index.libraries.items():
-                    topics = lib_data.get("topics", {})
-                    for topic_name in topics.keys():
-                        available_entries.append((lib_name, topic_name))
-                
-                if available_entries:
-                    fuzzy_matches = self.fuzzy_matcher.find_matching_entry(
-                        library_query=library,
-                        topic_query=topic,
-                        available_entries=available_entries,
-                        max_results=1,
-                    )
-                    
-                    if fuzzy_matches:
-                        best_match = fuzzy_matches[0]
-                        fuzzy_entry = self.kb_cache.get(best_match.library, best_match.topic)
-                        if fuzzy_entry and fuzzy_entry.content:
-                            response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
-                            return LookupResult(
-                                success=True,
-                                content=fuzzy_entry.content,
-                                source="stale_fuzzy_fallback",
-                                library=best_match.library,
-                                topic=best_match.topic,
-                                context7_id=fuzzy_entry.context7_id,
-                                cached_entry=fuzzy_entry,
-                                response_time_ms=response_time,
-                                fuzzy_score=best_match.score,
-                                matched_topic=best_match.topic,
-                                warning=f"Using fuzzy-matched stale data for '{best_match.library}/{best_match.topic}'. API was unavailable.",
-                            )
+                fuzzy_matches = self.fuzzy_matcher.find_matching_entry_indexed(
+                    library_query=library,
+                    topic_query=topic,
+                    index=self.kb_cache.fuzzy_index,
+                    max_results=1,
+                )
+
+                if fuzzy_matches:
+                    best_match = fuzzy_matches[0]
+                    fuzzy_entry = self.kb_cache.get(best_match.library, best_match.topic)
+                    if fuzzy_entry and fuzzy_entry.content:
+                        response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
+                        return LookupResult(
+                            success=True,
+                            content=fuzzy_entry.content,
+                            source="stale_fuzzy_fallback",
+                            library=best_match.library,
+                            topic=best_match.topic,
+                            context7_id=fuzzy_entry.context7_id,
+                            cached_entry=fuzzy_entry,
+                            response_time_ms=response_time,
+                            fuzzy_score=best_match.score,
+                            matched_topic=best_match.topic,
+                            warning=f"Using fuzzy-matched stale data for '{best_match.library}/{best_match.topic}'. API was unavailable.",
+                        )
             
             return None
         except Exception as e:
@@ -264,64 +283,161 @@ class KBLookup:
         Returns:
             LookupResult with documentation content
         """
-        # #region agent log
-        from ..core.debug_logger import write_debug_log
-        write_debug_log(
-            {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "E",
-                "message": "KBLookup.lookup called",
-                "data": {"library": library, "topic": topic},
-            },
-            project_root=self.project_root if hasattr(self, 'project_root') else None,
-            location="context7/lookup.py:lookup:entry",
-        )
-        # #endregion
+        with self._tracer.span("context7.lookup", library=library, topic=topic) as span:
+            result = await self._lookup(library, topic, use_fuzzy_match)
+            span.set(source=result.source, success=result.success)
+            return result
+
+    async def lookup_many(
+        self,
+        requests: Iterable[tuple[str, str | None]],
+        use_fuzzy_match: bool = False,
+        max_concurrency: int = 8,
+        item_timeout: float | None = None,
+        on_result: Callable[[LookupResult], None] | None = None,
+    ) -> list[LookupResult]:
+        """
+        Perform KB-first lookups for many (library, topic) pairs at once.
+
+        Cache hits are served locally. Misses are grouped by library so each
+        library ID is resolved once; the library's topics are then fetched
+        concurrently and each entry is stored in the KB cache as soon as it
+        arrives. Failures are reported per item instead of failing the batch.
+
+        Args:
+            requests: (library, topic) pairs; a None topic means "overview"
+            use_fuzzy_match: Whether to use fuzzy matching for cache misses
+            max_concurrency: Maximum concurrent resolve/fetch operations
+            item_timeout: Optional timeout in seconds per resolve or fetch
+            on_result: Optional callback invoked as each result completes
+
+        Returns:
+            LookupResults in request order (duplicate pairs share a result);
+            success, source and error give each item's status
+        """
+        start_time = datetime.now(UTC)
+        keys = [(library, topic or "overview") for library, topic in requests]
+        results: dict[tuple[str, str], LookupResult] = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        def finish(library: str, topic: str, result: LookupResult) -> None:
+            results[(library, topic)] = result
+            if on_result is not None:
+                on_result(result)
+
+        def failed(
+            library: str, topic: str, error: str, timed_out: bool = False
+        ) -> LookupResult:
+            return LookupResult(
+                success=False,
+                source="api",
+                library=library,
+                topic=topic,
+                error=error,
+                response_time_ms=(datetime.now(UTC) - start_time).total_seconds() * 1000,
+                timed_out=timed_out,
+            )
+
+        async def bounded(make_coro: Callable[[], Any]) -> Any:
+            async with semaphore:
+                if item_timeout is None:
+                    return await make_coro()
+                return await asyncio.wait_for(make_coro(), timeout=item_timeout)
+
+        async def fetch_topic(library: str, topic: str, context7_id: str) -> None:
+            try:
+                result = await bounded(
+                    lambda: self._fetch_shared(library, topic, start_time, context7_id)
+                )
+            except TimeoutError:
+                result = failed(
+                    library, topic, f"Context7 fetch timed out after {item_timeout}s", True
+                )
+            except Exception as e:
+                logger.debug(f"Batched Context7 fetch failed for {library}/{topic}: {e}")
+                result = failed(library, topic, str(e))
+            finish(library, topic, result)
+
+        async def fetch_library(library: str, topics: list[str]) -> None:
+            try:
+                context7_id, failure = await bounded(
+                    lambda: self._resolve_library_id(library, ", ".join(topics), start_time)
+                )
+            except Exception as e:
+                timed_out = isinstance(e, TimeoutError)
+                error = (
+                    f"Context7 resolve timed out after {item_timeout}s" if timed_out else str(e)
+                )
+                for topic in topics:
+                    finish(library, topic, failed(library, topic, error, timed_out))
+                return
+            if context7_id:
+                await asyncio.gather(
+                    *(fetch_topic(library, topic, context7_id) for topic in topics)
+                )
+                return
+            for topic in topics:
+                if failure is not None:
+                    finish(library, topic, replace(failure, topic=topic))
+                else:
+                    finish(library, topic, self._lookup_failure(library, topic, None, start_time))
+
+        with self._tracer.span("context7.lookup_many", items=len(keys)) as span:
+            misses: dict[str, list[str]] = {}
+            for library, topic in dict.fromkeys(keys):
+                local = self._lookup_local(library, topic, use_fuzzy_match, start_time)
+                if local is not None:
+                    finish(library, topic, local)
+                else:
+                    misses.setdefault(library, []).append(topic)
+
+            # R4: Record cache misses before API calls
+            analytics = self._get_analytics()
+            for topics in misses.values():
+                for _ in topics:
+                    analytics.record_cache_miss()
+
+            await asyncio.gather(
+                *(fetch_library(library, topics) for library, topics in misses.items())
+            )
+            span.set(
+                misses=sum(len(topics) for topics in misses.values()),
+                libraries_fetched=len(misses),
+            )
+        return [results[key] for key in keys]
+
+    async def _lookup(
+        self, library: str, topic: str | None, use_fuzzy_match: bool
+    ) -> LookupResult:
+        """Lookup implementation (see lookup())."""
         start_time = datetime.now(UTC)
 
         # Default topic if not provided
         if topic is None:
             topic = "overview"
 
+        local = self._lookup_local(library, topic, use_fuzzy_match, start_time)
+        if local is not None:
+            return local
+
+        # R4: Record cache miss before API call
+        self._get_analytics().record_cache_miss()
+        return await self._fetch_shared(library, topic, start_time)
+
+    def _lookup_local(
+        self, library: str, topic: str, use_fuzzy_match: bool, start_time: datetime
+    ) -> LookupResult | None:
+        """Serve a lookup from the KB cache (steps 1-2); None on a miss."""
         # Step 1: Check KB cache (exact match)
-        # #region agent log
-        write_debug_log(
-            {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "E",
-                "message": "About to check KB cache",
-                "data": {"library": library, "topic": topic},
-            },
-            project_root=self.project_root if hasattr(self, 'project_root') else None,
-            location="context7/lookup.py:lookup:before_cache_check",
-        )
-        # #endregion
-        cached_entry = self.kb_cache.get(library, topic)
-        # #region agent log
-        write_debug_log(
-            {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "E",
-                "message": "Cache check completed",
-                "data": {"library": library, "cached": cached_entry is not None},
-            },
-            project_root=self.project_root if hasattr(self, 'project_root') else None,
-            location="context7/lookup.py:lookup:after_cache_check",
-        )
-        # #endregion
+        with self._tracer.span(
+            "context7.kb_cache.get", library=library, topic=topic
+        ) as span:
+            cached_entry = self.kb_cache.get(library, topic)
+            span.set(hit=cached_entry is not None)
         if cached_entry:
             response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
             # R4: Record cache hit with latency
-            from .analytics import Analytics
-            from .metadata import MetadataManager
-            analytics = Analytics(
-                self.kb_cache.cache_structure,
-                MetadataManager(self.kb_cache.cache_structure)
-            )
-            analytics.record_cache_hit(response_time_ms=response_time)
+            self._get_analytics().record_cache_hit(response_time_ms=response_time)
             
             # Check if entry is stale
             if cached_entry.cached_at:
@@ -393,24 +509,11 @@ class KBLookup:
 
         # Step 2: Fuzzy matching (Phase 2)
         if use_fuzzy_match:
-            # Get available entries from cache index
-            from .metadata import MetadataManager
-
-            metadata_manager = MetadataManager(self.kb_cache.cache_structure)
-            index = metadata_manager.load_cache_index()
-
-            # Build list of available entries
-            available_entries = []
-            for lib_name, lib_data in index.libraries.items():
-                topics = lib_data.get("topics", {})
-                for topic_name in topics.keys():
-                    available_entries.append((lib_name, topic_name))
-
-            # Try fuzzy matching
-            fuzzy_matches = self.fuzzy_matcher.find_matching_entry(
+            # Try fuzzy matching (the trigram index narrows candidates)
+            fuzzy_matches = self.fuzzy_matcher.find_matching_entry_indexed(
                 library_query=library,
                 topic_query=topic,
-                available_entries=available_entries,
+                index=self.kb_cache.fuzzy_index,
                 max_results=1,
             )
 
@@ -423,12 +526,7 @@ class KBLookup:
                         datetime.now(UTC) - start_time
                     ).total_seconds() * 1000
                     # R4: Record fuzzy match with latency
-                    from .analytics import Analytics
-                    from .metadata import MetadataManager
-                    analytics = Analytics(
-                        self.kb_cache.cache_structure,
-                        MetadataManager(self.kb_cache.cache_structure)
-                    )
+                    analytics = self._get_analytics()
                     analytics.record_fuzzy_match()
                     analytics.record_cache_hit(response_time_ms=response_time)
                     return LookupResult(
@@ -444,35 +542,111 @@ class KBLookup:
                         matched_topic=best_match.topic,
                     )
 
-        # R4: Record cache miss before API call
-        from .analytics import Analytics
-        from .metadata import MetadataManager
-        analytics = Analytics(
-            self.kb_cache.cache_structure,
-            MetadataManager(self.kb_cache.cache_structure)
+        return None
+
+    async def _fetch_shared(
+        self,
+        library: str,
+        topic: str,
+        start_time: datetime,
+        context7_id: str | None = None,
+    ) -> LookupResult:
+        """Fetch a missed entry, sharing the fetch with concurrent lookups of it."""
+        # Steps 3-5 run once for concurrent misses on the same entry
+        result, shared = await _fetch_flights.do(
+            (str(self.kb_cache.cache_root), library, topic),
+            lambda: self._fetch_coalesced(library, topic, start_time, context7_id),
         )
-        analytics.record_cache_miss()
+        if shared:
+            response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
+            return replace(
+                result,
+                cached_entry=replace(result.cached_entry) if result.cached_entry else None,
+                response_time_ms=response_time,
+            )
+        return result
+
+    def _cached_result(
+        self, library: str, topic: str, start_time: datetime
+    ) -> LookupResult | None:
+        """Return a cache-hit result if the entry is cached now."""
+        cached_entry = self.kb_cache.get(library, topic)
+        if cached_entry is None:
+            return None
+        return LookupResult(
+            success=True,
+            content=cached_entry.content,
+            source="cache",
+            library=library,
+            topic=topic,
+            context7_id=cached_entry.context7_id,
+            cached_entry=cached_entry,
+            response_time_ms=(datetime.now(UTC) - start_time).total_seconds() * 1000,
+        )
+
+    async def _fetch_coalesced(
+        self,
+        library: str,
+        topic: str,
+        start_time: datetime,
+        context7_id: str | None = None,
+    ) -> LookupResult:
+        """
+        Fetch an entry as the single in-process leader for its key.
 
-        # Step 3: Resolve library ID if needed
+        Re-checks the cache (a previous flight may have just stored it) and,
+        if fetch_lease_timeout is set, holds a cross-process lease on the
+        entry so other processes wait for this fetch instead of repeating it.
+        """
+        cached = self._cached_result(library, topic, start_time)
+        if cached is not None:
+            return cached
+        if not self.fetch_lease_timeout:
+            return await self._fetch_from_api(library, topic, start_time, context7_id)
+
+        lease = CacheLock(
+            get_fetch_lease_file(self.kb_cache.cache_root, library, topic),
+            timeout=self.fetch_lease_timeout,
+        )
+        acquiring = asyncio.ensure_future(asyncio.to_thread(lease.acquire))
+        try:
+            acquired = await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The thread keeps waiting for the lease; give it back once held
+            def release_if_acquired(future: asyncio.Future[bool]) -> None:
+                if not future.cancelled() and future.exception() is None and future.result():
+                    lease.release()
+
+            acquiring.add_done_callback(release_if_acquired)
+            raise
+        try:
+            if acquired:
+                # Another process may have fetched it while we waited
+                cached = self._cached_result(library, topic, start_time)
+                if cached is not None:
+                    return cached
+            else:
+                logger.debug(f"Fetching {library}/{topic} without a fetch lease")
+            return await self._fetch_from_api(library, topic, start_time, context7_id)
+        finally:
+            if acquired:
+                lease.release()
+
+    async def _resolve_library_id(
+        self, library: str, topic: str, start_time: datetime
+    ) -> tuple[str | None, LookupResult | None]:
+        """
+        Resolve a library name to its Context7 ID (lookup step 3).
+
+        Returns:
+            Tuple of (context7_id, failure); failure is a LookupResult when
+            the lookup must stop early (e.g. quota exceeded)
+        """
         context7_id = None
 
         # Use backup client with automatic fallback (MCP Gateway -> HTTP)
         from .backup_client import call_context7_resolve_with_fallback
 
-        # #region agent log
-        write_debug_log(
-            {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": "E",
-                "message": "About to resolve library ID",
-                "data": {"library": library, "topic": topic, "has_mcp_gateway": self.mcp_gateway is not None},
-            },
-            project_root=self.project_root if hasattr(self, 'project_root') else None,
-            location="context7/lookup.py:lookup:before_resolve",
-        )
-        # #endregion
-        
         # CRITICAL FIX: Check quota BEFORE making API calls
         # This prevents unnecessary API calls when quota is already exceeded
         try:
@@ -487,7 +661,7 @@ class KBLookup:
                     f"Context7 API quota exceeded for '{library}' (topic: {topic}): {quota_msg}. "
                     f"Skipping API call. Consider upgrading your Context7 plan or waiting for quota reset."
                 )
-                return LookupResult(
+                return None, LookupResult(
                     success=False,
                     source="api",
                     library=library,
@@ -499,35 +673,15 @@ class KBLookup:
             pass  # If quota check fails, continue (graceful degradation)
         
         try:
-            # #region agent log
-            write_debug_log(
-                {
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "E",
-                    "message": "About to await call_context7_resolve_with_fallback",
-                    "data": {"library": library},
-                },
-                project_root=self.project_root if hasattr(self, 'project_root') else None,
-                location="context7/lookup.py:lookup:before_await_resolve",
-            )
-            # #endregion
-            resolve_result = await call_context7_resolve_with_fallback(
-                library, self.mcp_gateway
-            )
-            # #region agent log
-            write_debug_log(
-                {
-                    "sessionId": "debug-session",
-                    "runId": "run1",
-                    "hypothesisId": "E",
-                    "message": "call_context7_resolve_with_fallback returned",
-                    "data": {"library": library, "success": resolve_result.get("success") if isinstance(resolve_result, dict) else None},
-                },
-                project_root=self.project_root if hasattr(self, 'project_root') else None,
-                location="context7/lookup.py:lookup:after_resolve",
-            )
-            # #endregion
+            with self._tracer.span("context7.resolve", library=library) as span:
+                resolve_result = await call_context7_resolve_with_fallback(
+                    library, self.mcp_gateway
+                )
+                span.set(
+                    success=resolve_result.get("success")
+                    if isinstance(resolve_result, dict)
+                    else None
+                )
             if resolve_result.get("success"):
                 matches = resolve_result.get("result", {}).get("matches", [])
                 if matches and len(matches) > 0:
@@ -575,7 +729,7 @@ class KBLookup:
                         f"Continuing without Context7 documentation."
                     )
                 response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
-                return LookupResult(
+                return None, LookupResult(
                     success=False,
                     source="api",
                     library=library,
@@ -613,6 +767,29 @@ class KBLookup:
                 exc_info=True
             )
 
+        return context7_id, None
+
+    async def _fetch_from_api(
+        self,
+        library: str,
+        topic: str,
+        start_time: datetime,
+        context7_id: str | None = None,
+    ) -> LookupResult:
+        """
+        Resolve, fetch and store an entry (lookup steps 3-5).
+
+        Resolution is skipped when context7_id is already known (batched
+        lookups resolve each library once).
+        """
+        analytics = self._get_analytics()
+        if context7_id is None:
+            context7_id, failure = await self._resolve_library_id(
+                library, topic, start_time
+            )
+            if failure is not None:
+                return failure
+
         # Step 4: Fetch from Context7 API
         if context7_id:
             content = None
@@ -684,7 +861,12 @@ class KBLookup:
                     response_time_ms=response_time,
                 )
 
-        # If we reach here, lookup failed
+        return self._lookup_failure(library, topic, context7_id, start_time)
+
+    def _lookup_failure(
+        self, library: str, topic: str, context7_id: str | None, start_time: datetime
+    ) -> LookupResult:
+        """Build the result for a failed fetch, preferring stale cached data."""
         response_time = (datetime.now(UTC) - start_time).total_seconds() * 1000
         
         # P1 Improvement: Try stale cache fallback before returning failure
@@ -1,11 +1,19 @@
 """
 Metadata Management - Handles metadata files for Context7 KB cache.
+
+Cache hits are counted in a process-wide buffer and written to meta.yaml at
+most once per flush interval (and at exit), so reads never rewrite YAML.
 """
 
 from __future__ import annotations
 
+import atexit
+import logging
+import threading
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
@@ -13,6 +21,11 @@ import yaml
 if TYPE_CHECKING:
     from .cache_structure import CacheStructure
 
+logger = logging.getLogger(__name__)
+
+# Seconds between writes of buffered hit counters
+HIT_FLUSH_INTERVAL_SECONDS = 30.0
+
 
 @dataclass
 class LibraryMetadata:
@@ -90,6 +103,94 @@ class CacheIndex:
         )
 
 
+class _HitCounterBuffer:
+    """
+    Process-wide buffer of pending cache hits, keyed by meta.yaml path.
+
+    Shared by all MetadataManager instances so short-lived managers do not
+    lose hits; flushed when the interval elapses, on demand, and at exit.
+    """
+
+    def __init__(self, flush_interval: float = HIT_FLUSH_INTERVAL_SECONDS):
+        self.flush_interval = flush_interval
+        self._pending: dict[Path, tuple[str, int, str]] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def add(self, meta_file: Path, library: str) -> None:
+        """Count one hit; flush everything if the interval has elapsed."""
+        now_iso = datetime.now(UTC).isoformat() + "Z"
+        with self._lock:
+            _, hits, _ = self._pending.get(meta_file, (library, 0, now_iso))
+            self._pending[meta_file] = (library, hits + 1, now_iso)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def peek(self, meta_file: Path) -> tuple[int, str] | None:
+        """Return (pending hits, last accessed) for a file without consuming."""
+        with self._lock:
+            pending = self._pending.get(meta_file)
+        return (pending[1], pending[2]) if pending else None
+
+    def take(self, meta_file: Path) -> tuple[int, str] | None:
+        """Remove and return (pending hits, last accessed) for a file."""
+        with self._lock:
+            pending = self._pending.pop(meta_file, None)
+        return (pending[1], pending[2]) if pending else None
+
+    def flush(self) -> int:
+        """
+        Write all pending hits to their meta.yaml files.
+
+        Returns:
+            Number of files written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        written = 0
+        for meta_file, (library, hits, last_accessed) in pending.items():
+            if not meta_file.parent.exists():
+                continue  # Library deleted since the hit
+            metadata = _read_library_metadata(meta_file) or LibraryMetadata(library=library)
+            metadata.cache_hits += hits
+            metadata.last_accessed = last_accessed
+            if _write_library_metadata(meta_file, metadata):
+                written += 1
+        return written
+
+    def clear(self) -> None:
+        """Drop pending hits without writing them."""
+        with self._lock:
+            self._pending.clear()
+
+
+def _read_library_metadata(meta_file: Path) -> LibraryMetadata | None:
+    if not meta_file.exists():
+        return None
+    try:
+        with open(meta_file, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        return LibraryMetadata.from_dict(data)
+    except (OSError, yaml.YAMLError):
+        return None
+
+
+def _write_library_metadata(meta_file: Path, metadata: LibraryMetadata) -> bool:
+    try:
+        with open(meta_file, "w", encoding="utf-8") as f:
+            yaml.dump(metadata.to_dict(), f, default_flow_style=False, sort_keys=False)
+        return True
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Failed to save library metadata for {metadata.library}: {e}")
+        return False
+
+
+_hit_buffer = _HitCounterBuffer()
+atexit.register(_hit_buffer.flush)
+
+
 class MetadataManager:
     """Manages metadata files for Context7 KB cache."""
 
@@ -113,15 +214,15 @@ class MetadataManager:
             LibraryMetadata instance or None if not found
         """
         meta_file = self.cache_structure.get_library_meta_file(library)
-        if not meta_file.exists():
-            return None
-
-        try:
-            with open(meta_file, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            return LibraryMetadata.from_dict(data)
-        except (OSError, yaml.YAMLError):
-            return None
+        metadata = _read_library_metadata(meta_file)
+        pending = _hit_buffer.peek(meta_file)
+        if pending is not None:
+            # Include hits not yet flushed to disk
+            if metadata is None:
+                metadata = LibraryMetadata(library=library)
+            metadata.cache_hits += pending[0]
+            metadata.last_accessed = pending[1]
+        return metadata
 
     def save_library_metadata(self, metadata: LibraryMetadata):
         """
@@ -135,13 +236,11 @@ class MetadataManager:
             self.cache_structure.ensure_library_dir(metadata.library)
 
             meta_file = self.cache_structure.get_library_meta_file(metadata.library)
-            with open(meta_file, "w", encoding="utf-8") as f:
-                yaml.dump(metadata.to_dict(), f, default_flow_style=False, sort_keys=False)
-        except (OSError, yaml.YAMLError) as e:
-            import logging
-            logger = logging.getLogger(__name__)
+        except OSError as e:
             logger.warning(f"Failed to save library metadata for {metadata.library}: {e}")
-            # Don't raise - allow caller to continue
+            return
+        # Don't raise on write failure - allow caller to continue
+        _write_library_metadata(meta_file, metadata)
 
     def update_library_metadata(
         self,
@@ -159,10 +258,16 @@ class MetadataManager:
             topic: Optional topic to add
             increment_hits: Whether to increment cache hits
         """
-        metadata = self.load_library_metadata(library)
+        meta_file = self.cache_structure.get_library_meta_file(library)
+        metadata = _read_library_metadata(meta_file)
         if metadata is None:
             metadata = LibraryMetadata(library=library)
 
+        # Fold buffered hits into this write
+        pending = _hit_buffer.take(meta_file)
+        if pending is not None:
+            metadata.cache_hits += pending[0]
+
         if context7_id is not None:
             metadata.context7_id = context7_id
 
@@ -175,6 +280,27 @@ class MetadataManager:
         metadata.last_accessed = datetime.now(UTC).isoformat() + "Z"
         self.save_library_metadata(metadata)
 
+    def record_hit(self, library: str) -> None:
+        """
+        Count a cache hit without writing meta.yaml.
+
+        Hits are buffered process-wide and written by flush_hits(), when the
+        flush interval elapses, or at interpreter exit.
+
+        Args:
+            library: Library name
+        """
+        _hit_buffer.add(self.cache_structure.get_library_meta_file(library), library)
+
+    def flush_hits(self) -> int:
+        """
+        Write all buffered cache hits to meta.yaml.
+
+        Returns:
+            Number of library metadata files written
+        """
+        return _hit_buffer.flush()
+
     def load_cache_index(self) -> CacheIndex:
         """
         Load master cache index.
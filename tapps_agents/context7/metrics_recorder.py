@@ -0,0 +1,363 @@
+"""
+Metrics Recorder - Process-wide counters and latency histogram for Context7.
+
+Analytics used to rewrite the whole metrics YAML (with up to 1,000 raw
+response times) on every hit, miss and API call. MetricsRecorder instead
+keeps counters and a fixed-size HDR-style latency histogram in memory,
+appends deltas to an append-only log (.metrics.log) at most once per flush
+interval, and periodically compacts the log into the .metrics.yaml snapshot.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from .cache_locking import cache_lock, get_cache_lock_file
+
+logger = logging.getLogger(__name__)
+
+COUNTER_NAMES = ("cache_hits", "cache_misses", "api_calls", "fuzzy_matches")
+
+# Seconds between appends of pending deltas to the log
+FLUSH_INTERVAL_SECONDS = 5.0
+
+# Log records after which the log is folded into the snapshot
+COMPACT_AFTER_RECORDS = 200
+
+SNAPSHOT_VERSION = 2
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-linear latency histogram (HDR-style).
+
+    Values are recorded in microseconds. Each power-of-two range is split
+    into SUB_BUCKETS linear buckets, so any reported percentile is within
+    about 3% of the true value, while memory stays constant regardless of
+    how many samples are recorded.
+    """
+
+    SUB_BUCKET_BITS = 4
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+    MAX_VALUE_US = (1 << 40) - 1  # ~12.7 days
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.sum_ms = 0.0
+
+    @classmethod
+    def bucket_index(cls, value_us: int) -> int:
+        """Return the bucket index for a value in microseconds."""
+        value_us = min(max(value_us, 0), cls.MAX_VALUE_US)
+        if value_us < cls.SUB_BUCKETS:
+            return value_us
+        shift = value_us.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return cls.SUB_BUCKETS * (shift + 1) + (value_us >> shift) - cls.SUB_BUCKETS
+
+    @classmethod
+    def bucket_value_ms(cls, index: int) -> float:
+        """Return the midpoint of a bucket in milliseconds."""
+        if index < cls.SUB_BUCKETS:
+            return index / 1000.0
+        shift = index // cls.SUB_BUCKETS - 1
+        lower = (cls.SUB_BUCKETS + index % cls.SUB_BUCKETS) << shift
+        return (lower + ((1 << shift) - 1) / 2) / 1000.0
+
+    def record(self, value_ms: float, count: int = 1) -> None:
+        """Record a latency sample."""
+        index = self.bucket_index(round(value_ms * 1000))
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.sum_ms += value_ms * count
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's samples to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+
+    def percentile(self, percent: float) -> float:
+        """Return the latency (ms) at the given percentile, or 0.0 if empty."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100.0 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return self.bucket_value_ms(index)
+        return self.bucket_value_ms(max(self.counts))
+
+    @property
+    def mean_ms(self) -> float:
+        """Exact mean latency in milliseconds."""
+        return self.sum_ms / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize (sparse buckets)."""
+        return {
+            "count": self.count,
+            "sum_ms": self.sum_ms,
+            "buckets": {str(k): v for k, v in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> LatencyHistogram:
+        """Deserialize; tolerates missing or malformed data."""
+        histogram = cls()
+        if not isinstance(data, dict):
+            return histogram
+        try:
+            histogram.counts = {
+                int(k): int(v) for k, v in (data.get("buckets") or {}).items()
+            }
+            histogram.count = int(data.get("count", sum(histogram.counts.values())))
+            histogram.sum_ms = float(data.get("sum_ms", 0.0))
+        except (TypeError, ValueError):
+            return cls()
+        return histogram
+
+
+@dataclass
+class _MetricsState:
+    counters: dict[str, int] = field(default_factory=lambda: dict.fromkeys(COUNTER_NAMES, 0))
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def is_empty(self) -> bool:
+        return not any(self.counters.values()) and self.latency.count == 0
+
+    def merge(self, other: _MetricsState) -> None:
+        for name, value in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        self.latency.merge(other.latency)
+
+
+class MetricsRecorder:
+    """
+    In-memory Context7 metrics with an append-only on-disk log.
+
+    Use get_metrics_recorder() to obtain the instance for a cache root.
+    """
+
+    def __init__(
+        self,
+        cache_root: Path,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        compact_after: int = COMPACT_AFTER_RECORDS,
+    ):
+        """
+        Initialize recorder and load persisted metrics.
+
+        Args:
+            cache_root: Context7 cache root (holds .metrics.yaml and .metrics.log)
+            flush_interval: Seconds between log appends
+            compact_after: Log records after which the log is compacted
+        """
+        self.cache_root = Path(cache_root)
+        self.snapshot_file = self.cache_root / ".metrics.yaml"
+        self.log_file = self.cache_root / ".metrics.log"
+        self.lock_file = get_cache_lock_file(self.cache_root, library=".metrics")
+        self.flush_interval = flush_interval
+        self.compact_after = compact_after
+
+        self._lock = threading.RLock()
+        self._persisted, self._log_records = self._load()
+        self._pending = _MetricsState()
+        self._last_flush = time.monotonic()
+
+    # ------------------------------------------------------------- recording
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._pending.counters[counter] = self._pending.counters.get(counter, 0) + amount
+        self._maybe_flush()
+
+    def record_latency(self, value_ms: float) -> None:
+        """Record a response time sample (milliseconds)."""
+        with self._lock:
+            self._pending.latency.record(value_ms)
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    # --------------------------------------------------------------- reading
+
+    def counters(self) -> dict[str, int]:
+        """Return current counter totals (persisted plus pending)."""
+        with self._lock:
+            return {
+                name: self._persisted.counters.get(name, 0) + self._pending.counters.get(name, 0)
+                for name in set(self._persisted.counters) | set(self._pending.counters)
+            }
+
+    def latency(self) -> LatencyHistogram:
+        """Return a copy of the current latency histogram."""
+        with self._lock:
+            histogram = LatencyHistogram()
+            histogram.merge(self._persisted.latency)
+            histogram.merge(self._pending.latency)
+            return histogram
+
+    # ----------------------------------------------------------- persistence
+
+    def flush(self) -> bool:
+        """
+        Append pending deltas to the log, compacting if it grew too long.
+
+        Returns:
+            True if nothing was pending or the deltas were written
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if self._pending.is_empty():
+                return True
+            pending = self._pending
+            record = {
+                "t": time.time(),
+                "c": {k: v for k, v in pending.counters.items() if v},
+                "h": pending.latency.to_dict(),
+            }
+            compacted = False
+            try:
+                self.cache_root.mkdir(parents=True, exist_ok=True)
+                with cache_lock(self.lock_file, timeout=2.0):
+                    with open(self.log_file, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                    self._log_records += 1
+                    if self._log_records >= self.compact_after:
+                        self._compact_locked()
+                        compacted = True
+            except (OSError, RuntimeError):
+                # Keep deltas pending; retried on the next flush
+                logger.debug("Failed to flush Context7 metrics", exc_info=True)
+                return False
+            if not compacted:
+                # A compaction reloads state from disk, which includes this record
+                self._persisted.merge(pending)
+            self._pending = _MetricsState()
+            return True
+
+    def compact(self) -> None:
+        """Fold the log into the snapshot now."""
+        with self._lock:
+            self.flush()
+            try:
+                with cache_lock(self.lock_file, timeout=2.0):
+                    self._compact_locked()
+            except (OSError, RuntimeError):
+                logger.debug("Failed to compact Context7 metrics", exc_info=True)
+
+    def reset(self) -> None:
+        """Reset all metrics to zero on disk and in memory."""
+        with self._lock:
+            self._pending = _MetricsState()
+            self._persisted = _MetricsState()
+            try:
+                self.cache_root.mkdir(parents=True, exist_ok=True)
+                with cache_lock(self.lock_file, timeout=2.0):
+                    self._write_snapshot(self._persisted)
+                    self.log_file.unlink(missing_ok=True)
+                    self._log_records = 0
+            except (OSError, RuntimeError):
+                logger.debug("Failed to reset Context7 metrics", exc_info=True)
+
+    def _compact_locked(self) -> None:
+        """Rewrite the snapshot from snapshot + log (caller holds the file lock)."""
+        state, _ = self._load()
+        self._write_snapshot(state)
+        self.log_file.unlink(missing_ok=True)
+        self._log_records = 0
+        # Also picks up deltas appended by other processes
+        self._persisted = state
+
+    def _write_snapshot(self, state: _MetricsState) -> None:
+        data = {
+            "version": SNAPSHOT_VERSION,
+            **state.counters,
+            "latency_histogram": state.latency.to_dict(),
+        }
+        temp_file = self.snapshot_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+        temp_file.replace(self.snapshot_file)
+
+    def _load(self) -> tuple[_MetricsState, int]:
+        """Load snapshot and replay the log; returns (state, log records)."""
+        state = _MetricsState()
+        if self.snapshot_file.exists():
+            try:
+                with open(self.snapshot_file, encoding="utf-8") as f:
+                    data = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError):
+                data = {}
+            for name in COUNTER_NAMES:
+                with contextlib.suppress(TypeError, ValueError):
+                    state.counters[name] = int(data.get(name, 0) or 0)
+            if "latency_histogram" in data:
+                state.latency = LatencyHistogram.from_dict(data["latency_histogram"])
+            else:
+                # Pre-histogram snapshot: raw response time list
+                for value in data.get("response_times") or []:
+                    if isinstance(value, (int, float)):
+                        state.latency.record(float(value))
+
+        records = 0
+        if self.log_file.exists():
+            try:
+                lines = self.log_file.read_text(encoding="utf-8").splitlines()
+            except OSError:
+                lines = []
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn write from a crashed process
+                delta = _MetricsState()
+                delta.counters = {k: int(v) for k, v in (record.get("c") or {}).items()}
+                delta.latency = LatencyHistogram.from_dict(record.get("h"))
+                state.merge(delta)
+                records += 1
+        return state, records
+
+
+_recorders: dict[Path, MetricsRecorder] = {}
+_recorders_lock = threading.Lock()
+
+
+def get_metrics_recorder(cache_root: Path) -> MetricsRecorder:
+    """Return the process-wide MetricsRecorder for a cache root."""
+    key = Path(cache_root).resolve()
+    recorder = _recorders.get(key)
+    if recorder is None:
+        with _recorders_lock:
+            recorder = _recorders.get(key)
+            if recorder is None:
+                recorder = MetricsRecorder(key)
+                _recorders[key] = recorder
+    return recorder
+
+
+def flush_all_metrics() -> None:
+    """Flush every recorder (registered at exit)."""
+    for recorder in list(_recorders.values()):
+        with contextlib.suppress(Exception):  # best effort at interpreter exit
+            recorder.flush()
+
+
+atexit.register(flush_all_metrics)
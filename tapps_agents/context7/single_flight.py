@@ -0,0 +1,78 @@
+"""
+Single-flight request coalescing for Context7 lookups.
+
+Concurrent callers that miss the KB cache for the same key share one
+upstream fetch: the first caller (the leader) runs it, later callers wait
+for and reuse its result. Flights are process-wide and safe across threads
+and event loops (e.g. parallel workflow steps each running asyncio.run).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class _LeaderCancelled(Exception):
+    """Set on a flight whose leader was cancelled before finishing."""
+
+
+class SingleFlight[T]:
+    """Coalesces concurrent async calls that share a key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, concurrent.futures.Future[T]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        Run ``fn`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Flight key
+            fn: Coroutine factory producing the result
+
+        Returns:
+            Tuple of (result, shared); shared is True if another caller's
+            result was reused. A leader's exception propagates to its waiters;
+            if the leader is cancelled, a waiter takes over instead.
+        """
+        while True:
+            with self._lock:
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = concurrent.futures.Future()
+                    # Running futures cannot be cancelled by waiters
+                    flight.set_running_or_notify_cancel()
+                    self._flights[key] = flight
+            if leader:
+                break
+            try:
+                # Shield so a cancelled waiter does not cancel the flight
+                return await asyncio.shield(asyncio.wrap_future(flight)), True
+            except _LeaderCancelled:
+                continue  # Retry, possibly as the new leader
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            flight.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Return True if a call for ``key`` is running."""
+        with self._lock:
+            return key in self._flights
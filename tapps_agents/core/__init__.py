@@ -36,6 +36,7 @@ from .adaptive_cache_config import (
     AdaptiveCacheSettings,
     ConfigurationChange,
 )
+from .adaptive_concurrency import AdaptiveConcurrencyController, ConcurrencyConfig
 from .adaptive_scoring import AdaptiveScoringEngine
 from .agent_base import BaseAgent
 from .agent_learning import (
@@ -206,6 +207,8 @@ __all__ = [
     "ExecutionMode",
     "AutoPause",
     "ResourceOptimizer",
+    "AdaptiveConcurrencyController",
+    "ConcurrencyConfig",
     "LongDurationManager",
     "DurabilityGuarantee",
     "FailureRecovery",
@@ -0,0 +1,238 @@
+"""
+Adaptive Concurrency Controller
+
+AIMD (additive-increase / multiplicative-decrease) limit for concurrent
+file operations. Concurrency grows by one slot per round of successful
+operations while the machine keeps up, and is cut on timeouts, circuit
+breaker trips, latency inflation or memory pressure.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from .hardware_profiler import HardwareProfiler
+from .resource_monitor import ResourceMetrics, ResourceMonitor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConcurrencyConfig:
+    """Configuration for adaptive concurrency."""
+
+    initial_limit: int = 2
+    min_limit: int = 1
+    max_limit: int | None = None  # None: logical CPU core count
+
+    # AIMD steps
+    additive_increase: int = 1
+    multiplicative_decrease: float = 0.5
+    decrease_cooldown: float = 2.0  # seconds between two decreases
+
+    # Overload signals
+    latency_tolerance: float = 3.0  # smoothed latency vs. best seen
+    latency_smoothing: float = 0.3  # EWMA weight of the newest sample
+    cpu_threshold: float = 90.0  # % - hold (no increase) above this
+    memory_threshold: float = 85.0  # % - decrease above this
+    sample_interval: float = 2.0  # seconds between resource samples
+
+
+class AdaptiveConcurrencyController:
+    """
+    Async concurrency limiter whose limit adapts with AIMD.
+
+    Example:
+        >>> controller = AdaptiveConcurrencyController(max_limit=8)
+        >>> async with controller.slot():
+        ...     start = time.monotonic()
+        ...     await do_work()
+        ...     await controller.record_success(time.monotonic() - start)
+    """
+
+    def __init__(
+        self,
+        config: ConcurrencyConfig | None = None,
+        *,
+        max_limit: int | None = None,
+        resource_monitor: ResourceMonitor | None = None,
+        hardware_profiler: HardwareProfiler | None = None,
+    ):
+        """
+        Initialize controller.
+
+        Args:
+            config: Controller configuration
+            max_limit: Upper bound on concurrency (overrides config.max_limit)
+            resource_monitor: Source of CPU/memory readings
+            hardware_profiler: Source of the CPU core count
+        """
+        self.config = config or ConcurrencyConfig()
+        self.resource_monitor = resource_monitor or ResourceMonitor(
+            cpu_threshold=self.config.cpu_threshold,
+            memory_threshold=self.config.memory_threshold,
+        )
+
+        cores = (hardware_profiler or HardwareProfiler()).get_metrics().cpu_cores
+        upper = max_limit or self.config.max_limit or cores
+        self.max_limit = max(self.config.min_limit, upper)
+        self.min_limit = self.config.min_limit
+        self.initial_limit = min(max(self.config.initial_limit, self.min_limit), self.max_limit)
+        self._limit = self.initial_limit
+
+        self._in_flight = 0
+        self._condition: asyncio.Condition | None = None
+        self._successes_since_adjust = 0
+        self._latency_ewma: float | None = None
+        self._best_latency: float | None = None
+        self._last_decrease = float("-inf")
+        self._last_sample = float("-inf")
+        self._last_metrics: ResourceMetrics | None = None
+
+        self.peak_limit = self._limit
+        self.increases = 0
+        self.decreases = 0
+        self.last_decrease_reason: str | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created lazily so the controller can be built outside an event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        """Release a slot acquired with acquire()."""
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    async def record_success(self, latency: float) -> None:
+        """
+        Record a completed operation and possibly grow the limit.
+
+        The limit grows by ``additive_increase`` once per ``limit`` successes
+        (one round of in-flight work), unless the latest readings show the
+        machine is not keeping up.
+
+        Args:
+            latency: Wall-clock seconds the operation took
+        """
+        alpha = self.config.latency_smoothing
+        self._latency_ewma = (
+            latency
+            if self._latency_ewma is None
+            else alpha * latency + (1 - alpha) * self._latency_ewma
+        )
+        if self._best_latency is None or self._latency_ewma < self._best_latency:
+            self._best_latency = self._latency_ewma
+
+        metrics = await self._sample_resources()
+        if metrics is not None and metrics.memory_percent > self.config.memory_threshold:
+            self.record_overload("memory")
+            return
+        if (
+            self._best_latency
+            and self._latency_ewma > self._best_latency * self.config.latency_tolerance
+        ):
+            self.record_overload("latency")
+            return
+        if metrics is not None and metrics.cpu_percent > self.config.cpu_threshold:
+            return  # Saturated but keeping up: hold
+
+        self._successes_since_adjust += 1
+        if self._successes_since_adjust >= self._limit and self._limit < self.max_limit:
+            self._set_limit(self._limit + self.config.additive_increase)
+            self.increases += 1
+            self._successes_since_adjust = 0
+
+    def record_overload(self, reason: str) -> None:
+        """
+        Cut the limit multiplicatively (timeouts, circuit breaker trips, ...).
+
+        Repeated signals within ``decrease_cooldown`` count once, so one burst
+        of failures from the same round does not collapse the limit to 1.
+
+        Args:
+            reason: Short label reported in the summary
+        """
+        now = time.monotonic()
+        if now - self._last_decrease < self.config.decrease_cooldown:
+            return
+        self._last_decrease = now
+        new_limit = max(self.min_limit, int(self._limit * self.config.multiplicative_decrease))
+        if new_limit < self._limit:
+            self.decreases += 1
+            logger.debug(
+                "Concurrency %s -> %s (%s)", self._limit, new_limit, reason
+            )
+        self._set_limit(new_limit)
+        self.last_decrease_reason = reason
+        self._successes_since_adjust = 0
+        # Latency under the new limit becomes the reference again
+        self._latency_ewma = None
+        self._best_latency = None
+
+    def _set_limit(self, value: int) -> None:
+        # Limit changes happen while a slot is held; its release() wakes the
+        # waiters, which re-check against the new limit
+        self._limit = min(self.max_limit, max(self.min_limit, value))
+        self.peak_limit = max(self.peak_limit, self._limit)
+
+    async def _sample_resources(self) -> ResourceMetrics | None:
+        """Return a resource reading at most every ``sample_interval`` seconds."""
+        now = time.monotonic()
+        if now - self._last_sample < self.config.sample_interval:
+            return self._last_metrics
+        self._last_sample = now
+        try:
+            # get_current_metrics() blocks ~100ms measuring CPU
+            self._last_metrics = await asyncio.to_thread(
+                self.resource_monitor.get_current_metrics
+            )
+        except Exception as e:
+            logger.debug("Resource sampling failed: %s", e)
+            self._last_metrics = None
+        return self._last_metrics
+
+    def summary(self) -> dict[str, Any]:
+        """Return the chosen concurrency and adjustment counts."""
+        return {
+            "initial": self.initial_limit,
+            "final": self._limit,
+            "peak": self.peak_limit,
+            "max": self.max_limit,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "last_decrease_reason": self.last_decrease_reason,
+        }
@@ -3,7 +3,7 @@ AST Parser - Extracts code structure for tiered context.
 """
 
 import ast
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +31,15 @@ class ClassInfo:
     docstring: str | None = None
 
 
+@dataclass
+class ImportInfo:
+    """A single import statement."""
+
+    module: str
+    names: list[str]
+    level: int = 0  # Leading dots of a relative import
+
+
 @dataclass
 class ModuleInfo:
     """Information about a module."""
@@ -40,6 +49,7 @@ class ModuleInfo:
     classes: list[ClassInfo]
     constants: list[tuple[str, Any]]
     docstring: str | None = None
+    import_details: list[ImportInfo] = field(default_factory=list)
 
 
 class ASTParser:
@@ -85,6 +95,7 @@ class ASTParser:
     def _extract_module_info(self, tree: ast.Module, code: str) -> ModuleInfo:
         """Extract module information from AST."""
         imports: list[str] = []
+        import_details: list[ImportInfo] = []
         functions: list[FunctionInfo] = []
         classes: list[ClassInfo] = []
         constants: list[tuple[str, Any]] = []
@@ -102,10 +113,18 @@ class ASTParser:
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     imports.append(alias.name)
+                    import_details.append(ImportInfo(module=alias.name, names=[]))
             elif isinstance(node, ast.ImportFrom):
                 module = node.module or ""
                 for alias in node.names:
                     imports.append(f"{module}.{alias.name}" if module else alias.name)
+                import_details.append(
+                    ImportInfo(
+                        module=module,
+                        names=[alias.name for alias in node.names],
+                        level=node.level,
+                    )
+                )
             elif isinstance(node, ast.FunctionDef):
                 func_info = self._extract_function_info(node, code)
                 functions.append(func_info)
@@ -128,6 +147,7 @@ class ASTParser:
             classes=classes,
             constants=constants,
             docstring=docstring,
+            import_details=import_details,
         )
 
     def _extract_function_info(self, node: ast.FunctionDef, code: str) -> FunctionInfo:
@@ -186,6 +206,66 @@ class ASTParser:
             docstring=docstring,
         )
 
+    def resolve_local_imports(
+        self, file_path: Path, use_cache: bool = True
+    ) -> list[Path]:
+        """
+        Resolve a file's imports to source files on disk.
+
+        Relative imports resolve against the file's package; absolute imports
+        against the file's directory and the directory containing its
+        top-level package. Third-party and stdlib modules are not found there
+        and are skipped.
+
+        Args:
+            file_path: Path to the Python file
+            use_cache: Whether to use cached parse results
+
+        Returns:
+            Resolved module files (deduplicated, excluding file_path itself)
+        """
+        file_path = file_path.resolve()
+        module_info = self.parse_file(file_path, use_cache=use_cache)
+
+        # Directory holding the top-level package (a sys.path entry)
+        package_root = file_path.parent
+        while (package_root / "__init__.py").exists() and package_root.parent != package_root:
+            package_root = package_root.parent
+        search_roots = list(dict.fromkeys([file_path.parent, package_root]))
+
+        resolved: dict[Path, None] = {}
+
+        def add_module(base: Path, dotted: str) -> bool:
+            parts = [p for p in dotted.split(".") if p]
+            target = base.joinpath(*parts)
+            candidates = [target / "__init__.py"]
+            if parts:
+                candidates.insert(0, target.with_suffix(".py"))
+            for candidate in candidates:
+                if candidate.is_file():
+                    if candidate != file_path:
+                        resolved[candidate] = None
+                    return True
+            return target.is_dir()  # Namespace package
+
+        for info in module_info.import_details:
+            if info.level:
+                bases = [file_path.parent]
+                for _ in range(info.level - 1):
+                    bases = [bases[0].parent]
+            else:
+                bases = search_roots
+            for base in bases:
+                if not add_module(base, info.module):
+                    continue
+                # "from pkg import mod" may name submodules
+                for name in info.names:
+                    if name != "*":
+                        add_module(base, f"{info.module}.{name}")
+                break
+
+        return list(resolved)
+
     def clear_cache(self):
         """Clear the parser cache."""
         self._cache.clear()
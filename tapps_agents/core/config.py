@@ -144,6 +144,26 @@ class ReviewerAgentConfig(BaseModel):
         default=True,
         description="Enable parallel execution of quality tools (Ruff, mypy, bandit)",
     )
+    batch_tools: bool = Field(
+        default=True,
+        description=(
+            "For multi-file reviewer commands, run ruff/mypy/bandit/jscpd once over "
+            "all files and split results per file instead of launching them per file"
+        ),
+    )
+    scoring_backend: str = Field(
+        default="thread",
+        pattern="^(thread|process)$",
+        description=(
+            "Where CPU-bound scoring runs: 'thread' (default) or 'process' "
+            "(warm worker processes, scales across cores)"
+        ),
+    )
+    scoring_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Worker processes for the 'process' scoring backend (default: CPU count)",
+    )
     context7: ReviewerAgentContext7Config = Field(
         default_factory=ReviewerAgentContext7Config,
         description="Context7 integration settings for Reviewer Agent"
@@ -352,6 +372,11 @@ class Context7KnowledgeBaseConfig(BaseModel):
     auto_cleanup_threshold: float = Field(
         default=0.9, ge=0.0, le=1.0, description="Cleanup when cache reaches this fraction of max size"
     )
+    fetch_lease_timeout: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds to wait for another process fetching the same entry (0=no cross-process lease)",
+    )
 
 
 class Context7RefreshConfig(BaseModel):
@@ -785,6 +810,27 @@ class ExpertConfig(BaseModel):
         description="Approximate weight for supporting experts in agreement calculation",
     )
 
+    # Multi-expert consultation fan-out
+    max_concurrent_consultations: int = Field(
+        default=4, ge=1, le=32, description="Maximum experts consulted concurrently"
+    )
+    consultation_timeout: float = Field(
+        default=60.0,
+        gt=0.0,
+        le=600.0,
+        description="Per-expert consultation timeout (seconds)",
+    )
+    early_exit_on_agreement: bool = Field(
+        default=False,
+        description="Return once the primary expert and a quorum of supporting experts reach the high agreement threshold",
+    )
+    consultation_quorum: int = Field(
+        default=2,
+        ge=1,
+        le=20,
+        description="Supporting expert responses required before an early exit",
+    )
+
     @model_validator(mode="after")
     def validate_weights_sum(self):
         """Ensure confidence weights sum to approximately 1.0"""
@@ -10,17 +10,19 @@ Provides consistent debug logging with:
 This utility fixes the path resolution issue where debug logs were written
 to subdirectories instead of project root, causing failures when running
 from subdirectories.
+
+Entries are written through the buffered tracer (see tracing.py) and only
+when tracing is enabled, e.g. ``TAPPS_AGENTS_TRACE=debug``.
 """
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .path_validator import PathValidator
+from .tracing import TraceLevel, get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +35,10 @@ def write_debug_log(
     """
     Write debug log entry with project root detection and non-blocking error handling.
     
-    This function ensures debug logs are always written to the project root's
-    `.cursor/debug.log` file, regardless of the current working directory.
+    Entries go to the project root's `.cursor/debug.log` file, regardless of
+    the current working directory. They are queued and appended in batches
+    by the tracer's background writer; when tracing is disabled (the default)
+    nothing is done.
     
     Args:
         message: Dictionary containing log entry data
@@ -42,7 +46,8 @@ def write_debug_log(
         location: Optional location identifier (e.g., "reviewer/agent.py:733")
     
     Returns:
-        True if log was written successfully, False otherwise (non-blocking)
+        True if the entry was queued, False if tracing is disabled or it
+        failed (non-blocking)
     
     Example:
         >>> write_debug_log({
@@ -51,37 +56,14 @@ def write_debug_log(
         ...     "data": {"file": "src/main.py"}
         ... }, location="reviewer/agent.py:733")
     """
+    tracer = get_tracer()
+    if not tracer.enabled(TraceLevel.DEBUG):
+        return False
     try:
-        # Use PathValidator to detect project root (not current working directory)
-        validator = PathValidator(project_root)
-        log_path = validator.project_root / ".cursor" / "debug.log"
-        
-        # Create .cursor directory if it doesn't exist
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Prepare log entry with timestamp and location
-        log_entry = {
-            **message,
-            "timestamp": int(datetime.now().timestamp() * 1000),
-            "iso_timestamp": datetime.now().isoformat(),
-        }
-        
-        if location:
-            log_entry["location"] = location
-        
-        # Write log entry (append mode)
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
-        
+        tracer.log(message, project_root=project_root, location=location)
         return True
-        
-    except OSError as e:
-        # Silently ignore - debug logs are non-critical
-        # Only log to Python logger at debug level (not stderr)
-        logger.debug(f"Debug log write failed (non-critical): {e}")
-        return False
     except Exception as e:
-        # Catch any other unexpected errors
+        # Debug logs are non-critical
         logger.debug(f"Unexpected error in debug log write: {e}")
         return False
 
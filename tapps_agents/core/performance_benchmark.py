@@ -4,6 +4,7 @@ Performance Benchmarks for NUC Optimization
 Measures and compares performance before/after optimization.
 """
 
+import ast
 import json
 import time
 from dataclasses import asdict, dataclass
@@ -58,6 +59,312 @@ class BenchmarkComparison:
         }
 
 
+@dataclass
+class ParseCountResult:
+    """Source parses performed while scoring a set of files."""
+
+    files: int
+    parses_before: int
+    parses_after: int
+    duration_before: float = 0.0
+    duration_after: float = 0.0
+
+    @property
+    def parses_per_file_before(self) -> float:
+        """Average parses per file without a shared analysis context."""
+        return self.parses_before / self.files if self.files else 0.0
+
+    @property
+    def parses_per_file_after(self) -> float:
+        """Average parses per file with a shared analysis context."""
+        return self.parses_after / self.files if self.files else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data["parses_per_file_before"] = self.parses_per_file_before
+        data["parses_per_file_after"] = self.parses_per_file_after
+        return data
+
+
+def benchmark_scoring_parses(files: list[Path]) -> ParseCountResult:
+    """
+    Micro-benchmark: count ``ast.parse`` calls made by the AST-based scorers.
+
+    Runs the in-process scorers that parse source (complexity, maintainability,
+    performance, and their issue extractors) once without and once with a
+    shared FileAnalysisContext. External tools (ruff, mypy, bandit, jscpd) are
+    not run since they do their own parsing out of process.
+
+    Args:
+        files: Python files to score
+
+    Returns:
+        ParseCountResult with before/after parse counts
+    """
+    from ..agents.reviewer.analysis_context import FileAnalysisContext
+    from ..agents.reviewer.scoring import CodeScorer
+    from .language_detector import Language
+
+    sources = [(f, f.read_text(encoding="utf-8", errors="replace")) for f in files]
+    scorer = CodeScorer(ruff_enabled=False, mypy_enabled=False, jscpd_enabled=False)
+    counter = {"parses": 0}
+    original_parse = ast.parse
+
+    def counting_parse(source, *args, **kwargs):  # type: ignore[no-untyped-def]
+        # Only count real source parses; radon re-submits finished trees
+        if isinstance(source, (str, bytes)):
+            counter["parses"] += 1
+        return original_parse(source, *args, **kwargs)
+
+    def run(shared: bool) -> tuple[int, float]:
+        counter["parses"] = 0
+        start = time.perf_counter()
+        for file_path, code in sources:
+            analysis = FileAnalysisContext(file_path, code, Language.PYTHON) if shared else None
+            context = analysis.as_scorer_context() if analysis else None
+            scorer._calculate_complexity(code, analysis)
+            scorer._calculate_maintainability(code, analysis)
+            scorer._get_performance_scorer().calculate(
+                code, Language.PYTHON, file_path, context=context
+            )
+            scorer.get_maintainability_issues(code, file_path, analysis=analysis)
+            scorer.get_performance_issues(code, file_path, analysis=analysis)
+        return counter["parses"], time.perf_counter() - start
+
+    ast.parse = counting_parse  # type: ignore[assignment]
+    try:
+        parses_before, duration_before = run(shared=False)
+        parses_after, duration_after = run(shared=True)
+    finally:
+        ast.parse = original_parse  # type: ignore[assignment]
+
+    return ParseCountResult(
+        files=len(sources),
+        parses_before=parses_before,
+        parses_after=parses_after,
+        duration_before=duration_before,
+        duration_after=duration_after,
+    )
+
+
+@dataclass
+class BackendBenchmarkResult:
+    """Wall time to score a set of files on the thread vs. process backend."""
+
+    files: int
+    workers: int
+    thread_seconds: float
+    process_seconds: float
+    process_startup_seconds: float = 0.0
+
+    @property
+    def speedup(self) -> float:
+        """Thread time divided by process time (>1 means processes win)."""
+        return self.thread_seconds / self.process_seconds if self.process_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data["speedup"] = self.speedup
+        return data
+
+
+def benchmark_scoring_backends(
+    files: list[Path], workers: int | None = None, include_tools: bool = False
+) -> BackendBenchmarkResult:
+    """
+    Benchmark: score ``files`` concurrently on the thread and process backends.
+
+    Both backends score with the same number of concurrent workers. Worker
+    start-up (spawn + scorer preload) is measured separately from scoring.
+    By default ruff, mypy and jscpd are disabled so the comparison covers the
+    in-process, CPU-bound scorers (radon, AST walks, bandit).
+
+    Args:
+        files: Python files to score
+        workers: Concurrent workers for both backends (default: CPU count)
+        include_tools: Also run ruff/mypy/jscpd
+
+    Returns:
+        BackendBenchmarkResult with wall times and speedup
+    """
+    import asyncio
+    import os
+
+    from ..agents.reviewer.scorer_registry import ScorerRegistry
+    from ..agents.reviewer.scoring import CodeScorer
+    from ..agents.reviewer.scoring_pool import ScoringProcessPool
+    from ..agents.reviewer.tools.tool_memo import get_tool_result_memo
+    from .config import ProjectConfig
+    from .language_detector import Language
+
+    workers = workers or os.cpu_count() or 1
+    config = ProjectConfig()
+    if not include_tools:
+        config.quality_tools.ruff_enabled = False
+        config.quality_tools.mypy_enabled = False
+        config.quality_tools.jscpd_enabled = False
+    scorer = ScorerRegistry._instantiate_scorer(CodeScorer, Language.PYTHON, config)
+    sources = [(f, f.read_text(encoding="utf-8", errors="replace")) for f in files]
+
+    async def run_threads() -> None:
+        semaphore = asyncio.Semaphore(workers)
+
+        async def score(file_path: Path, code: str) -> None:
+            async with semaphore:
+                analysis = ScorerRegistry.create_analysis_context(
+                    file_path, code, Language.PYTHON
+                )
+                await asyncio.to_thread(
+                    ScorerRegistry.run_scorer, scorer, file_path, code, analysis
+                )
+
+        await asyncio.gather(*(score(f, c) for f, c in sources))
+
+    async def run_processes(pool: ScoringProcessPool) -> None:
+        await asyncio.gather(
+            *(pool.score(scorer, f, c, Language.PYTHON) for f, c in sources)
+        )
+
+    # Memoized bandit runs would let the second backend skip work
+    get_tool_result_memo().clear()
+    start = time.perf_counter()
+    asyncio.run(run_threads())
+    thread_seconds = time.perf_counter() - start
+
+    get_tool_result_memo().clear()
+    pool = ScoringProcessPool(max_workers=workers, config=config)
+    try:
+        start = time.perf_counter()
+        pool.warm_up()
+        startup_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        asyncio.run(run_processes(pool))
+        process_seconds = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    return BackendBenchmarkResult(
+        files=len(sources),
+        workers=workers,
+        thread_seconds=thread_seconds,
+        process_seconds=process_seconds,
+        process_startup_seconds=startup_seconds,
+    )
+
+
+@dataclass
+class SchedulingBenchmarkResult:
+    """Wall time to run a synthetic workflow with sequential vs. DAG scheduling."""
+
+    steps: int
+    max_parallel: int
+    sequential_seconds: float
+    dag_seconds: float
+    sequential_rounds: int
+    dag_rounds: int
+
+    @property
+    def speedup(self) -> float:
+        """Sequential time divided by DAG time (>1 means DAG wins)."""
+        return self.sequential_seconds / self.dag_seconds if self.dag_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data["speedup"] = self.speedup
+        return data
+
+
+def fan_out_fan_in_steps(steps: int = 50) -> list[Any]:
+    """
+    Build a synthetic fan-out/fan-in workflow.
+
+    A ``plan`` step creates ``spec``; ``steps - 2`` independent ``part-<i>``
+    steps each require ``spec``; a ``merge`` step requires every part. The
+    steps are also chained with ``next:`` in declaration order, as generated
+    workflows are.
+
+    Args:
+        steps: Total number of steps (at least 3)
+
+    Returns:
+        List of WorkflowStep
+    """
+    from ..workflow.models import WorkflowStep
+
+    parts = [f"part-{i}" for i in range(max(steps - 2, 1))]
+    step_ids = ["plan", *parts, "merge"]
+    workflow_steps = [WorkflowStep(id="plan", agent="planner", action="plan", creates=["spec"])]
+    workflow_steps += [
+        WorkflowStep(id=part, agent="implementer", action="implement", requires=["spec"], creates=[part])
+        for part in parts
+    ]
+    workflow_steps.append(WorkflowStep(id="merge", agent="reviewer", action="review", requires=parts))
+    for step, next_id in zip(workflow_steps, step_ids[1:], strict=False):
+        step.next = next_id
+    return workflow_steps
+
+
+def benchmark_workflow_scheduling(
+    steps: int = 50, step_seconds: float = 0.01, max_parallel: int = 8
+) -> SchedulingBenchmarkResult:
+    """
+    Benchmark: run a fan-out/fan-in workflow under both scheduling modes.
+
+    Each step sleeps for ``step_seconds``. The loop mirrors
+    WorkflowExecutor.execute(): find ready steps, run them with
+    ParallelStepExecutor.execute_parallel, record completions, repeat.
+
+    Args:
+        steps: Number of steps in the synthetic workflow
+        step_seconds: Simulated duration of every step
+        max_parallel: Concurrent step limit
+
+    Returns:
+        SchedulingBenchmarkResult with wall times and scheduling rounds
+    """
+    import asyncio
+
+    from ..workflow.models import WorkflowState
+    from ..workflow.parallel_executor import ParallelStepExecutor
+
+    workflow_steps = fan_out_fan_in_steps(steps)
+
+    async def execute_step(step: Any) -> dict[str, Any]:
+        await asyncio.sleep(step_seconds)
+        return {}
+
+    async def run(scheduling: str) -> tuple[float, int]:
+        executor = ParallelStepExecutor(max_parallel=max_parallel, scheduling=scheduling)
+        state = WorkflowState(workflow_id=f"benchmark-{scheduling}", started_at=datetime.now())
+        completed: set[str] = set()
+        artifacts: set[str] = set()
+        rounds = 0
+        start = time.perf_counter()
+        while ready := executor.find_ready_steps(workflow_steps, completed, set(), artifacts):
+            for result in await executor.execute_parallel(ready, execute_step, state=state):
+                completed.add(result.step.id)
+                artifacts.update(result.step.creates)
+            rounds += 1
+        if len(completed) != len(workflow_steps):
+            raise RuntimeError(f"{scheduling} scheduling stalled after {len(completed)} steps")
+        return time.perf_counter() - start, rounds
+
+    sequential_seconds, sequential_rounds = asyncio.run(run("sequential"))
+    dag_seconds, dag_rounds = asyncio.run(run("dag"))
+
+    return SchedulingBenchmarkResult(
+        steps=len(workflow_steps),
+        max_parallel=max_parallel,
+        sequential_seconds=sequential_seconds,
+        dag_seconds=dag_seconds,
+        sequential_rounds=sequential_rounds,
+        dag_rounds=dag_rounds,
+    )
+
+
 class PerformanceBenchmark:
     """Performance benchmarking for NUC optimization."""
 
@@ -0,0 +1,459 @@
+"""
+Tracing - Buffered, level-gated spans and events for tapps-agents.
+
+Replaces per-call appends to ``.cursor/debug.log`` on hot paths:
+
+- Level-gated: when tracing is off (the default) span() returns a shared
+  no-op span and event() returns immediately, so nothing is formatted,
+  queued or written
+- Buffered: records go to an in-memory queue drained by a background
+  writer thread, which appends them in batches (one open per log file per
+  flush interval instead of one per record)
+- Spans carry start/end timestamps and duration
+- Optional export of recorded spans/events as Chrome trace JSON, loadable
+  in chrome://tracing and https://ui.perfetto.dev
+
+Configuration (environment, read once when the tracer is created):
+
+- ``TAPPS_AGENTS_TRACE``: off | info | debug | trace (or 0-3; ``1``/``true``
+  mean debug)
+- ``TAPPS_AGENTS_TRACE_CHROME``: write a Chrome trace file here at exit
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from enum import IntEnum
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV_VAR = "TAPPS_AGENTS_TRACE"
+CHROME_TRACE_ENV_VAR = "TAPPS_AGENTS_TRACE_CHROME"
+
+# Seconds the writer waits to batch records before appending them
+FLUSH_INTERVAL_SECONDS = 1.0
+
+# Spans/events kept in memory for Chrome trace export
+MAX_TRACE_EVENTS = 100_000
+
+
+class TraceLevel(IntEnum):
+    """Trace verbosity; a record is kept if its level <= the tracer level."""
+
+    OFF = 0
+    INFO = 1
+    DEBUG = 2
+    TRACE = 3
+
+
+def parse_trace_level(value: str | None) -> TraceLevel:
+    """
+    Parse a trace level from a name or number.
+
+    Args:
+        value: e.g. "debug", "2", "true"; empty or unknown means OFF
+
+    Returns:
+        TraceLevel
+    """
+    if not value:
+        return TraceLevel.OFF
+    value = value.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return TraceLevel.DEBUG
+    if value.isdigit():
+        return TraceLevel(min(int(value), TraceLevel.TRACE))
+    try:
+        return TraceLevel[value.upper()]
+    except KeyError:
+        return TraceLevel.OFF
+
+
+def _resolve_debug_log_path(project_root: Path | None) -> Path:
+    from .path_validator import PathValidator
+
+    return PathValidator(project_root).project_root / ".cursor" / "debug.log"
+
+
+class _NoopSpan:
+    """Span returned when tracing is disabled; every operation is free."""
+
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """A timed operation; recorded when the ``with`` block exits."""
+
+    __slots__ = ("_tracer", "attrs", "name", "project_root", "start_ns", "wall_start")
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        attrs: dict[str, Any],
+        project_root: Path | None = None,
+    ):
+        self._tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.project_root = project_root
+        self.start_ns = 0
+        self.wall_start = 0.0
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes (e.g. results) to the span."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> Span:
+        self.wall_start = time.time()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self._tracer._finish_span(self, end_ns)
+
+
+class Tracer:
+    """
+    Level-gated tracer with a background batch writer.
+
+    Use get_tracer() for the process-wide instance.
+    """
+
+    def __init__(
+        self,
+        level: TraceLevel = TraceLevel.OFF,
+        log_path: Path | None = None,
+        chrome_trace_path: Path | None = None,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_events: int = MAX_TRACE_EVENTS,
+    ):
+        """
+        Initialize tracer.
+
+        Args:
+            level: Records above this level are dropped
+            log_path: JSONL log file (default: <project root>/.cursor/debug.log)
+            chrome_trace_path: Chrome trace file written at exit, if set
+            flush_interval: Seconds the writer batches records for
+            max_events: Spans/events kept in memory for Chrome export
+        """
+        self.level = level
+        self.log_path = Path(log_path) if log_path else None
+        self.chrome_trace_path = Path(chrome_trace_path) if chrome_trace_path else None
+        self.flush_interval = flush_interval
+
+        self._queue: queue.SimpleQueue[tuple[Path | None, dict[str, Any]]] = queue.SimpleQueue()
+        self._trace_events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._paths: dict[Path | None, Path] = {}
+        self._write_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._pending = threading.Event()
+        self._pid = os.getpid()
+
+    # ------------------------------------------------------------- recording
+
+    def enabled(self, level: TraceLevel = TraceLevel.DEBUG) -> bool:
+        """Return True if records at ``level`` are kept (guard costly data)."""
+        return self.level >= level > TraceLevel.OFF
+
+    def span(
+        self,
+        name: str,
+        level: TraceLevel = TraceLevel.DEBUG,
+        project_root: Path | None = None,
+        **attrs: Any,
+    ) -> Span | _NoopSpan:
+        """
+        Start a span; use as a context manager.
+
+        Args:
+            name: Span name (e.g. "context7.lookup")
+            level: Span level
+            project_root: Project whose debug log receives the record
+            **attrs: Span attributes
+
+        Returns:
+            Span, or a shared no-op span when the level is disabled
+        """
+        if not self.level >= level > TraceLevel.OFF:
+            return NOOP_SPAN
+        return Span(self, name, attrs, project_root)
+
+    def event(
+        self,
+        name: str,
+        data: dict[str, Any] | None = None,
+        level: TraceLevel = TraceLevel.DEBUG,
+        location: str | None = None,
+        project_root: Path | None = None,
+    ) -> None:
+        """
+        Record an instant event.
+
+        Args:
+            name: Event name / message
+            data: Event attributes
+            level: Event level
+            location: Source location (e.g. "context7/lookup.py:lookup")
+            project_root: Project whose debug log receives the record
+        """
+        if not self.level >= level > TraceLevel.OFF:
+            return
+        record: dict[str, Any] = {"type": "event", "message": name}
+        if data:
+            record["data"] = data
+        self.log(record, project_root=project_root, location=location)
+
+    def log(
+        self,
+        record: dict[str, Any],
+        project_root: Path | None = None,
+        location: str | None = None,
+    ) -> None:
+        """
+        Queue a raw JSON record for the debug log (no level check).
+
+        Args:
+            record: Log entry; timestamps and location are added
+            project_root: Project whose debug log receives the record
+            location: Source location
+        """
+        now = time.time()
+        entry = {
+            **record,
+            "timestamp": int(now * 1000),
+            "iso_timestamp": datetime.fromtimestamp(now).isoformat(),
+        }
+        if location:
+            entry["location"] = location
+        data = record.get("data")
+        self._trace_events.append(
+            {
+                "name": str(record.get("message", "event")),
+                "ph": "i",
+                "s": "t",
+                "ts": time.perf_counter_ns() // 1000,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": {"location": location, **(data if isinstance(data, dict) else {})},
+            }
+        )
+        self._enqueue(project_root, entry)
+
+    def _finish_span(self, span: Span, end_ns: int) -> None:
+        duration_ns = end_ns - span.start_ns
+        tid = threading.get_ident()
+        self._trace_events.append(
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": span.start_ns // 1000,
+                "dur": duration_ns // 1000,
+                "pid": self._pid,
+                "tid": tid,
+                "args": span.attrs,
+            }
+        )
+        self._enqueue(
+            span.project_root,
+            {
+                "type": "span",
+                "message": span.name,
+                "data": span.attrs,
+                "start": span.wall_start,
+                "end": span.wall_start + duration_ns / 1e9,
+                "duration_ms": duration_ns / 1e6,
+                "thread": tid,
+                "timestamp": int(span.wall_start * 1000),
+                "iso_timestamp": datetime.fromtimestamp(span.wall_start).isoformat(),
+            },
+        )
+
+    def _enqueue(self, project_root: Path | None, entry: dict[str, Any]) -> None:
+        self._queue.put((project_root, entry))
+        if self._writer is None:
+            self._start_writer()
+        self._pending.set()
+
+    # --------------------------------------------------------------- writing
+
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="tapps-trace-writer", daemon=True
+                )
+                self._writer.start()
+
+    def _run_writer(self) -> None:
+        while not self._stop.is_set():
+            self._pending.wait()
+            # Let records accumulate so each file is opened once per batch
+            self._stop.wait(self.flush_interval)
+            self._pending.clear()
+            self._drain()
+
+    def _drain(self) -> int:
+        with self._write_lock:
+            batch: list[tuple[Path | None, dict[str, Any]]] = []
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            by_path: dict[Path, list[str]] = {}
+            for project_root, entry in batch:
+                try:
+                    path = self._log_path_for(project_root)
+                    by_path.setdefault(path, []).append(json.dumps(entry, default=str))
+                except Exception as e:  # Non-critical: drop the record
+                    logger.debug(f"Dropping trace record: {e}")
+            for path, lines in by_path.items():
+                try:
+                    with open(path, "a", encoding="utf-8") as f:
+                        f.write("\n".join(lines) + "\n")
+                except OSError as e:
+                    logger.debug(f"Trace log write failed (non-critical): {e}")
+            return len(batch)
+
+    def _log_path_for(self, project_root: Path | None) -> Path:
+        if self.log_path is not None:
+            project_root = None
+        path = self._paths.get(project_root)
+        if path is None:
+            path = self.log_path or _resolve_debug_log_path(project_root)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._paths[project_root] = path
+        return path
+
+    def flush(self) -> int:
+        """
+        Write all queued records now.
+
+        Returns:
+            Number of records written
+        """
+        return self._drain()
+
+    # ---------------------------------------------------------------- export
+
+    def export_chrome_trace(self, path: Path) -> Path:
+        """
+        Write recorded spans and events as Chrome trace JSON.
+
+        Args:
+            path: Output file (open in chrome://tracing or ui.perfetto.dev)
+
+        Returns:
+            The written path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"traceEvents": list(self._trace_events), "displayTimeUnit": "ms"}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        return path
+
+    def clear(self) -> None:
+        """Drop in-memory spans/events kept for export."""
+        self._trace_events.clear()
+
+    def shutdown(self) -> None:
+        """Flush, export the Chrome trace if configured, and stop the writer."""
+        self._stop.set()
+        self._pending.set()
+        self.flush()
+        if self.chrome_trace_path and self._trace_events:
+            try:
+                self.export_chrome_trace(self.chrome_trace_path)
+            except OSError as e:
+                logger.debug(f"Chrome trace export failed: {e}")
+
+
+_tracer: Tracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer (configured from the environment)."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                chrome_path = os.environ.get(CHROME_TRACE_ENV_VAR)
+                _tracer = Tracer(
+                    level=parse_trace_level(os.environ.get(TRACE_ENV_VAR)),
+                    chrome_trace_path=Path(chrome_path) if chrome_path else None,
+                )
+    return _tracer
+
+
+def configure_tracing(
+    level: TraceLevel | str = TraceLevel.DEBUG,
+    log_path: Path | None = None,
+    chrome_trace_path: Path | None = None,
+    flush_interval: float = FLUSH_INTERVAL_SECONDS,
+) -> Tracer:
+    """
+    Replace the process-wide tracer (flushing the previous one).
+
+    Args:
+        level: TraceLevel or level name
+        log_path: JSONL log file (default: <project root>/.cursor/debug.log)
+        chrome_trace_path: Chrome trace file written at exit
+        flush_interval: Seconds the writer batches records for
+
+    Returns:
+        The new tracer
+    """
+    global _tracer
+    if isinstance(level, str):
+        level = parse_trace_level(level)
+    with _tracer_lock:
+        previous, _tracer = _tracer, Tracer(
+            level=level,
+            log_path=log_path,
+            chrome_trace_path=chrome_trace_path,
+            flush_interval=flush_interval,
+        )
+    if previous is not None:
+        previous.shutdown()
+    return _tracer
+
+
+def _shutdown_tracer() -> None:
+    if _tracer is not None:
+        with contextlib.suppress(Exception):  # best effort at interpreter exit
+            _tracer.shutdown()
+
+
+atexit.register(_shutdown_tracer)
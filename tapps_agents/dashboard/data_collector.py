@@ -535,10 +535,17 @@ class DashboardDataCollector:
             if not events_dir.exists():
                 return []
 
-            event_files = sorted(events_dir.glob("*.json"), reverse=True)[:limit]
+            from ..workflow.segmented_log import SegmentedEventLog
+
+            # Read-only: legacy event files are migrated by the event bus, not here
+            log = SegmentedEventLog(events_dir, read_only=True)
+            records = [record.data for record in log.tail(limit=limit)]
+            # Legacy per-event files not migrated yet are older than the log
+            for ef in sorted(events_dir.glob("*.json"), reverse=True)[: limit - len(records)]:
+                records.append(_read_json(ef))
+
             events = []
-            for ef in event_files:
-                data = _read_json(ef)
+            for data in records:
                 if data:
                     events.append({
                         "timestamp": data.get("timestamp", ""),
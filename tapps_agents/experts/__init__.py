@@ -62,9 +62,22 @@ from .observability import (
     RAGMetrics,
     WeakArea,
 )
-from .performance_tracker import ExpertPerformance, ExpertPerformanceTracker
+from .performance_tracker import (
+    ConsultationWriter,
+    ExpertPerformance,
+    ExpertPerformanceTracker,
+    get_consultation_writer,
+)
+from .rag_bm25 import BM25Index
+from .rag_chunk_store import ChunkStore
 from .rag_chunker import Chunk, Chunker
-from .rag_embedder import Embedder, SentenceTransformerEmbedder, create_embedder
+from .rag_embedder import (
+    Embedder,
+    SentenceTransformerEmbedder,
+    SharedEmbedder,
+    create_embedder,
+    get_shared_embedder,
+)
 from .rag_evaluation import (
     EvaluationMetrics,
     EvaluationQuestion,
@@ -101,9 +114,13 @@ __all__ = [
     "Chunker",
     "Embedder",
     "SentenceTransformerEmbedder",
+    "SharedEmbedder",
     "create_embedder",
+    "get_shared_embedder",
     "IndexMetadata",
     "VectorIndex",
+    "ChunkStore",
+    "BM25Index",
     "RAGEvaluator",
     "EvaluationMetrics",
     "EvaluationQuestion",
@@ -160,6 +177,8 @@ __all__ = [
     "GeneratedExpert",
     "ExpertPerformanceTracker",
     "ExpertPerformance",
+    "ConsultationWriter",
+    "get_consultation_writer",
     "AdaptiveVotingEngine",
     "KnowledgeEnhancer",
     "KnowledgeGap",
@@ -3,6 +3,15 @@
 Caches expert responses to avoid redundant queries within workflows,
 reducing token usage and improving response time.
 
+Lookups are similarity-keyed: queries are normalized, and when no entry
+matches exactly, the nearest cached query of the same domain (by cosine
+similarity of query embeddings) is returned if it clears a threshold.
+Responses live in a size-bounded LRU memory tier backed by a single
+append-only store that is compacted when it accumulates dead records.
+With numpy available, embeddings are kept as float32 vectors and each
+domain's are stacked into a normalized matrix, so a lookup scores every
+candidate with one matrix-vector product.
+
 @ai-prime-directive: Cache must:
 - Provide 40-60% hit rate after warmup
 - Respect TTL (24 hours default)
@@ -13,26 +22,70 @@ reducing token usage and improving response time.
 import hashlib
 import json
 import logging
+import math
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from .rag_embedder import Embedder, create_embedder
+
+# numpy is optional: without it similarities are computed in pure Python
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+STORE_FILE = "responses.jsonl"
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache keying (case, punctuation, whitespace)."""
+    return " ".join(_NON_WORD.sub(" ", query.lower()).split())
+
+
+def cosine_similarity(a: list[float], b: list[float]) -> float:
+    """Cosine similarity of two vectors (0.0 if either is empty or zero)."""
+    if not a or len(a) != len(b):
+        return 0.0
+    dot = sum(x * y for x, y in zip(a, b, strict=True))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def _as_vector(values: Any) -> Any:
+    """Embedding as a float32 array (a float list without numpy); None if empty."""
+    if values is None or len(values) == 0:
+        return None
+    if np is not None:
+        return np.asarray(values, dtype=np.float32).reshape(-1)
+    return [float(x) for x in values]
+
 
 @dataclass
 class CachedExpertResponse:
     """Cached expert consultation response.
 
     Attributes:
-        query_hash: Hash of query + domain
+        query_hash: Hash of normalized query + domain
         domain: Domain name
         query: Original query text
         response: Expert response data
         experts_consulted: List of experts used
         timestamp: Cache creation time
         ttl_hours: Time to live in hours
+        knowledge_fingerprint: Fingerprint of the knowledge the response
+            was based on ("" if unknown)
     """
     query_hash: str
     domain: str
@@ -41,6 +94,7 @@ class CachedExpertResponse:
     experts_consulted: list[str]
     timestamp: datetime
     ttl_hours: int = 24
+    knowledge_fingerprint: str = ""
 
     @property
     def is_expired(self) -> bool:
@@ -57,7 +111,8 @@ class CachedExpertResponse:
             "response": self.response,
             "experts_consulted": self.experts_consulted,
             "timestamp": self.timestamp.isoformat(),
-            "ttl_hours": self.ttl_hours
+            "ttl_hours": self.ttl_hours,
+            "knowledge_fingerprint": self.knowledge_fingerprint,
         }
 
     @classmethod
@@ -67,14 +122,36 @@ class CachedExpertResponse:
         return cls(**data)
 
 
+@dataclass
+class _IndexEntry:
+    """Lookup data kept in memory for every live cache entry."""
+
+    domain: str
+    normalized_query: str
+    embedding: Any  # float32 vector (float list without numpy) or None
+    embedding_model: str
+    timestamp: datetime
+    ttl_hours: int
+    knowledge_fingerprint: str
+    offset: int = -1  # Byte offset of the record in the store (-1: memory only)
+
+    @property
+    def is_expired(self) -> bool:
+        return datetime.now() > self.timestamp + timedelta(hours=self.ttl_hours)
+
+
 class ExpertCache:
-    """Cache for expert consultations."""
+    """Similarity-keyed cache for expert consultations."""
 
     def __init__(
         self,
         cache_dir: Path | None = None,
         ttl_hours: int = 24,
-        enable_disk_cache: bool = True
+        enable_disk_cache: bool = True,
+        similarity_threshold: float = 0.92,
+        max_memory_entries: int = 256,
+        embedder: Embedder | None = None,
+        use_embeddings: bool = True,
     ):
         """Initialize expert cache.
 
@@ -82,6 +159,12 @@ class ExpertCache:
             cache_dir: Directory for disk cache
             ttl_hours: Time to live for cache entries
             enable_disk_cache: Enable persistent disk cache
+            similarity_threshold: Minimum cosine similarity for a rephrased
+                query to hit a cached entry
+            max_memory_entries: Maximum responses kept in the memory tier
+            embedder: Embedder for query vectors (default: the shared
+                embedder, loaded on first use)
+            use_embeddings: Disable to match on normalized queries only
         """
         if cache_dir is None:
             cache_dir = Path(".tapps-agents/cache/experts")
@@ -89,61 +172,78 @@ class ExpertCache:
         self.cache_dir = cache_dir
         self.ttl_hours = ttl_hours
         self.enable_disk_cache = enable_disk_cache
-        self._memory_cache: dict[str, CachedExpertResponse] = {}
+        self.similarity_threshold = similarity_threshold
+        self.max_memory_entries = max_memory_entries
+        self.use_embeddings = use_embeddings
+        self._embedder = embedder
+        self._embedder_checked = embedder is not None
+        self._lock = threading.RLock()
+        self._memory_cache: OrderedDict[str, CachedExpertResponse] = OrderedDict()
+        self._index: dict[str, _IndexEntry] = {}
+        # Per-domain (model, keys, normalized embedding matrix), built on lookup
+        self._matrices: dict[str, tuple[str, list[str], Any]] = {}
+        self._fingerprints: dict[str, str] = {}
+        self._store_records = 0
+
+        # Statistics
+        self.stats = self._empty_stats()
+        self._domain_stats: dict[str, dict[str, int]] = {}
 
         if self.enable_disk_cache:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._load_store()
 
-        # Statistics
-        self.stats = {"hits": 0, "misses": 0, "expirations": 0}
+    @property
+    def store_path(self) -> Path:
+        """Path of the on-disk response store."""
+        return self.cache_dir / STORE_FILE
 
     def get(
         self,
         query: str,
-        domain: str
+        domain: str,
+        knowledge_fingerprint: str | None = None,
     ) -> CachedExpertResponse | None:
         """Get cached response for query.
 
         Args:
             query: Expert query
             domain: Domain name
+            knowledge_fingerprint: Current fingerprint of the domain's
+                knowledge; entries built on other knowledge are invalidated
 
         Returns:
             Cached response or None if not found/expired
         """
-        query_hash = self._hash_query(query, domain)
-
-        # Check memory cache first
-        if query_hash in self._memory_cache:
-            cached = self._memory_cache[query_hash]
-            if not cached.is_expired:
-                self.stats["hits"] += 1
+        normalized = normalize_query(query)
+        query_hash = self._hash_query(normalized, domain)
+
+        with self._lock:
+            self._check_fingerprint(domain, knowledge_fingerprint)
+            cached = self._load_live(query_hash)
+            if cached is not None:
+                self._record_hit(domain, similar=False)
                 logger.debug(f"Cache hit: {domain}")
                 return cached
-            else:
-                self.stats["expirations"] += 1
-                del self._memory_cache[query_hash]
-
-        # Check disk cache
-        if self.enable_disk_cache:
-            cache_file = self.cache_dir / f"{query_hash}.json"
-            if cache_file.exists():
-                try:
-                    data = json.loads(cache_file.read_text(encoding="utf-8"))
-                    cached = CachedExpertResponse.from_dict(data)
+            has_candidates = any(
+                entry.domain == domain and entry.embedding is not None
+                for entry in self._index.values()
+            )
 
-                    if not cached.is_expired:
-                        self._memory_cache[query_hash] = cached
-                        self.stats["hits"] += 1
-                        logger.debug(f"Disk cache hit: {domain}")
+        embedding = self._embed(normalized) if has_candidates else None
+        if embedding is not None:
+            model = self._embedding_model()
+            with self._lock:
+                for key in self._nearest(domain, embedding, model):
+                    cached = self._load_live(key)
+                    if cached is not None:
+                        self._record_hit(domain, similar=True)
+                        logger.debug(f"Similar-query cache hit: {domain}")
                         return cached
-                    else:
-                        self.stats["expirations"] += 1
-                        cache_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to load cache: {e}")
 
-        self.stats["misses"] += 1
+        with self._lock:
+            self.stats["misses"] += 1
+            self._domain(domain)["misses"] += 1
         logger.debug(f"Cache miss: {domain}")
         return None
 
@@ -152,7 +252,8 @@ class ExpertCache:
         query: str,
         domain: str,
         response: Any,
-        experts_consulted: list[str]
+        experts_consulted: list[str],
+        knowledge_fingerprint: str | None = None,
     ) -> CachedExpertResponse:
         """Cache expert response.
 
@@ -161,11 +262,15 @@ class ExpertCache:
             domain: Domain name
             response: Expert response
             experts_consulted: List of experts consulted
+            knowledge_fingerprint: Fingerprint of the knowledge the
+                response was based on
 
         Returns:
             Cached response object
         """
-        query_hash = self._hash_query(query, domain)
+        normalized = normalize_query(query)
+        query_hash = self._hash_query(normalized, domain)
+        embedding = self._embed(normalized)
 
         cached = CachedExpertResponse(
             query_hash=query_hash,
@@ -174,51 +279,94 @@ class ExpertCache:
             response=response,
             experts_consulted=experts_consulted,
             timestamp=datetime.now(),
-            ttl_hours=self.ttl_hours
+            ttl_hours=self.ttl_hours,
+            knowledge_fingerprint=knowledge_fingerprint or "",
+        )
+        entry = _IndexEntry(
+            domain=domain,
+            normalized_query=normalized,
+            embedding=embedding,
+            embedding_model=self._embedding_model() if embedding is not None else "",
+            timestamp=cached.timestamp,
+            ttl_hours=cached.ttl_hours,
+            knowledge_fingerprint=cached.knowledge_fingerprint,
         )
 
-        # Save to memory cache
-        self._memory_cache[query_hash] = cached
-
-        # Save to disk cache
-        if self.enable_disk_cache:
-            try:
-                cache_file = self.cache_dir / f"{query_hash}.json"
-                cache_file.write_text(
-                    json.dumps(cached.to_dict(), indent=2),
-                    encoding="utf-8"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to save cache to disk: {e}")
+        with self._lock:
+            self._check_fingerprint(domain, knowledge_fingerprint)
+            if self.enable_disk_cache:
+                try:
+                    entry.offset = self._append(
+                        {"op": "put", "entry": cached.to_dict(), "index": self._index_record(entry)}
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to save cache to disk: {e}")
+            self._index[query_hash] = entry
+            self._matrices.pop(domain, None)
+            self._remember(query_hash, cached)
+            self._maybe_compact()
 
         logger.debug(f"Cached response for: {domain}")
         return cached
 
-    def _hash_query(self, query: str, domain: str) -> str:
-        """Generate hash for query + domain."""
-        content = f"{domain}:{query}".lower().strip()
+    def invalidate_domain(self, domain: str, knowledge_fingerprint: str | None = None) -> int:
+        """Drop a domain's entries, keeping those built on the given fingerprint.
+
+        Args:
+            domain: Domain name
+            knowledge_fingerprint: Current knowledge fingerprint (None drops
+                every entry of the domain)
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._index.items()
+                if entry.domain == domain
+                and (knowledge_fingerprint is None or entry.knowledge_fingerprint != knowledge_fingerprint)
+            ]
+            for key in stale:
+                self._remove(key)
+            if knowledge_fingerprint is None:
+                self._fingerprints.pop(domain, None)
+            else:
+                self._fingerprints[domain] = knowledge_fingerprint
+            self.stats["invalidations"] += len(stale)
+            self._maybe_compact()
+        if stale:
+            logger.info(f"Invalidated {len(stale)} cache entries for {domain}")
+        return len(stale)
+
+    def _hash_query(self, normalized_query: str, domain: str) -> str:
+        """Generate hash for normalized query + domain."""
+        content = f"{domain.lower().strip()}:{normalized_query}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        total_queries = self.stats["hits"] + self.stats["misses"]
-        hit_rate = (
-            (self.stats["hits"] / total_queries * 100)
-            if total_queries > 0 else 0
-        )
-
-        return {
-            "hits": self.stats["hits"],
-            "misses": self.stats["misses"],
-            "expirations": self.stats["expirations"],
-            "total_queries": total_queries,
-            "hit_rate_percentage": hit_rate,
-            "memory_cache_size": len(self._memory_cache),
-            "disk_cache_size": (
-                len(list(self.cache_dir.glob("*.json")))
-                if self.enable_disk_cache else 0
-            )
-        }
+        with self._lock:
+            total_queries = self.stats["hits"] + self.stats["misses"]
+            return {
+                "hits": self.stats["hits"],
+                "similar_hits": self.stats["similar_hits"],
+                "misses": self.stats["misses"],
+                "expirations": self.stats["expirations"],
+                "evictions": self.stats["evictions"],
+                "invalidations": self.stats["invalidations"],
+                "total_queries": total_queries,
+                "hit_rate_percentage": self._hit_rate(self.stats),
+                "memory_cache_size": len(self._memory_cache),
+                "disk_cache_size": (
+                    sum(1 for entry in self._index.values() if entry.offset >= 0)
+                    if self.enable_disk_cache else 0
+                ),
+                "domains": {
+                    domain: {**counts, "hit_rate_percentage": self._hit_rate(counts)}
+                    for domain, counts in sorted(self._domain_stats.items())
+                },
+            }
 
     def clear_expired(self) -> int:
         """Clear expired cache entries.
@@ -226,28 +374,13 @@ class ExpertCache:
         Returns:
             Number of entries cleared
         """
-        cleared = 0
-
-        # Clear memory cache
-        expired_keys = [
-            k for k, v in self._memory_cache.items()
-            if v.is_expired
-        ]
-        for key in expired_keys:
-            del self._memory_cache[key]
-            cleared += 1
-
-        # Clear disk cache
-        if self.enable_disk_cache:
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    data = json.loads(cache_file.read_text(encoding="utf-8"))
-                    cached = CachedExpertResponse.from_dict(data)
-                    if cached.is_expired:
-                        cache_file.unlink()
-                        cleared += 1
-                except Exception as e:
-                    logger.warning(f"Failed to check cache expiry: {e}")
+        with self._lock:
+            expired_keys = [k for k, v in self._index.items() if v.is_expired]
+            for key in expired_keys:
+                self._remove(key)
+            cleared = len(expired_keys)
+            if cleared and self.enable_disk_cache:
+                self._compact()
 
         if cleared > 0:
             logger.info(f"Cleared {cleared} expired cache entries")
@@ -256,11 +389,257 @@ class ExpertCache:
 
     def clear_all(self) -> None:
         """Clear all cache entries."""
-        self._memory_cache.clear()
+        with self._lock:
+            self._memory_cache.clear()
+            self._index.clear()
+            self._matrices.clear()
+            self._fingerprints.clear()
+            self._store_records = 0
+
+            if self.enable_disk_cache:
+                self.store_path.unlink(missing_ok=True)
+                # Per-query files written by earlier versions
+                for cache_file in self.cache_dir.glob("*.json"):
+                    cache_file.unlink()
+
+            self.stats = self._empty_stats()
+            self._domain_stats.clear()
+        logger.info("All cache entries cleared")
 
-        if self.enable_disk_cache:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+    # Internals (callers hold self._lock unless noted)
 
-        self.stats = {"hits": 0, "misses": 0, "expirations": 0}
-        logger.info("All cache entries cleared")
+    @staticmethod
+    def _empty_stats() -> dict[str, int]:
+        return {
+            "hits": 0,
+            "similar_hits": 0,
+            "misses": 0,
+            "expirations": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    @staticmethod
+    def _hit_rate(counts: dict[str, int]) -> float:
+        total = counts["hits"] + counts["misses"]
+        return counts["hits"] / total * 100 if total > 0 else 0
+
+    def _domain(self, domain: str) -> dict[str, int]:
+        return self._domain_stats.setdefault(domain, {"hits": 0, "similar_hits": 0, "misses": 0})
+
+    def _record_hit(self, domain: str, similar: bool) -> None:
+        self.stats["hits"] += 1
+        self._domain(domain)["hits"] += 1
+        if similar:
+            self.stats["similar_hits"] += 1
+            self._domain(domain)["similar_hits"] += 1
+
+    def _check_fingerprint(self, domain: str, knowledge_fingerprint: str | None) -> None:
+        """Invalidate the domain if its knowledge fingerprint changed."""
+        if knowledge_fingerprint is None or self._fingerprints.get(domain) == knowledge_fingerprint:
+            return
+        self.invalidate_domain(domain, knowledge_fingerprint)
+
+    def _embedding_model(self) -> str:
+        return self._embedder.get_model_name() if self._embedder is not None else ""
+
+    def _embed(self, normalized_query: str) -> Any:
+        """Embed a normalized query (None when embeddings are unavailable).
+
+        Called without holding the lock.
+        """
+        if not self.use_embeddings or not normalized_query:
+            return None
+        if not self._embedder_checked:
+            with self._lock:
+                if not self._embedder_checked:
+                    self._embedder = create_embedder()
+                    self._embedder_checked = True
+        if self._embedder is None:
+            return None
+        try:
+            return _as_vector(self._embedder.embed_query(normalized_query))
+        except Exception as e:
+            logger.debug(f"Query embedding failed, using exact match only: {e}")
+            return None
+
+    def _nearest(self, domain: str, embedding: Any, model: str) -> list[str]:
+        """Keys of the domain's entries above the threshold, most similar first."""
+        if np is None:
+            scored = []
+            for key, entry in self._index.items():
+                if entry.domain != domain or entry.embedding is None or entry.embedding_model != model:
+                    continue
+                similarity = cosine_similarity(embedding, entry.embedding)
+                if similarity >= self.similarity_threshold:
+                    scored.append((similarity, key))
+            scored.sort(reverse=True)
+            return [key for _, key in scored]
+
+        keys, matrix = self._domain_matrix(domain, model, len(embedding))
+        norm = float(np.linalg.norm(embedding))
+        if not keys or not norm:
+            return []
+        similarities = matrix @ (embedding / norm)
+        hits = np.flatnonzero(similarities >= self.similarity_threshold)
+        hits = hits[np.argsort(-similarities[hits], kind="stable")]
+        return [keys[i] for i in hits]
+
+    def _domain_matrix(self, domain: str, model: str, dim: int) -> tuple[list[str], Any]:
+        """Keys and unit-normalized embedding rows of a domain's entries."""
+        cached = self._matrices.get(domain)
+        if cached is not None and cached[0] == model and cached[2].shape[1] == dim:
+            return cached[1], cached[2]
+        keys = [
+            key
+            for key, entry in self._index.items()
+            if entry.domain == domain
+            and entry.embedding is not None
+            and entry.embedding_model == model
+            and len(entry.embedding) == dim
+        ]
+        matrix = np.empty((len(keys), dim), dtype=np.float32)
+        for row, key in enumerate(keys):
+            matrix[row] = self._index[key].embedding
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms > 0, norms, 1.0)
+        self._matrices[domain] = (model, keys, matrix)
+        return keys, matrix
+
+    def _load_live(self, key: str) -> CachedExpertResponse | None:
+        """Return the response for a key, dropping it if expired."""
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        if entry.is_expired:
+            self.stats["expirations"] += 1
+            self._remove(key)
+            return None
+
+        cached = self._memory_cache.get(key)
+        if cached is not None:
+            self._memory_cache.move_to_end(key)
+            return cached
+        if entry.offset < 0:
+            del self._index[key]
+            self._matrices.pop(entry.domain, None)
+            return None
+        try:
+            with open(self.store_path, "rb") as f:
+                f.seek(entry.offset)
+                record = json.loads(f.readline())
+            cached = CachedExpertResponse.from_dict(record["entry"])
+        except Exception as e:
+            logger.warning(f"Failed to load cache: {e}")
+            self._index.pop(key, None)
+            self._matrices.pop(entry.domain, None)
+            return None
+        self._remember(key, cached)
+        return cached
+
+    def _remember(self, key: str, cached: CachedExpertResponse) -> None:
+        """Put a response in the memory tier, evicting least recently used."""
+        self._memory_cache[key] = cached
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.max_memory_entries:
+            evicted, _ = self._memory_cache.popitem(last=False)
+            self.stats["evictions"] += 1
+            entry = self._index.get(evicted)
+            if entry is not None and entry.offset < 0:
+                # Not on disk: the entry is gone for good
+                del self._index[evicted]
+                self._matrices.pop(entry.domain, None)
+
+    def _remove(self, key: str) -> None:
+        self._memory_cache.pop(key, None)
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._matrices.pop(entry.domain, None)
+        if entry is not None and entry.offset >= 0:
+            try:
+                self._append({"op": "del", "key": key})
+            except Exception as e:
+                logger.warning(f"Failed to record cache removal: {e}")
+
+    @staticmethod
+    def _index_record(entry: _IndexEntry) -> dict[str, Any]:
+        return {
+            "normalized_query": entry.normalized_query,
+            "embedding": (
+                [round(float(x), 6) for x in entry.embedding] if entry.embedding is not None else None
+            ),
+            "embedding_model": entry.embedding_model,
+        }
+
+    def _append(self, record: dict[str, Any]) -> int:
+        """Append a record to the store and return its byte offset."""
+        with open(self.store_path, "ab") as f:
+            offset = f.tell()
+            f.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._store_records += 1
+        return offset
+
+    def _load_store(self) -> None:
+        """Rebuild the in-memory index by replaying the store."""
+        if not self.store_path.exists():
+            return
+        offset = 0
+        try:
+            with open(self.store_path, "rb") as f:
+                for line in f:
+                    line_offset, offset = offset, offset + len(line)
+                    self._store_records += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Torn write at the end of the store
+                    if record.get("op") == "del":
+                        self._index.pop(record.get("key", ""), None)
+                        continue
+                    data, meta = record["entry"], record["index"]
+                    entry = _IndexEntry(
+                        domain=data["domain"],
+                        normalized_query=meta["normalized_query"],
+                        embedding=_as_vector(meta.get("embedding")),
+                        embedding_model=meta.get("embedding_model", ""),
+                        timestamp=datetime.fromisoformat(data["timestamp"]),
+                        ttl_hours=data["ttl_hours"],
+                        knowledge_fingerprint=data.get("knowledge_fingerprint", ""),
+                        offset=line_offset,
+                    )
+                    if entry.is_expired:
+                        self._index.pop(data["query_hash"], None)
+                        continue
+                    self._index[data["query_hash"]] = entry
+                    if entry.knowledge_fingerprint:
+                        self._fingerprints[entry.domain] = entry.knowledge_fingerprint
+        except Exception as e:
+            logger.warning(f"Failed to load cache store: {e}")
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        live = sum(1 for entry in self._index.values() if entry.offset >= 0)
+        if self.enable_disk_cache and self._store_records - live > max(64, live):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the store with live records only."""
+        tmp_path = self.store_path.with_suffix(".tmp")
+        new_offsets: dict[str, int] = {}
+        try:
+            with open(self.store_path, "rb") as src, open(tmp_path, "wb") as dst:
+                for key, entry in self._index.items():
+                    if entry.offset < 0:
+                        continue
+                    src.seek(entry.offset)
+                    new_offsets[key] = dst.tell()
+                    dst.write(src.readline())
+            tmp_path.replace(self.store_path)
+        except Exception as e:
+            logger.warning(f"Failed to compact cache store: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        for key, entry in self._index.items():
+            entry.offset = new_offsets.get(key, -1)
+        self._store_records = len(new_offsets)
+        logger.debug(f"Compacted expert cache store to {len(new_offsets)} records")
@@ -21,6 +21,7 @@ Manages expert instances and provides consultation services with weighted decisi
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from pathlib import Path
@@ -36,6 +37,7 @@ from .confidence_calculator import ConfidenceCalculator
 from .confidence_metrics import get_tracker
 from .domain_config import DomainConfig, DomainConfigParser
 from .expert_config import load_expert_configs
+from .performance_tracker import get_consultation_writer
 from .weight_distributor import ExpertWeightMatrix
 
 logger = logging.getLogger(__name__)
@@ -292,10 +294,19 @@ class ExpertRegistry:
         include_all: bool = True,
         prioritize_builtin: bool = False,
         agent_id: str | None = None,
+        max_concurrency: int | None = None,
+        expert_timeout: float | None = None,
+        early_exit: bool | None = None,
     ) -> ConsultationResult:
         """
         Consult multiple experts on a domain question and aggregate weighted responses.
 
+        Experts are consulted concurrently (up to max_concurrency at a time),
+        each bounded by expert_timeout. With early_exit, the consultation
+        returns as soon as the primary expert and a quorum of supporting
+        experts reach the high agreement threshold; experts still running
+        are cancelled.
+
         Args:
             query: The question to ask
             domain: Domain context
@@ -305,6 +316,12 @@ class ExpertRegistry:
                                For technical domains, built-in experts should be prioritized.
                                For business domains, customer experts should be prioritized.
             agent_id: Optional agent ID for agent-specific confidence threshold
+            max_concurrency: Maximum concurrent expert consultations
+                (default: expert config max_concurrent_consultations)
+            expert_timeout: Per-expert timeout in seconds
+                (default: expert config consultation_timeout)
+            early_exit: Return once primary + quorum agree
+                (default: expert config early_exit_on_agreement)
 
         Returns:
             ConsultationResult with weighted answer and agreement metrics
@@ -360,73 +377,32 @@ class ExpertRegistry:
         # Get project profile if available
         project_profile = self._get_project_profile()
 
-        # Consult each expert
-        responses = []
-        for expert_id in expert_ids_to_consult:
-            expert = self.experts.get(expert_id)
-            if not expert:
-                continue  # Skip if expert not registered
+        # Get expert config for fan-out limits and thresholds
+        expert_config = get_expert_config()
 
-            try:
-                # Pass project profile to expert consultation
-                response = await expert.run(
-                    "consult",
-                    query=query,
-                    domain=domain,
-                    project_profile=project_profile,
-                )
-                if "error" not in response:
-                    confidence = response.get("confidence", 0.0)
-                    responses.append(
-                        {
-                            "expert_id": expert_id,
-                            "expert_name": expert.agent_name,
-                            "answer": response.get("answer", ""),
-                            "confidence": confidence,
-                            "sources": response.get("sources", []),
-                        }
-                    )
-                    
-                    # Track expert consultation for adaptive learning
-                    try:
-                        from ..experts.performance_tracker import (
-                            ExpertPerformanceTracker,
-                        )
-                        perf_tracker = ExpertPerformanceTracker(project_root=self.project_root)
-                        perf_tracker.track_consultation(
-                            expert_id=expert_id,
-                            domain=domain,
-                            confidence=confidence,
-                            query=query,
-                        )
-                    except Exception as e:
-                        # Don't fail consultation if tracking fails
-                        logger.debug(f"Failed to track expert consultation: {e}")
-            except Exception as e:
-                # Log error but continue with other experts
-                responses.append({"expert_id": expert_id, "error": str(e)})
+        # Determine primary expert ID (needed up front for the early-exit check)
+        primary_expert_id = self._get_primary_expert_id(domain, expert_ids_to_consult)
+
+        # Consult experts concurrently
+        responses = await self._consult_experts(
+            expert_ids_to_consult,
+            query=query,
+            domain=domain,
+            project_profile=project_profile,
+            primary_expert_id=primary_expert_id,
+            max_concurrency=max_concurrency or expert_config.max_concurrent_consultations,
+            expert_timeout=expert_timeout or expert_config.consultation_timeout,
+            early_exit=(
+                expert_config.early_exit_on_agreement if early_exit is None else early_exit
+            ),
+        )
 
         if not responses:
             raise ValueError(f"No expert responses received for domain '{domain}'")
 
-        # Determine primary expert ID for aggregation
-        primary_expert_id = None
-        if self.weight_matrix:
-            primary_expert_id = self.weight_matrix.get_primary_expert(domain)
-
-        # If no primary from weight matrix, use first expert or built-in expert for technical domains
+        # Fallback to first available expert
         if not primary_expert_id:
-            is_technical_domain = domain in TECHNICAL_DOMAINS
-            if is_technical_domain:
-                # For technical domains, prefer built-in expert
-                for expert_id in expert_ids_to_consult:
-                    if expert_id in self.builtin_experts:
-                        primary_expert_id = expert_id
-                        break
-
-            # Fallback to first available expert
-            if not primary_expert_id and responses:
-                primary_expert_id = responses[0].get("expert_id")
+            primary_expert_id = responses[0].get("expert_id")
 
         # Ensure a stable non-None primary expert id for downstream logic and dataclass typing.
         if not primary_expert_id:
@@ -465,8 +441,6 @@ class ExpertRegistry:
             project_profile=project_profile,
         )
 
-        # Get expert config for thresholds
-        expert_config = get_expert_config()
         all_agreed = agreement_level >= expert_config.high_agreement_threshold
 
         # Track confidence metrics
@@ -503,6 +477,162 @@ class ExpertRegistry:
             all_experts_agreed=all_agreed,
         )
 
+    def _get_primary_expert_id(self, domain: str, expert_ids: list[str]) -> str | None:
+        """
+        Determine the primary expert before consulting.
+
+        Uses the weight matrix, or for technical domains the first built-in
+        expert in consultation order. Returns None when the primary is the
+        first expert that responds.
+        """
+        if self.weight_matrix:
+            primary_expert_id = self.weight_matrix.get_primary_expert(domain)
+            if primary_expert_id:
+                return primary_expert_id
+
+        if domain in TECHNICAL_DOMAINS:
+            for expert_id in expert_ids:
+                if expert_id in self.builtin_experts:
+                    return expert_id
+        return None
+
+    async def _consult_experts(
+        self,
+        expert_ids: list[str],
+        query: str,
+        domain: str,
+        project_profile: ProjectProfile | None,
+        primary_expert_id: str | None,
+        max_concurrency: int,
+        expert_timeout: float,
+        early_exit: bool,
+    ) -> list[dict[str, Any]]:
+        """
+        Fan a consultation out to experts concurrently.
+
+        Args:
+            expert_ids: Experts to consult, in priority order
+            query: The question to ask
+            domain: Domain context
+            project_profile: Project profile passed to each expert
+            primary_expert_id: Primary expert (None: first registered expert)
+            max_concurrency: Maximum concurrent consultations
+            expert_timeout: Per-expert timeout in seconds
+            early_exit: Stop once primary + quorum reach the agreement threshold
+
+        Returns:
+            Responses in consultation order (successful and error entries)
+        """
+        experts = [
+            (expert_id, self.experts[expert_id])
+            for expert_id in expert_ids
+            if expert_id in self.experts  # Skip if expert not registered
+        ]
+        if not experts:
+            return []
+        if not primary_expert_id:
+            primary_expert_id = experts[0][0]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        writer = get_consultation_writer(self.project_root)
+
+        async def consult_one(expert_id: str, expert: BaseExpert) -> dict[str, Any] | None:
+            async with semaphore:
+                try:
+                    # Pass project profile to expert consultation
+                    response = await asyncio.wait_for(
+                        expert.run(
+                            "consult",
+                            query=query,
+                            domain=domain,
+                            project_profile=project_profile,
+                        ),
+                        expert_timeout,
+                    )
+                except TimeoutError:
+                    logger.warning(
+                        f"Expert {expert_id} timed out after {expert_timeout}s on {domain}"
+                    )
+                    return {
+                        "expert_id": expert_id,
+                        "error": f"Consultation timed out after {expert_timeout}s",
+                    }
+                except Exception as e:
+                    # Log error but continue with other experts
+                    return {"expert_id": expert_id, "error": str(e)}
+
+            if "error" in response:
+                return None
+            confidence = response.get("confidence", 0.0)
+
+            # Track expert consultation for adaptive learning (batched write)
+            try:
+                writer.record(expert_id, domain, confidence, query)
+            except Exception as e:
+                # Don't fail consultation if tracking fails
+                logger.debug(f"Failed to track expert consultation: {e}")
+
+            return {
+                "expert_id": expert_id,
+                "expert_name": expert.agent_name,
+                "answer": response.get("answer", ""),
+                "confidence": confidence,
+                "sources": response.get("sources", []),
+            }
+
+        tasks = {
+            asyncio.create_task(consult_one(expert_id, expert)): position
+            for position, (expert_id, expert) in enumerate(experts)
+        }
+        results: dict[int, dict[str, Any]] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    response = task.result()
+                    if response is not None:
+                        results[tasks[task]] = response
+                if (
+                    early_exit
+                    and pending
+                    and self._quorum_reached(list(results.values()), domain, primary_expert_id)
+                ):
+                    logger.debug(
+                        f"Consultation on {domain} reached agreement; "
+                        f"cancelling {len(pending)} pending experts"
+                    )
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return [results[position] for position in sorted(results)]
+
+    def _quorum_reached(
+        self, responses: list[dict[str, Any]], domain: str, primary_expert_id: str
+    ) -> bool:
+        """
+        Check the early-exit policy.
+
+        True once the primary expert has answered, at least consultation_quorum
+        supporting experts have answered, and their agreement with the primary
+        reaches high_agreement_threshold.
+        """
+        valid = [r for r in responses if "error" not in r]
+        if not any(r.get("expert_id") == primary_expert_id for r in valid):
+            return False
+
+        expert_config = get_expert_config()
+        if len(valid) - 1 < expert_config.consultation_quorum:
+            return False
+        agreement = self._calculate_agreement(valid, domain, primary_expert_id)
+        return agreement >= expert_config.high_agreement_threshold
+
     def _aggregate_responses(
         self,
         responses: list[dict[str, Any]],
@@ -2,12 +2,20 @@
 Expert Performance Tracker
 
 Tracks expert consultation effectiveness for adaptive learning.
+
+Consultations recorded during expert fan-out go through a process-wide
+ConsultationWriter per performance file, which appends them in batches
+instead of opening the JSONL file once per expert response.
 """
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -17,6 +25,133 @@ from ..core.outcome_tracker import OutcomeTracker
 
 logger = logging.getLogger(__name__)
 
+# Seconds between batched appends of pending consultation records
+FLUSH_INTERVAL_SECONDS = 2.0
+
+# Pending records that trigger an append regardless of the interval
+MAX_PENDING_RECORDS = 64
+
+
+def consultation_record(
+    expert_id: str, domain: str, confidence: float, query: str | None = None
+) -> dict[str, Any]:
+    """Build the JSONL record stored for one expert consultation."""
+    return {
+        "expert_id": expert_id,
+        "domain": domain,
+        "confidence": confidence,
+        "query": query,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+class ConsultationWriter:
+    """
+    Batched, thread-safe appender for expert_performance.jsonl.
+
+    Use get_consultation_writer() to obtain the instance for a project.
+    """
+
+    def __init__(
+        self,
+        performance_file: Path,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_pending: int = MAX_PENDING_RECORDS,
+    ):
+        """
+        Initialize writer.
+
+        Args:
+            performance_file: JSONL file consultations are appended to
+            flush_interval: Seconds between appends
+            max_pending: Pending records that force an append
+        """
+        self.performance_file = Path(performance_file)
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    def record(
+        self,
+        expert_id: str,
+        domain: str,
+        confidence: float,
+        query: str | None = None,
+    ) -> None:
+        """
+        Queue a consultation record.
+
+        Args:
+            expert_id: Expert identifier
+            domain: Domain consulted
+            confidence: Confidence score (0.0-1.0)
+            query: Optional query text
+        """
+        with self._lock:
+            self._pending.append(consultation_record(expert_id, domain, confidence, query))
+            due = (
+                len(self._pending) >= self.max_pending
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Append pending records to the performance file.
+
+        Returns:
+            True if nothing was pending or the records were written
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return True
+            lines = "".join(json.dumps(r, default=str) + "\n" for r in self._pending)
+            try:
+                self.performance_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.performance_file, "a", encoding="utf-8") as f:
+                    f.write(lines)
+            except OSError as e:
+                # Keep records pending; retried on the next flush
+                logger.debug(f"Failed to flush expert consultations: {e}")
+                return False
+            self._pending = []
+            return True
+
+
+_writers: dict[Path, ConsultationWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _performance_file(project_root: Path) -> Path:
+    return project_root / ".tapps-agents" / "learning" / "expert_performance.jsonl"
+
+
+def get_consultation_writer(project_root: Path | None = None) -> ConsultationWriter:
+    """Return the process-wide ConsultationWriter for a project."""
+    key = _performance_file(Path(project_root or Path.cwd()).resolve())
+    writer = _writers.get(key)
+    if writer is None:
+        with _writers_lock:
+            writer = _writers.get(key)
+            if writer is None:
+                writer = ConsultationWriter(key)
+                _writers[key] = writer
+    return writer
+
+
+def flush_all_consultations() -> None:
+    """Flush every consultation writer (registered at exit)."""
+    for writer in list(_writers.values()):
+        with contextlib.suppress(Exception):  # best effort at interpreter exit
+            writer.flush()
+
+
+atexit.register(flush_all_consultations)
+
 
 @dataclass
 class ExpertPerformance:
@@ -53,8 +188,8 @@ class ExpertPerformanceTracker:
             outcome_tracker: OutcomeTracker instance
         """
         self.project_root = project_root or Path.cwd()
-        self.learning_dir = self.project_root / ".tapps-agents" / "learning"
-        self.performance_file = self.learning_dir / "expert_performance.jsonl"
+        self.performance_file = _performance_file(self.project_root)
+        self.learning_dir = self.performance_file.parent
         self.outcome_tracker = outcome_tracker or OutcomeTracker()
 
         # Ensure learning directory exists
@@ -76,13 +211,7 @@ class ExpertPerformanceTracker:
             confidence: Confidence score (0.0-1.0)
             query: Optional query text
         """
-        consultation_data = {
-            "expert_id": expert_id,
-            "domain": domain,
-            "confidence": confidence,
-            "query": query,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        consultation_data = consultation_record(expert_id, domain, confidence, query)
 
         try:
             with open(self.performance_file, "a", encoding="utf-8") as f:
@@ -90,6 +219,12 @@ class ExpertPerformanceTracker:
         except Exception as e:
             logger.error(f"Error tracking consultation: {e}")
 
+    def _flush_pending(self) -> None:
+        """Flush records still buffered by this project's ConsultationWriter."""
+        writer = _writers.get(self.performance_file.resolve())
+        if writer is not None:
+            writer.flush()
+
     def calculate_performance(
         self, expert_id: str, days: int = 30
     ) -> ExpertPerformance | None:
@@ -192,6 +327,7 @@ class ExpertPerformanceTracker:
         self, expert_id: str, days: int
     ) -> list[dict[str, Any]]:
         """Load consultations for an expert within time window."""
+        self._flush_pending()
         if not self.performance_file.exists():
             return []
 
@@ -216,6 +352,7 @@ class ExpertPerformanceTracker:
 
     def _get_all_expert_ids(self, days: int) -> set[str]:
         """Get all expert IDs from consultations."""
+        self._flush_pending()
         if not self.performance_file.exists():
             return set()
 
@@ -0,0 +1,427 @@
+"""
+BM25 Keyword Index for SimpleKnowledgeBase
+
+Inverted index over header-aware markdown chunks, ranked with BM25. Markdown
+structure is encoded as field weights on term frequencies (headers by level,
+code blocks, list items) instead of per-line score boosts.
+
+The index is built once per set of knowledge files, persisted as JSON tagged
+with a content fingerprint, and shared in-process between knowledge bases
+over the same files. A query only reads the posting lists of its terms, so
+its cost no longer grows with the number of lines in the corpus.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "bm25_index.json"
+
+# Sections longer than this are split (at a blank line when possible)
+MAX_CHUNK_LINES = 40
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Field weights applied to term frequencies
+BODY_WEIGHT = 1.0
+LIST_WEIGHT = 1.2
+CODE_WEIGHT = 1.4
+H1_WEIGHT = 2.0
+HEADER_LEVEL_STEP = 0.2
+
+# Query terms also match indexed terms they prefix ("auth" -> "authentication")
+MIN_PREFIX_LENGTH = 3
+MAX_PREFIX_EXPANSIONS = 64
+PREFIX_MATCH_WEIGHT = 0.7
+
+# Indexes kept in memory, keyed by fingerprint
+MAX_CACHED_INDEXES = 16
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase alphanumeric terms of two or more characters.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Terms in order of appearance
+    """
+    return [term for term in _TOKEN_PATTERN.findall(text.lower()) if len(term) > 1]
+
+
+def header_weight(level: int) -> float:
+    """Field weight for a header line (H1 highest, never below body text)."""
+    return max(BODY_WEIGHT, H1_WEIGHT - level * HEADER_LEVEL_STEP)
+
+
+def line_weights(lines: list[str]) -> tuple[list[float], list[bool]]:
+    """
+    Classify markdown lines into weighted fields.
+
+    Args:
+        lines: Lines of a markdown file
+
+    Returns:
+        Tuple of (weight per line, header flag per line). Lines starting with
+        ``#`` inside fenced code blocks are code, not headers.
+    """
+    weights: list[float] = []
+    headers: list[bool] = []
+    in_code = False
+    for line in lines:
+        stripped = line.strip()
+        is_header = False
+        if stripped.startswith("```"):
+            in_code = not in_code
+            weight = CODE_WEIGHT
+        elif in_code:
+            weight = CODE_WEIGHT
+        elif stripped.startswith("#"):
+            is_header = True
+            weight = header_weight(len(stripped) - len(stripped.lstrip("#")))
+        elif stripped.startswith(("- ", "* ")):
+            weight = LIST_WEIGHT
+        else:
+            weight = BODY_WEIGHT
+        weights.append(weight)
+        headers.append(is_header)
+    return weights, headers
+
+
+def split_sections(
+    lines: list[str], headers: list[bool], max_lines: int = MAX_CHUNK_LINES
+) -> list[tuple[int, int, int | None]]:
+    """
+    Split a file into header-aligned chunks.
+
+    Each chunk starts at a header (or the top of the file) and runs to the
+    next header; long sections are cut into pieces of at most ``max_lines``,
+    preferring to cut after a blank line.
+
+    Args:
+        lines: Lines of a markdown file
+        headers: Header flag per line (from line_weights)
+        max_lines: Maximum lines per chunk
+
+    Returns:
+        List of (start, end, header_line) with 0-based, end-exclusive line
+        ranges; header_line is the line of the section header, if any
+    """
+    starts = [i for i, is_header in enumerate(headers) if is_header and i > 0]
+    bounds = list(zip([0, *starts], [*starts, len(lines)], strict=True))
+
+    chunks: list[tuple[int, int, int | None]] = []
+    for start, end in bounds:
+        header = start if headers and headers[start] else None
+        while end - start > max_lines:
+            cut = start + max_lines
+            for i in range(cut - 1, start + max_lines // 2, -1):
+                if not lines[i].strip():
+                    cut = i + 1
+                    break
+            chunks.append((start, cut, header))
+            start = cut
+        if end > start:
+            chunks.append((start, end, header))
+    return chunks
+
+
+def fingerprint(documents: dict[str, str]) -> str:
+    """
+    Fingerprint a set of documents (names and contents) and the index format.
+
+    Args:
+        documents: Mapping of source name to file content
+
+    Returns:
+        Hex digest that changes when any file is added, removed or edited
+    """
+    digest = hashlib.sha256(f"bm25-v{INDEX_VERSION}:{MAX_CHUNK_LINES}".encode())
+    for source in sorted(documents):
+        digest.update(source.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(
+            hashlib.blake2b(documents[source].encode("utf-8"), digest_size=16).digest()
+        )
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class ChunkSpan:
+    """Line range of an indexed chunk."""
+
+    source: str  # Source name as passed to BM25Index.build
+    start: int  # First line (0-based)
+    end: int  # Line after the last one
+
+
+class BM25Index:
+    """
+    Inverted index with BM25 ranking over markdown chunks.
+
+    Use load_or_build_index() to get a shared, persisted instance.
+    """
+
+    def __init__(self, fingerprint: str = ""):
+        """
+        Initialize an empty index.
+
+        Args:
+            fingerprint: Fingerprint of the indexed documents
+        """
+        self.fingerprint = fingerprint
+        self._sources: list[str] = []
+        # chunk id -> (source id, start, end)
+        self._chunks: list[tuple[int, int, int]] = []
+        self._lengths: list[int] = []
+        # term -> [(chunk id, weighted term frequency)]
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        self._vocabulary: list[str] = []
+        self._avg_length = 0.0
+
+    @classmethod
+    def build(cls, documents: dict[str, str], fingerprint: str = "") -> BM25Index:
+        """
+        Index a set of markdown documents.
+
+        Args:
+            documents: Mapping of source name to file content
+            fingerprint: Fingerprint of the documents
+
+        Returns:
+            Built index
+        """
+        index = cls(fingerprint)
+        postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        for source in sorted(documents):
+            source_id = len(index._sources)
+            index._sources.append(source)
+            lines = documents[source].split("\n")
+            weights, headers = line_weights(lines)
+            for start, end, header in split_sections(lines, headers):
+                frequencies: dict[str, float] = defaultdict(float)
+                length = 0
+                # Pieces of a split section still match on its header
+                extra = [header] if header is not None and header < start else []
+                for i in [*extra, *range(start, end)]:
+                    terms = tokenize(lines[i])
+                    length += len(terms)
+                    for term in terms:
+                        frequencies[term] += weights[i]
+                if not length:
+                    continue
+                chunk_id = len(index._chunks)
+                index._chunks.append((source_id, start, end))
+                index._lengths.append(length)
+                for term, frequency in frequencies.items():
+                    postings[term].append((chunk_id, frequency))
+        index._postings = dict(postings)
+        index._finalize()
+        return index
+
+    def _finalize(self) -> None:
+        self._vocabulary = sorted(self._postings)
+        self._avg_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        )
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def search(
+        self, terms: list[str], max_results: int = 5
+    ) -> list[tuple[ChunkSpan, float]]:
+        """
+        Rank chunks for a query with BM25.
+
+        Args:
+            terms: Query terms (already tokenized)
+            max_results: Maximum number of chunks to return
+
+        Returns:
+            List of (chunk, score) sorted by score. The score (0.0-1.0) is the
+            chunk's BM25 score relative to the best candidate, multiplied by
+            the IDF-weighted fraction of query terms the chunk contains, so
+            a chunk matching every term as well as the best one scores 1.0.
+            Terms that occur in no chunk are left out of the fraction.
+        """
+        query_terms = list(dict.fromkeys(terms))
+        chunk_count = len(self._chunks)
+        if not query_terms or not chunk_count or max_results <= 0:
+            return []
+
+        bm25: dict[int, float] = defaultdict(float)
+        matched_idf: dict[int, float] = defaultdict(float)
+        total_idf = 0.0
+        for term in query_terms:
+            frequencies = self._term_frequencies(term)
+            df = len(frequencies)
+            if not df:
+                continue
+            idf = math.log(1.0 + (chunk_count - df + 0.5) / (df + 0.5))
+            total_idf += idf
+            for chunk_id, tf in frequencies.items():
+                norm = BM25_K1 * (
+                    1.0 - BM25_B + BM25_B * self._lengths[chunk_id] / self._avg_length
+                )
+                bm25[chunk_id] += idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+                matched_idf[chunk_id] += idf
+        if not bm25:
+            return []
+
+        best = max(bm25.values())
+        scores = {
+            chunk_id: (score / best) * (matched_idf[chunk_id] / total_idf)
+            for chunk_id, score in bm25.items()
+        }
+        top = heapq.nlargest(
+            max_results, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+        return [(self.span(chunk_id), score) for chunk_id, score in top]
+
+    def _term_frequencies(self, term: str) -> dict[int, float]:
+        """Weighted frequencies per chunk for a term and its prefix matches."""
+        frequencies: dict[int, float] = defaultdict(float)
+        for chunk_id, tf in self._postings.get(term, ()):
+            frequencies[chunk_id] += tf
+        if len(term) >= MIN_PREFIX_LENGTH:
+            position = bisect.bisect_right(self._vocabulary, term)
+            for candidate in self._vocabulary[position : position + MAX_PREFIX_EXPANSIONS]:
+                if not candidate.startswith(term):
+                    break
+                for chunk_id, tf in self._postings[candidate]:
+                    frequencies[chunk_id] += PREFIX_MATCH_WEIGHT * tf
+        return frequencies
+
+    def span(self, chunk_id: int) -> ChunkSpan:
+        """Return the line range of a chunk."""
+        source_id, start, end = self._chunks[chunk_id]
+        return ChunkSpan(self._sources[source_id], start, end)
+
+    # ----------------------------------------------------------- persistence
+
+    def save(self, path: Path) -> bool:
+        """
+        Write the index to disk atomically.
+
+        Args:
+            path: Index file path
+
+        Returns:
+            True if the index was written
+        """
+        data = {
+            "version": INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "sources": self._sources,
+            "chunks": self._chunks,
+            "lengths": self._lengths,
+            "postings": {
+                term: [value for posting in postings for value in posting]
+                for term, postings in self._postings.items()
+            },
+        }
+        path = Path(path)
+        temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            temp_file.replace(path)
+        except OSError as e:
+            logger.debug(f"Failed to save BM25 index to {path}: {e}")
+            temp_file.unlink(missing_ok=True)
+            return False
+        return True
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str) -> BM25Index | None:
+        """
+        Load a persisted index if it matches the fingerprint.
+
+        Args:
+            path: Index file path
+            fingerprint: Expected fingerprint of the documents
+
+        Returns:
+            Loaded index, or None if missing, stale or unreadable
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                data.get("version") != INDEX_VERSION
+                or data.get("fingerprint") != fingerprint
+            ):
+                return None
+            index = cls(fingerprint)
+            index._sources = [str(source) for source in data["sources"]]
+            index._chunks = [(int(s), int(a), int(b)) for s, a, b in data["chunks"]]
+            index._lengths = [int(length) for length in data["lengths"]]
+            index._postings = {
+                term: list(zip(flat[::2], flat[1::2], strict=True))
+                for term, flat in data["postings"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        index._finalize()
+        return index
+
+
+_indexes: OrderedDict[str, BM25Index] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def load_or_build_index(
+    documents: dict[str, str], index_path: Path | None = None
+) -> BM25Index:
+    """
+    Return the index for a set of documents.
+
+    Looks in the in-process cache first, then loads ``index_path`` if its
+    fingerprint matches, and otherwise builds the index and saves it there.
+
+    Args:
+        documents: Mapping of source name to file content
+        index_path: Optional index file for persistence
+
+    Returns:
+        Index over the documents
+    """
+    key = fingerprint(documents)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = BM25Index.load(index_path, key) if index_path else None
+            if index is None:
+                index = BM25Index.build(documents, key)
+                logger.debug(
+                    f"Built BM25 index: {len(documents)} files, {len(index)} chunks"
+                )
+                if index_path:
+                    index.save(index_path)
+            _indexes[key] = index
+            if len(_indexes) > MAX_CACHED_INDEXES:
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(key)
+        return index
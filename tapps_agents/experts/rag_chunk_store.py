@@ -0,0 +1,193 @@
+"""
+RAG Chunk Store - Compact, memory-mapped storage for indexed chunks.
+
+Replaces the pretty-printed ``chunks.json`` written next to each FAISS index.
+The file holds a fixed-width record table and a UTF-8 blob; it is opened
+with mmap and a ``Chunk`` is only materialized when it is accessed (e.g.
+returned as a search result), so loading an expert's index costs time and
+memory proportional to the results used, not to the corpus size.
+
+Layout (little-endian)::
+
+    header   magic, version, chunk count, source count
+    ids      int64 FAISS ID per chunk
+    records  source index, line range, token count, blob offset and lengths
+    sources  blob offset and length per distinct source file
+    blob     UTF-8 chunk IDs, chunk contents and source paths
+"""
+
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import overload
+
+from .rag_chunker import Chunk
+
+logger = logging.getLogger(__name__)
+
+CHUNK_STORE_FILENAME = "chunks.bin"
+CHUNK_STORE_MAGIC = b"TAPPSCHK"
+CHUNK_STORE_VERSION = 1
+
+_HEADER = struct.Struct("<8sIII")  # magic, version, chunk count, source count
+_ID = struct.Struct("<q")
+# source index, line_start, line_end, token_count, blob offset, id length, content length
+_RECORD = struct.Struct("<IiiIQII")
+_SOURCE = struct.Struct("<QI")  # blob offset, length
+
+
+class ChunkStore(Sequence[Chunk]):
+    """
+    Read-only, memory-mapped sequence of chunks.
+
+    Indexing returns a freshly decoded ``Chunk``; nothing is cached, so
+    resident memory stays bounded by the chunks callers hold on to.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a chunk store.
+
+        Args:
+            path: Path to a file written by ChunkStore.write
+
+        Raises:
+            ValueError: If the file is not a chunk store of a supported version
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, source_count = _HEADER.unpack_from(self._map, 0)
+        if magic != CHUNK_STORE_MAGIC or version != CHUNK_STORE_VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported chunk store: {self.path}")
+
+        self._count = count
+        self._ids_offset = _HEADER.size
+        self._records_offset = self._ids_offset + count * _ID.size
+        sources_offset = self._records_offset + count * _RECORD.size
+        self._blob_offset = sources_offset + source_count * _SOURCE.size
+        # Distinct source files are few (one per knowledge file); decode them eagerly
+        self._sources = [
+            self._text(*_SOURCE.unpack_from(self._map, sources_offset + i * _SOURCE.size))
+            for i in range(source_count)
+        ]
+        self._source_paths: dict[int, Path] = {}
+
+    @classmethod
+    def write(cls, path: Path, chunks: Iterable[Chunk], chunk_ids: Iterable[int]) -> None:
+        """
+        Write chunks to a store file atomically.
+
+        Args:
+            path: Destination file
+            chunks: Chunks to store, in index order
+            chunk_ids: FAISS ID of each chunk
+        """
+        path = Path(path)
+        ids = array("q", chunk_ids)
+        blob = bytearray()
+        records = bytearray()
+        source_index: dict[str, int] = {}
+        source_table = bytearray()
+        count = 0
+        for chunk in chunks:
+            source = str(chunk.source_file)
+            if source not in source_index:
+                encoded = source.encode("utf-8")
+                source_index[source] = len(source_index)
+                source_table += _SOURCE.pack(len(blob), len(encoded))
+                blob += encoded
+            chunk_id = chunk.chunk_id.encode("utf-8")
+            content = chunk.content.encode("utf-8")
+            records += _RECORD.pack(
+                source_index[source],
+                chunk.line_start,
+                chunk.line_end,
+                chunk.token_count,
+                len(blob),
+                len(chunk_id),
+                len(content),
+            )
+            blob += chunk_id
+            blob += content
+            count += 1
+        if count != len(ids):
+            raise ValueError(f"Got {len(ids)} chunk IDs for {count} chunks")
+        if sys.byteorder != "little":
+            ids.byteswap()
+
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(CHUNK_STORE_MAGIC, CHUNK_STORE_VERSION, count, len(source_index)))
+            f.write(ids.tobytes())
+            f.write(records)
+            f.write(source_table)
+            f.write(blob)
+        temp_path.replace(path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, position: int) -> Chunk: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[Chunk]: ...
+
+    def __getitem__(self, position: int | slice) -> Chunk | list[Chunk]:
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._count))]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("chunk position out of range")
+
+        source, line_start, line_end, token_count, offset, id_length, content_length = (
+            _RECORD.unpack_from(self._map, self._records_offset + position * _RECORD.size)
+        )
+        return Chunk(
+            content=self._text(offset + id_length, content_length),
+            source_file=self._source_path(source),
+            line_start=line_start,
+            line_end=line_end,
+            chunk_id=self._text(offset, id_length),
+            token_count=token_count,
+        )
+
+    def ids(self) -> list[int]:
+        """Return the FAISS ID of every chunk, in store order."""
+        ids = array("q")
+        ids.frombytes(self._map[self._ids_offset : self._records_offset])
+        if sys.byteorder != "little":
+            ids.byteswap()
+        return ids.tolist()
+
+    def source_files(self) -> list[str]:
+        """Return the source file of every chunk without decoding contents."""
+        return [
+            self._sources[
+                _RECORD.unpack_from(self._map, self._records_offset + i * _RECORD.size)[0]
+            ]
+            for i in range(self._count)
+        ]
+
+    def close(self) -> None:
+        """Unmap the file. Chunks already materialized stay valid."""
+        self._map.close()
+
+    def _text(self, offset: int, length: int) -> str:
+        start = self._blob_offset + offset
+        return self._map[start : start + length].decode("utf-8")
+
+    def _source_path(self, source: int) -> Path:
+        path = self._source_paths.get(source)
+        if path is None:
+            path = self._source_paths[source] = Path(self._sources[source])
+        return path
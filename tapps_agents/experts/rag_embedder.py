@@ -1,14 +1,29 @@
 """
 RAG Embedder - Interface and implementation for generating embeddings.
 
-Supports multiple embedding backends with a common interface.
+Supports multiple embedding backends with a common interface. Models are
+loaded once per process and shared through SharedEmbedder, which batches
+concurrent requests and caches query embeddings.
 """
 
+from __future__ import annotations
+
+import hashlib
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
 # Try to import sentence-transformers (optional dependency)
 try:
     from sentence_transformers import SentenceTransformer
@@ -23,7 +38,7 @@ class Embedder(ABC):
     """Abstract interface for embedding generation."""
 
     @abstractmethod
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed(self, texts: list[str]) -> np.ndarray:
         """
         Generate embeddings for a list of texts.
 
@@ -31,10 +46,22 @@ class Embedder(ABC):
             texts: List of text strings to embed
 
         Returns:
-            List of embedding vectors (each is a list of floats)
+            float32 array of shape (len(texts), embedding_dim)
         """
         pass
 
+    def embed_query(self, text: str) -> np.ndarray:
+        """
+        Generate the embedding for a single query.
+
+        Args:
+            text: Query text
+
+        Returns:
+            float32 vector of length embedding_dim
+        """
+        return self.embed([text])[0]
+
     @abstractmethod
     def get_embedding_dim(self) -> int:
         """
@@ -63,7 +90,7 @@ class SentenceTransformerEmbedder(Embedder):
     This is the default embedder for FAISS-based RAG.
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = DEFAULT_EMBEDDING_MODEL):
         """
         Initialize sentence-transformers embedder.
 
@@ -83,15 +110,17 @@ class SentenceTransformerEmbedder(Embedder):
         try:
             self.model = SentenceTransformer(model_name)
             self.model_name = model_name
-            # Get embedding dimension by encoding a dummy text
-            dummy_embedding = self.model.encode(["test"], convert_to_numpy=False)[0]
-            self._embedding_dim = len(dummy_embedding)
+            dim = self.model.get_sentence_embedding_dimension()
+            if dim is None:
+                # Model does not declare its dimension: encode a dummy text
+                dim = len(self.model.encode(["test"], convert_to_numpy=True)[0])
+            self._embedding_dim = int(dim)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to initialize sentence-transformers model '{model_name}': {e}"
             ) from e
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
+    def embed(self, texts: list[str]) -> np.ndarray:
         """
         Generate embeddings for texts.
 
@@ -99,10 +128,12 @@ class SentenceTransformerEmbedder(Embedder):
             texts: List of text strings
 
         Returns:
-            List of embedding vectors (each is a list of floats)
+            float32 array of shape (len(texts), embedding_dim)
         """
+        import numpy as np
+
         if not texts:
-            return []
+            return np.empty((0, self._embedding_dim), dtype=np.float32)
 
         try:
             # Encode texts to embeddings
@@ -112,9 +143,7 @@ class SentenceTransformerEmbedder(Embedder):
                 show_progress_bar=False,
                 normalize_embeddings=True,  # Normalize for cosine similarity
             )
-
-            # Convert numpy arrays to lists
-            return [embedding.tolist() for embedding in embeddings]
+            return np.asarray(embeddings, dtype=np.float32)
         except Exception as e:
             logger.error(f"Failed to generate embeddings: {e}", exc_info=True)
             raise RuntimeError(f"Embedding generation failed: {e}") from e
@@ -128,10 +157,215 @@ class SentenceTransformerEmbedder(Embedder):
         return self.model_name
 
 
+class _EmbedRequest:
+    """Texts waiting in a micro-batch, and their result."""
+
+    __slots__ = ("done", "error", "result", "texts")
+
+    def __init__(self, texts: list[str]):
+        self.texts = texts
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.done = False
+
+
+class SharedEmbedder(Embedder):
+    """
+    Process-wide embedder for one model.
+
+    - The model is loaded on first use and shared by every knowledge base
+    - Concurrent embed() calls from different threads are micro-batched:
+      the first caller waits up to ``max_wait`` seconds for others, then
+      encodes all pending texts in one model call
+    - Query embeddings are kept in an LRU cache keyed by a hash of the text
+
+    Use get_shared_embedder() to obtain the instance for a model.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        factory: Callable[[str], Embedder] | None = None,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+        cache_size: int = 1024,
+    ):
+        """
+        Initialize shared embedder (the model is not loaded yet).
+
+        Args:
+            model_name: Name of the embedding model
+            factory: Creates the underlying embedder (default:
+                SentenceTransformerEmbedder)
+            max_batch_size: Stop waiting for more requests at this many texts
+            max_wait: Seconds the first request waits for others to join
+            cache_size: Maximum number of cached query embeddings
+        """
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.cache_size = cache_size
+        self._factory = factory or SentenceTransformerEmbedder
+        self._model: Embedder | None = None
+        self._load_error: Exception | None = None
+        self._load_lock = threading.Lock()
+        self._batch_cond = threading.Condition()
+        self._pending: list[_EmbedRequest] = []
+        self._pending_texts = 0
+        self._batching = False
+        self._cache: OrderedDict[bytes, Any] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.batches = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def load(self) -> Embedder:
+        """
+        Load the model if needed.
+
+        Returns:
+            The underlying embedder
+
+        Raises:
+            RuntimeError: If the model failed to load (now or earlier)
+        """
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    if self._load_error is not None:
+                        raise RuntimeError(
+                            f"Embedding model '{self.model_name}' unavailable: {self._load_error}"
+                        )
+                    try:
+                        self._model = self._factory(self.model_name)
+                    except Exception as e:
+                        self._load_error = e
+                        raise RuntimeError(
+                            f"Embedding model '{self.model_name}' unavailable: {e}"
+                        ) from e
+                    logger.info(f"Loaded embedding model: {self.model_name}")
+        return self._model
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Generate embeddings, batched with concurrent callers.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            float32 array of shape (len(texts), embedding_dim)
+        """
+        model = self.load()
+        if not texts:
+            return model.embed([])
+
+        request = _EmbedRequest(list(texts))
+        with self._batch_cond:
+            self._pending.append(request)
+            self._pending_texts += len(request.texts)
+            self._batch_cond.notify_all()
+            while not request.done and self._batching:
+                self._batch_cond.wait()
+            if not request.done:
+                # No batch running: lead the next one
+                self._batching = True
+                self._collect_batch()
+                batch, self._pending, self._pending_texts = self._pending, [], 0
+
+        if not request.done:
+            self._run_batch(model, batch)
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _collect_batch(self) -> None:
+        """Wait (holding the condition) for more requests to join the batch."""
+        deadline = time.monotonic() + self.max_wait
+        while self._pending_texts < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._batch_cond.wait(remaining)
+
+    def _run_batch(self, model: Embedder, batch: list[_EmbedRequest]) -> None:
+        texts = [text for request in batch for text in request.texts]
+        try:
+            vectors = model.embed(texts)
+        except BaseException as e:
+            for request in batch:
+                request.error = e
+        else:
+            offset = 0
+            for request in batch:
+                request.result = vectors[offset : offset + len(request.texts)]
+                offset += len(request.texts)
+        with self._batch_cond:
+            self.batches += 1
+            for request in batch:
+                request.done = True
+            self._batching = False
+            self._batch_cond.notify_all()
+
+    def embed_query(self, text: str) -> np.ndarray:
+        """
+        Generate a query embedding, served from the LRU cache when possible.
+
+        Cached vectors are shared between callers and must not be modified.
+
+        Args:
+            text: Query text
+
+        Returns:
+            float32 vector of length embedding_dim
+        """
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._cache_lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return vector
+            self.cache_misses += 1
+        vector = self.embed([text])[0]
+        with self._cache_lock:
+            self._cache[key] = vector
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vector
+
+    def get_embedding_dim(self) -> int:
+        """Get embedding dimension (loads the model)."""
+        return self.load().get_embedding_dim()
+
+    def get_model_name(self) -> str:
+        """Get model name."""
+        return self.model_name
+
+
+_shared_embedders: dict[str, SharedEmbedder] = {}
+_shared_embedders_lock = threading.Lock()
+
+
+def get_shared_embedder(model_name: str = DEFAULT_EMBEDDING_MODEL) -> SharedEmbedder:
+    """Return the process-wide SharedEmbedder for a model (not yet loaded)."""
+    embedder = _shared_embedders.get(model_name)
+    if embedder is None:
+        with _shared_embedders_lock:
+            embedder = _shared_embedders.get(model_name)
+            if embedder is None:
+                embedder = SharedEmbedder(model_name)
+                _shared_embedders[model_name] = embedder
+    return embedder
+
+
 def create_embedder(model_name: str | None = None) -> Embedder | None:
     """
     Factory function to create an embedder.
 
+    Returns the process-wide shared embedder for the model, loading the
+    model on the first call only.
+
     Args:
         model_name: Optional model name (default: "all-MiniLM-L6-v2")
 
@@ -145,8 +379,10 @@ def create_embedder(model_name: str | None = None) -> Embedder | None:
         )
         return None
 
+    embedder = get_shared_embedder(model_name or DEFAULT_EMBEDDING_MODEL)
     try:
-        return SentenceTransformerEmbedder(model_name=model_name or "all-MiniLM-L6-v2")
+        embedder.load()
+        return embedder
     except Exception as e:
         logger.warning(f"Failed to create embedder: {e}. Falling back to SimpleKnowledgeBase.")
         return None
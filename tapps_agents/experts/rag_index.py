@@ -2,14 +2,21 @@
 RAG Index - FAISS-based vector index for semantic search.
 
 Provides indexing and querying capabilities for knowledge base chunks.
+Vectors are stored under stable chunk IDs (faiss.IndexIDMap), so the chunks
+of a changed knowledge file can be removed and re-embedded without
+rebuilding the whole index. Chunks are persisted in a memory-mapped
+ChunkStore and only decoded when returned as search results.
 """
 
+import hashlib
 import json
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .rag_chunk_store import CHUNK_STORE_FILENAME, ChunkStore
 from .rag_chunker import Chunk
 from .rag_embedder import Embedder
 
@@ -25,7 +32,24 @@ except ImportError:
     faiss = None  # type: ignore
 
 # Schema version for index metadata
-INDEX_SCHEMA_VERSION = "1.0"
+# 1.1: ID-mapped index with per-file content fingerprints
+INDEX_SCHEMA_VERSION = "1.1"
+
+# Chunk file written by releases before the binary chunk store (still loadable)
+LEGACY_CHUNKS_FILENAME = "chunks.json"
+
+
+def file_fingerprint(content: str) -> str:
+    """
+    Fingerprint the content of a knowledge file.
+
+    Args:
+        content: File content
+
+    Returns:
+        Short hex digest of the content
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
 
 
 @dataclass
@@ -39,6 +63,8 @@ class IndexMetadata:
     chunk_params: dict[str, Any] = field(default_factory=dict)
     source_files: list[str] = field(default_factory=list)
     source_fingerprint: str = ""  # Hash of source file set
+    file_fingerprints: dict[str, str] = field(default_factory=dict)  # file -> content hash
+    next_id: int = 0  # Next unused chunk ID
 
     def to_dict(self) -> dict[str, Any]:
         """Convert metadata to dictionary."""
@@ -50,6 +76,8 @@ class IndexMetadata:
             "chunk_params": self.chunk_params,
             "source_files": self.source_files,
             "source_fingerprint": self.source_fingerprint,
+            "file_fingerprints": self.file_fingerprints,
+            "next_id": self.next_id,
         }
 
     @classmethod
@@ -63,6 +91,8 @@ class IndexMetadata:
             chunk_params=data.get("chunk_params", {}),
             source_files=data.get("source_files", []),
             source_fingerprint=data.get("source_fingerprint", ""),
+            file_fingerprints=data.get("file_fingerprints", {}),
+            next_id=data.get("next_id", 0),
         )
 
 
@@ -72,6 +102,7 @@ class VectorIndex:
 
     Provides:
     - Index building from chunks and embeddings
+    - Incremental updates of changed source files
     - Persistent storage to disk
     - Loading from disk
     - Semantic similarity search
@@ -92,13 +123,16 @@ class VectorIndex:
 
         self.embedder = embedder
         self.index: Any | None = None  # FAISS index
-        self.chunks: list[Chunk] = []
+        self.chunks: Sequence[Chunk] = []  # list, or a ChunkStore after load()
+        self.chunk_ids: list[int] = []  # FAISS ID of each chunk
         self.metadata: IndexMetadata | None = None
+        self._positions: dict[int, int] = {}  # FAISS ID -> position in chunks
 
     def build(
         self,
         chunks: list[Chunk],
         chunk_params: dict[str, Any] | None = None,
+        file_fingerprints: dict[str, str] | None = None,
     ) -> None:
         """
         Build index from chunks.
@@ -106,6 +140,8 @@ class VectorIndex:
         Args:
             chunks: List of chunks to index
             chunk_params: Optional parameters used for chunking (for metadata)
+            file_fingerprints: Optional content fingerprint per source file,
+                used to detect changed files later (see update_files)
         """
         if not self.embedder:
             raise ValueError("Embedder is required for building index")
@@ -115,39 +151,119 @@ class VectorIndex:
 
         logger.info(f"Building FAISS index from {len(chunks)} chunks...")
 
-        # Generate embeddings for all chunks
-        texts = [chunk.content for chunk in chunks]
-        embeddings = self.embedder.embed(texts)
-
-        if not embeddings:
-            raise ValueError("Failed to generate embeddings")
-
-        embedding_dim = len(embeddings[0])
-        num_chunks = len(embeddings)
+        embeddings_array = self._embed_chunks(chunks)
+        num_chunks, embedding_dim = embeddings_array.shape
 
         # Create FAISS index (L2 distance index, normalized for cosine similarity)
-        # Since embeddings are normalized, L2 distance = 2 - 2*cosine_similarity
-        self.index = faiss.IndexFlatL2(embedding_dim)
-
-        # Convert embeddings to numpy array
-        import numpy as np
-
-        embeddings_array = np.array(embeddings, dtype="float32")
-        self.index.add(embeddings_array)
+        # Since embeddings are normalized, L2 distance = 2 - 2*cosine_similarity.
+        # The ID map lets update_files() remove the vectors of a single file.
+        self.index = faiss.IndexIDMap(faiss.IndexFlatL2(embedding_dim))
+        ids = list(range(num_chunks))
+        self.index.add_with_ids(embeddings_array, self._id_array(ids))
 
         # Store chunks and metadata
-        self.chunks = chunks
+        self._set_chunks(chunks, ids)
         self.metadata = IndexMetadata(
             model_name=self.embedder.get_model_name(),
             embedding_dim=embedding_dim,
-            chunk_count=num_chunks,
             chunk_params=chunk_params or {},
-            source_files=list(set(str(c.source_file) for c in chunks)),
-            source_fingerprint=self._calculate_source_fingerprint(chunks),
+            file_fingerprints=dict(file_fingerprints or {}),
+            next_id=num_chunks,
         )
+        self._update_source_metadata()
 
         logger.info(f"Index built successfully: {num_chunks} chunks, dim={embedding_dim}")
 
+    def update_files(
+        self,
+        file_chunks: dict[str, list[Chunk]],
+        removed_files: list[str] | None = None,
+        file_fingerprints: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Replace the chunks of changed source files, embedding only those.
+
+        Args:
+            file_chunks: Source file (as str) -> all of its current chunks;
+                existing chunks of these files are replaced
+            removed_files: Source files whose chunks are dropped
+            file_fingerprints: New content fingerprint per changed file
+        """
+        if not self.embedder:
+            raise ValueError("Embedder is required for updating index")
+        if self.index is None or self.metadata is None:
+            raise ValueError("Index not built, cannot update")
+
+        stale = set(file_chunks) | set(removed_files or [])
+        kept_chunks: list[Chunk] = []
+        kept_ids: list[int] = []
+        stale_ids: list[int] = []
+        sources = self._chunk_sources()
+        for position, (chunk_id, source) in enumerate(
+            zip(self.chunk_ids, sources, strict=True)
+        ):
+            if source in stale:
+                stale_ids.append(chunk_id)
+            else:
+                kept_chunks.append(self.chunks[position])
+                kept_ids.append(chunk_id)
+        if stale_ids:
+            self.index.remove_ids(self._id_array(stale_ids))
+
+        new_chunks = [chunk for chunks in file_chunks.values() for chunk in chunks]
+        new_ids = list(range(self.metadata.next_id, self.metadata.next_id + len(new_chunks)))
+        if new_chunks:
+            self.index.add_with_ids(self._embed_chunks(new_chunks), self._id_array(new_ids))
+
+        self._set_chunks(kept_chunks + new_chunks, kept_ids + new_ids)
+        for source in removed_files or []:
+            self.metadata.file_fingerprints.pop(source, None)
+        self.metadata.file_fingerprints.update(file_fingerprints or {})
+        self.metadata.next_id += len(new_chunks)
+        self._update_source_metadata()
+
+        logger.info(
+            f"Index updated: {len(file_chunks)} changed and {len(removed_files or [])} "
+            f"removed files, {len(new_chunks)} chunks embedded, {len(stale_ids)} removed"
+        )
+
+    def _embed_chunks(self, chunks: list[Chunk]) -> Any:
+        import numpy as np
+
+        embeddings_array = np.asarray(
+            self.embedder.embed([chunk.content for chunk in chunks]), dtype="float32"
+        )
+        if embeddings_array.ndim != 2 or len(embeddings_array) != len(chunks):
+            raise ValueError("Failed to generate embeddings")
+        return embeddings_array
+
+    @staticmethod
+    def _id_array(ids: list[int]) -> Any:
+        import numpy as np
+
+        return np.asarray(ids, dtype="int64")
+
+    def _set_chunks(self, chunks: Sequence[Chunk], chunk_ids: list[int]) -> None:
+        previous = self.chunks
+        self.chunks = chunks
+        self.chunk_ids = chunk_ids
+        self._positions = {chunk_id: i for i, chunk_id in enumerate(chunk_ids)}
+        # Release the mapping so save() can replace the file (required on Windows)
+        if isinstance(previous, ChunkStore) and previous is not chunks:
+            previous.close()
+
+    def _chunk_sources(self) -> list[str]:
+        if isinstance(self.chunks, ChunkStore):
+            return self.chunks.source_files()
+        return [str(chunk.source_file) for chunk in self.chunks]
+
+    def _update_source_metadata(self) -> None:
+        self.metadata.chunk_count = len(self.chunks)
+        self.metadata.source_files = sorted(set(self._chunk_sources()))
+        self.metadata.source_fingerprint = self._calculate_source_fingerprint(
+            self.metadata.source_files
+        )
+
     def search(
         self,
         query_text: str,
@@ -171,16 +287,14 @@ class VectorIndex:
         if not self.chunks:
             return []
 
-        # Generate embedding for query
-        query_embeddings = self.embedder.embed([query_text])
-        if not query_embeddings:
-            return []
-
         import numpy as np
 
-        query_vector = np.array([query_embeddings[0]], dtype="float32")
+        # Generate embedding for query (cached by shared embedders)
+        query_vector = np.asarray(
+            self.embedder.embed_query(query_text), dtype="float32"
+        ).reshape(1, -1)
 
-        # Search index
+        # Search index (returns chunk IDs)
         k = min(top_k, len(self.chunks))
         distances, indices = self.index.search(query_vector, k)
 
@@ -190,7 +304,8 @@ class VectorIndex:
         # This approximates cosine similarity
         results: list[tuple[Chunk, float]] = []
         for _i, (distance, idx) in enumerate(zip(distances[0], indices[0], strict=False)):
-            if idx < 0 or idx >= len(self.chunks):  # Invalid index
+            position = self._positions.get(int(idx))
+            if position is None:  # Invalid or removed ID
                 continue
 
             # Convert L2 distance to similarity (0.0-1.0)
@@ -200,7 +315,7 @@ class VectorIndex:
 
             # Filter by threshold
             if similarity >= similarity_threshold:
-                chunk = self.chunks[int(idx)]
+                chunk = self.chunks[position]
                 results.append((chunk, similarity))
 
         # Sort by similarity (highest first)
@@ -225,11 +340,14 @@ class VectorIndex:
         index_path = index_dir / "index.faiss"
         faiss.write_index(self.index, str(index_path))
 
-        # Save chunks as JSON
-        chunks_path = index_dir / "chunks.json"
-        chunks_data = [chunk.to_dict() for chunk in self.chunks]
-        with open(chunks_path, "w", encoding="utf-8") as f:
-            json.dump(chunks_data, f, indent=2)
+        # Save chunks (unchanged if they are still mapped from this file)
+        chunks_path = index_dir / CHUNK_STORE_FILENAME
+        if not (
+            isinstance(self.chunks, ChunkStore)
+            and self.chunks.path.resolve() == chunks_path.resolve()
+        ):
+            ChunkStore.write(chunks_path, self.chunks, self.chunk_ids)
+        (index_dir / LEGACY_CHUNKS_FILENAME).unlink(missing_ok=True)
 
         # Save metadata
         metadata_path = index_dir / "metadata.json"
@@ -264,18 +382,22 @@ class VectorIndex:
 
         index = faiss.read_index(str(index_path))
 
-        # Load chunks
-        chunks_path = index_dir / "chunks.json"
-        if not chunks_path.exists():
+        # Load chunks (memory-mapped; decoded only when accessed)
+        chunks_path = index_dir / CHUNK_STORE_FILENAME
+        legacy_path = index_dir / LEGACY_CHUNKS_FILENAME
+        chunks: Sequence[Chunk]
+        if chunks_path.exists():
+            chunks = ChunkStore(chunks_path)
+            chunk_ids = chunks.ids()
+        elif legacy_path.exists():
+            with open(legacy_path, encoding="utf-8") as f:
+                chunks_data = json.load(f)
+            chunks = [Chunk.from_dict(data) for data in chunks_data]
+            # Indexes written before schema 1.1 use positions as IDs
+            chunk_ids = [int(data.get("id", i)) for i, data in enumerate(chunks_data)]
+        else:
             raise FileNotFoundError(f"Chunks file not found: {chunks_path}")
 
-        with open(chunks_path, encoding="utf-8") as f:
-            chunks_data = json.load(f)
-
-        from .rag_chunker import Chunk
-
-        chunks = [Chunk.from_dict(data) for data in chunks_data]
-
         # Load metadata
         metadata_path = index_dir / "metadata.json"
         metadata = None
@@ -287,17 +409,14 @@ class VectorIndex:
         # Create instance
         instance = cls(embedder=embedder)
         instance.index = index
-        instance.chunks = chunks
+        instance._set_chunks(chunks, chunk_ids)
         instance.metadata = metadata
 
         logger.info(f"Index loaded from {index_dir}: {len(chunks)} chunks")
 
         return instance
 
-    def _calculate_source_fingerprint(self, chunks: list[Chunk]) -> str:
-        """Calculate fingerprint of source files."""
-        import hashlib
-
-        source_files = sorted(set(str(c.source_file) for c in chunks))
+    def _calculate_source_fingerprint(self, source_files: list[str]) -> str:
+        """Calculate fingerprint of the (sorted, distinct) source files."""
         fingerprint_str = "|".join(source_files)
         return hashlib.sha256(fingerprint_str.encode("utf-8")).hexdigest()[:16]
@@ -3,6 +3,7 @@ Simple File-Based RAG System for Industry Experts
 
 Provides knowledge retrieval from markdown files in a knowledge/ directory
 using keyword search and context extraction. No vector DB required.
+Queries are answered from a persisted BM25 inverted index (see rag_bm25).
 """
 
 import logging
@@ -10,6 +11,14 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from .rag_bm25 import (
+    INDEX_FILENAME,
+    BM25Index,
+    ChunkSpan,
+    load_or_build_index,
+    tokenize,
+)
+
 logger = logging.getLogger(__name__)
 
 # Maximum file size for RAG knowledge files (10 MB)
@@ -32,23 +41,38 @@ class SimpleKnowledgeBase:
     Simple file-based knowledge base for RAG.
 
     Features:
-    - Keyword search in markdown files
+    - Keyword search in markdown files (BM25 over an inverted index)
     - Context extraction around matches
     - File-based storage (no vector DB)
     - Markdown-aware chunking
     """
 
-    def __init__(self, knowledge_dir: Path, domain: str | None = None):
+    def __init__(
+        self,
+        knowledge_dir: Path,
+        domain: str | None = None,
+        index_dir: Path | None = None,
+    ):
         """
         Initialize knowledge base.
 
         Args:
             knowledge_dir: Directory containing knowledge files (markdown)
             domain: Optional domain filter (only load files matching domain)
+            index_dir: Optional directory for the persisted keyword index
+                (default: .tapps-agents/rag_index/<domain>)
         """
         self.knowledge_dir = Path(knowledge_dir)
         self.domain = domain
+        if index_dir:
+            self.index_dir = Path(index_dir)
+        else:
+            base_dir = self.knowledge_dir.parent / ".tapps-agents" / "rag_index"
+            self.index_dir = base_dir / (domain or "general")
         self.files: dict[Path, str] = {}  # Cache of loaded files
+        self._index: BM25Index | None = None  # Built or loaded on first search
+        self._sources: dict[str, Path] = {}
+        self._lines: dict[Path, list[str]] = {}
         self._load_knowledge_files()
 
     def _load_knowledge_files(self):
@@ -122,6 +146,9 @@ class SimpleKnowledgeBase:
         """
         Search knowledge base for relevant chunks.
 
+        Chunks are ranked with the BM25 index and trimmed to the matching
+        lines plus context, within their markdown section.
+
         Args:
             query: Search query (keywords)
             max_results: Maximum number of chunks to return
@@ -131,117 +158,72 @@ class SimpleKnowledgeBase:
             List of KnowledgeChunk objects sorted by relevance
         """
         query_keywords = self._normalize_query(query)
+        terms = [term for keyword in sorted(query_keywords) for term in tokenize(keyword)]
+        if not terms or not self.files:
+            return []
 
         chunks: list[KnowledgeChunk] = []
-
-        for file_path, content in self.files.items():
-            file_chunks = self._extract_relevant_chunks(
-                file_path, content, query_keywords, context_lines
-            )
-            chunks.extend(file_chunks)
-
-        # Sort by score (highest first)
-        chunks.sort(key=lambda c: c.score, reverse=True)
-
-        # Return top results
-        return chunks[:max_results]
-
-    def _extract_relevant_chunks(
-        self, file_path: Path, content: str, query_keywords: set, context_lines: int
-    ) -> list[KnowledgeChunk]:
-        """
-        Extract relevant chunks from a file based on keyword matches.
-
-        Uses markdown-aware chunking (respects headers, paragraphs).
-        """
-        lines = content.split("\n")
-        chunks: list[KnowledgeChunk] = []
-
-        # Score each line by keyword matches with improved scoring
-        line_scores: dict[int, float] = {}
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            
-            # Base score: count keyword matches
-            base_score = sum(1.0 for keyword in query_keywords if keyword in line_lower)
-            
-            # Boost for exact phrase matches (consecutive keywords)
-            if len(query_keywords) > 1:
-                query_phrase = " ".join(sorted(query_keywords))
-                if query_phrase in line_lower or any(
-                    keyword1 in line_lower and keyword2 in line_lower
-                    for keyword1 in query_keywords
-                    for keyword2 in query_keywords
-                    if keyword1 != keyword2
-                ):
-                    base_score *= 1.3
-            
-            # Boost score for headers (marked by #)
-            header_boost = 1.0
-            if line.strip().startswith("#"):
-                # H1 gets highest boost, H2 less, etc.
-                header_level = len(line) - len(line.lstrip("#"))
-                header_boost = 2.0 - (header_level * 0.2)
-            
-            # Boost for code blocks (examples are valuable)
-            if line.strip().startswith("```"):
-                base_score *= 1.4
-            
-            # Boost for lines with lists (structured information)
-            if line.strip().startswith("- ") or line.strip().startswith("* "):
-                base_score *= 1.2
-            
-            score = base_score * header_boost
-            
-            if score > 0:
-                line_scores[i] = score
-
-        if not line_scores:
-            return chunks  # No matches
-
-        # Group consecutive high-scoring lines into chunks
-        current_chunk_start: int | None = None
-        current_chunk_lines: list[int] = []
-
-        for i in sorted(line_scores.keys()):
-            if current_chunk_start is None:
-                current_chunk_start = i
-                current_chunk_lines = [i]
-            elif i - current_chunk_lines[-1] <= context_lines:
-                # Within context distance, add to current chunk
-                current_chunk_lines.append(i)
-            else:
-                # New chunk needed
-                if current_chunk_start is not None:
-                    chunk = self._create_chunk_from_lines(
-                        file_path,
-                        lines,
-                        current_chunk_start,
-                        current_chunk_lines[-1],
-                        context_lines,
-                        query_keywords,
-                    )
-                    if chunk:
-                        chunks.append(chunk)
-
-                current_chunk_start = i
-                current_chunk_lines = [i]
-
-        # Add final chunk
-        if current_chunk_start is not None:
-            chunk = self._create_chunk_from_lines(
-                file_path,
-                lines,
-                current_chunk_start,
-                current_chunk_lines[-1],
-                context_lines,
-                query_keywords,
-            )
+        for span, score in self._get_index().search(terms, max_results=max_results):
+            chunk = self._chunk_from_span(span, set(terms), context_lines, query_keywords)
             if chunk:
+                chunk.score = score
                 chunks.append(chunk)
 
         return chunks
 
+    def _get_index(self) -> BM25Index:
+        """Load or build the BM25 index on first use."""
+        if self._index is None:
+            documents = {
+                self._source_name(file_path): content
+                for file_path, content in self.files.items()
+            }
+            self._sources = {
+                self._source_name(file_path): file_path for file_path in self.files
+            }
+            self._index = load_or_build_index(
+                documents, self.index_dir / INDEX_FILENAME
+            )
+        return self._index
+
+    def _source_name(self, file_path: Path) -> str:
+        """Index name of a file (path relative to knowledge_dir when possible)."""
+        try:
+            return file_path.relative_to(self.knowledge_dir).as_posix()
+        except ValueError:
+            return str(file_path)
+
+    def _chunk_from_span(
+        self,
+        span: ChunkSpan,
+        terms: set[str],
+        context_lines: int,
+        query_keywords: set,
+    ) -> KnowledgeChunk | None:
+        """Create a KnowledgeChunk around the matching lines of an indexed chunk."""
+        file_path = self._sources[span.source]
+        lines = self._lines.get(file_path)
+        if lines is None:
+            lines = self._lines[file_path] = self.files[file_path].split("\n")
+
+        matched = [
+            i
+            for i in range(span.start, span.end)
+            if any(term in lines[i].lower() for term in terms)
+        ]
+        # Matched only through the header of a split section: keep the piece
+        first, last = (matched[0], matched[-1]) if matched else (span.start, span.end - 1)
+        return self._create_chunk_from_lines(
+            file_path,
+            lines,
+            first,
+            last,
+            context_lines,
+            query_keywords,
+            lower=span.start,
+            upper=span.end,
+        )
+
     def _create_chunk_from_lines(
         self,
         file_path: Path,
@@ -250,11 +232,20 @@ class SimpleKnowledgeBase:
         end_line: int,
         context_lines: int,
         query_keywords: set,
+        lower: int = 0,
+        upper: int | None = None,
     ) -> KnowledgeChunk | None:
-        """Create a KnowledgeChunk from line range with context."""
+        """
+        Create a KnowledgeChunk from line range with context.
+
+        Context is clipped to lines ``lower`` to ``upper`` (end-exclusive,
+        default: the whole file).
+        """
         # Expand range with context
-        actual_start = max(0, start_line - context_lines)
-        actual_end = min(len(lines), end_line + context_lines)
+        actual_start = max(lower, start_line - context_lines)
+        actual_end = min(
+            len(lines) if upper is None else upper, end_line + 1 + context_lines
+        )
 
         # Try to align to markdown boundaries (headers)
         for i in range(actual_start, start_line):
@@ -10,9 +10,16 @@ import logging
 import time
 from pathlib import Path
 
+from .rag_chunk_store import CHUNK_STORE_FILENAME
 from .rag_chunker import Chunk, Chunker
 from .rag_embedder import Embedder, create_embedder
-from .rag_index import VectorIndex
+from .rag_index import (
+    INDEX_SCHEMA_VERSION,
+    LEGACY_CHUNKS_FILENAME,
+    IndexMetadata,
+    VectorIndex,
+    file_fingerprint,
+)
 from .rag_safety import create_safety_handler
 from .simple_rag import KnowledgeChunk, SimpleKnowledgeBase
 
@@ -29,6 +36,7 @@ class VectorKnowledgeBase:
     Features:
     - Semantic similarity search using embeddings
     - Automatic index building and caching
+    - Incremental re-indexing of added, edited and deleted files
     - Fallback to SimpleKnowledgeBase if dependencies unavailable
     - Time-bounded queries (<2s target)
     """
@@ -106,38 +114,55 @@ class VectorKnowledgeBase:
                 logger.warning(f"Failed to initialize vector RAG: {e}. Falling back to SimpleKnowledgeBase.")
 
         # Fallback to SimpleKnowledgeBase
-        self.fallback_kb = SimpleKnowledgeBase(self.knowledge_dir, domain=self.domain)
+        self.fallback_kb = SimpleKnowledgeBase(
+            self.knowledge_dir, domain=self.domain, index_dir=self.index_dir
+        )
         self._backend_type = "simple"
         logger.info("Using SimpleKnowledgeBase fallback (vector dependencies unavailable)")
         self._initialized = True
 
     def _build_or_load_index(self) -> None:
-        """Build new index or load existing one."""
+        """Load the existing index and re-index changed files, or build a new one."""
         if not self.embedder:
             return
 
+        files = self._load_knowledge_files()
+        fingerprints = {str(path): file_fingerprint(content) for path, content in files.items()}
+
         # Check if index exists and is valid
         if self._index_exists() and self._index_is_valid():
             try:
                 self.index = VectorIndex.load(self.index_dir, embedder=self.embedder)
+                self._sync_index(files, fingerprints)
                 logger.info(f"Loaded existing index from {self.index_dir}")
                 return
             except Exception as e:
                 logger.warning(f"Failed to load existing index: {e}. Rebuilding...")
 
         # Build new index
-        self._build_index()
+        self._build_index(files, fingerprints)
+
+    def _chunk_params(self) -> dict[str, int]:
+        return {"target_tokens": self.chunk_size, "overlap_tokens": self.overlap}
 
     def _index_exists(self) -> bool:
         """Check if index files exist."""
         return (
             (self.index_dir / "index.faiss").exists()
-            and (self.index_dir / "chunks.json").exists()
+            and (
+                (self.index_dir / CHUNK_STORE_FILENAME).exists()
+                or (self.index_dir / LEGACY_CHUNKS_FILENAME).exists()
+            )
             and (self.index_dir / "metadata.json").exists()
         )
 
     def _index_is_valid(self) -> bool:
-        """Check if existing index is valid (matches current sources)."""
+        """
+        Check if the existing index can be reused.
+
+        The schema, embedding model and chunking parameters must match;
+        changed source files are re-indexed by _sync_index.
+        """
         try:
             import json
 
@@ -146,27 +171,19 @@ class VectorKnowledgeBase:
                 return False
 
             with open(metadata_path, encoding="utf-8") as f:
-                metadata = json.load(f)
+                metadata = IndexMetadata.from_dict(json.load(f))
 
-            # Check schema version
-            if metadata.get("schema_version") != "1.0":
-                return False
-
-            # TODO: Could check source fingerprint for more validation
-            return True
+            return (
+                metadata.schema_version == INDEX_SCHEMA_VERSION
+                and metadata.model_name == self.embedding_model
+                and metadata.chunk_params == self._chunk_params()
+            )
         except Exception:
             return False
 
-    def _build_index(self) -> None:
-        """Build FAISS index from knowledge files."""
-        if not self.embedder:
-            return
-
-        logger.info(f"Building vector index from {self.knowledge_dir}...")
-        start_time = time.time()
-
-        # Load and chunk all markdown files
-        all_chunks: list[Chunk] = []
+    def _load_knowledge_files(self) -> dict[Path, str]:
+        """Read the markdown files of this knowledge base (domain-filtered)."""
+        files: dict[Path, str] = {}
         for md_file in self.knowledge_dir.rglob("*.md"):
             # Filter by domain if specified
             if self.domain:
@@ -177,11 +194,66 @@ class VectorKnowledgeBase:
                     continue
 
             try:
-                content = md_file.read_text(encoding="utf-8")
-                file_chunks = self.chunker.chunk_file(md_file, content)
-                all_chunks.extend(file_chunks)
+                files[md_file] = md_file.read_text(encoding="utf-8")
+            except Exception as e:
+                logger.warning(f"Failed to process {md_file}: {e}")
+                continue
+        return files
+
+    def _sync_index(self, files: dict[Path, str], fingerprints: dict[str, str]) -> None:
+        """Re-embed added or edited files and drop deleted ones."""
+        if not self.index or not self.index.metadata:
+            return
+        indexed = self.index.metadata.file_fingerprints
+        changed = [path for path in files if indexed.get(str(path)) != fingerprints[str(path)]]
+        removed = [source for source in indexed if source not in fingerprints]
+        if not changed and not removed:
+            return
+
+        start_time = time.time()
+        file_chunks = {
+            str(path): self.chunker.chunk_file(path, files[path]) for path in changed
+        }
+        self.index.update_files(
+            file_chunks,
+            removed_files=removed,
+            file_fingerprints={str(path): fingerprints[str(path)] for path in changed},
+        )
+        self.index.save(self.index_dir)
+
+        elapsed = time.time() - start_time
+        logger.info(
+            f"Index refreshed in {elapsed:.2f}s: {len(changed)} changed, "
+            f"{len(removed)} removed files"
+        )
+
+    def _build_index(
+        self,
+        files: dict[Path, str] | None = None,
+        fingerprints: dict[str, str] | None = None,
+    ) -> None:
+        """Build FAISS index from knowledge files."""
+        if not self.embedder:
+            return
+
+        logger.info(f"Building vector index from {self.knowledge_dir}...")
+        start_time = time.time()
+
+        if files is None:
+            files = self._load_knowledge_files()
+        if fingerprints is None:
+            fingerprints = {
+                str(path): file_fingerprint(content) for path, content in files.items()
+            }
+
+        # Chunk all markdown files
+        all_chunks: list[Chunk] = []
+        for md_file, content in files.items():
+            try:
+                all_chunks.extend(self.chunker.chunk_file(md_file, content))
             except Exception as e:
                 logger.warning(f"Failed to process {md_file}: {e}")
+                fingerprints.pop(str(md_file), None)
                 continue
 
         if not all_chunks:
@@ -192,10 +264,8 @@ class VectorKnowledgeBase:
         self.index = VectorIndex(embedder=self.embedder)
         self.index.build(
             all_chunks,
-            chunk_params={
-                "target_tokens": self.chunk_size,
-                "overlap_tokens": self.overlap,
-            },
+            chunk_params=self._chunk_params(),
+            file_fingerprints=fingerprints,
         )
 
         # Save index
@@ -222,14 +292,12 @@ class VectorKnowledgeBase:
 
         # Use fallback if vector backend not available
         if self._backend_type == "simple" and self.fallback_kb:
-            return self.fallback_kb.search(query, max_results=max_results, context_lines=context_lines)
+            return self._fallback_search(query, max_results, context_lines)
 
         # Use vector search
         if not self.index:
             logger.warning("Index not available, falling back to SimpleKnowledgeBase")
-            if not self.fallback_kb:
-                self.fallback_kb = SimpleKnowledgeBase(self.knowledge_dir, domain=self.domain)
-            return self.fallback_kb.search(query, max_results=max_results, context_lines=context_lines)
+            return self._fallback_search(query, max_results, context_lines)
 
         # Perform semantic search with timeout
         start_time = time.time()
@@ -271,9 +339,24 @@ class VectorKnowledgeBase:
             return knowledge_chunks
         except Exception as e:
             logger.error(f"Vector search failed: {e}. Falling back to SimpleKnowledgeBase.", exc_info=True)
-            if not self.fallback_kb:
-                self.fallback_kb = SimpleKnowledgeBase(self.knowledge_dir, domain=self.domain)
-            return self.fallback_kb.search(query, max_results=max_results, context_lines=context_lines)
+            return self._fallback_search(query, max_results, context_lines)
+
+    def _fallback_search(
+        self, query: str, max_results: int, context_lines: int
+    ) -> list[KnowledgeChunk]:
+        """
+        Search with the keyword fallback.
+
+        Keyword scores are relevance relative to the best match, not
+        embedding similarities, so similarity_threshold does not apply.
+        """
+        if not self.fallback_kb:
+            self.fallback_kb = SimpleKnowledgeBase(
+                self.knowledge_dir, domain=self.domain, index_dir=self.index_dir
+            )
+        return self.fallback_kb.search(
+            query, max_results=max_results, context_lines=context_lines
+        )
 
     def get_context(self, query: str, max_length: int = 2000) -> str:
         """
@@ -291,12 +374,14 @@ class VectorKnowledgeBase:
         if not chunks:
             return "No relevant knowledge found in knowledge base."
 
-        # Format with safety handler
+        # Format with safety handler. search() already applied
+        # similarity_threshold to semantic results, and keyword fallback
+        # scores are not similarities, so no chunk is filtered again here.
         chunk_tuples = [
             (chunk.content, chunk.score, str(chunk.source_file)) for chunk in chunks
         ]
         formatted_context, sources, all_safe = self.safety_handler.format_retrieved_context(
-            chunk_tuples, max_length=max_length, min_similarity=self.similarity_threshold
+            chunk_tuples, max_length=max_length, min_similarity=0.0
         )
 
         # Add citations if required
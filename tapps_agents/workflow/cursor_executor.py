@@ -66,6 +66,7 @@ from .progress_manager import ProgressUpdateManager
 from .skill_invoker import SkillInvoker
 from .state_manager import AdvancedStateManager
 from .state_persistence_config import StatePersistenceConfigManager
+from .step_scheduler import StepScheduler
 from .worktree_manager import WorktreeManager
 
 
@@ -108,6 +109,7 @@ class CursorWorkflowExecutor:
         self.worktree_manager = WorktreeManager(project_root=self.project_root)
         self.project_profile: ProjectProfile | None = None
         self.parallel_executor = ParallelStepExecutor(max_parallel=8, default_timeout_seconds=3600.0)
+        self._scheduler: StepScheduler | None = None  # Readiness tracking for the current run
         self.logger: WorkflowLogger | None = None  # Initialized in start() with workflow_id
         self.progress_manager: ProgressUpdateManager | None = None  # Initialized in start() with workflow
         
@@ -586,8 +588,14 @@ class CursorWorkflowExecutor:
             
             # Use parallel execution for independent steps
             steps_executed = 0
-            completed_step_ids = set(self.state.completed_steps)
-            running_step_ids: set[str] = set()
+            self._scheduler = self.parallel_executor.create_scheduler(
+                self.workflow.steps,
+                completed_step_ids=self.state.completed_steps,
+                available_artifacts=self.state.artifacts,
+                scheduling=self.workflow.settings.scheduling,
+            )
+            completed_step_ids = self._scheduler.completed
+            running_step_ids = self._scheduler.running
 
             while (
                 self.state
@@ -878,12 +886,17 @@ class CursorWorkflowExecutor:
         running_step_ids: set[str],
     ) -> list[WorkflowStep]:
         """Find steps ready to execute (dependencies met)."""
+        scheduler = self._scheduler
+        if scheduler is not None and running_step_ids is scheduler.running:
+            # The run's sets drive the scheduler's counters: no rescan needed
+            return scheduler.pop_ready()
         available_artifacts = set(self.state.artifacts.keys())
         return self.parallel_executor.find_ready_steps(
             workflow_steps=self.workflow.steps,
             completed_step_ids=completed_step_ids,
             running_step_ids=running_step_ids,
             available_artifacts=available_artifacts,
+            scheduling=self.workflow.settings.scheduling,
         )
 
     def _handle_no_ready_steps(self, completed_step_ids: set[str]) -> bool:
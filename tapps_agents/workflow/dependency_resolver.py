@@ -59,14 +59,17 @@ class DependencyGraph:
 class DependencyResolver:
     """Resolves workflow step dependencies and execution order."""
 
-    def __init__(self, steps: list[WorkflowStep]):
+    def __init__(self, steps: list[WorkflowStep], include_next: bool = True):
         """
         Initialize dependency resolver.
 
         Args:
             steps: List of workflow steps
+            include_next: Treat each step's 'next' as a dependency of the next
+                step (False keeps only artifact and depends_on edges)
         """
         self.steps = steps
+        self.include_next = include_next
         self.graph = self._build_graph()
 
     def _build_graph(self) -> DependencyGraph:
@@ -75,24 +78,30 @@ class DependencyResolver:
         dependencies: dict[str, set[str]] = defaultdict(set)
         dependents: dict[str, set[str]] = defaultdict(set)
 
-        # Create node mapping
+        # Create node mapping and index artifact producers
+        producers: dict[str, list[str]] = defaultdict(list)
         for step in self.steps:
             nodes[step.id] = step
+            for artifact in step.creates:
+                producers[artifact].append(step.id)
 
         # Build dependency edges based on artifact requirements
         for step in self.steps:
             # Step depends on artifacts created by other steps
             for required_artifact in step.requires:
-                # Find steps that create this artifact
-                for other_step in self.steps:
-                    if other_step.id == step.id:
-                        continue
-                    if required_artifact in other_step.creates:
-                        dependencies[step.id].add(other_step.id)
-                        dependents[other_step.id].add(step.id)
+                for producer_id in producers.get(required_artifact, ()):
+                    if producer_id != step.id:
+                        dependencies[step.id].add(producer_id)
+                        dependents[producer_id].add(step.id)
+
+            # Explicitly declared dependencies
+            for dep_id in step.depends_on:
+                if dep_id in nodes and dep_id != step.id:
+                    dependencies[step.id].add(dep_id)
+                    dependents[dep_id].add(step.id)
 
             # Also consider explicit 'next' relationships as dependencies
-            if step.next:
+            if self.include_next and step.next:
                 # 'next' creates an implicit dependency: next step depends on current step
                 if step.next in nodes:
                     dependencies[step.next].add(step.id)
@@ -207,6 +216,30 @@ class DependencyResolver:
 
         return cycles
 
+    def critical_path_lengths(self) -> dict[str, int]:
+        """
+        Compute the critical-path length of every step.
+
+        The critical-path length of a step is the number of steps on the
+        longest dependency chain starting at it (the step itself included).
+        Scheduling steps with longer chains first shortens the makespan.
+
+        Returns:
+            Mapping of step ID to critical-path length
+
+        Raises:
+            ValueError: If the graph has a circular dependency
+        """
+        graph = self.graph
+        lengths: dict[str, int] = {}
+        for level in reversed(self.resolve_execution_order()):
+            for step_id in level:
+                lengths[step_id] = 1 + max(
+                    (lengths[dep] for dep in graph.dependents.get(step_id, set())),
+                    default=0,
+                )
+        return lengths
+
     def get_dependencies(self, step_id: str) -> set[str]:
         """
         Get direct dependencies for a step.
@@ -12,7 +12,6 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 import uuid
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -21,6 +20,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .segmented_log import SegmentedEventLog
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,7 +150,8 @@ class EventStore:
     """
     Append-only event store for workflow events.
     
-    Uses atomic file operations for durability without locking.
+    Events go to a segmented event log under ``event-log/``; checkpoints are
+    written per workflow with atomic file operations.
     """
     
     def __init__(self, store_dir: Path):
@@ -161,40 +163,69 @@ class EventStore:
         """
         self.store_dir = Path(store_dir)
         self.store_dir.mkdir(parents=True, exist_ok=True)
+        self._log = SegmentedEventLog(self.store_dir / "event-log", fsync=True)
+        self._migrate_legacy_events()
     
     def _get_workflow_dir(self, workflow_id: str) -> Path:
-        """Get directory for workflow events."""
+        """Get directory for workflow checkpoints."""
         return self.store_dir / workflow_id
     
-    def _get_events_file(self, workflow_id: str) -> Path:
-        """Get events file path."""
-        return self._get_workflow_dir(workflow_id) / "events.jsonl"
-    
     def _get_checkpoint_file(self, workflow_id: str) -> Path:
         """Get latest checkpoint file path."""
         return self._get_workflow_dir(workflow_id) / "checkpoint.json"
     
-    def append_event(self, event: WorkflowEvent) -> None:
+    def _migrate_legacy_events(self) -> None:
         """
-        Append event to store (atomic, no locking).
+        Move per-workflow events.jsonl files into the event log.
         
-        Uses append mode with explicit flush for durability.
+        Each file is renamed to ``events.jsonl.migrating`` before its events
+        are appended and deleted afterwards. Under the log's writer lock,
+        events already logged (sequence_number not above the workflow's
+        latest logged one) are skipped, so an interrupted import resumes
+        without duplicates.
         """
-        workflow_dir = self._get_workflow_dir(event.workflow_id)
-        workflow_dir.mkdir(parents=True, exist_ok=True)
-        
-        events_file = self._get_events_file(event.workflow_id)
-        
-        # Append with newline-delimited JSON
-        with open(events_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event.to_dict()) + "\n")
-            f.flush()
-            try:
-                os.fsync(f.fileno())  # Ensure durability
-            except OSError:
-                # fsync can fail on some systems (e.g., network drives on Windows)
-                # Continue anyway as flush() provides some durability guarantees
-                pass
+        if not any(self.store_dir.glob("*/events.jsonl*")):
+            return
+        with self._log.writer_lock():
+            for events_file in sorted(self.store_dir.glob("*/events.jsonl")):
+                try:
+                    events_file.rename(events_file.with_name("events.jsonl.migrating"))
+                except OSError as e:
+                    logger.warning(f"Failed to migrate events from {events_file}: {e}")
+            for events_file in sorted(self.store_dir.glob("*/events.jsonl.migrating")):
+                self._migrate_events_file(events_file)
+    
+    def _migrate_events_file(self, events_file: Path) -> None:
+        events = []
+        try:
+            with open(events_file, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        try:
+                            events.append(WorkflowEvent.from_dict(json.loads(line)))
+                        except Exception as e:
+                            logger.warning(f"Failed to parse event: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to migrate events from {events_file}: {e}")
+            return
+        logged_sequence: dict[str, int] = {}
+        for event in sorted(events, key=lambda e: e.sequence_number):
+            if event.workflow_id not in logged_sequence:
+                latest = self._log.latest(event.workflow_id)
+                logged_sequence[event.workflow_id] = (
+                    int(latest.data.get("sequence_number", 0)) if latest else 0
+                )
+            logged = logged_sequence[event.workflow_id]
+            if not logged or event.sequence_number > logged:
+                self.append_event(event)
+        events_file.unlink(missing_ok=True)
+    
+    def append_event(self, event: WorkflowEvent) -> None:
+        """
+        Append event to store (fsynced for durability).
+        """
+        self._log.append(event.workflow_id, event.event_type.value, event.to_dict())
     
     def get_events(self, workflow_id: str) -> list[WorkflowEvent]:
         """
@@ -202,21 +233,12 @@ class EventStore:
         
         Returns events in sequence order.
         """
-        events_file = self._get_events_file(workflow_id)
-        
-        if not events_file.exists():
-            return []
-        
         events = []
-        with open(events_file, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        event = WorkflowEvent.from_dict(json.loads(line))
-                        events.append(event)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse event: {e}")
+        for record in self._log.read_events(workflow_id=workflow_id):
+            try:
+                events.append(WorkflowEvent.from_dict(record.data))
+            except Exception as e:
+                logger.warning(f"Failed to parse event: {e}")
         
         return sorted(events, key=lambda e: e.sequence_number)
     
@@ -265,20 +287,26 @@ class EventStore:
         if not self.store_dir.exists():
             return []
         
-        return [
+        workflow_ids = self._log.workflow_ids()
+        workflow_ids.extend(
             d.name for d in self.store_dir.iterdir()
-            if d.is_dir() and not d.name.startswith(".")
-        ]
+            if d.is_dir()
+            and not d.name.startswith(".")
+            and d.name not in workflow_ids
+            and (d / "checkpoint.json").exists()
+        )
+        return workflow_ids
     
     def delete_workflow(self, workflow_id: str) -> bool:
         """Delete all data for a workflow."""
         import shutil
         
+        deleted = self._log.delete_workflow(workflow_id)
         workflow_dir = self._get_workflow_dir(workflow_id)
         if workflow_dir.exists():
             shutil.rmtree(workflow_dir)
-            return True
-        return False
+            deleted = True
+        return deleted
 
 
 class DurableWorkflowState:
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Any
 
 from .events import EventType, WorkflowEvent
+from .segmented_log import SegmentedEventLog
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +23,9 @@ class FileBasedEventBus:
     """
     File-based event bus for agent coordination.
 
-    Stores events in .tapps-agents/events/ for persistence
-    and real-time monitoring. Supports event subscription for
-    in-process event handling.
+    Stores events in a segmented event log under .tapps-agents/events/
+    for persistence and real-time monitoring. Supports event subscription
+    for in-process event handling.
     """
 
     def __init__(self, project_root: Path):
@@ -37,7 +38,37 @@ class FileBasedEventBus:
         self.project_root = Path(project_root)
         self.events_dir = self.project_root / ".tapps-agents" / "events"
         self.events_dir.mkdir(parents=True, exist_ok=True)
+        self.log = SegmentedEventLog(self.events_dir)
         self.subscribers: dict[EventType, list[Callable[[WorkflowEvent], Any]]] = {}
+        self._migrate_legacy_events()
+
+    def _migrate_legacy_events(self) -> None:
+        """Move events stored as one JSON file each into the event log."""
+        legacy_events: list[tuple[str, Path, dict[str, Any]]] = []
+        for event_file in self.events_dir.glob("*.json"):
+            try:
+                event_data = json.loads(event_file.read_text(encoding="utf-8"))
+                legacy_events.append(
+                    (event_data["timestamp"], event_file, event_data)
+                )
+            except (json.JSONDecodeError, KeyError, TypeError, OSError) as e:
+                logger.debug(f"Skipping unreadable event file {event_file}: {e}")
+
+        legacy_events.sort(key=lambda item: item[0])
+        if not legacy_events:
+            return
+        with self.log.writer_lock():
+            for _, event_file, event_data in legacy_events:
+                if not event_file.exists():
+                    continue  # Migrated by another instance
+                self.log.append(
+                    event_data.get("workflow_id", ""),
+                    event_data.get("event_type", ""),
+                    event_data,
+                )
+                event_file.unlink(missing_ok=True)
+        if legacy_events:
+            logger.info(f"Migrated {len(legacy_events)} event files into the event log")
 
     async def publish(self, event: WorkflowEvent) -> None:
         """
@@ -46,19 +77,12 @@ class FileBasedEventBus:
         Args:
             event: Workflow event to publish
         """
-        # Store event in file for persistence
-        event_filename = (
-            f"{event.workflow_id}-{event.timestamp.timestamp():.6f}-{event.event_type.value}.json"
-        )
-        event_file = self.events_dir / event_filename
-
+        # Append event to the event log for persistence
         try:
-            event_file.write_text(
-                json.dumps(event.to_dict(), indent=2), encoding="utf-8"
-            )
-        except (OSError, json.JSONEncodeError) as e:
+            self.log.append(event.workflow_id, event.event_type.value, event.to_dict())
+        except (OSError, TypeError, ValueError) as e:
             logger.warning(
-                f"Failed to write event to file {event_file}: {e}",
+                f"Failed to write event to log {self.events_dir}: {e}",
                 exc_info=True,
             )
 
@@ -119,7 +143,7 @@ class FileBasedEventBus:
         limit: int | None = None,
     ) -> list[WorkflowEvent]:
         """
-        Get events from file system.
+        Get events from the event log.
 
         Args:
             workflow_id: Filter by workflow ID
@@ -127,39 +151,19 @@ class FileBasedEventBus:
             limit: Maximum number of events to return
 
         Returns:
-            List of workflow events
+            List of workflow events, most recent first
         """
         events: list[WorkflowEvent] = []
-
-        if not self.events_dir.exists():
-            return events
-
-        # Get all event files, sorted by timestamp (filename contains timestamp)
-        event_files = sorted(self.events_dir.glob("*.json"), reverse=True)
-
-        for event_file in event_files:
+        records = self.log.tail(
+            workflow_id=workflow_id,
+            event_type=event_type.value if event_type else None,
+            limit=limit or None,
+        )
+        for record in records:
             try:
-                event_data = json.loads(event_file.read_text(encoding="utf-8"))
-
-                # Filter by workflow_id if specified
-                if workflow_id and event_data.get("workflow_id") != workflow_id:
-                    continue
-
-                # Filter by event_type if specified
-                if event_type and event_data.get("event_type") != event_type.value:
-                    continue
-
-                event = WorkflowEvent.from_dict(event_data)
-                events.append(event)
-
-                # Apply limit if specified
-                if limit and len(events) >= limit:
-                    break
-
-            except (json.JSONDecodeError, KeyError, OSError) as e:
-                logger.debug(f"Failed to read event file {event_file}: {e}")
-                continue
-
+                events.append(WorkflowEvent.from_dict(record.data))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Failed to read event {record.seq}: {e}")
         return events
 
     def get_latest_event(
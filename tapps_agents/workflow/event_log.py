@@ -5,16 +5,18 @@ Provides durable, append-only event logging for workflow execution.
 Epic 5 / Story 5.4: Workflow State Management
 """
 
+import itertools
 import json
 import logging
-import os
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from .segmented_log import LogPosition, SegmentedEventLog
+
 logger = logging.getLogger(__name__)
 
 
@@ -218,7 +220,14 @@ class EventStream:
 
 
 class WorkflowEventLog:
-    """Manages append-only event log for workflow execution."""
+    """
+    Manages append-only event log for workflow execution.
+
+    Besides the shared event log, each workflow has a ``<workflow_id>.tail.json``
+    sidecar holding its last sequence number and the log position after its
+    last event, so resuming a workflow does not read its history. A
+    workflow without a sidecar has no events.
+    """
 
     def __init__(self, events_dir: Path, enable_streaming: bool = True):
         """
@@ -230,39 +239,109 @@ class WorkflowEventLog:
         """
         self.events_dir = Path(events_dir)
         self.events_dir.mkdir(parents=True, exist_ok=True)
+        self._log = SegmentedEventLog(self.events_dir, fsync=True)
         self._sequence_counter: dict[str, int] = {}
         self._stream: EventStream | None = EventStream() if enable_streaming else None
+        self._migrate_legacy_events()
+
+    def _migrate_legacy_events(self) -> None:
+        """
+        Move per-workflow JSONL event files into the event log.
 
-    def _get_event_file(self, workflow_id: str) -> Path:
-        """Get event log file path for a workflow."""
-        return self.events_dir / f"{workflow_id}.events.jsonl"
+        Each file is renamed to ``.migrating`` before its events are
+        appended, and deleted after the tail sidecars of its workflows are
+        written. Under the log's writer lock, events whose seq is not above
+        the workflow's latest logged seq are skipped, so an import
+        interrupted by a crash resumes without duplicates.
+        """
+        if not any(self.events_dir.glob("*.events.jsonl*")):
+            return
+        with self._log.writer_lock():
+            for event_file in sorted(self.events_dir.glob("*.events.jsonl")):
+                try:
+                    event_file.rename(event_file.with_name(event_file.name + ".migrating"))
+                except OSError as e:
+                    logger.warning(f"Failed to migrate events from {event_file}: {e}")
+            for event_file in sorted(self.events_dir.glob("*.events.jsonl.migrating")):
+                self._migrate_event_file(event_file)
+
+    def _migrate_event_file(self, event_file: Path) -> None:
+        logged_seq: dict[str, int] = {}
+        migrated = 0
+        end = self._log.end_position
+        try:
+            with open(event_file, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        event_data = json.loads(line)
+                        workflow_id = event_data["workflow_id"]
+                        if workflow_id not in logged_seq:
+                            latest = self._log.latest(workflow_id)
+                            logged_seq[workflow_id] = (
+                                int(latest.data.get("seq", 0)) if latest else 0
+                            )
+                        logged = logged_seq[workflow_id]
+                        seq = int(event_data.get("seq", 0))
+                        if logged and seq <= logged:
+                            continue
+                        record = self._log.append(
+                            workflow_id, event_data["event_type"], event_data
+                        )
+                        logged_seq[workflow_id] = max(logged, seq)
+                        end = record.next_position
+                        migrated += 1
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                        logger.warning(f"Skipping unreadable event in {event_file}: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to migrate events from {event_file}: {e}")
+            return
+        for workflow_id, seq in logged_seq.items():
+            self._write_tail(workflow_id, seq, end)
+        event_file.unlink(missing_ok=True)
+        logger.info(f"Migrated {migrated} events from {event_file} into the event log")
 
     def _get_next_sequence(self, workflow_id: str) -> int:
         """Get next sequence number for a workflow."""
         if workflow_id not in self._sequence_counter:
-            # Try to read last sequence from file
-            event_file = self._get_event_file(workflow_id)
-            if event_file.exists():
-                try:
-                    last_seq = 0
-                    with open(event_file, encoding="utf-8") as f:
-                        for line in f:
-                            if line.strip():
-                                event_data = json.loads(line)
-                                last_seq = max(last_seq, event_data.get("seq", 0))
-                    self._sequence_counter[workflow_id] = last_seq
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to read sequence from {event_file}: {e}",
-                        exc_info=True,
-                    )
-                    self._sequence_counter[workflow_id] = 0
-            else:
-                self._sequence_counter[workflow_id] = 0
+            self._sequence_counter[workflow_id] = self._recover_sequence(workflow_id)
 
         self._sequence_counter[workflow_id] += 1
         return self._sequence_counter[workflow_id]
 
+    def _tail_file(self, workflow_id: str) -> Path:
+        return self.events_dir / f"{workflow_id}.tail.json"
+
+    def _recover_sequence(self, workflow_id: str) -> int:
+        """
+        Find a workflow's last sequence number.
+
+        Starts from the tail sidecar and reads only the log written after it
+        (events a crash kept out of the sidecar). A workflow without a
+        sidecar has no events; an unreadable sidecar falls back to the log
+        index.
+        """
+        try:
+            tail = json.loads(self._tail_file(workflow_id).read_text(encoding="utf-8"))
+            seq = int(tail["seq"])
+            position = (int(tail["segment"]), int(tail["offset"]))
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, KeyError, TypeError):
+            latest = self._log.latest(workflow_id)
+            return int(latest.data.get("seq", 0)) if latest else 0
+
+        for record in self._log.stream(position, workflow_id=workflow_id):
+            seq = max(seq, int(record.data.get("seq", 0)))
+        return seq
+
+    def _write_tail(self, workflow_id: str, seq: int, position: LogPosition) -> None:
+        segment, offset = position
+        self._tail_file(workflow_id).write_text(
+            json.dumps({"seq": seq, "segment": segment, "offset": offset}), encoding="utf-8"
+        )
+
     def emit_event(
         self,
         event_type: str,
@@ -329,17 +408,14 @@ class WorkflowEventLog:
             tool_call_summary=tool_call_summary,
         )
 
-        # Append to event log file (best-effort, non-blocking)
+        # Append to event log (best-effort, non-blocking)
         try:
-            event_file = self._get_event_file(workflow_id)
-            with open(event_file, "a", encoding="utf-8") as f:
-                # Use atomic write: write to temp file, then rename
-                # For append-only, we'll use a simpler approach with file locking
-                # In practice, JSONL append is atomic on most filesystems
-                json_line = json.dumps(event.to_dict(), ensure_ascii=False)
-                f.write(json_line + "\n")
-                f.flush()
-                os.fsync(f.fileno())  # Ensure durability
+            if seq == 1:
+                # Mark where the workflow's events start, so they are found
+                # even if a crash keeps the first one out of the sidecar
+                self._write_tail(workflow_id, 0, self._log.end_position)
+            record = self._log.append(workflow_id, event_type, event.to_dict())
+            self._write_tail(workflow_id, seq, record.next_position)
         except Exception as e:
             # Log error but don't fail workflow execution
             logger.error(
@@ -371,41 +447,70 @@ class WorkflowEventLog:
         Returns:
             List of events, ordered by sequence number
         """
-        event_file = self._get_event_file(workflow_id)
-        if not event_file.exists():
-            return []
-
         events: list[WorkflowEvent] = []
         try:
-            with open(event_file, encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            event_data = json.loads(line)
-                            event = WorkflowEvent.from_dict(event_data)
-                            events.append(event)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to parse event line: {e}",
-                                extra={"workflow_id": workflow_id, "line": line[:100]},
-                            )
-                            continue
-
-            # Sort by sequence number (should already be sorted, but ensure it)
-            events.sort(key=lambda e: e.seq)
-
             if limit:
-                events = events[-limit:]  # Get most recent events
-
+                # Read backwards from the end of the log; stop after limit events
+                records = list(itertools.islice(self._log.reverse(workflow_id), limit))
+                records.reverse()
+            else:
+                records = list(self._log.read_events(workflow_id=workflow_id))
         except Exception as e:
             logger.error(
-                f"Failed to read events from {event_file}: {e}",
+                f"Failed to read events from {self.events_dir}: {e}",
                 exc_info=True,
                 extra={"workflow_id": workflow_id},
             )
+            return events
+
+        for record in records:
+            try:
+                events.append(WorkflowEvent.from_dict(record.data))
+            except Exception as e:
+                logger.warning(
+                    f"Failed to parse event record: {e}",
+                    extra={"workflow_id": workflow_id, "seq": record.seq},
+                )
 
+        # Sort by sequence number (should already be sorted, but ensure it)
+        events.sort(key=lambda e: e.seq)
         return events
 
+    def stream_events(
+        self, workflow_id: str, position: LogPosition | None = None
+    ) -> Iterator[tuple[WorkflowEvent, LogPosition]]:
+        """
+        Stream a workflow's events stored after a log position, oldest first.
+
+        Monitors pass the last position they received back in to read only
+        new events.
+
+        Args:
+            workflow_id: Workflow ID
+            position: Log position to start after (None = start of the log)
+
+        Yields:
+            (event, position after the event) pairs
+        """
+        for record in self._log.stream(position, workflow_id=workflow_id):
+            try:
+                event = WorkflowEvent.from_dict(record.data)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to parse event record: {e}",
+                    extra={"workflow_id": workflow_id, "seq": record.seq},
+                )
+                continue
+            yield event, record.next_position
+
+    def end_position(self) -> LogPosition:
+        """Log position after the latest event (stream_events() from here to follow)."""
+        return self._log.end_position
+
+    def list_workflows(self) -> list[str]:
+        """List workflow IDs that have logged events."""
+        return self._log.workflow_ids()
+
     def get_execution_history(
         self, workflow_id: str
     ) -> dict[str, Any]:
@@ -32,6 +32,7 @@ def generate_execution_plan(workflow: Workflow) -> dict[str, Any]:
             "context_tier": step.context_tier,
             "creates": step.creates,
             "requires": step.requires,
+            "depends_on": step.depends_on,
             "consults": step.consults,
             "condition": step.condition,
             "next": step.next,
@@ -61,10 +62,13 @@ def generate_execution_plan(workflow: Workflow) -> dict[str, Any]:
                 for creating_step_id in artifact_to_steps[required_artifact]:
                     if step.id not in dependency_graph[creating_step_id]:
                         dependency_graph[creating_step_id].append(step.id)
+        for dep_id in step.depends_on:
+            if dep_id in dependency_graph and step.id not in dependency_graph[dep_id]:
+                dependency_graph[dep_id].append(step.id)
 
     # Find entry points (steps with no requirements)
     entry_points = [
-        step.id for step in workflow.steps if not step.requires
+        step.id for step in workflow.steps if not step.requires and not step.depends_on
     ]
 
     # Find exit points (steps with no next and no dependents)
@@ -89,6 +93,7 @@ def generate_execution_plan(workflow: Workflow) -> dict[str, Any]:
             "code_scoring": workflow.settings.code_scoring,
             "context_tier_default": workflow.settings.context_tier_default,
             "auto_detect": workflow.settings.auto_detect,
+            "scheduling": workflow.settings.scheduling,
         },
         "step_graph": step_graph,
         "dependency_graph": dependency_graph,
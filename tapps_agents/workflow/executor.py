@@ -45,6 +45,7 @@ from .parser import WorkflowParser
 from .progress_monitor import WorkflowProgressMonitor
 from .recommender import WorkflowRecommendation, WorkflowRecommender
 from .state_manager import AdvancedStateManager
+from .step_scheduler import StepScheduler
 from .timeline import generate_timeline, save_timeline
 from .validation import ValidatorRegistry, WorkflowValidator
 
@@ -82,6 +83,7 @@ class WorkflowExecutor:
         self.recommender: WorkflowRecommender | None = None
         self.state_manager: AdvancedStateManager | None = None
         self.parallel_executor = ParallelStepExecutor(max_parallel=8, default_timeout_seconds=3600.0)
+        self._scheduler: StepScheduler | None = None  # Readiness tracking for the current run
         self.logger: WorkflowLogger | None = None  # Initialized in start() with workflow_id
         
         # Issue fix: Support for continue-from and skip-steps flags
@@ -448,8 +450,14 @@ class WorkflowExecutor:
         try:
             # Use parallel execution for independent steps
             steps_executed = 0
-            completed_step_ids = set(self.state.completed_steps)
-            running_step_ids: set[str] = set()
+            self._scheduler = self.parallel_executor.create_scheduler(
+                self.workflow.steps,
+                completed_step_ids=self.state.completed_steps,
+                available_artifacts=self.state.artifacts,
+                scheduling=self.workflow.settings.scheduling,
+            )
+            completed_step_ids = self._scheduler.completed
+            running_step_ids = self._scheduler.running
 
             while (
                 self.state
@@ -637,12 +645,17 @@ class WorkflowExecutor:
         running_step_ids: set[str],
     ) -> list[WorkflowStep]:
         """Find steps ready to execute (dependencies met)."""
+        scheduler = self._scheduler
+        if scheduler is not None and running_step_ids is scheduler.running:
+            # The run's sets drive the scheduler's counters: no rescan needed
+            return scheduler.pop_ready()
         available_artifacts = set(self.state.artifacts.keys())
         return self.parallel_executor.find_ready_steps(
             workflow_steps=self.workflow.steps,
             completed_step_ids=completed_step_ids,
             running_step_ids=running_step_ids,
             available_artifacts=available_artifacts,
+            scheduling=self.workflow.settings.scheduling,
         )
 
     def _handle_no_ready_steps(self, completed_step_ids: set[str]) -> bool:
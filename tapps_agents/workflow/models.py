@@ -55,6 +55,12 @@ class WorkflowStep:
     repeats: bool = False
     scoring: dict[str, Any] | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    depends_on: list[str] = field(default_factory=list)  # Step ids that must complete first
+
+
+# Step scheduling modes: follow the 'next:' chain, or run any step whose
+# dependencies are met
+SCHEDULING_MODES = ("sequential", "dag")
 
 
 @dataclass
@@ -65,6 +71,7 @@ class WorkflowSettings:
     code_scoring: bool = True
     context_tier_default: int = 2
     auto_detect: bool = True
+    scheduling: str = "sequential"  # sequential ('next:' chain) or dag (dependency-driven)
 
 
 @dataclass
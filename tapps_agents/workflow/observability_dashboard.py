@@ -170,29 +170,22 @@ class ObservabilityDashboard:
             "summary": {},
         }
 
-        # Find all workflow event files
+        # Find all workflows with logged events
         if self.event_log:
-            events_dir = self.event_log.events_dir
-            if events_dir.exists():
-                event_files = list(events_dir.glob("*.events.jsonl"))
-                workflow_ids = [
-                    f.stem.replace(".events", "") for f in event_files
-                ]
+            for wf_id in self.event_log.list_workflows():
+                try:
+                    wf_data = self._generate_workflow_dashboard(wf_id)
+                    wf_data["workflow_id"] = wf_id
+                    dashboard["workflows"].append(wf_data)
+                except Exception as e:
+                    dashboard["workflows"].append(
+                        {"workflow_id": wf_id, "error": str(e)}
+                    )
 
-                for wf_id in workflow_ids:
-                    try:
-                        wf_data = self._generate_workflow_dashboard(wf_id)
-                        wf_data["workflow_id"] = wf_id
-                        dashboard["workflows"].append(wf_data)
-                    except Exception as e:
-                        dashboard["workflows"].append(
-                            {"workflow_id": wf_id, "error": str(e)}
-                        )
-
-                # Generate summary
-                dashboard["summary"] = self._generate_summary(
-                    dashboard["workflows"]
-                )
+            # Generate summary
+            dashboard["summary"] = self._generate_summary(
+                dashboard["workflows"]
+            )
 
         return dashboard
 
@@ -8,12 +8,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Container, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, TypeVar
 
-from .models import StepExecution, WorkflowState, WorkflowStep
+from .models import SCHEDULING_MODES, StepExecution, WorkflowState, WorkflowStep
+from .step_scheduler import SchedulePlan, StepScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,7 @@ class ParallelStepExecutor:
     - Per-step timeouts
     - Cancellation propagation
     - Deterministic state updates (ordered by step.id)
+    - Optional DAG scheduling: any step whose dependencies are met is ready
     """
 
     def __init__(
@@ -104,6 +106,7 @@ class ParallelStepExecutor:
         max_parallel: int = 8,
         default_timeout_seconds: float | None = 3600.0,  # 1 hour default
         default_retry_config: RetryConfig | None = None,
+        scheduling: str = "sequential",
     ):
         """
         Initialize parallel step executor.
@@ -112,10 +115,15 @@ class ParallelStepExecutor:
             max_parallel: Maximum number of steps to execute concurrently
             default_timeout_seconds: Default timeout per step (None = no timeout)
             default_retry_config: Default retry configuration (no retries if None)
+            scheduling: Default scheduling mode ("sequential" or "dag")
         """
+        if scheduling not in SCHEDULING_MODES:
+            raise ValueError(f"Unknown scheduling mode: {scheduling}")
         self.max_parallel = max_parallel
         self.default_timeout_seconds = default_timeout_seconds
         self.default_retry_config = default_retry_config or RetryConfig(max_attempts=1)
+        self.scheduling = scheduling
+        self._dag_plan: SchedulePlan | None = None
 
     def find_ready_steps(
         self,
@@ -123,11 +131,13 @@ class ParallelStepExecutor:
         completed_step_ids: set[str],
         running_step_ids: set[str],
         available_artifacts: set[str] | None = None,
+        scheduling: str | None = None,
     ) -> list[WorkflowStep]:
         """
         Find steps that are ready to execute (dependencies met).
 
-        This method respects the workflow's sequential 'next:' chain to prevent
+        In "dag" scheduling mode see _find_ready_steps_dag(). In the default
+        "sequential" mode this method respects the workflow's sequential 'next:' chain to prevent
         premature step execution. A step is only ready if:
         1. It's the 'next:' step from a completed step, OR it's the first step
         2. All its artifact dependencies are met
@@ -146,10 +156,16 @@ class ParallelStepExecutor:
             completed_step_ids: Set of completed step IDs
             running_step_ids: Set of currently running step IDs
             available_artifacts: Set of available artifact names (from state.artifacts)
+            scheduling: Scheduling mode for this call (default: self.scheduling)
 
         Returns:
             List of steps ready to execute
         """
+        if (scheduling or self.scheduling) == "dag":
+            return self._find_ready_steps_dag(
+                workflow_steps, completed_step_ids, running_step_ids, available_artifacts
+            )
+
         ready: list[WorkflowStep] = []
         artifacts = available_artifacts or set()
 
@@ -191,6 +207,82 @@ class ParallelStepExecutor:
 
         return ready
 
+    def _find_ready_steps_dag(
+        self,
+        workflow_steps: list[WorkflowStep],
+        completed_step_ids: set[str],
+        running_step_ids: set[str],
+        available_artifacts: set[str] | None = None,
+    ) -> list[WorkflowStep]:
+        """
+        Find ready steps using the workflow's dependency graph.
+
+        A step is ready when every step it depends on has completed (explicit
+        'depends_on' plus the producers of its 'requires' artifacts) and all
+        its required artifacts are available. 'next:' is not a dependency in
+        this mode.
+
+        Ready steps are returned highest priority first: longest critical
+        path, then position along the 'next:' chain, then declaration order.
+        Steps are started in this order, so the priority decides which steps
+        get a slot when more than max_parallel are ready.
+        """
+        artifacts = available_artifacts or set()
+        plan = self._get_dag_plan(workflow_steps)
+        ready = [
+            step
+            for step in workflow_steps
+            if step.id not in completed_step_ids
+            and step.id not in running_step_ids
+            and plan.dependencies[step.id] <= completed_step_ids
+            and all(req in artifacts for req in step.requires)
+        ]
+        ready.sort(key=lambda step: plan.priority[step.id])
+        return ready
+
+    def _get_dag_plan(self, workflow_steps: list[WorkflowStep]) -> SchedulePlan:
+        """
+        Return the DAG plan for a workflow, rebuilding it if the steps changed.
+
+        Raises:
+            ValueError: If the steps have a circular dependency
+        """
+        plan = self._dag_plan
+        if plan is None or plan.step_ids != tuple(step.id for step in workflow_steps):
+            plan = SchedulePlan.build(workflow_steps)
+            self._dag_plan = plan
+        return plan
+
+    def create_scheduler(
+        self,
+        workflow_steps: list[WorkflowStep],
+        completed_step_ids: Iterable[str] = (),
+        available_artifacts: Container[str] | None = None,
+        scheduling: str | None = None,
+    ) -> StepScheduler:
+        """
+        Create an incremental scheduler for one workflow run.
+
+        The scheduler applies the same readiness rules as find_ready_steps()
+        but updates them as steps complete instead of rescanning all steps.
+
+        Args:
+            workflow_steps: All workflow steps
+            completed_step_ids: Step IDs already completed
+            available_artifacts: Live container of available artifact names
+                (e.g. state.artifacts)
+            scheduling: Scheduling mode (default: self.scheduling)
+
+        Returns:
+            StepScheduler whose ``completed``/``running`` sets drive readiness
+        """
+        return StepScheduler(
+            workflow_steps,
+            scheduling=scheduling or self.scheduling,
+            completed=completed_step_ids,
+            artifacts=available_artifacts,
+        )
+
     def _get_retry_config(self, step: WorkflowStep) -> RetryConfig:
         """
         Get retry configuration for a step.
@@ -24,6 +24,7 @@ from typing import Any
 import yaml
 
 from .models import (
+    SCHEDULING_MODES,
     Workflow,
     WorkflowSettings,
     WorkflowStep,
@@ -213,11 +214,18 @@ class WorkflowParser:
         auto_detect = workflow_data.get("auto_detect")
         if auto_detect is None:
             auto_detect = settings_data.get("auto_detect", True)
+        scheduling = settings_data.get("scheduling", "sequential")
+        if scheduling not in SCHEDULING_MODES:
+            raise ValueError(
+                f"{WorkflowParser._err_prefix(file_path)}Workflow 'settings.scheduling' must be one of: "
+                + ", ".join(SCHEDULING_MODES)
+            )
         settings = WorkflowSettings(
             quality_gates=settings_data.get("quality_gates", True),
             code_scoring=settings_data.get("code_scoring", True),
             context_tier_default=settings_data.get("context_tier_default", 2),
             auto_detect=auto_detect if isinstance(auto_detect, bool) else True,
+            scheduling=scheduling,
         )
 
         # Parse steps
@@ -323,6 +331,9 @@ class WorkflowParser:
             file_path=file_path,
             step_id=step_id,
         )
+        depends_on = WorkflowParser._validate_str_list(
+            step_data.get("depends_on", []), field="depends_on", file_path=file_path, step_id=step_id
+        )
 
         next_step = step_data.get("next")
         if next_step is not None and not isinstance(next_step, str):
@@ -352,6 +363,7 @@ class WorkflowParser:
             repeats=step_data.get("repeats", False),
             scoring=step_data.get("scoring"),
             metadata=step_data.get("metadata", {}),
+            depends_on=depends_on,
         )
 
     @staticmethod
@@ -373,3 +385,8 @@ class WorkflowParser:
                     raise ValueError(
                         f"{WorkflowParser._err_prefix(file_path, s.id)}Step 'optional_steps' references unknown step id: {opt}"
                     )
+            for dep in s.depends_on:
+                if dep not in step_id_set:
+                    raise ValueError(
+                        f"{WorkflowParser._err_prefix(file_path, s.id)}Step 'depends_on' references unknown step id: {dep}"
+                    )
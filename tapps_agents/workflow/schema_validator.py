@@ -64,6 +64,7 @@ class WorkflowSchemaValidator:
         "code_scoring",
         "context_tier_default",
         "auto_detect",
+        "scheduling",
     }
 
     # Allowed step-level fields
@@ -74,6 +75,7 @@ class WorkflowSchemaValidator:
         "context_tier",
         "creates",
         "requires",
+        "depends_on",
         "consults",
         "condition",
         "next",
@@ -287,7 +289,7 @@ class WorkflowSchemaValidator:
             )
 
         # Validate list fields
-        list_fields = ["creates", "requires", "consults", "optional_steps"]
+        list_fields = ["creates", "requires", "depends_on", "consults", "optional_steps"]
         for field in list_fields:
             value = step_data.get(field)
             if value is not None:
@@ -472,6 +474,20 @@ class WorkflowSchemaValidator:
                             )
                         )
 
+            # Validate 'depends_on' references
+            depends_on = step_data.get("depends_on", [])
+            if isinstance(depends_on, list):
+                for dep in depends_on:
+                    if isinstance(dep, str) and dep not in step_ids:
+                        errors.append(
+                            ValidationError(
+                                field="depends_on",
+                                message=f"Step 'depends_on' references unknown step id: {dep}",
+                                file_path=file_path,
+                                step_id=step_id,
+                            )
+                        )
+
             # Validate gate routing references
             # Allow special keywords: "next" (use step's next field), "retry" (retry current step)
             gate = step_data.get("gate")
@@ -0,0 +1,773 @@
+"""
+Segmented Event Log
+
+Append-only event log used by the workflow event stores (FileBasedEventBus,
+WorkflowEventLog and durable_state.EventStore). Events are appended as JSON
+lines to size-capped segment files. Each segment has a sidecar index of
+(seq, offset, length, workflow_id, event_type) entries, so tail reads,
+per-workflow and per-type lookups and read_events(since_seq) seek straight to
+the records they need instead of parsing every stored event.
+
+Opening a log only recovers its tail (the last sequence number and the end of
+the active segment) by reverse-seeking the last record; the sidecar indexes
+are loaded on the first indexed query. stream() and reverse() read records
+from a byte position or backwards from the end without the index, so resuming
+or following a workflow costs the same however long its history is.
+
+Writers in any process serialize on a ``writer.lock`` file in the log
+directory, so sequence numbers stay unique and tail repairs never race an
+append in progress. Readers take no lock and only read complete records.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+from collections.abc import Generator, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Windows doesn't support fcntl, use msvcrt byte-range locks instead
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+DEFAULT_MAX_SEGMENT_BYTES = 8 * 1024 * 1024
+
+# Block size for reading segments backwards
+_REVERSE_BLOCK_BYTES = 64 * 1024
+
+# Event type of the record that marks a workflow's events as deleted
+_TOMBSTONE = "__workflow_deleted__"
+
+# In-memory index entry: (seq, segment number, offset, length, workflow_id)
+_Entry = tuple[int, int, int, int, str]
+
+# Byte position in the log: (segment number, offset within the segment)
+LogPosition = tuple[int, int]
+
+WRITER_LOCK_FILENAME = "writer.lock"
+
+
+def _lock_exclusive(f: Any) -> None:
+    """Block until holding an exclusive lock on an open file."""
+    if sys.platform == "win32":
+        f.seek(0)
+        while True:
+            try:
+                # LK_LOCK retries for about a second before raising
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock(f: Any) -> None:
+    if sys.platform == "win32":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@dataclass(frozen=True)
+class LogRecord:
+    """An event as stored in the log."""
+
+    seq: int  # Log-wide monotonic sequence number
+    workflow_id: str
+    event_type: str
+    data: dict[str, Any]
+    segment: int = 0
+    offset: int = 0
+    length: int = 0
+
+    @property
+    def next_position(self) -> LogPosition:
+        """Position just after this record (where stream() resumes)."""
+        return (self.segment, self.offset + self.length)
+
+
+class SegmentedEventLog:
+    """
+    Segmented append-only event log with a sidecar index.
+
+    Segments are named ``00000001.log``, ``00000002.log``, ... with a
+    matching ``.idx`` file each; a new segment starts once the active one
+    reaches max_segment_bytes. The index is loaded into memory on first use
+    and kept current with records appended by other instances (or processes)
+    sharing the directory.
+
+    Appends, tombstones and tail repairs hold the directory's writer lock.
+    A read-only log never writes, locks or repairs anything.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        fsync: bool = False,
+        read_only: bool = False,
+    ):
+        """
+        Initialize event log.
+
+        Args:
+            log_dir: Directory holding the segment and index files
+            max_segment_bytes: Segment size that triggers a new segment
+            fsync: Whether to fsync each appended event
+            read_only: Open for reading only (e.g. dashboards and CLI reports)
+        """
+        self.log_dir = Path(log_dir)
+        if not read_only:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync = fsync
+        self.read_only = read_only
+        self._lock = threading.RLock()
+        self._writer_depth = 0
+        self._writer_file: Any = None
+
+        self._entries: list[_Entry] = []
+        self._by_workflow: dict[str, list[int]] = {}
+        self._by_type: dict[str, list[int]] = {}
+        self._by_key: dict[tuple[str, str], list[int]] = {}
+        self._deleted_before: dict[str, int] = {}
+        self._last_seq = 0
+
+        # Active segment, end of its complete records and, once the index is
+        # loaded, how much of its sidecar has been read
+        self._indexed = False
+        self._segment = 1
+        self._segment_end = 0
+        self._index_end = 0
+
+        self._open()
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recently appended record."""
+        with self._lock:
+            self._catch_up()
+            return self._last_seq
+
+    def append(self, workflow_id: str, event_type: str, data: dict[str, Any]) -> LogRecord:
+        """
+        Append an event to the log.
+
+        Args:
+            workflow_id: Workflow the event belongs to
+            event_type: Event type (indexed together with workflow_id)
+            data: JSON-serializable event payload
+
+        Returns:
+            The stored record
+
+        Raises:
+            PermissionError: If the log was opened read-only
+        """
+        with self.writer_lock():
+            self._catch_up()
+            if self._segment_end >= self.max_segment_bytes:
+                self._segment += 1
+                self._segment_end = 0
+                self._index_end = 0
+
+            seq = self._last_seq + 1
+            raw = (
+                json.dumps(
+                    {
+                        "seq": seq,
+                        "workflow_id": workflow_id,
+                        "event_type": event_type,
+                        "data": data,
+                    },
+                    ensure_ascii=False,
+                )
+                + "\n"
+            ).encode("utf-8")
+
+            with open(self._data_path(self._segment), "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(raw)
+                f.flush()
+                if self.fsync:
+                    # fsync can fail on some systems (e.g., network drives)
+                    with contextlib.suppress(OSError):
+                        os.fsync(f.fileno())
+            index_line = self._write_index_entry(
+                self._segment, seq, offset, len(raw), workflow_id, event_type
+            )
+
+            self._segment_end = offset + len(raw)
+            self._index_end += index_line
+            self._add_entry(seq, self._segment, offset, len(raw), workflow_id, event_type)
+            return LogRecord(
+                seq=seq,
+                workflow_id=workflow_id,
+                event_type=event_type,
+                data=data,
+                segment=self._segment,
+                offset=offset,
+                length=len(raw),
+            )
+
+    @contextlib.contextmanager
+    def writer_lock(self) -> Generator[None]:
+        """
+        Hold the log's cross-process writer lock (reentrant per instance).
+
+        Appends take it on their own; hold it around a batch of appends that
+        must not interleave with other writers, such as a migration.
+
+        Raises:
+            PermissionError: If the log was opened read-only
+        """
+        if self.read_only:
+            raise PermissionError(f"Event log {self.log_dir} is open read-only")
+        with self._lock:
+            if self._writer_depth == 0:
+                writer_file = open(self.log_dir / WRITER_LOCK_FILENAME, "a+b")  # noqa: SIM115
+                try:
+                    _lock_exclusive(writer_file)
+                except BaseException:
+                    writer_file.close()
+                    raise
+                self._writer_file = writer_file
+            self._writer_depth += 1
+            try:
+                yield
+            finally:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    writer_file, self._writer_file = self._writer_file, None
+                    try:
+                        _unlock(writer_file)
+                    finally:
+                        writer_file.close()
+
+    @property
+    def end_position(self) -> LogPosition:
+        """Position just after the last record (stream() from here to follow new events)."""
+        with self._lock:
+            self._catch_up()
+            return (self._segment, self._segment_end)
+
+    def stream(
+        self,
+        position: LogPosition | None = None,
+        workflow_id: str | None = None,
+        event_type: str | None = None,
+    ) -> Iterator[LogRecord]:
+        """
+        Stream events stored after a byte position, oldest first.
+
+        Reads the segments sequentially without loading the index, so the
+        cost is proportional to the data after the position. Records of a
+        workflow deleted later in the log are still yielded.
+
+        Args:
+            position: Where to start (None = start of the log), usually a
+                record's next_position or end_position
+            workflow_id: Filter by workflow ID
+            event_type: Filter by event type
+
+        Yields:
+            Matching records up to the end of the log at the time of the call
+        """
+        with self._lock:
+            self._catch_up()
+            last_segment, last_end = self._segment, self._segment_end
+        segment, offset = position or (1, 0)
+
+        while segment <= last_segment:
+            data_path = self._data_path(segment)
+            try:
+                f = open(data_path, "rb")  # noqa: SIM115
+            except OSError:
+                segment, offset = segment + 1, 0
+                continue
+            with f:
+                end = last_end if segment == last_segment else os.fstat(f.fileno()).st_size
+                f.seek(offset)
+                for line in f:
+                    if offset >= end or not line.endswith(b"\n"):
+                        break
+                    record = self._decode(line, segment, offset)
+                    offset += len(line)
+                    if record is not None and self._matches(record, workflow_id, event_type):
+                        yield record
+            segment, offset = segment + 1, 0
+
+    def reverse(
+        self, workflow_id: str | None = None, event_type: str | None = None
+    ) -> Iterator[LogRecord]:
+        """
+        Stream events newest first by reading the segments backwards.
+
+        Does not load the index; stop iterating once enough records were
+        read (e.g. with itertools.islice) and the cost is proportional to how
+        far back they are.
+
+        Args:
+            workflow_id: Filter by workflow ID
+            event_type: Filter by event type
+
+        Yields:
+            Matching records, most recent first
+        """
+        with self._lock:
+            self._catch_up()
+            last_segment, last_end = self._segment, self._segment_end
+
+        deleted: set[str] = set()
+        for segment in range(last_segment, 0, -1):
+            data_path = self._data_path(segment)
+            try:
+                end = last_end if segment == last_segment else data_path.stat().st_size
+            except OSError:
+                continue
+            for offset, line in self._reverse_lines(data_path, end):
+                record = self._decode(line, segment, offset)
+                if record is None:
+                    continue
+                if record.event_type == _TOMBSTONE:
+                    # Everything older of this workflow was deleted
+                    deleted.add(record.workflow_id)
+                elif record.workflow_id not in deleted and self._matches(
+                    record, workflow_id, event_type
+                ):
+                    yield record
+
+    def read_events(
+        self,
+        since_seq: int = 0,
+        workflow_id: str | None = None,
+        event_type: str | None = None,
+    ) -> Iterator[LogRecord]:
+        """
+        Stream events appended after a sequence number, oldest first.
+
+        Args:
+            since_seq: Only yield records with a greater sequence number
+            workflow_id: Filter by workflow ID
+            event_type: Filter by event type
+
+        Yields:
+            Matching records in sequence order
+        """
+        with self._lock:
+            self._load_index()
+            positions = self._positions(workflow_id, event_type)
+            start = bisect.bisect_right(
+                positions, since_seq, key=lambda position: self._entries[position][0]
+            )
+            entries = [
+                self._entries[position]
+                for position in positions[start:]
+                if self._is_live(self._entries[position])
+            ]
+        yield from self._read_entries(entries)
+
+    def tail(
+        self,
+        workflow_id: str | None = None,
+        event_type: str | None = None,
+        limit: int | None = 1,
+    ) -> list[LogRecord]:
+        """
+        Read the most recent events.
+
+        Filtered reads load the index (once per instance) and read only the
+        matching records. Unfiltered reads of a few records use the reverse
+        reader until the index is loaded.
+
+        Args:
+            workflow_id: Filter by workflow ID
+            event_type: Filter by event type
+            limit: Maximum number of events to return (None = all)
+
+        Returns:
+            Matching records, most recent first
+        """
+        with self._lock:
+            filtered = workflow_id is not None or event_type is not None
+            if not self._indexed and not filtered and limit is not None:
+                return list(itertools.islice(self.reverse(), limit))
+            self._load_index()
+            entries: list[_Entry] = []
+            for position in reversed(self._positions(workflow_id, event_type)):
+                if limit is not None and len(entries) >= limit:
+                    break
+                entry = self._entries[position]
+                if self._is_live(entry):
+                    entries.append(entry)
+        return list(self._read_entries(entries))
+
+    def latest(
+        self, workflow_id: str | None = None, event_type: str | None = None
+    ) -> LogRecord | None:
+        """Get the most recent matching event, if any."""
+        records = self.tail(workflow_id=workflow_id, event_type=event_type, limit=1)
+        return records[0] if records else None
+
+    def workflow_ids(self) -> list[str]:
+        """List workflows that have events in the log."""
+        with self._lock:
+            self._load_index()
+            return [workflow_id for workflow_id, positions in self._by_workflow.items() if positions]
+
+    def delete_workflow(self, workflow_id: str) -> bool:
+        """
+        Drop a workflow's events from all future reads.
+
+        The events stay in their segments; an appended tombstone record hides
+        them.
+
+        Returns:
+            True if the workflow had events
+        """
+        with self.writer_lock():
+            self._load_index()
+            if not self._by_workflow.get(workflow_id):
+                return False
+            self.append(workflow_id, _TOMBSTONE, {})
+            return True
+
+    def _data_path(self, segment: int) -> Path:
+        return self.log_dir / f"{segment:08d}.log"
+
+    def _index_path(self, segment: int) -> Path:
+        return self.log_dir / f"{segment:08d}.idx"
+
+    def _write_index_entry(
+        self, segment: int, seq: int, offset: int, length: int, workflow_id: str, event_type: str
+    ) -> int:
+        """Append an entry to a segment's sidecar index; return its size."""
+        line = (
+            json.dumps([seq, offset, length, workflow_id, event_type], ensure_ascii=False) + "\n"
+        ).encode("utf-8")
+        with open(self._index_path(segment), "ab") as f:
+            f.write(line)
+        return len(line)
+
+    def _segments(self) -> list[int]:
+        return sorted(
+            int(path.stem) for path in self.log_dir.glob("*.log") if path.stem.isdigit()
+        )
+
+    def _open(self) -> None:
+        """
+        Recover the tail of the log without reading the whole index.
+
+        Under the writer lock, so no append can be in progress, truncates a
+        torn trailing record of the active segment and completes its sidecar
+        index if a crashed append left it behind. Finds the last sequence
+        number by reading the log backwards.
+        """
+        if self.read_only:
+            self._recover_tail()
+            return
+        with self.writer_lock():
+            self._recover_tail()
+
+    def _recover_tail(self) -> None:
+        segments = self._segments()
+        if not segments:
+            return
+        self._segment = segments[-1]
+        data_path = self._data_path(self._segment)
+        size = data_path.stat().st_size
+        self._segment_end = self._complete_end(data_path, size)
+        if not self.read_only:
+            if self._segment_end < size:
+                logger.warning(f"Truncating incomplete record at the end of {data_path}")
+                os.truncate(data_path, self._segment_end)
+
+            indexed_end = self._indexed_end(self._segment)
+            if indexed_end < self._segment_end:
+                self._scan(self._segment, indexed_end, self._segment_end, write_index=True)
+
+        for segment in reversed(segments):
+            end = self._segment_end if segment == self._segment else None
+            latest = self._last_record(segment, end)
+            if latest is not None:
+                self._last_seq = latest.seq
+                break
+
+    def _load_index(self) -> None:
+        """Load the sidecar index of every segment on first use."""
+        if self._indexed:
+            self._catch_up()
+            return
+        self._indexed = True
+        segments = self._segments()
+        for segment in segments:
+            self._segment = segment
+            self._segment_end = 0
+            self._index_end = 0
+            # Sealed segments are complete, so entries the sidecar misses can be written
+            self._read_segment(write_index=not self.read_only and segment != segments[-1])
+
+    def _catch_up(self) -> None:
+        """Pick up records appended by other writers since the last check."""
+        if not self._indexed:
+            self._refresh_tail()
+            return
+        try:
+            size = self._data_path(self._segment).stat().st_size
+        except OSError:
+            size = 0
+        if size > self._segment_end:
+            self._read_segment(write_index=False)
+        while self._data_path(self._segment + 1).exists():
+            self._segment += 1
+            self._segment_end = 0
+            self._index_end = 0
+            self._read_segment(write_index=False)
+
+    def _refresh_tail(self) -> None:
+        """Move the tail to the end of the log, reading only the last record."""
+        while self._data_path(self._segment + 1).exists():
+            self._segment += 1
+            self._segment_end = 0
+        data_path = self._data_path(self._segment)
+        try:
+            size = data_path.stat().st_size
+        except OSError:
+            return
+        if size <= self._segment_end:
+            return
+        end = self._complete_end(data_path, size)
+        latest = self._last_record(self._segment, end)
+        if latest is not None:
+            self._last_seq = max(self._last_seq, latest.seq)
+        self._segment_end = max(self._segment_end, end)
+
+    def _last_record(self, segment: int, end: int | None = None) -> LogRecord | None:
+        """Read the last readable record of a segment (tombstones included)."""
+        data_path = self._data_path(segment)
+        try:
+            if end is None:
+                end = data_path.stat().st_size
+        except OSError:
+            return None
+        for offset, line in self._reverse_lines(data_path, end):
+            record = self._decode(line, segment, offset)
+            if record is not None:
+                return record
+        return None
+
+    def _read_segment(self, write_index: bool) -> None:
+        """
+        Index the unread part of the active segment.
+
+        Reads new sidecar index entries, then scans any data the index does
+        not cover yet (gaps left by interleaved writers and the unindexed
+        end). With write_index, entries found by scanning are written to the
+        sidecar.
+        """
+        segment = self._segment
+        index_path = self._index_path(segment)
+        if index_path.exists():
+            with open(index_path, "rb") as f:
+                f.seek(self._index_end)
+                chunk = f.read()
+            complete = chunk[: chunk.rfind(b"\n") + 1]
+            self._index_end += len(complete)
+            entries = []
+            for line in complete.splitlines():
+                try:
+                    seq, offset, length, workflow_id, event_type = json.loads(line)
+                except (ValueError, TypeError):
+                    continue
+                entries.append((offset, length, seq, workflow_id, event_type))
+            for offset, length, seq, workflow_id, event_type in sorted(entries):
+                if offset < self._segment_end:
+                    continue
+                if offset > self._segment_end:
+                    self._scan(segment, self._segment_end, offset, write_index)
+                self._add_entry(seq, segment, offset, length, workflow_id, event_type)
+                self._segment_end = offset + length
+
+        data_path = self._data_path(segment)
+        try:
+            size = data_path.stat().st_size
+        except OSError:
+            return
+        if size > self._segment_end:
+            self._segment_end = self._scan(segment, self._segment_end, size, write_index)
+
+    def _scan(self, segment: int, start: int, end: int, write_index: bool) -> int:
+        """
+        Parse the records between two offsets of a segment.
+
+        Returns:
+            Offset just after the last complete record scanned
+        """
+        data_path = self._data_path(segment)
+        with open(data_path, "rb") as f:
+            f.seek(start)
+            chunk = f.read(end - start)
+        offset = start
+        for line in chunk.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            record = self._decode(line, segment, offset)
+            if record is None:
+                logger.warning(f"Skipping corrupt record in {data_path} at offset {offset}")
+            else:
+                self._add_entry(
+                    record.seq, segment, offset, len(line), record.workflow_id, record.event_type
+                )
+                if write_index:
+                    written = self._write_index_entry(
+                        segment, record.seq, offset, len(line), record.workflow_id, record.event_type
+                    )
+                    if segment == self._segment:
+                        self._index_end += written
+            offset += len(line)
+        return offset
+
+    def _indexed_end(self, segment: int) -> int:
+        """End of the data covered by the last entry of a segment's sidecar index."""
+        index_path = self._index_path(segment)
+        try:
+            size = index_path.stat().st_size
+        except OSError:
+            return 0
+        complete = self._complete_end(index_path, size)
+        if complete < size:
+            os.truncate(index_path, complete)
+        for _offset, line in self._reverse_lines(index_path, complete):
+            try:
+                _seq, offset, length, _workflow_id, _event_type = json.loads(line)
+                return offset + length
+            except (ValueError, TypeError):
+                continue
+        return 0
+
+    @staticmethod
+    def _complete_end(path: Path, size: int) -> int:
+        """Offset just after the last newline in the first size bytes of a file."""
+        with open(path, "rb") as f:
+            end = size
+            while end > 0:
+                start = max(0, end - _REVERSE_BLOCK_BYTES)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline != -1:
+                    return start + newline + 1
+                end = start
+        return 0
+
+    @staticmethod
+    def _reverse_lines(path: Path, end: int) -> Iterator[tuple[int, bytes]]:
+        """Yield (offset, line) for the lines before end, last line first."""
+        if end <= 0:
+            return
+        with open(path, "rb") as f:
+            buffer = b""  # File contents from buffer_start up to line_end
+            buffer_start = end
+            line_end = end
+            while line_end > 0:
+                newline = buffer.rfind(b"\n", 0, max(line_end - 1 - buffer_start, 0))
+                if newline == -1 and buffer_start > 0:
+                    start = max(0, buffer_start - _REVERSE_BLOCK_BYTES)
+                    f.seek(start)
+                    buffer = f.read(buffer_start - start) + buffer
+                    buffer_start = start
+                    continue
+                line_start = buffer_start + newline + 1
+                yield line_start, buffer[line_start - buffer_start : line_end - buffer_start]
+                buffer = buffer[: line_start - buffer_start]
+                line_end = line_start
+
+    @staticmethod
+    def _decode(raw: bytes, segment: int, offset: int) -> LogRecord | None:
+        try:
+            record = json.loads(raw)
+            return LogRecord(
+                seq=record["seq"],
+                workflow_id=record["workflow_id"],
+                event_type=record["event_type"],
+                data=record.get("data") or {},
+                segment=segment,
+                offset=offset,
+                length=len(raw),
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _matches(record: LogRecord, workflow_id: str | None, event_type: str | None) -> bool:
+        return (
+            record.event_type != _TOMBSTONE
+            and (workflow_id is None or record.workflow_id == workflow_id)
+            and (event_type is None or record.event_type == event_type)
+        )
+
+    def _add_entry(
+        self, seq: int, segment: int, offset: int, length: int, workflow_id: str, event_type: str
+    ) -> None:
+        self._last_seq = max(self._last_seq, seq)
+        if not self._indexed:
+            return
+        if event_type == _TOMBSTONE:
+            self._deleted_before[workflow_id] = seq
+            self._by_workflow.pop(workflow_id, None)
+            for key in [key for key in self._by_key if key[0] == workflow_id]:
+                del self._by_key[key]
+            return
+
+        position = len(self._entries)
+        self._entries.append((seq, segment, offset, length, workflow_id))
+        self._by_workflow.setdefault(workflow_id, []).append(position)
+        self._by_type.setdefault(event_type, []).append(position)
+        self._by_key.setdefault((workflow_id, event_type), []).append(position)
+
+    def _positions(self, workflow_id: str | None, event_type: str | None) -> Sequence[int]:
+        """Index positions of the matching entries, in sequence order."""
+        if workflow_id is not None and event_type is not None:
+            return self._by_key.get((workflow_id, event_type), [])
+        if workflow_id is not None:
+            return self._by_workflow.get(workflow_id, [])
+        if event_type is not None:
+            return self._by_type.get(event_type, [])
+        return range(len(self._entries))
+
+    def _is_live(self, entry: _Entry) -> bool:
+        return entry[0] > self._deleted_before.get(entry[4], 0)
+
+    def _read_entries(self, entries: list[_Entry]) -> Iterator[LogRecord]:
+        """Read the records for index entries, keeping one segment open at a time."""
+        handle = None
+        current = None
+        try:
+            for _seq, segment, offset, length, _workflow_id in entries:
+                if handle is None or segment != current:
+                    if handle is not None:
+                        handle.close()
+                    handle = open(self._data_path(segment), "rb")  # noqa: SIM115
+                    current = segment
+                handle.seek(offset)
+                record = self._decode(handle.read(length), segment, offset)
+                if record is None:
+                    logger.debug(f"Failed to read event at {segment}:{offset}")
+                else:
+                    yield record
+        finally:
+            if handle is not None:
+                handle.close()
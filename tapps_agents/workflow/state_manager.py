@@ -2,6 +2,12 @@
 Advanced Workflow State Management
 
 Provides enhanced state persistence with validation, migration, versioning, and recovery.
+
+Saves are write-ahead journaled: a full snapshot is written periodically and
+every save in between appends only the delta against the previous save to the
+snapshot's journal segment. Loading a snapshot replays its segment. History is
+a per-workflow log of pointers (sequence number and journal offset) rather
+than a copy of each saved state.
 """
 
 from __future__ import annotations
@@ -21,6 +27,11 @@ logger = logging.getLogger(__name__)
 # State format version for migration
 CURRENT_STATE_VERSION = "2.0"
 
+# Journal compaction: take a fresh snapshot after this many deltas, or once the
+# segment outgrows both the snapshot it extends and this many bytes
+DEFAULT_SNAPSHOT_INTERVAL = 50
+MIN_COMPACTION_BYTES = 256 * 1024
+
 
 @dataclass
 class StateMetadata:
@@ -38,6 +49,8 @@ class StateMetadata:
     completed_steps_count: int = 0
     progress_percentage: float = 0.0
     trigger_step_id: str | None = None
+    # Sequence number of the latest save (snapshot or journal delta)
+    seq: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -176,22 +189,106 @@ class StateMigrator:
         return state_data
 
 
+class StateDelta:
+    """Computes and applies journal deltas between serialized states."""
+
+    @staticmethod
+    def diff(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+        """
+        Compute the delta that turns one serialized state into another.
+
+        Lists that only grew are recorded as appended items and dictionaries
+        as changed and removed keys; any other change replaces the field.
+
+        Returns:
+            Delta with optional "set", "append", "merge", "remove" and "unset"
+            sections (empty if nothing changed)
+        """
+        delta: dict[str, Any] = {}
+        for key, value in current.items():
+            if key not in previous:
+                delta.setdefault("set", {})[key] = value
+                continue
+            old = previous[key]
+            if old == value:
+                continue
+            if isinstance(old, list) and isinstance(value, list) and value[: len(old)] == old:
+                delta.setdefault("append", {})[key] = value[len(old) :]
+            elif isinstance(old, dict) and isinstance(value, dict):
+                changed = {k: v for k, v in value.items() if k not in old or old[k] != v}
+                removed = [k for k in old if k not in value]
+                if changed:
+                    delta.setdefault("merge", {})[key] = changed
+                if removed:
+                    delta.setdefault("remove", {})[key] = removed
+            else:
+                delta.setdefault("set", {})[key] = value
+        unset = [key for key in previous if key not in current]
+        if unset:
+            delta["unset"] = unset
+        return delta
+
+    @staticmethod
+    def apply(state_data: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+        """Apply a delta from diff() to serialized state data in place."""
+        state_data.update(delta.get("set", {}))
+        for key, items in delta.get("append", {}).items():
+            state_data[key] = [*state_data.get(key, []), *items]
+        for key, changed in delta.get("merge", {}).items():
+            state_data[key] = {**state_data.get(key, {}), **changed}
+        for key, removed in delta.get("remove", {}).items():
+            mapping = state_data.get(key, {})
+            for k in removed:
+                mapping.pop(k, None)
+        for key in delta.get("unset", []):
+            state_data.pop(key, None)
+        return state_data
+
+    @staticmethod
+    def checksum(delta: dict[str, Any]) -> str:
+        """Calculate SHA256 checksum for a journal delta."""
+        return hashlib.sha256(json.dumps(delta, sort_keys=True).encode()).hexdigest()
+
+
+@dataclass
+class _JournalCursor:
+    """What a manager last wrote for a workflow, used to diff the next save."""
+
+    state_file: str
+    seq: int
+    state_data: dict[str, Any]
+    checksum: str  # Checksum of the snapshot
+    deltas: int
+    segment_bytes: int
+    snapshot_bytes: int
+
+
 class AdvancedStateManager:
     """Advanced workflow state manager with validation, migration, and recovery."""
 
-    def __init__(self, state_dir: Path, compression: bool = False):
+    def __init__(
+        self,
+        state_dir: Path,
+        compression: bool = False,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+    ):
         """
         Initialize advanced state manager.
 
         Args:
             state_dir: Directory for state storage
             compression: Enable compression for state files
+            snapshot_interval: Journal deltas between full snapshots
         """
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.compression = compression
+        self.snapshot_interval = max(1, snapshot_interval)
         self.history_dir = self.state_dir / "history"
         self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.journal_dir = self.state_dir / "journal"
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self._cursors: dict[str, _JournalCursor] = {}
 
     def save_state(
         self, state: WorkflowState, workflow_path: Path | None = None
@@ -199,69 +296,72 @@ class AdvancedStateManager:
         """
         Save workflow state with validation and metadata.
 
+        Appends the delta against the previous save to the journal, or writes
+        a full snapshot when there is no previous save to diff against or the
+        journal segment is due for compaction.
+
         Args:
             state: Workflow state to save
             workflow_path: Optional path to workflow YAML
 
         Returns:
-            Path to saved state file
+            Path to the state snapshot whose journal holds this save
         """
-        # Convert state to dict
         state_data = self._state_to_dict(state)
+        cursor = self._cursors.get(state.workflow_id)
+        if cursor is not None and not self._cursor_is_current(cursor):
+            cursor = None
 
-        # Calculate checksum
-        checksum = StateValidator.calculate_checksum(state_data)
-        state_data["_checksum"] = checksum
-
-        # Create metadata
-        state_file = (
-            f"{state.workflow_id}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
-        )
-        if self.compression:
-            state_file += ".gz"
+        offset: int | None = None
+        if cursor is None or self._should_snapshot(cursor):
+            cursor = self._write_snapshot(state.workflow_id, state_data, cursor)
+        else:
+            delta = StateDelta.diff(cursor.state_data, state_data)
+            if not delta:
+                state_path = self.state_dir / cursor.state_file
+                self._update_last_pointer(state.workflow_id, state_path, workflow_path)
+                return state_path
+            offset = self._append_delta(cursor, delta, state_data)
+        state_path = self.state_dir / cursor.state_file
 
         # Epic 12: Extract checkpoint metadata from state if available
         checkpoint_metadata = state.variables.get("_checkpoint_metadata", {})
-        
+
         metadata = StateMetadata(
             version=CURRENT_STATE_VERSION,
             saved_at=datetime.now(),
-            checksum=checksum,
+            checksum=cursor.checksum,
             workflow_id=state.workflow_id,
-            state_file=state_file,
+            state_file=cursor.state_file,
             workflow_path=str(workflow_path) if workflow_path else None,
             compression=self.compression,
             current_step=checkpoint_metadata.get("current_step") or state.current_step,
             completed_steps_count=checkpoint_metadata.get("completed_steps", len(state.completed_steps)),
             progress_percentage=checkpoint_metadata.get("progress_percentage", 0.0),
             trigger_step_id=checkpoint_metadata.get("trigger_step_id"),
+            seq=cursor.seq,
         )
 
-        # Save state file
-        state_path = self.state_dir / state_file
-        self._write_state_file(state_path, state_data, self.compression)
-
         # Save metadata
-        metadata_path = self.state_dir / f"{state.workflow_id}.meta.json"
         from .file_utils import atomic_write_json
+
+        metadata_path = self.state_dir / f"{state.workflow_id}.meta.json"
         atomic_write_json(metadata_path, metadata.to_dict(), indent=2)
 
-        # Save to history
-        history_path = self.history_dir / state_file
-        self._write_state_file(history_path, state_data, self.compression)
+        # Record a history pointer into the journal
+        self._append_history(
+            state.workflow_id,
+            {
+                "seq": cursor.seq,
+                "saved_at": metadata.saved_at.isoformat(),
+                "status": state.status,
+                "current_step": state.current_step,
+                "state_file": cursor.state_file,
+                "offset": offset,
+            },
+        )
 
-        # Update last pointer
-        last_data = {
-            "workflow_id": state.workflow_id,
-            "state_file": str(state_path),
-            "metadata_file": str(metadata_path),
-            "saved_at": datetime.now().isoformat(),
-            "version": CURRENT_STATE_VERSION,
-            "workflow_path": str(workflow_path) if workflow_path else None,
-        }
-        last_path = self.state_dir / "last.json"
-        from .file_utils import atomic_write_json
-        atomic_write_json(last_path, last_data, indent=2)
+        self._update_last_pointer(state.workflow_id, state_path, workflow_path)
 
         # Session handoff when workflow ends (plan 2.1)
         if state.status in ("completed", "failed", "paused"):
@@ -300,14 +400,18 @@ class AdvancedStateManager:
         workflow_id: str | None = None,
         state_file: Path | None = None,
         validate: bool = True,
+        seq: int | None = None,
     ) -> tuple[WorkflowState, StateMetadata]:
         """
         Load workflow state with validation and migration.
 
+        The snapshot is read and its journal segment replayed on top of it.
+
         Args:
             workflow_id: Workflow ID to load (uses last if not specified)
             state_file: Specific state file to load
             validate: Whether to validate state integrity
+            seq: Replay the journal only up to this save (see list_states)
 
         Returns:
             (WorkflowState, StateMetadata)
@@ -342,6 +446,7 @@ class AdvancedStateManager:
 
         # Extract checksum if present
         expected_checksum = state_data.pop("_checksum", None)
+        state_data.pop("_seq", None)
 
         # Validate if requested
         if validate:
@@ -366,6 +471,8 @@ class AdvancedStateManager:
                     )
                 return self._recover_from_history(state_path, recovered_workflow_id)
 
+        state_data = self._replay_journal(state_path, state_data, up_to_seq=seq)
+
         # Check version and migrate if needed
         metadata_path = self.state_dir / f"{state_data['workflow_id']}.meta.json"
         if metadata_path.exists():
@@ -413,9 +520,24 @@ class AdvancedStateManager:
         states = []
 
         if workflow_id:
-            # List history for specific workflow
-            pattern = f"{workflow_id}-*.json*"
-            for state_file in self.history_dir.glob(pattern):
+            # List history pointers for specific workflow
+            for entry in self._read_history(workflow_id):
+                state_path = self.state_dir / entry["state_file"]
+                if not state_path.exists():
+                    continue
+                states.append(
+                    {
+                        "workflow_id": workflow_id,
+                        "state_file": str(state_path),
+                        "seq": entry.get("seq"),
+                        "status": entry.get("status"),
+                        "current_step": entry.get("current_step"),
+                        "saved_at": datetime.fromisoformat(entry["saved_at"]).timestamp(),
+                    }
+                )
+
+            # Full-copy history written before journaling
+            for state_file in self._legacy_history_files(workflow_id):
                 try:
                     state_data = self._read_state_file(state_file)
                     states.append(
@@ -541,7 +663,10 @@ class AdvancedStateManager:
                 if should_remove:
                     try:
                         # Get file size before removal
+                        segment_path = self._segment_path(state_file)
                         file_size = state_path.stat().st_size
+                        if segment_path.exists():
+                            file_size += segment_path.stat().st_size
                         if dry_run:
                             would_remove.append({
                                 "state_file": state_file,
@@ -554,6 +679,7 @@ class AdvancedStateManager:
                             workflows_cleaned.add(workflow_id)
                         else:
                             state_path.unlink()
+                            segment_path.unlink(missing_ok=True)
                             removed_size += file_size
                             removed_count += 1
                             workflows_cleaned.add(workflow_id)
@@ -589,19 +715,30 @@ class AdvancedStateManager:
         """Attempt to recover state from history."""
         logger.info(f"Attempting recovery from history for {workflow_id}")
 
-        # Find most recent valid state in history
-        pattern = f"{workflow_id}-*.json*"
-        history_files = sorted(
-            self.history_dir.glob(pattern),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
+        # Find most recent valid snapshot the history points to, then fall
+        # back to full-copy history written before journaling
+        history_files: list[Path] = []
+        for entry in reversed(self._read_history(workflow_id)):
+            snapshot_path = self.state_dir / entry["state_file"]
+            if (
+                snapshot_path not in history_files
+                and snapshot_path != corrupted_path
+                and snapshot_path.exists()
+            ):
+                history_files.append(snapshot_path)
+        history_files.extend(
+            sorted(
+                self._legacy_history_files(workflow_id),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )
         )
 
         for history_file in history_files:
             try:
                 state_data = self._read_state_file(history_file)
                 expected_checksum = state_data.pop("_checksum", None)
-                is_valid, error = StateValidator.validate_state(
+                is_valid, _error = StateValidator.validate_state(
                     state_data, expected_checksum
                 )
                 if is_valid:
@@ -614,6 +751,189 @@ class AdvancedStateManager:
 
         raise ValueError(f"Could not recover state for workflow {workflow_id}")
 
+    def _update_last_pointer(
+        self, workflow_id: str, state_path: Path, workflow_path: Path | None
+    ) -> None:
+        """
+        Point last.json at a workflow's latest save.
+
+        Only rewritten when the pointer on disk differs; other managers may
+        share the state directory, so it is compared with the file itself.
+        """
+        from .file_utils import atomic_write_json
+
+        pointer = {
+            "workflow_id": workflow_id,
+            "state_file": str(state_path),
+            "metadata_file": str(self.state_dir / f"{workflow_id}.meta.json"),
+            "version": CURRENT_STATE_VERSION,
+            "workflow_path": str(workflow_path) if workflow_path else None,
+        }
+        last_path = self.state_dir / "last.json"
+        if self._read_last_pointer(last_path) != pointer:
+            atomic_write_json(
+                last_path,
+                {**pointer, "saved_at": datetime.now().isoformat()},
+                indent=2,
+            )
+
+    @staticmethod
+    def _read_last_pointer(last_path: Path) -> dict[str, Any] | None:
+        """Read last.json without its saved_at timestamp (None if unreadable)."""
+        try:
+            with open(last_path, encoding="utf-8") as f:
+                pointer = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(pointer, dict):
+            return None
+        pointer.pop("saved_at", None)
+        return pointer
+
+    def _segment_path(self, state_file: str) -> Path:
+        """Journal segment holding the deltas saved on top of a snapshot."""
+        name = Path(state_file).name.removesuffix(".gz").removesuffix(".json")
+        return self.journal_dir / f"{name}.jsonl"
+
+    def _cursor_is_current(self, cursor: _JournalCursor) -> bool:
+        """Check that nothing else wrote to the snapshot's journal since us."""
+        try:
+            segment_bytes = self._segment_path(cursor.state_file).stat().st_size
+        except OSError:
+            return False
+        return (
+            segment_bytes == cursor.segment_bytes
+            and (self.state_dir / cursor.state_file).exists()
+        )
+
+    def _should_snapshot(self, cursor: _JournalCursor) -> bool:
+        """Compact once replaying the segment costs more than a snapshot."""
+        return cursor.deltas >= self.snapshot_interval or cursor.segment_bytes > max(
+            cursor.snapshot_bytes, MIN_COMPACTION_BYTES
+        )
+
+    def _write_snapshot(
+        self,
+        workflow_id: str,
+        state_data: dict[str, Any],
+        cursor: _JournalCursor | None,
+    ) -> _JournalCursor:
+        """Write a full snapshot and start an empty journal segment for it."""
+        if cursor is not None:
+            seq = cursor.seq + 1
+        else:
+            seq = 1
+            metadata_path = self.state_dir / f"{workflow_id}.meta.json"
+            if metadata_path.exists():
+                try:
+                    with open(metadata_path, encoding="utf-8") as f:
+                        seq = int(json.load(f).get("seq", 0)) + 1
+                except (OSError, ValueError, TypeError) as e:
+                    logger.debug(f"Could not read metadata {metadata_path}: {e}")
+
+        checksum = StateValidator.calculate_checksum(state_data)
+        state_file = (
+            f"{workflow_id}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{seq}.json"
+        )
+        if self.compression:
+            state_file += ".gz"
+
+        state_path = self.state_dir / state_file
+        self._write_state_file(
+            state_path,
+            {**state_data, "_checksum": checksum, "_seq": seq},
+            self.compression,
+        )
+        self._segment_path(state_file).write_bytes(b"")
+
+        cursor = _JournalCursor(
+            state_file=state_file,
+            seq=seq,
+            state_data=state_data,
+            checksum=checksum,
+            deltas=0,
+            segment_bytes=0,
+            snapshot_bytes=state_path.stat().st_size,
+        )
+        self._cursors[workflow_id] = cursor
+        return cursor
+
+    def _append_delta(
+        self, cursor: _JournalCursor, delta: dict[str, Any], state_data: dict[str, Any]
+    ) -> int:
+        """Append a delta to the cursor's journal segment; return its offset."""
+        record = {
+            "seq": cursor.seq + 1,
+            "saved_at": datetime.now().isoformat(),
+            "delta": delta,
+            "checksum": StateDelta.checksum(delta),
+        }
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        with open(self._segment_path(cursor.state_file), "ab") as f:
+            f.write(line)
+
+        offset = cursor.segment_bytes
+        cursor.seq += 1
+        cursor.state_data = state_data
+        cursor.deltas += 1
+        cursor.segment_bytes += len(line)
+        return offset
+
+    def _replay_journal(
+        self, state_path: Path, state_data: dict[str, Any], up_to_seq: int | None = None
+    ) -> dict[str, Any]:
+        """Apply the snapshot's journal segment, stopping at a torn record."""
+        segment_path = self._segment_path(state_path.name)
+        if not segment_path.exists():
+            return state_data
+
+        with open(segment_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    record = json.loads(line)
+                    delta = record["delta"]
+                    valid = StateDelta.checksum(delta) == record.get("checksum")
+                except (ValueError, KeyError, TypeError):
+                    valid = False
+                if not valid:
+                    logger.warning(
+                        f"Ignoring journal {segment_path} from line {line_number}: "
+                        "corrupt or incomplete record"
+                    )
+                    break
+                if up_to_seq is not None and record["seq"] > up_to_seq:
+                    break
+                StateDelta.apply(state_data, delta)
+        return state_data
+
+    def _append_history(self, workflow_id: str, entry: dict[str, Any]) -> None:
+        """Append a pointer to a save to the workflow's history log."""
+        with open(self.history_dir / f"{workflow_id}.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def _read_history(self, workflow_id: str) -> list[dict[str, Any]]:
+        """Read the workflow's history pointers, oldest first."""
+        history_path = self.history_dir / f"{workflow_id}.jsonl"
+        if not history_path.exists():
+            return []
+        entries = []
+        with open(history_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and entry.get("state_file"):
+                    entries.append(entry)
+        return entries
+
+    def _legacy_history_files(self, workflow_id: str) -> list[Path]:
+        """Full state copies that history held before journaling."""
+        return [
+            *self.history_dir.glob(f"{workflow_id}-*.json"),
+            *self.history_dir.glob(f"{workflow_id}-*.json.gz"),
+        ]
+
     def _write_state_file(self, path: Path, data: dict[str, Any], compress: bool):
         """Write state file with optional compression using atomic write."""
         from .file_utils import atomic_write_json
@@ -649,7 +969,9 @@ class AdvancedStateManager:
                 "status": getattr(artifact, "status", "pending"),
                 "created_by": getattr(artifact, "created_by", None),
                 "created_at": created_at.isoformat() if created_at else None,
-                "metadata": getattr(artifact, "metadata", {}) or {},
+                "metadata": _make_json_serializable(
+                    getattr(artifact, "metadata", {}) or {}
+                ),
             }
 
         def _make_json_serializable(obj: Any) -> Any:
@@ -697,8 +1019,8 @@ class AdvancedStateManager:
             "workflow_id": state.workflow_id,
             "started_at": state.started_at.isoformat(),
             "current_step": state.current_step,
-            "completed_steps": state.completed_steps,
-            "skipped_steps": state.skipped_steps,
+            "completed_steps": list(state.completed_steps),
+            "skipped_steps": list(state.skipped_steps),
             "artifacts": {
                 k: _artifact_to_dict(k, v) for k, v in (state.artifacts or {}).items()
             },
@@ -0,0 +1,298 @@
+"""
+Incremental Step Scheduler
+
+Tracks workflow step readiness with per-step counters instead of rescanning
+every step on each scheduling tick. Completing a step or producing an
+artifact updates only the counters of the steps that wait on it, and steps
+whose counters reach zero are pushed onto a priority queue. Scheduling a
+whole workflow costs O(edges log steps) instead of O(steps²).
+"""
+
+# @note: Readiness rules match ParallelStepExecutor.find_ready_steps() for both
+# scheduling modes; find_ready_steps() remains the stateless equivalent.
+
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from collections.abc import Callable, Container, Iterable
+from dataclasses import dataclass
+
+from .dependency_resolver import DependencyResolver
+from .models import SCHEDULING_MODES, WorkflowStep
+
+
+@dataclass(frozen=True)
+class SchedulePlan:
+    """Dependencies and scheduling priority of a workflow's steps (DAG mode)."""
+
+    step_ids: tuple[str, ...]
+    dependencies: dict[str, frozenset[str]]
+    priority: dict[str, tuple[int, int, int]]  # Sort key: lower runs first
+
+    @classmethod
+    def build(cls, steps: list[WorkflowStep]) -> SchedulePlan:
+        """
+        Build the plan from the dependency graph ('next:' is not a dependency).
+
+        Priority is the longest critical path first, then the position along
+        the 'next:' chain from the first step, then declaration order.
+
+        Raises:
+            ValueError: If the steps have a circular dependency
+        """
+        step_ids = tuple(step.id for step in steps)
+        resolver = DependencyResolver(steps, include_next=False)
+        critical_path = resolver.critical_path_lengths()
+
+        # Position along the 'next:' chain starting at the first step
+        chain_rank: dict[str, int] = {}
+        step_by_id = {step.id: step for step in steps}
+        current = steps[0] if steps else None
+        while current is not None and current.id not in chain_rank:
+            chain_rank[current.id] = len(chain_rank)
+            current = step_by_id.get(current.next) if current.next else None
+
+        return cls(
+            step_ids=step_ids,
+            dependencies={
+                step_id: frozenset(resolver.graph.dependencies.get(step_id, ()))
+                for step_id in step_ids
+            },
+            priority={
+                step_id: (-critical_path[step_id], chain_rank.get(step_id, len(step_ids)), index)
+                for index, step_id in enumerate(step_ids)
+            },
+        )
+
+
+class _TrackedSet(set[str]):
+    """Set of step IDs that reports every addition and removal."""
+
+    def __init__(self, on_add: Callable[[str], None], on_remove: Callable[[str], None]):
+        super().__init__()
+        self._on_add = on_add
+        self._on_remove = on_remove
+
+    def add(self, item: str) -> None:
+        if item not in self:
+            super().add(item)
+            self._on_add(item)
+
+    def discard(self, item: str) -> None:
+        if item in self:
+            super().discard(item)
+            self._on_remove(item)
+
+    def remove(self, item: str) -> None:
+        if item not in self:
+            raise KeyError(item)
+        self.discard(item)
+
+    def pop(self) -> str:
+        item = next(iter(self))
+        self.discard(item)
+        return item
+
+    def clear(self) -> None:
+        for item in list(self):
+            self.discard(item)
+
+    def update(self, *others: Iterable[str]) -> None:
+        for other in others:
+            for item in other:
+                self.add(item)
+
+    def difference_update(self, *others: Iterable[str]) -> None:
+        for other in others:
+            for item in list(other):
+                self.discard(item)
+
+    def __ior__(self, other):  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def __isub__(self, other):  # type: ignore[override]
+        self.difference_update(other)
+        return self
+
+
+class StepScheduler:
+    """
+    Event-driven readiness tracking for one workflow run.
+
+    ``completed`` and ``running`` are sets of step IDs that executors mutate
+    as before (add/discard); each mutation updates the counters of the
+    affected steps. pop_ready() returns newly ready steps, highest priority
+    first, and marks them running.
+
+    A step is ready when it is neither completed nor running and:
+    - "dag" mode: every step it depends on is completed and all its
+      required artifacts are available
+    - "sequential" mode: it is the first step and nothing has completed, or
+      a completed step names it in 'next:', and all its required artifacts
+      are available
+    """
+
+    def __init__(
+        self,
+        steps: list[WorkflowStep],
+        scheduling: str = "sequential",
+        completed: Iterable[str] = (),
+        artifacts: Container[str] | None = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            steps: Workflow steps
+            scheduling: Scheduling mode ("sequential" or "dag")
+            completed: Step IDs already completed (e.g. when resuming)
+            artifacts: Live container of available artifact names (e.g.
+                state.artifacts); checked when a producing step completes
+
+        Raises:
+            ValueError: On an unknown mode, or a circular dependency in DAG mode
+        """
+        if scheduling not in SCHEDULING_MODES:
+            raise ValueError(f"Unknown scheduling mode: {scheduling}")
+        self.steps = steps
+        self.scheduling = scheduling
+        self._dag = scheduling == "dag"
+        self._steps_by_id = {step.id: step for step in steps}
+        self._artifact_source: Container[str] = artifacts if artifacts is not None else set()
+
+        # Counters: unavailable required artifacts, incomplete dependencies
+        # (DAG mode) and completed 'next:' predecessors (sequential mode)
+        self._missing: dict[str, int] = dict.fromkeys(self._steps_by_id, 0)
+        self._unmet: dict[str, int] = dict.fromkeys(self._steps_by_id, 0)
+        self._chain_sources: dict[str, int] = dict.fromkeys(self._steps_by_id, 0)
+        self._dependents: dict[str, list[str]] = defaultdict(list)
+        self._requirers: dict[str, list[str]] = defaultdict(list)
+        self._available: set[str] = set()
+        # Required artifacts to look up in the source on each pop_ready():
+        # those no step creates, and those created by completed steps
+        self._awaiting: set[str] = set()
+
+        if self._dag:
+            plan = SchedulePlan.build(steps)
+            self._priority = plan.priority
+            for step_id, deps in plan.dependencies.items():
+                self._unmet[step_id] = len(deps)
+                for dep in deps:
+                    self._dependents[dep].append(step_id)
+        else:
+            self._priority = {step.id: (0, 0, index) for index, step in enumerate(steps)}
+            if steps:
+                # Virtual predecessor: the first step runs while nothing is complete
+                self._chain_sources[steps[0].id] = 1
+
+        producers: set[str] = set()
+        for step in steps:
+            producers.update(step.creates)
+            for name in set(step.requires):
+                self._requirers[name].append(step.id)
+                self._missing[step.id] += 1
+        self._external = {name for name in self._requirers if name not in producers}
+        self._awaiting.update(self._requirers)
+
+        self._heap: list[tuple[tuple[int, int, int], str]] = []
+        self._queued: set[str] = set()
+        self.completed = _TrackedSet(self._on_completed, self._on_uncompleted)
+        self.running = _TrackedSet(self._noop, self._on_stopped)
+
+        self._check_awaiting()
+        self._awaiting.intersection_update(self._external)
+        self.completed.update(step_id for step_id in completed if step_id in self._steps_by_id)
+        for step in steps:
+            self._maybe_ready(step.id)
+
+    def pop_ready(self, limit: int | None = None) -> list[WorkflowStep]:
+        """
+        Take the ready steps off the queue and mark them running.
+
+        Args:
+            limit: Maximum number of steps to return (None = all ready)
+
+        Returns:
+            Ready steps, highest priority first
+        """
+        self._check_awaiting()
+        ready: list[WorkflowStep] = []
+        while self._heap and (limit is None or len(ready) < limit):
+            _, step_id = heapq.heappop(self._heap)
+            self._queued.discard(step_id)
+            if self._is_ready(step_id):
+                ready.append(self._steps_by_id[step_id])
+        self.running.update(step.id for step in ready)
+        return ready
+
+    def add_artifact(self, name: str) -> None:
+        """Record that an artifact became available."""
+        if name in self._available:
+            return
+        self._available.add(name)
+        self._awaiting.discard(name)
+        for step_id in self._requirers.get(name, ()):
+            self._missing[step_id] -= 1
+            self._maybe_ready(step_id)
+
+    def _check_awaiting(self) -> None:
+        for name in [name for name in self._awaiting if name in self._artifact_source]:
+            self.add_artifact(name)
+
+    def _is_ready(self, step_id: str) -> bool:
+        return (
+            step_id not in self.completed
+            and step_id not in self.running
+            and self._missing[step_id] == 0
+            and self._unmet[step_id] == 0
+            and (self._dag or self._chain_sources[step_id] > 0)
+        )
+
+    def _maybe_ready(self, step_id: str) -> None:
+        if step_id not in self._queued and self._is_ready(step_id):
+            heapq.heappush(self._heap, (self._priority[step_id], step_id))
+            self._queued.add(step_id)
+
+    def _on_completed(self, step_id: str) -> None:
+        step = self._steps_by_id.get(step_id)
+        if step is None:
+            return
+        if self._dag:
+            for dependent in self._dependents.get(step_id, ()):
+                self._unmet[dependent] -= 1
+                self._maybe_ready(dependent)
+        else:
+            if len(self.completed) == 1 and self.steps:
+                self._chain_sources[self.steps[0].id] -= 1
+            if step.next in self._chain_sources:
+                self._chain_sources[step.next] += 1
+                self._maybe_ready(step.next)
+        for name in step.creates:
+            if name in self._requirers and name not in self._available:
+                self._awaiting.add(name)
+
+    def _on_uncompleted(self, step_id: str) -> None:
+        step = self._steps_by_id.get(step_id)
+        if step is None:
+            return
+        # Dependents queued earlier are re-checked (and dropped) in pop_ready()
+        if self._dag:
+            for dependent in self._dependents.get(step_id, ()):
+                self._unmet[dependent] += 1
+        else:
+            if not self.completed and self.steps:
+                self._chain_sources[self.steps[0].id] += 1
+                self._maybe_ready(self.steps[0].id)
+            if step.next in self._chain_sources:
+                self._chain_sources[step.next] -= 1
+        self._maybe_ready(step_id)
+
+    def _on_stopped(self, step_id: str) -> None:
+        if step_id in self._steps_by_id:
+            self._maybe_ready(step_id)
+
+    @staticmethod
+    def _noop(step_id: str) -> None:
+        pass
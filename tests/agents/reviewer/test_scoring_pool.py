@@ -0,0 +1,77 @@
+"""
+Tests for ScoringProcessPool - process backend for CPU-bound scoring.
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from tapps_agents.agents.reviewer.scorer_registry import ScorerRegistry
+from tapps_agents.agents.reviewer.scoring import CodeScorer
+from tapps_agents.agents.reviewer.scoring_pool import ScoringProcessPool, _to_compact
+from tapps_agents.agents.reviewer.tools.tool_memo import ToolRun, get_tool_result_memo
+from tapps_agents.core.config import ProjectConfig
+from tapps_agents.core.language_detector import Language
+
+pytestmark = pytest.mark.unit
+
+SOURCE = '''
+def classify(n):
+    if n < 0:
+        return "negative"
+    for i in range(n):
+        if i % 2:
+            continue
+    return "done"
+'''
+
+
+def _config() -> ProjectConfig:
+    config = ProjectConfig()
+    config.quality_tools.ruff_enabled = False
+    config.quality_tools.mypy_enabled = False
+    config.quality_tools.jscpd_enabled = False
+    return config
+
+
+def test_to_compact_reduces_to_builtins():
+    compact = _to_compact({"path": Path("a.py"), "items": ("x", 1), "nested": {2: None}})
+    assert compact == {"path": "a.py", "items": ["x", 1], "nested": {"2": None}}
+
+
+@pytest.mark.timeout(120)
+def test_process_scores_match_thread_scores(tmp_path: Path):
+    target = tmp_path / "sample.py"
+    target.write_text(SOURCE)
+    config = _config()
+    scorer = ScorerRegistry._instantiate_scorer(CodeScorer, Language.PYTHON, config)
+
+    get_tool_result_memo().clear()
+    analysis = ScorerRegistry.create_analysis_context(target, SOURCE, Language.PYTHON)
+    thread_scores = ScorerRegistry.run_scorer(scorer, target, SOURCE, analysis)
+
+    get_tool_result_memo().clear()
+    pool = ScoringProcessPool(max_workers=1, config=config)
+    try:
+        process_scores = asyncio.run(pool.score(scorer, target, SOURCE, Language.PYTHON))
+    finally:
+        pool.shutdown()
+
+    assert process_scores == _to_compact(thread_scores)
+    # The worker's bandit run is handed back to the parent memo
+    assert "bandit" in get_tool_result_memo().runs_for(target)
+
+
+def test_runs_for_returns_only_current_successful_runs(tmp_path: Path):
+    memo = get_tool_result_memo()
+    memo.clear()
+    target = tmp_path / "m.py"
+    target.write_text("x = 1\n")
+    memo.put(target, "ruff", ToolRun(returncode=0))
+    memo.put(target, "mypy", ToolRun(returncode=None, error="timeout"))
+
+    assert set(memo.runs_for(target)) == {"ruff"}
+
+    target.write_text("x = 2\n")
+    assert memo.runs_for(target) == {}
@@ -0,0 +1,128 @@
+"""
+Tests for BatchToolRunner - one tool run per batch, split back per file.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tapps_agents.agents.reviewer.scoring import CodeScorer
+from tapps_agents.agents.reviewer.tools.batch_tools import BatchToolRunner
+from tapps_agents.agents.reviewer.tools.scoped_mypy import ScopedMypyExecutor
+from tapps_agents.agents.reviewer.tools.tool_memo import ToolResultMemo, ToolRun
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def two_files(tmp_path: Path) -> tuple[Path, Path]:
+    a = tmp_path / "a.py"
+    b = tmp_path / "b.py"
+    a.write_text("import os\n")
+    b.write_text("x = 1\n")
+    return a, b
+
+
+def _completed(stdout: str, returncode: int = 1) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr="")
+
+
+class TestBatchRuff:
+    def test_splits_diagnostics_per_file(self, two_files):
+        a, b = two_files
+        diag = {"code": {"name": "F401"}, "message": "unused", "filename": str(a)}
+        runner = BatchToolRunner(memo=ToolResultMemo())
+
+        with patch(
+            "tapps_agents.agents.reviewer.tools.batch_tools.subprocess.run",
+            return_value=_completed(json.dumps([diag])),
+        ) as run:
+            results = runner.run_ruff([a, b])
+
+        assert run.call_count == 1
+        assert json.loads(results[a].stdout) == [diag]
+        assert results[a].returncode == 1
+        assert results[b] == ToolRun(returncode=0, stdout="")
+
+    def test_unparseable_output_primes_nothing(self, two_files):
+        runner = BatchToolRunner(memo=ToolResultMemo())
+        with patch(
+            "tapps_agents.agents.reviewer.tools.batch_tools.subprocess.run",
+            return_value=_completed("ruff crashed", returncode=2),
+        ):
+            assert runner.run_ruff(list(two_files)) == {}
+
+
+class TestBatchMypy:
+    def test_parse_batch_output_splits_per_file(self, two_files):
+        a, b = two_files
+        output = (
+            f"{a.name}:3:5: error: Incompatible types [assignment]\n"
+            f"{a.name}:7: error: Missing return [return]\n"
+            "other.py:1: error: Not a target [misc]\n"
+        )
+        per_file = ScopedMypyExecutor().parse_batch_output(output, [a, b], cwd=a.parent)
+
+        assert [i.error_code for i in per_file[a]] == ["assignment", "return"]
+        assert per_file[a][0].column == 5
+        assert per_file[b] == []
+
+    def test_fatal_exit_returns_none(self, two_files):
+        with patch(
+            "tapps_agents.agents.reviewer.tools.scoped_mypy.subprocess.run",
+            return_value=_completed("duplicate module", returncode=2),
+        ):
+            assert ScopedMypyExecutor().run_batch_sync(list(two_files)) is None
+
+
+class TestBatchBandit:
+    def test_counts_issues_per_file(self, tmp_path: Path):
+        pytest.importorskip("bandit")
+        risky = tmp_path / "risky.py"
+        clean = tmp_path / "clean.py"
+        risky.write_text("import subprocess\n\ndef run(cmd):\n    subprocess.call(cmd, shell=True)\n")
+        clean.write_text("x = 1\n")
+
+        results = BatchToolRunner(memo=ToolResultMemo()).run_bandit([risky, clean])
+
+        assert results[risky].payload["high"] >= 1
+        assert results[clean].payload == {"high": 0, "medium": 0}
+
+
+class TestPrime:
+    def test_primed_memo_serves_scorer_without_launching_ruff(self, two_files):
+        a, b = two_files
+        memo = ToolResultMemo()
+        diag = {"code": {"name": "F401"}, "message": "unused", "filename": str(a)}
+        runner = BatchToolRunner(
+            memo=memo, mypy_enabled=False, bandit_enabled=False, jscpd_enabled=False
+        )
+        with patch(
+            "tapps_agents.agents.reviewer.tools.batch_tools.subprocess.run",
+            return_value=_completed(json.dumps([diag])),
+        ):
+            assert runner.prime([a, b]) == {"ruff": 2}
+
+        scorer = CodeScorer()
+        scorer.has_ruff = True
+        scorer._tool_memo = memo
+        scorer._invoke_ruff = MagicMock(side_effect=AssertionError("should not run"))
+
+        assert scorer.get_ruff_issues(a) == [diag]
+        assert scorer.get_ruff_issues(b) == []
+
+    def test_single_file_is_left_to_per_file_path(self, two_files):
+        runner = BatchToolRunner(memo=ToolResultMemo())
+        runner.run_ruff = MagicMock()
+
+        assert runner.prime([two_files[0]], tools=("ruff",)) == {}
+        runner.run_ruff.assert_not_called()
+
+    def test_failing_tool_is_skipped(self, two_files):
+        runner = BatchToolRunner(memo=ToolResultMemo())
+        runner.run_mypy = MagicMock(side_effect=RuntimeError("boom"))
+
+        assert runner.prime(list(two_files), tools=("mypy",)) == {}
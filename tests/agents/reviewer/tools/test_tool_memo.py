@@ -0,0 +1,121 @@
+"""
+Tests for ToolResultMemo - shared ruff/mypy runs per file content.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tapps_agents.agents.reviewer.scoring import CodeScorer
+from tapps_agents.agents.reviewer.tools.tool_memo import ToolResultMemo, ToolRun
+
+pytestmark = pytest.mark.unit
+
+
+class TestToolResultMemo:
+    def test_same_content_runs_once(self, tmp_path: Path):
+        memo = ToolResultMemo()
+        target = tmp_path / "m.py"
+        target.write_text("x = 1\n")
+        runner = MagicMock(return_value=ToolRun(returncode=0))
+
+        memo.get_or_run(target, "ruff", runner)
+        memo.get_or_run(target, "ruff", runner)
+
+        assert runner.call_count == 1
+        assert memo.get_stats()["hits"] == 1
+
+    def test_content_change_misses(self, tmp_path: Path):
+        memo = ToolResultMemo()
+        target = tmp_path / "m.py"
+        target.write_text("x = 1\n")
+        runner = MagicMock(return_value=ToolRun(returncode=0))
+
+        memo.get_or_run(target, "ruff", runner)
+        target.write_text("x = 2\n")
+        memo.get_or_run(target, "ruff", runner)
+
+        assert runner.call_count == 2
+
+    def test_tools_are_keyed_separately(self, tmp_path: Path):
+        memo = ToolResultMemo()
+        target = tmp_path / "m.py"
+        target.write_text("x = 1\n")
+        runner = MagicMock(return_value=ToolRun(returncode=0))
+
+        memo.get_or_run(target, "ruff", runner)
+        memo.get_or_run(target, "mypy", runner)
+
+        assert runner.call_count == 2
+
+    def test_failures_expire(self, tmp_path: Path):
+        memo = ToolResultMemo(failure_ttl_seconds=0.0)
+        target = tmp_path / "m.py"
+        target.write_text("x = 1\n")
+        runner = MagicMock(return_value=ToolRun(returncode=None, error="timeout"))
+
+        memo.get_or_run(target, "ruff", runner)
+        memo.get_or_run(target, "ruff", runner)
+
+        assert runner.call_count == 2
+
+    def test_bounded_entries(self, tmp_path: Path):
+        memo = ToolResultMemo(max_entries=2)
+        for i in range(3):
+            target = tmp_path / f"m{i}.py"
+            target.write_text(f"x = {i}\n")
+            memo.get_or_run(target, "ruff", lambda: ToolRun(returncode=0))
+
+        assert memo.get_stats()["entries"] == 2
+
+    def test_missing_file_runs_without_memo(self, tmp_path: Path):
+        memo = ToolResultMemo()
+        runner = MagicMock(return_value=ToolRun(returncode=0))
+
+        memo.get_or_run(tmp_path / "missing.py", "ruff", runner)
+        memo.get_or_run(tmp_path / "missing.py", "ruff", runner)
+
+        assert runner.call_count == 2
+
+
+class TestCodeScorerSharesToolRuns:
+    @patch("tapps_agents.agents.reviewer.scoring.HAS_RUFF", True)
+    @patch("subprocess.run")
+    def test_ruff_score_and_issues_share_one_run(self, mock_subprocess, tmp_path: Path):
+        scorer = CodeScorer(ruff_enabled=True)
+        scorer._tool_memo = ToolResultMemo()
+        target = tmp_path / "m.py"
+        target.write_text("import os\n")
+        mock_subprocess.return_value = MagicMock(
+            returncode=1,
+            stdout='[{"code": {"name": "F401"}, "message": "Unused import"}]',
+            stderr="",
+        )
+
+        score = scorer._calculate_linting_score(target)
+        issues = scorer.get_ruff_issues(target)
+
+        assert mock_subprocess.call_count == 1
+        assert score == 7.0
+        assert issues[0]["code"]["name"] == "F401"
+
+    @patch("tapps_agents.agents.reviewer.scoring.HAS_MYPY", True)
+    @patch("subprocess.run")
+    def test_mypy_score_and_errors_share_one_run(self, mock_subprocess, tmp_path: Path):
+        scorer = CodeScorer(mypy_enabled=True)
+        scorer._tool_memo = ToolResultMemo()
+        target = tmp_path / "m.py"
+        target.write_text("x: int = 'a'\n")
+        mock_subprocess.return_value = MagicMock(
+            returncode=1,
+            stdout="m.py:1: error: Incompatible types in assignment [assignment]\n",
+            stderr="",
+        )
+
+        score = scorer._calculate_type_checking_score(target)
+        errors = scorer.get_mypy_errors(target)
+
+        assert mock_subprocess.call_count == 1
+        assert score == 9.5
+        assert errors[0]["error_code"] == "assignment"
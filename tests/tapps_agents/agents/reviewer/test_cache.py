@@ -222,3 +222,152 @@ class TestFileHash:
         """Test that file hash is truncated to 16 characters."""
         hash_value = cache._file_hash(temp_file)
         assert len(hash_value) == 16
+
+
+class TestCacheIndex:
+    """Tests for the SQLite metadata index."""
+
+    @pytest.mark.asyncio
+    async def test_fast_path_skips_rehash_for_unchanged_file(self, cache, temp_file):
+        """Test that an unchanged, non-racy file is not read again."""
+        import os
+        from unittest.mock import patch
+
+        old = temp_file.stat().st_mtime_ns - 10_000_000_000
+        os.utime(temp_file, ns=(old, old))
+        await cache.save_result(temp_file, "score", "1.0", {"score": 85.0})
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("re-hashed")):
+            cached = await cache.get_cached_result(temp_file, "score", "1.0")
+        assert cached == {"score": 85.0}
+
+    @pytest.mark.asyncio
+    async def test_fast_path_misses_when_content_changes(self, cache, temp_file):
+        """Test that a same-size edit with a new mtime is detected."""
+        import os
+
+        old = temp_file.stat().st_mtime_ns - 10_000_000_000
+        os.utime(temp_file, ns=(old, old))
+        await cache.save_result(temp_file, "score", "1.0", {"score": 85.0})
+
+        temp_file.write_text("# Test file\nprint('HELLO')\n")
+        assert await cache.get_cached_result(temp_file, "score", "1.0") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entry_count(self, temp_cache_dir, tmp_path):
+        """Test that least-recently-used entries are evicted beyond max_entries."""
+        cache = ReviewerResultCache(cache_dir=temp_cache_dir, max_entries=2)
+        files = []
+        for i in range(3):
+            f = tmp_path / f"f{i}.py"
+            f.write_text(f"x = {i}\n")
+            files.append(f)
+
+        await cache.save_result(files[0], "score", "1.0", {"i": 0})
+        await cache.save_result(files[1], "score", "1.0", {"i": 1})
+        assert await cache.get_cached_result(files[0], "score", "1.0") == {"i": 0}
+        await cache.save_result(files[2], "score", "1.0", {"i": 2})
+
+        assert cache.get_stats()["entries"] == 2
+        assert await cache.get_cached_result(files[1], "score", "1.0") is None
+        assert await cache.get_cached_result(files[0], "score", "1.0") == {"i": 0}
+        assert len(list(temp_cache_dir.glob("*.json"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_size(self, temp_cache_dir, temp_file):
+        """Test that results beyond max_size_bytes are evicted."""
+        cache = ReviewerResultCache(cache_dir=temp_cache_dir, max_size_bytes=1)
+        await cache.save_result(temp_file, "score", "1.0", {"score": 85.0})
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_instances_sharing_directory_see_each_other(self, temp_cache_dir, temp_file):
+        """Test that separate cache instances (e.g. processes) share entries."""
+        writer = ReviewerResultCache(cache_dir=temp_cache_dir)
+        reader = ReviewerResultCache(cache_dir=temp_cache_dir)
+
+        await writer.save_result(temp_file, "score", "1.0", {"score": 85.0})
+        assert await reader.get_cached_result(temp_file, "score", "1.0") == {"score": 85.0}
+
+        assert reader.invalidate_file(temp_file) == 1
+        assert await writer.get_cached_result(temp_file, "score", "1.0") is None
+
+    @pytest.mark.asyncio
+    async def test_legacy_metadata_is_imported(self, temp_cache_dir, temp_file):
+        """Test that entries from a pre-index metadata.json remain usable."""
+        import json
+        from datetime import UTC, datetime
+
+        legacy = ReviewerResultCache(cache_dir=temp_cache_dir, enabled=False)
+        file_hash = legacy._file_hash(temp_file)
+        key = legacy._make_cache_key(temp_file, "score", "1.0", file_hash)
+        legacy._get_cache_file(key).write_text(json.dumps({"score": 70.0}))
+        (temp_cache_dir / "metadata.json").write_text(json.dumps({
+            key: {
+                "file_path": str(temp_file.resolve()),
+                "file_hash": file_hash,
+                "command": "score",
+                "version": "1.0",
+                "cached_at": datetime.now(UTC).isoformat() + "Z",
+            }
+        }))
+
+        cache = ReviewerResultCache(cache_dir=temp_cache_dir)
+        assert await cache.get_cached_result(temp_file, "score", "1.0") == {"score": 70.0}
+        assert not (temp_cache_dir / "metadata.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_prune_removes_entries_for_changed_files(self, cache, temp_file):
+        """Test that prune_expired drops entries whose file content changed."""
+        await cache.save_result(temp_file, "score", "1.0", {"score": 85.0})
+        temp_file.write_text("# Changed\n")
+        assert cache.prune_expired() == 1
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestDependencyInvalidation:
+    """Tests for import-closure based invalidation."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create app.py -> service.py -> models.py."""
+        (tmp_path / "models.py").write_text("class User:\n    name: str\n")
+        (tmp_path / "service.py").write_text("from models import User\n")
+        (tmp_path / "app.py").write_text("import service\n")
+        (tmp_path / "other.py").write_text("x = 1\n")
+        return tmp_path
+
+    def test_default_ttl_is_days(self):
+        """Test that the default TTL is no longer one hour."""
+        assert ReviewerResultCache.DEFAULT_TTL >= 24 * 3600
+
+    @pytest.mark.asyncio
+    async def test_upstream_change_invalidates_transitive_dependents(self, cache, project):
+        """Test that editing a module drops results of files importing it."""
+        for name in ("app", "service", "models", "other"):
+            await cache.save_result(project / f"{name}.py", "score", "1.0", {"f": name})
+
+        (project / "models.py").write_text("class User:\n    name: int\n")
+
+        assert await cache.get_cached_result(project / "app.py", "score", "1.0") is None
+        assert await cache.get_cached_result(project / "service.py", "score", "1.0") is None
+        assert await cache.get_cached_result(project / "other.py", "score", "1.0") == {"f": "other"}
+
+    @pytest.mark.asyncio
+    async def test_rehashing_changed_file_drops_dependents(self, cache, project):
+        """Test that noticing a changed file eagerly removes its dependents."""
+        await cache.save_result(project / "app.py", "score", "1.0", {"f": "app"})
+        assert cache.get_stats()["entries"] == 1
+
+        (project / "service.py").write_text("from models import User\nVALUE = 2\n")
+        cache._file_hash(project / "service.py")
+
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_file_includes_dependents(self, cache, project):
+        """Test that invalidate_file also removes entries importing the file."""
+        await cache.save_result(project / "app.py", "score", "1.0", {"f": "app"})
+        await cache.save_result(project / "models.py", "score", "1.0", {"f": "models"})
+
+        assert cache.invalidate_file(project / "models.py") == 2
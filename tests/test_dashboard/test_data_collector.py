@@ -157,3 +157,15 @@ class TestCollectEvents:
         result = collector.collect_events()
         assert len(result) == 1
         assert result[0]["event_type"] == "workflow_started"
+        # Read-only: the legacy file is left for the event bus to migrate
+        assert (events_dir / "wf-1-2026-01-01-started.json").exists()
+
+    def test_reads_event_log(self, tmp_project):
+        from tapps_agents.workflow.segmented_log import SegmentedEventLog
+
+        log = SegmentedEventLog(tmp_project / ".tapps-agents" / "events")
+        for step in ("plan", "implement"):
+            log.append("wf-1", "step_completed", {"event_type": "step_completed", "step_id": step})
+
+        result = DashboardDataCollector(tmp_project).collect_events(limit=1)
+        assert [e["step_id"] for e in result] == ["implement"]
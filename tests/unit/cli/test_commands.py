@@ -546,6 +546,51 @@ class TestReviewerBatchOperations:
             # Both files should be processed successfully
             assert mock_agent.run.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_process_file_batch_reports_concurrency(self, tmp_path):
+        """Test batch summary reports the adaptive concurrency chosen."""
+        files = []
+        for i in range(3):
+            file = tmp_path / f"file{i}.py"
+            file.write_text(f"def func{i}(): pass", encoding="utf-8")
+            files.append(file)
+
+        mock_agent = MagicMock()
+        mock_agent.run = AsyncMock(
+            side_effect=lambda command, file: {"file": file, "scoring": {"overall_score": 85.0}}
+        )
+
+        result = await reviewer._process_file_batch(mock_agent, files, "score", max_workers=2)
+
+        assert result["successful"] == 3
+        assert result["_concurrency"]["max"] == 2
+        assert 1 <= result["_concurrency"]["final"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_process_file_batch_primes_tools_per_chunk(self, tmp_path):
+        """Test quality tools are primed in chunks that fit the tool memo."""
+        from tapps_agents.agents.reviewer.tools.tool_memo import ToolResultMemo
+
+        files = []
+        for i in range(25):
+            file = tmp_path / f"file{i}.py"
+            file.write_text(f"def func{i}(): pass", encoding="utf-8")
+            files.append(file)
+
+        mock_agent = MagicMock()
+        # score primes 4 tools; 80 entries fit two chunks of 10 files
+        mock_agent.scorer._tool_memo = ToolResultMemo(max_entries=80)
+        mock_agent.run = AsyncMock(
+            side_effect=lambda command, file: {"file": file, "scoring": {"overall_score": 85.0}}
+        )
+        prime = AsyncMock(side_effect=lambda agent, chunk, command: {"ruff": len(chunk)})
+
+        with patch.object(reviewer, "_prime_batch_tools", prime):
+            result = await reviewer._process_file_batch(mock_agent, files, "score", max_workers=2)
+
+        assert [len(call.args[1]) for call in prime.await_args_list] == [10, 10, 5]
+        assert result["_batch_tools"] == {"ruff": 25}
+
     @pytest.mark.asyncio
     async def test_process_file_batch_with_errors(self, tmp_path):
         """Test batch processing with some errors."""
@@ -269,6 +269,89 @@ class TestContext7AgentHelper:
         assert result is False
 
 
+class TestBatchedDocumentation:
+    """Tests for batched documentation lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_documentation_many_uses_one_batch(self, helper):
+        """Test that uncached pairs are sent to lookup_many in one call."""
+        from tapps_agents.context7.lookup import LookupResult
+
+        helper.doc_manager = None
+        helper.kb_lookup.lookup_many = AsyncMock(
+            return_value=[
+                LookupResult(success=True, content="# Hooks", source="api", library="react", topic="hooks"),
+                LookupResult(success=False, source="api", library="nope", topic=None, error="not found"),
+            ]
+        )
+
+        docs = await helper.get_documentation_many([("react", "hooks"), ("nope", None)])
+
+        helper.kb_lookup.lookup_many.assert_awaited_once()
+        assert docs[("react", "hooks")]["content"] == "# Hooks"
+        assert docs[("nope", None)] is None
+
+    @pytest.mark.asyncio
+    async def test_saved_documentation_is_not_refetched(self, helper):
+        """Test that saved documentation short-circuits the batch."""
+        helper.doc_manager = Mock()
+        helper.doc_manager.get_saved_documentation.return_value = {"content": "saved"}
+        helper.kb_lookup.lookup_many = AsyncMock()
+
+        docs = await helper.get_documentation_many([("react", "hooks")])
+
+        assert docs == {("react", "hooks"): {"content": "saved"}}
+        helper.kb_lookup.lookup_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_breaker_skips_batch(self, helper, monkeypatch):
+        """Test that no lookups are made while the circuit breaker is open."""
+        from tapps_agents.context7 import circuit_breaker
+
+        breaker = circuit_breaker.CircuitBreaker()
+        breaker.trip("test")
+        monkeypatch.setattr(circuit_breaker, "_context7_circuit_breaker", breaker)
+        helper.doc_manager = None
+        helper.kb_lookup.lookup_many = AsyncMock()
+
+        docs = await helper.get_documentation_many([("react", "hooks")])
+
+        assert docs == {("react", "hooks"): None}
+        helper.kb_lookup.lookup_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_timed_out_batch_counts_as_breaker_failure(self, helper, monkeypatch):
+        """Test that a batch in which every lookup timed out is recorded as a failure."""
+        from tapps_agents.context7 import circuit_breaker
+        from tapps_agents.context7.lookup import LookupResult
+
+        breaker = circuit_breaker.CircuitBreaker()
+        monkeypatch.setattr(circuit_breaker, "_context7_circuit_breaker", breaker)
+        helper.doc_manager = None
+        helper.kb_lookup.lookup_many = AsyncMock(
+            return_value=[
+                LookupResult(success=False, source="api", library="react", topic="hooks",
+                             error="timed out", timed_out=True),
+            ]
+        )
+
+        await helper.get_documentation_many([("react", "hooks")])
+
+        assert breaker.stats.failed_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_get_documentation_for_libraries_batches(self, helper):
+        """Test that multi-library lookups delegate to get_documentation_many."""
+        helper.get_documentation_many = AsyncMock(
+            return_value={("react", "hooks"): {"content": "x"}, ("vue", "hooks"): None}
+        )
+
+        docs = await helper.get_documentation_for_libraries(["react", "vue"], topic="hooks")
+
+        assert docs == {"react": {"content": "x"}, "vue": None}
+        helper.get_documentation_many.assert_awaited_once()
+
+
 class TestGetContext7Helper:
     """Tests for get_context7_helper function."""
 
@@ -2,8 +2,6 @@
 Unit tests for Context7 analytics.
 """
 
-from unittest.mock import patch
-
 import pytest
 
 from tapps_agents.context7.analytics import Analytics, CacheMetrics, LibraryMetrics
@@ -82,8 +80,8 @@ class TestAnalytics:
         assert analytics.metrics["cache_hits"] == initial_hits + 1
 
         # Check response time recorded
-        response_times = analytics.metrics.get("response_times", [])
-        assert 10.5 in response_times
+        assert analytics.metrics["response_time_samples"] == 1
+        assert analytics.get_cache_metrics().avg_response_time_ms == 10.5
 
     def test_record_cache_miss(self, analytics):
         initial_misses = analytics.metrics.get("cache_misses", 0)
@@ -227,22 +225,58 @@ class TestAnalytics:
         assert analytics.metrics["cache_misses"] == 0
         assert analytics.metrics["api_calls"] == 0
         assert analytics.metrics["fuzzy_matches"] == 0
-        assert len(analytics.metrics["response_times"]) == 0
-
-    def test_response_times_limit(self, analytics):
-        """Test that response times are limited to 1000 entries (removes oldest)."""
-        # Mock _save_metrics to avoid 1100 file I/O operations (performance optimization)
-        with patch.object(analytics, '_save_metrics'):
-            # Record many response times (should keep only last 1000)
-            # Using 1100 iterations to exceed limit but still be fast enough
-            for i in range(1100):
-                analytics.record_cache_hit(response_time_ms=float(i))
-
-        response_times = analytics.metrics.get("response_times", [])
-        assert len(response_times) == 1000, "Should limit to 1000 entries"
-        # Should have the latest values (100-1099), first 100 should be removed
-        assert min(response_times) >= 100, "Oldest entries should be removed"
-        assert max(response_times) == 1099, "Newest entry should be present"
+        assert analytics.metrics["response_time_samples"] == 0
+
+    def test_response_time_percentiles(self, analytics):
+        """Test p50/p95/p99 from the fixed-size latency histogram."""
+        for i in range(1, 1001):
+            analytics.record_cache_hit(response_time_ms=float(i))
+
+        metrics = analytics.get_cache_metrics()
+        assert metrics.p50_response_time_ms == pytest.approx(500, rel=0.04)
+        assert metrics.p95_response_time_ms == pytest.approx(950, rel=0.04)
+        assert metrics.p99_response_time_ms == pytest.approx(990, rel=0.04)
+        assert metrics.avg_response_time_ms == pytest.approx(500.5)
+        # Memory is bounded by bucket count, not sample count
+        assert len(analytics.metrics["latency_histogram"]["buckets"]) < 200
+
+    def test_recording_does_not_write_until_flush(self, analytics, temp_cache_root):
+        """Test that records are buffered and flushed to an append-only log."""
+        analytics.record_cache_hit(response_time_ms=5.0)
+        analytics.record_cache_miss()
+        assert not (temp_cache_root / ".metrics.log").exists()
+
+        analytics.flush()
+        log_lines = (temp_cache_root / ".metrics.log").read_text().splitlines()
+        assert len(log_lines) == 1
+
+    def test_log_compaction_preserves_totals(self, temp_cache_root):
+        """Test that compacting the log into the snapshot keeps all counts."""
+        from tapps_agents.context7.metrics_recorder import MetricsRecorder
+
+        recorder = MetricsRecorder(temp_cache_root, flush_interval=0, compact_after=3)
+        # flush_interval=0: every record is appended; records 1-3 are compacted
+        for _ in range(4):
+            recorder.increment("cache_hits")
+        recorder.record_latency(2.0)
+
+        reloaded = MetricsRecorder(temp_cache_root)
+        assert reloaded.counters()["cache_hits"] == 4
+        assert reloaded.latency().count == 1
+        assert len((temp_cache_root / ".metrics.log").read_text().splitlines()) == 2
+
+    def test_legacy_response_times_are_imported(self, temp_cache_root):
+        """Test that a pre-histogram .metrics.yaml is still read."""
+        import yaml
+
+        from tapps_agents.context7.metrics_recorder import MetricsRecorder
+
+        (temp_cache_root / ".metrics.yaml").write_text(
+            yaml.safe_dump({"cache_hits": 3, "response_times": [10.0, 20.0, 30.0]})
+        )
+        recorder = MetricsRecorder(temp_cache_root)
+        assert recorder.counters()["cache_hits"] == 3
+        assert recorder.latency().mean_ms == 20.0
 
     def test_average_response_time_calculation(self, analytics):
         analytics.record_cache_hit(response_time_ms=10.0)
@@ -263,11 +297,19 @@ class TestAnalytics:
         analytics1.record_cache_hit()
         analytics1.record_cache_miss()
 
-        # Create new instance (should load from file)
+        # New instances share the process-wide recorder
         analytics2 = Analytics(cache_structure, metadata_manager)
         assert analytics2.metrics["cache_hits"] == 1
         assert analytics2.metrics["cache_misses"] == 1
 
+        # A fresh process reads flushed metrics from disk
+        from tapps_agents.context7.metrics_recorder import MetricsRecorder
+
+        analytics1.flush()
+        recorder = MetricsRecorder(temp_cache_root)
+        assert recorder.counters()["cache_hits"] == 1
+        assert recorder.counters()["cache_misses"] == 1
+
     def test_hit_rate_calculation(self, analytics):
         # 80% hit rate
         for _ in range(8):
@@ -0,0 +1,80 @@
+"""
+Unit tests for Context7 cache pre-warming.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from tapps_agents.context7.cache_prewarm import CachePrewarmer
+from tapps_agents.context7.lookup import LookupResult
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "requirements.txt").write_text(
+        "fastapi>=0.100\nhttpx\npydantic\ncelery\n", encoding="utf-8"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def helper(project):
+    helper = Mock()
+    helper.project_root = project
+    helper.is_library_cached = Mock(side_effect=lambda name: name == "pydantic")
+    helper.kb_lookup.lookup_many = AsyncMock(
+        side_effect=lambda requests, **kwargs: [
+            LookupResult(
+                success=name != "celery",
+                library=name,
+                topic=topic,
+                source="api",
+                error="Context7 fetch timed out after 10.0s" if name == "celery" else None,
+                timed_out=name == "celery",
+            )
+            for name, topic in requests
+        ]
+    )
+    return helper
+
+
+class TestCachePrewarmer:
+    @pytest.mark.asyncio
+    async def test_prewarm_uses_one_batch(self, helper, project):
+        prewarmer = CachePrewarmer(helper, project_root=project, max_concurrent=4)
+
+        result = await prewarmer.prewarm()
+
+        helper.kb_lookup.lookup_many.assert_awaited_once()
+        requests = helper.kb_lookup.lookup_many.await_args.args[0]
+        assert sorted(requests) == [
+            ("celery", "overview"), ("fastapi", "overview"), ("httpx", "overview"),
+        ]
+        assert helper.kb_lookup.lookup_many.await_args.kwargs["max_concurrency"] == 4
+        assert result.libraries == {
+            "fastapi": "success", "httpx": "success", "pydantic": "skipped", "celery": "timeout",
+        }
+        assert (result.successful, result.skipped, result.failed) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_batch_error_marks_libraries_failed(self, helper, project):
+        helper.kb_lookup.lookup_many = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await CachePrewarmer(helper, project_root=project).prewarm(skip_cached=False)
+
+        assert set(result.libraries.values()) == {"error"}
+        assert result.failed == 4
+
+    @pytest.mark.asyncio
+    async def test_missing_kb_lookup_marks_libraries_failed(self, helper, project):
+        helper.kb_lookup = None
+
+        result = await CachePrewarmer(helper, project_root=project).prewarm()
+
+        assert result.libraries == {
+            "fastapi": "error", "httpx": "error", "pydantic": "skipped", "celery": "error",
+        }
+        assert (result.successful, result.skipped, result.failed) == (0, 1, 3)
@@ -0,0 +1,168 @@
+"""
+Unit tests for the Context7 fuzzy trigram index.
+"""
+
+import random
+import string
+
+import pytest
+import yaml
+
+from tapps_agents.context7.fuzzy_index import (
+    INDEX_FILENAME,
+    FuzzyIndex,
+    ngrams,
+    similarity_upper_bound,
+)
+from tapps_agents.context7.fuzzy_matcher import FuzzyMatcher, _lcs_length
+from tapps_agents.context7.kb_cache import KBCache
+
+pytestmark = pytest.mark.unit
+
+WORDS = [
+    "react", "fastapi", "django", "pytest", "pydantic", "vue", "express",
+    "routing", "hooks", "overview", "auth", "models", "testing", "middleware",
+]
+
+
+def _random_name(rnd: random.Random) -> str:
+    word = rnd.choice(WORDS)
+    if rnd.random() < 0.5:
+        i = rnd.randrange(len(word) + 1)
+        word = word[:i] + rnd.choice(string.ascii_lowercase + "-_") + word[i:]
+    if rnd.random() < 0.3:
+        word += str(rnd.randint(0, 9))
+    return word
+
+
+def _write_index(path, libraries):
+    data = {
+        lib: {"topics": {topic: {} for topic in topics}} for lib, topics in libraries.items()
+    }
+    path.write_text(yaml.safe_dump({"libraries": data}), encoding="utf-8")
+
+
+def _key(match):
+    return (match.library, match.topic, round(match.score, 9))
+
+
+class TestSimilarityBound:
+    def test_ngrams_are_padded_and_lowercased(self):
+        assert ngrams("Ab") == {" ab", "ab "}
+        assert ngrams("") == set()
+
+    def test_bound_never_below_lcs_ratio(self):
+        rnd = random.Random(3)
+        for _ in range(2000):
+            a = _random_name(rnd)
+            b = _random_name(rnd)
+            ga, gb = ngrams(a), ngrams(b)
+            bound = similarity_upper_bound(len(a), len(ga), len(b), len(gb), len(ga & gb))
+            ratio = 2 * _lcs_length(a, b) / (len(a) + len(b))
+            assert bound >= ratio - 1e-12, (a, b)
+
+    def test_identical_strings_bound_is_one(self):
+        g = len(ngrams("routing"))
+        assert similarity_upper_bound(7, g, 7, g, g) == 1.0
+
+
+class TestFuzzyIndexQueries:
+    @pytest.fixture
+    def libraries(self):
+        rnd = random.Random(11)
+        libraries: dict[str, set[str]] = {}
+        for _ in range(60):
+            topics = libraries.setdefault(_random_name(rnd), set())
+            topics.update(_random_name(rnd) for _ in range(rnd.randint(1, 15)))
+        return libraries
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85])
+    def test_same_results_as_full_scan(self, tmp_path, libraries, threshold):
+        _write_index(tmp_path / "index.yaml", libraries)
+        index = FuzzyIndex(tmp_path / "index.yaml")
+        entries = [(lib, topic) for lib, topics in libraries.items() for topic in topics]
+        matcher = FuzzyMatcher(threshold=threshold)
+
+        rnd = random.Random(5)
+        for _ in range(40):
+            lib_q, topic_q = _random_name(rnd), _random_name(rnd)
+            full = matcher.find_matching_entry(lib_q, topic_q, entries, max_results=10_000)
+            indexed = matcher.find_matching_entry_indexed(
+                lib_q, topic_q, index, max_results=10_000
+            )
+            assert sorted(map(_key, indexed)) == sorted(map(_key, full))
+
+    def test_prunes_candidates(self, tmp_path, libraries):
+        _write_index(tmp_path / "index.yaml", libraries)
+        index = FuzzyIndex(tmp_path / "index.yaml")
+        matcher = FuzzyMatcher(threshold=0.8)
+
+        candidates = index.candidate_entries(
+            "fastapi", "routing", 0.8, 0.6, matcher._calculate_similarity
+        )
+        assert 0 < len(candidates) < len(index.entries())
+
+    def test_persisted_index_is_reused(self, tmp_path, libraries, monkeypatch):
+        _write_index(tmp_path / "index.yaml", libraries)
+        FuzzyIndex(tmp_path / "index.yaml").entries()
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+        def fail_rebuild(self, stamp):
+            raise AssertionError("index should load from disk")
+
+        monkeypatch.setattr(FuzzyIndex, "_rebuild", fail_rebuild)
+        fresh = FuzzyIndex(tmp_path / "index.yaml")
+        expected = {(lib, topic) for lib, topics in libraries.items() for topic in topics}
+        assert set(fresh.entries()) == expected
+
+    def test_external_write_triggers_rebuild(self, tmp_path):
+        _write_index(tmp_path / "index.yaml", {"react": ["hooks"]})
+        index = FuzzyIndex(tmp_path / "index.yaml")
+        assert index.entries() == [("react", "hooks")]
+
+        _write_index(tmp_path / "index.yaml", {"vue": ["routing", "state"]})
+        assert sorted(index.entries()) == [("vue", "routing"), ("vue", "state")]
+
+
+class TestKBCacheIntegration:
+    def test_store_and_delete_update_index_incrementally(self, tmp_path, monkeypatch):
+        cache = KBCache(cache_root=tmp_path / "cache")
+        cache.store("react", "hooks", "# Hooks")
+        index = cache.fuzzy_index
+        assert index.entries() == [("react", "hooks")]
+
+        rebuilds = []
+        original = FuzzyIndex._rebuild
+        monkeypatch.setattr(
+            FuzzyIndex, "_rebuild", lambda self, stamp: rebuilds.append(stamp) or original(self, stamp)
+        )
+
+        cache.store("react", "routing", "# Routing")
+        cache.store("fastapi", "routing", "# Routing")
+        assert sorted(index.entries()) == [
+            ("fastapi", "routing"), ("react", "hooks"), ("react", "routing"),
+        ]
+
+        cache.delete("react", "hooks")
+        cache.delete("fastapi")
+        assert index.entries() == [("react", "routing")]
+        assert rebuilds == []
+
+        matches = FuzzyMatcher(threshold=0.7).find_matching_entry_indexed(
+            "reactt", "routing", index
+        )
+        assert [(m.library, m.topic) for m in matches] == [("react", "routing")]
+
+    def test_save_writes_incremental_changes(self, tmp_path, monkeypatch):
+        cache = KBCache(cache_root=tmp_path / "cache")
+        cache.store("react", "hooks", "# Hooks")
+        cache.fuzzy_index.entries()
+        cache.store("vue", "state", "# State")
+        assert cache.fuzzy_index.save()
+
+        def fail_rebuild(self, stamp):
+            raise AssertionError("index should load from disk")
+
+        monkeypatch.setattr(FuzzyIndex, "_rebuild", fail_rebuild)
+        fresh = FuzzyIndex(cache.cache_structure.index_file)
+        assert sorted(fresh.entries()) == [("react", "hooks"), ("vue", "state")]
@@ -2,9 +2,11 @@
 Unit tests for Context7 fuzzy matcher.
 """
 
+import random
+
 import pytest
 
-from tapps_agents.context7.fuzzy_matcher import FuzzyMatch, FuzzyMatcher
+from tapps_agents.context7.fuzzy_matcher import FuzzyMatch, FuzzyMatcher, _lcs_length
 
 pytestmark = pytest.mark.unit
 
@@ -178,3 +180,31 @@ class TestFuzzyMatcher:
         assert len(matches) > 0
         assert matches[0].library == "react"
         assert matches[0].topic == "hooks"
+
+
+def _lcs_dp(a: str, b: str) -> int:
+    dp = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            if a[i - 1] == b[j - 1]:
+                dp[i][j] = dp[i - 1][j - 1] + 1
+            else:
+                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+    return dp[-1][-1]
+
+
+class TestBitParallelLCS:
+    @pytest.mark.parametrize(
+        ("a", "b", "expected"),
+        [("", "abc", 0), ("abc", "abc", 3), ("react", "react-dom", 5), ("abcd", "xyz", 0)],
+    )
+    def test_known_values(self, a, b, expected):
+        assert _lcs_length(a, b) == expected
+        assert _lcs_length(b, a) == expected
+
+    def test_matches_dynamic_programming(self):
+        rnd = random.Random(7)
+        for _ in range(500):
+            a = "".join(rnd.choice("abc-") for _ in range(rnd.randint(0, 70)))
+            b = "".join(rnd.choice("abc-") for _ in range(rnd.randint(0, 70)))
+            assert _lcs_length(a, b) == _lcs_dp(a, b)
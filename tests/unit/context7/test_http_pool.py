@@ -0,0 +1,283 @@
+"""
+Unit tests for the pooled Context7 HTTP client and its circuit breaker integration.
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from tapps_agents.context7 import backup_client, http_pool
+from tapps_agents.context7.backup_client import create_async_fallback_http_client
+from tapps_agents.context7.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerOpen,
+    CircuitState,
+    get_context7_circuit_breaker,
+)
+from tapps_agents.context7.http_pool import Context7HttpPool
+from tapps_agents.core.offline_mode import OfflineMode
+
+pytestmark = pytest.mark.unit
+
+
+class FakeContext7:
+    """MockTransport handler emulating the Context7 search and docs endpoints."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.status = 200
+        self.error: Exception | None = None
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            if self.status != 200:
+                return httpx.Response(self.status, json={"message": "Monthly quota exceeded"})
+            if request.url.path.endswith("/search"):
+                query = request.url.params["query"]
+                return httpx.Response(200, json={"results": [{"id": f"/org/{query}"}]})
+            return httpx.Response(
+                200,
+                json={"snippets": [{"codeTitle": "Usage", "codeList": [{"code": "x = 1", "language": "python"}]}]},
+            )
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    fake = FakeContext7()
+    pool = Context7HttpPool(transport=httpx.MockTransport(fake))
+    monkeypatch.setattr(http_pool, "_pool", pool)
+    monkeypatch.setenv("CONTEXT7_API_KEY", "test-key")
+    monkeypatch.setenv("CONTEXT7_API_URL", "https://context7.test/api/v2")
+    monkeypatch.setattr(backup_client, "_CONTEXT7_QUOTA_EXCEEDED", False)
+    monkeypatch.setattr(backup_client, "_CONTEXT7_QUOTA_MESSAGE", None)
+    monkeypatch.setattr(OfflineMode, "_offline_mode", False)
+    monkeypatch.setattr(OfflineMode, "_connection_failures", 0)
+    breaker = get_context7_circuit_breaker()
+    breaker.reset()
+    yield fake
+    breaker.reset()
+
+
+class TestContext7HttpPool:
+    @pytest.mark.asyncio
+    async def test_client_is_reused_within_loop(self):
+        pool = Context7HttpPool(transport=httpx.MockTransport(FakeContext7()))
+        client = pool.async_client()
+        await pool.get("https://context7.test/api/v2/search?query=a")
+        await pool.get("https://context7.test/api/v2/search?query=b")
+        assert pool.async_client() is client
+        await pool.aclose()
+        assert client.is_closed
+
+    def test_each_event_loop_gets_own_client(self):
+        pool = Context7HttpPool(transport=httpx.MockTransport(FakeContext7()))
+
+        async def client():
+            return pool.async_client()
+
+        clients = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(asyncio.run(client())))
+            for _ in range(2)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(clients) == 2
+        assert clients[0] is not clients[1]
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit_bounds_concurrency(self):
+        fake = FakeContext7(delay=0.02)
+        pool = Context7HttpPool(transport=httpx.MockTransport(fake), max_per_host=3)
+        await asyncio.gather(
+            *(pool.get(f"https://context7.test/api/v2/search?query={i}") for i in range(12))
+        )
+        assert len(fake.requests) == 12
+        assert fake.max_in_flight == 3
+
+    def test_http2_follows_h2_availability(self):
+        assert Context7HttpPool().http2 is http_pool.H2_AVAILABLE
+        assert Context7HttpPool(http2=False).http2 is False
+
+    def test_sync_client_is_shared(self):
+        pool = Context7HttpPool()
+        assert pool.sync_client() is pool.sync_client()
+        pool.close()
+
+    def test_loop_shutdown_closes_client(self):
+        pool = Context7HttpPool(transport=httpx.MockTransport(FakeContext7()))
+
+        async def request():
+            await pool.get("https://context7.test/api/v2/search?query=a")
+            return pool.async_client()
+
+        client = asyncio.run(request())
+        assert client.is_closed
+
+    def test_close_closes_clients_of_open_loops(self):
+        pool = Context7HttpPool(transport=httpx.MockTransport(FakeContext7()))
+        loop = asyncio.new_event_loop()
+
+        async def client():
+            return pool.async_client()
+
+        try:
+            async_client = loop.run_until_complete(client())
+            pool.close()
+            assert async_client.is_closed
+            assert not pool._loops
+        finally:
+            loop.close()
+
+
+class TestHalfOpenLimit:
+    @staticmethod
+    def half_open_breaker():
+        breaker = CircuitBreaker(CircuitBreakerConfig(success_threshold=2))
+        breaker.trip("test")
+        breaker._stats.last_failure_time -= breaker.config.reset_timeout_seconds
+        return breaker
+
+    @pytest.mark.asyncio
+    async def test_allow_request_limits_half_open_probes(self):
+        breaker = self.half_open_breaker()
+
+        assert breaker.allow_request() and breaker.allow_request()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is False
+        assert breaker.stats.rejected_requests == 1
+
+        breaker.release()
+        assert breaker.allow_request() is True
+
+    @pytest.mark.asyncio
+    async def test_recorded_results_free_half_open_slots(self):
+        breaker = CircuitBreaker(CircuitBreakerConfig(success_threshold=3, half_open_max_requests=1))
+        breaker.trip("test")
+        breaker._stats.last_failure_time -= breaker.config.reset_timeout_seconds
+
+        for _ in range(3):
+            assert breaker.allow_request() is True
+            assert breaker.allow_request() is False
+            await breaker.record_result(True)
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_call_limits_half_open_probes(self):
+        breaker = self.half_open_breaker()
+        started = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def probe():
+            started.set()
+            await finish.wait()
+            return "ok"
+
+        probes = [asyncio.create_task(breaker.call(probe)) for _ in range(2)]
+        await started.wait()
+        with pytest.raises(CircuitBreakerOpen):
+            await breaker.call(probe)
+        finish.set()
+
+        assert await asyncio.gather(*probes) == ["ok", "ok"]
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_frees_half_open_slot(self):
+        breaker = self.half_open_breaker()
+        blocked = [asyncio.create_task(breaker.call(asyncio.sleep, 10)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for task in blocked:
+            task.cancel()
+        await asyncio.gather(*blocked, return_exceptions=True)
+
+        assert breaker.allow_request() is True
+
+
+class TestAsyncFallbackClient:
+    @pytest.mark.asyncio
+    async def test_resolve_and_docs(self, fake_api):
+        resolve, get_docs = create_async_fallback_http_client()
+
+        resolved = await resolve("react")
+        docs = await get_docs("/org/react", "hooks")
+
+        assert resolved["result"]["matches"][0]["id"] == "/org/react"
+        assert "x = 1" in docs["result"]["content"]
+        docs_request = fake_api.requests[1]
+        assert docs_request.url.path == "/api/v2/docs/code/org/react"
+        assert docs_request.url.params["topic"] == "hooks"
+        assert docs_request.headers["Authorization"] == "Bearer test-key"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_pooled_client(self, fake_api):
+        resolve, _ = create_async_fallback_http_client()
+        results = await asyncio.gather(*(resolve(f"lib{i}") for i in range(20)))
+        assert all(r["success"] for r in results)
+        assert len(http_pool._pool._loops) == 1
+
+    @pytest.mark.asyncio
+    async def test_quota_error_trips_breaker(self, fake_api):
+        fake_api.status = 429
+        resolve, get_docs = create_async_fallback_http_client()
+
+        result = await resolve("react")
+
+        assert result["success"] is False
+        assert "quota exceeded" in result["error"]
+        assert get_context7_circuit_breaker().state == CircuitState.OPEN
+        await get_docs("/org/react")
+        assert len(fake_api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_rejects_without_request(self, fake_api):
+        breaker = get_context7_circuit_breaker()
+        breaker.trip("test")
+        _, get_docs = create_async_fallback_http_client()
+
+        result = await get_docs("/org/react")
+
+        assert result["success"] is False
+        assert "OPEN" in result["error"]
+        assert fake_api.requests == []
+        assert breaker.stats.rejected_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_open_breaker(self, fake_api):
+        fake_api.error = httpx.ReadTimeout("timed out")
+        _, get_docs = create_async_fallback_http_client()
+        breaker = get_context7_circuit_breaker()
+
+        for _ in range(breaker.config.failure_threshold):
+            assert (await get_docs("/org/react"))["success"] is False
+        assert breaker.state == CircuitState.OPEN
+
+        await get_docs("/org/react")
+        assert len(fake_api.requests) == breaker.config.failure_threshold
+
+    @pytest.mark.asyncio
+    async def test_breaker_closes_after_half_open_successes(self, fake_api):
+        breaker = get_context7_circuit_breaker()
+        breaker.trip("test")
+        breaker._stats.last_failure_time -= breaker.config.reset_timeout_seconds
+        resolve, _ = create_async_fallback_http_client()
+
+        for _ in range(breaker.config.success_threshold):
+            assert (await resolve("react"))["success"] is True
+        assert breaker.state == CircuitState.CLOSED
@@ -145,3 +145,64 @@ class TestKBCache:
         
         retrieved = cache.get("test-lib", "test-topic")
         assert retrieved is None
+
+
+class TestKBCacheHotTier:
+    """Tests for the in-memory hot tier in front of the disk cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        """KBCache with one entry whose doc file is older than the racy window."""
+        import os
+        import time
+
+        from tapps_agents.context7 import kb_cache as kb_cache_module
+        from tapps_agents.context7 import metadata as metadata_module
+
+        kb_cache_module._hot_tier.clear()
+        metadata_module._hit_buffer.clear()
+        # Keep the periodic flush from firing in long-lived test processes
+        monkeypatch.setattr(metadata_module._hit_buffer, "_last_flush", time.monotonic())
+        cache = KBCache(cache_dir=tmp_path / "cache")
+        cache.cache_structure.ensure_library_dir("react")
+        doc_file = cache.cache_structure.get_library_doc_file("react", "hooks")
+        doc_file.write_text(
+            CacheEntry(library="react", topic="hooks", content="useState").to_markdown(),
+            encoding="utf-8",
+        )
+        old = doc_file.stat().st_mtime_ns - 10_000_000_000
+        os.utime(doc_file, ns=(old, old))
+        return cache
+
+    def test_repeat_hit_skips_disk_read_and_metadata_write(self, cache):
+        """Test that a second hit is served from memory without writes."""
+        first = cache.get("react", "hooks")
+        assert first is not None
+
+        meta_file = cache.cache_structure.get_library_meta_file("react")
+        with patch("pathlib.Path.read_text", side_effect=AssertionError("disk read")):
+            second = cache.get("react", "hooks")
+
+        assert second.content == "useState"
+        assert second is not first
+        assert not meta_file.exists()
+        assert cache.metadata_manager.load_library_metadata("react").cache_hits == 2
+        cache.metadata_manager.flush_hits()
+        assert meta_file.exists()
+
+    def test_modified_file_is_reloaded(self, cache):
+        """Test that a changed doc file is not served from memory."""
+        cache.get("react", "hooks")
+        doc_file = cache.cache_structure.get_library_doc_file("react", "hooks")
+        doc_file.write_text(
+            CacheEntry(library="react", topic="hooks", content="useEffect").to_markdown(),
+            encoding="utf-8",
+        )
+
+        assert cache.get("react", "hooks").content == "useEffect"
+
+    def test_delete_drops_hot_entry(self, cache):
+        """Test that deleted entries are not served from memory."""
+        cache.get("react", "hooks")
+        assert cache.delete("react", "hooks")
+        assert cache.get("react", "hooks") is None
@@ -360,3 +360,241 @@ class TestLibraryIDExtraction:
         # Error message should reference the library ID even if not preserved in result
         assert "/facebook/react" in result.error or "react" in result.error
         assert result.source == "api"  # Should indicate API failure
+
+
+class FakeUpstream:
+    """Slow fake Context7 resolve/docs clients that count calls."""
+
+    def __init__(self, delay: float = 0.2):
+        import threading
+
+        self.delay = delay
+        self.resolve = 0
+        self.docs = 0
+        self.docs_in_flight = 0
+        self.max_docs_in_flight = 0
+        self.unknown_libraries: set[str] = set()
+        self.failing_topics: set[str] = set()
+        self._lock = threading.Lock()
+
+    async def resolve_library(self, library_name, mcp_gateway=None):
+        import asyncio
+
+        with self._lock:
+            self.resolve += 1
+        await asyncio.sleep(self.delay)
+        if library_name in self.unknown_libraries:
+            return {"success": True, "result": {"matches": []}}
+        return {"success": True, "result": {"matches": [{"id": f"/org/{library_name}"}]}}
+
+    async def get_docs(self, context7_id, topic=None, mode="code", page=1, mcp_gateway=None):
+        import asyncio
+
+        with self._lock:
+            self.docs += 1
+            self.docs_in_flight += 1
+            self.max_docs_in_flight = max(self.max_docs_in_flight, self.docs_in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.docs_in_flight -= 1
+        if topic in self.failing_topics:
+            return {"success": False, "error": "API returned status 500"}
+        return {"success": True, "result": {"content": f"# {context7_id} {topic}"}}
+
+
+@pytest.fixture
+def upstream():
+    """Patch the Context7 clients with a FakeUpstream."""
+    fake = FakeUpstream()
+    with (
+        patch(
+            "tapps_agents.context7.backup_client.call_context7_resolve_with_fallback",
+            side_effect=fake.resolve_library,
+        ),
+        patch(
+            "tapps_agents.context7.backup_client.call_context7_get_docs_with_fallback",
+            side_effect=fake.get_docs,
+        ),
+    ):
+        yield fake
+
+
+class TestConcurrentMissCoalescing:
+    """Concurrent misses for the same entry trigger a single upstream fetch."""
+
+    @pytest.mark.asyncio
+    async def test_same_loop_misses_share_fetch(self, tmp_path, upstream):
+        import asyncio
+
+        cache = KBCache(cache_root=tmp_path / "cache")
+        results = await asyncio.gather(
+            *(KBLookup(kb_cache=cache).lookup("lib", "hooks") for _ in range(5))
+        )
+
+        assert (upstream.resolve, upstream.docs) == (1, 1)
+        assert all(r.success and r.content == "# /org/lib hooks" for r in results)
+        assert len({id(r) for r in results}) == 5
+        assert cache.get("lib", "hooks") is not None
+
+    def test_threaded_misses_share_fetch(self, tmp_path, upstream):
+        import asyncio
+        import threading
+
+        cache = KBCache(cache_root=tmp_path / "cache")
+        barrier = threading.Barrier(8)
+        results = []
+        stores = []
+        original_store = cache.store
+
+        def counting_store(*args, **kwargs):
+            stores.append(args)
+            return original_store(*args, **kwargs)
+
+        cache.store = counting_store
+
+        def worker():
+            barrier.wait()
+            results.append(asyncio.run(KBLookup(kb_cache=cache).lookup("lib", "hooks")))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert (upstream.resolve, upstream.docs) == (1, 1)
+        assert len(stores) == 1
+        assert len(results) == 8 and all(r.success for r in results)
+
+    @pytest.mark.asyncio
+    async def test_different_topics_fetch_separately(self, tmp_path, upstream):
+        import asyncio
+
+        cache = KBCache(cache_root=tmp_path / "cache")
+        lookup = KBLookup(kb_cache=cache)
+        await asyncio.gather(lookup.lookup("lib", "hooks"), lookup.lookup("lib", "routing"))
+
+        assert upstream.docs == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_lease_is_released(self, tmp_path, upstream):
+        from tapps_agents.context7.cache_locking import CacheLock, get_fetch_lease_file
+
+        cache = KBCache(cache_root=tmp_path / "cache")
+        lookup = KBLookup(kb_cache=cache, fetch_lease_timeout=5.0)
+        result = await lookup.lookup("lib", "hooks")
+
+        assert result.success and result.source == "api"
+        assert upstream.docs == 1
+        lease = CacheLock(get_fetch_lease_file(cache.cache_root, "lib", "hooks"), timeout=0.5)
+        assert lease.acquire()
+        lease.release()
+
+    @pytest.mark.asyncio
+    async def test_fetch_lease_is_released_when_cancelled_while_acquiring(
+        self, tmp_path, upstream, monkeypatch
+    ):
+        import asyncio
+        import threading
+
+        from tapps_agents.context7.cache_locking import CacheLock, get_fetch_lease_file
+
+        acquiring = threading.Event()
+        proceed = threading.Event()
+        original_acquire = CacheLock.acquire
+
+        def slow_acquire(self):
+            acquiring.set()
+            proceed.wait(5)
+            return original_acquire(self)
+
+        monkeypatch.setattr(CacheLock, "acquire", slow_acquire)
+        cache = KBCache(cache_root=tmp_path / "cache")
+        lookup = KBLookup(kb_cache=cache, fetch_lease_timeout=5.0)
+        task = asyncio.create_task(lookup.lookup("lib", "hooks"))
+        await asyncio.to_thread(acquiring.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        proceed.set()
+        await asyncio.sleep(0.1)
+
+        assert not get_fetch_lease_file(cache.cache_root, "lib", "hooks").exists()
+        assert upstream.docs == 0
+
+
+class TestLookupMany:
+    """Batched lookups resolve each library once and fetch topics concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_each_library_once(self, tmp_path, upstream):
+        cache = KBCache(cache_root=tmp_path / "cache")
+        lookup = KBLookup(kb_cache=cache)
+        requests = [("lib", "hooks"), ("lib", "routing"), ("lib", "state"), ("other", None)]
+
+        results = await lookup.lookup_many(requests)
+
+        assert upstream.resolve == 2
+        assert upstream.docs == 4
+        assert upstream.max_docs_in_flight >= 3
+        assert [(r.library, r.topic) for r in results] == [
+            ("lib", "hooks"), ("lib", "routing"), ("lib", "state"), ("other", "overview"),
+        ]
+        assert all(r.success and r.source == "api" for r in results)
+        assert cache.get("lib", "routing").context7_id == "/org/lib"
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_skip_network(self, tmp_path, upstream):
+        cache = KBCache(cache_root=tmp_path / "cache")
+        cache.store("lib", "hooks", "# cached", context7_id="/org/lib")
+        lookup = KBLookup(kb_cache=cache)
+
+        results = await lookup.lookup_many([("lib", "hooks"), ("lib", "routing")])
+
+        assert [r.source for r in results] == ["cache", "api"]
+        assert upstream.docs == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_results_report_per_item_status(self, tmp_path, upstream):
+        upstream.unknown_libraries.add("missing")
+        upstream.failing_topics.add("broken")
+        lookup = KBLookup(kb_cache=KBCache(cache_root=tmp_path / "cache"))
+
+        results = await lookup.lookup_many(
+            [("lib", "hooks"), ("flaky", "broken"), ("missing", "hooks"), ("missing", "state")]
+        )
+
+        assert [r.success for r in results] == [True, False, False, False]
+        assert "Failed to fetch documentation" in results[1].error
+        assert "Could not resolve library ID for 'missing'" in results[2].error
+        assert results[3].topic == "state"
+        assert upstream.resolve == 3
+
+    @pytest.mark.asyncio
+    async def test_item_timeout(self, tmp_path, upstream):
+        upstream.delay = 0.5
+        lookup = KBLookup(kb_cache=KBCache(cache_root=tmp_path / "cache"))
+
+        (result,) = await lookup.lookup_many([("lib", "hooks")], item_timeout=0.05)
+
+        assert result.success is False
+        assert "timed out" in result.error
+
+    @pytest.mark.asyncio
+    async def test_streams_results_and_dedupes(self, tmp_path, upstream):
+        cache = KBCache(cache_root=tmp_path / "cache")
+        lookup = KBLookup(kb_cache=cache)
+        stored_when_reported = []
+
+        def on_result(result):
+            stored_when_reported.append(cache.exists(result.library, result.topic))
+
+        results = await lookup.lookup_many(
+            [("lib", "hooks"), ("lib", "hooks"), ("lib", "routing")], on_result=on_result
+        )
+
+        assert results[0] is results[1]
+        assert upstream.docs == 2
+        assert stored_when_reported == [True, True]
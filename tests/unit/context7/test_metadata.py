@@ -188,6 +188,37 @@ class TestMetadataManager:
         metadata = metadata_manager.load_library_metadata("react")
         assert metadata.cache_hits == 2
 
+    def test_record_hit_is_buffered_until_flush(self, metadata_manager, monkeypatch):
+        """Test that hits are visible immediately but written only on flush."""
+        import time
+
+        from tapps_agents.context7 import metadata as metadata_module
+
+        metadata_module._hit_buffer.clear()
+        # Keep the periodic flush from firing in long-lived test processes
+        monkeypatch.setattr(metadata_module._hit_buffer, "_last_flush", time.monotonic())
+        metadata_manager.save_library_metadata(LibraryMetadata(library="react"))
+        meta_file = metadata_manager.cache_structure.get_library_meta_file("react")
+        before = meta_file.read_text()
+
+        metadata_manager.record_hit("react")
+        metadata_manager.record_hit("react")
+
+        assert meta_file.read_text() == before
+        assert metadata_manager.load_library_metadata("react").cache_hits == 2
+
+        assert metadata_manager.flush_hits() == 1
+        assert "cache_hits: 2" in meta_file.read_text()
+        assert metadata_manager.load_library_metadata("react").cache_hits == 2
+
+    def test_update_library_metadata_folds_buffered_hits(self, metadata_manager):
+        """Test that a metadata write includes pending hits exactly once."""
+        metadata_manager.record_hit("react")
+        metadata_manager.update_library_metadata("react", topic="hooks")
+        metadata_manager.flush_hits()
+
+        assert metadata_manager.load_library_metadata("react").cache_hits == 1
+
     def test_update_cache_index(self, metadata_manager):
         """Test updating cache index."""
         metadata_manager.update_cache_index(
@@ -0,0 +1,121 @@
+"""
+Unit tests for Context7 single-flight request coalescing.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from tapps_agents.context7.single_flight import SingleFlight
+
+pytestmark = pytest.mark.unit
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "doc"
+
+        results = await asyncio.gather(*(flights.do("k", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["doc"] * 5
+        assert sorted(shared for _, shared in results) == [False] + [True] * 4
+        assert not flights.in_flight("k")
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_independently(self):
+        flights = SingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            flights.do("a", lambda: fetch(1)), flights.do("b", lambda: fetch(2))
+        )
+        assert results == [(1, False), (2, False)]
+
+    @pytest.mark.asyncio
+    async def test_leader_exception_reaches_waiters(self):
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.02)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(
+            *(flights.do("k", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert not flights.in_flight("k")
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_cancelled(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        leader = asyncio.create_task(flights.do("k", fetch))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(flights.do("k", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await waiter == (2, False)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_flight(self):
+        flights = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "doc"
+
+        leader = asyncio.create_task(flights.do("k", fetch))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(flights.do("k", fetch))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+
+        assert await leader == ("doc", False)
+
+    def test_coalesces_across_threads_and_event_loops(self):
+        flights = SingleFlight()
+        calls = 0
+        barrier = threading.Barrier(4)
+        results = []
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.2)
+            return "doc"
+
+        def worker():
+            barrier.wait()
+            results.append(asyncio.run(flights.do("k", fetch)))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["doc"] * 4
@@ -0,0 +1,144 @@
+"""
+Unit tests for AdaptiveConcurrencyController (AIMD concurrency limit).
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from tapps_agents.core.adaptive_concurrency import (
+    AdaptiveConcurrencyController,
+    ConcurrencyConfig,
+)
+from tapps_agents.core.hardware_profiler import HardwareMetrics
+from tapps_agents.core.resource_monitor import ResourceMetrics
+
+pytestmark = pytest.mark.unit
+
+
+def _metrics(cpu: float = 20.0, memory: float = 40.0) -> ResourceMetrics:
+    return ResourceMetrics(
+        timestamp="2026-01-01T00:00:00+00:00",
+        cpu_percent=cpu,
+        memory_percent=memory,
+        memory_used_mb=0.0,
+        memory_available_mb=0.0,
+        disk_percent=0.0,
+        disk_used_gb=0.0,
+        disk_free_gb=0.0,
+    )
+
+
+def _controller(
+    cores: int = 8, cpu: float = 20.0, memory: float = 40.0, **config
+) -> AdaptiveConcurrencyController:
+    monitor = MagicMock()
+    monitor.get_current_metrics.return_value = _metrics(cpu, memory)
+    profiler = MagicMock()
+    profiler.get_metrics.return_value = HardwareMetrics(
+        cpu_cores=cores,
+        ram_gb=16.0,
+        disk_free_gb=100.0,
+        disk_total_gb=200.0,
+        disk_type="ssd",
+        cpu_arch="x86_64",
+    )
+    config.setdefault("sample_interval", 0.0)
+    config.setdefault("decrease_cooldown", 0.0)
+    return AdaptiveConcurrencyController(
+        ConcurrencyConfig(**config), resource_monitor=monitor, hardware_profiler=profiler
+    )
+
+
+async def _succeed(controller: AdaptiveConcurrencyController, count: int) -> None:
+    for _ in range(count):
+        await controller.record_success(0.1)
+
+
+class TestLimits:
+    def test_max_limit_defaults_to_core_count(self):
+        controller = _controller(cores=6)
+        assert controller.max_limit == 6
+        assert controller.limit == 2
+
+    def test_explicit_max_limit_caps(self):
+        monitor = MagicMock()
+        controller = AdaptiveConcurrencyController(max_limit=1, resource_monitor=monitor)
+        assert controller.max_limit == 1
+        assert controller.limit == 1
+
+
+class TestAIMD:
+    @pytest.mark.asyncio
+    async def test_grows_one_slot_per_round_up_to_max(self):
+        controller = _controller(cores=4)
+
+        await _succeed(controller, 2)
+        assert controller.limit == 3
+        await _succeed(controller, 3)
+        assert controller.limit == 4
+        await _succeed(controller, 20)
+        assert controller.limit == 4
+        assert controller.summary()["increases"] == 2
+
+    def test_overload_halves_limit(self):
+        controller = _controller(cores=16, initial_limit=8)
+
+        controller.record_overload("timeout")
+
+        assert controller.limit == 4
+        assert controller.summary()["last_decrease_reason"] == "timeout"
+
+    def test_overloads_within_cooldown_count_once(self):
+        controller = _controller(cores=16, initial_limit=8, decrease_cooldown=60.0)
+
+        controller.record_overload("timeout")
+        controller.record_overload("timeout")
+
+        assert controller.limit == 4
+        assert controller.decreases == 1
+
+    @pytest.mark.asyncio
+    async def test_high_cpu_holds(self):
+        controller = _controller(cpu=99.0)
+        await _succeed(controller, 10)
+        assert controller.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_memory_pressure_backs_off(self):
+        controller = _controller(memory=97.0, initial_limit=4)
+        await _succeed(controller, 1)
+        assert controller.limit == 2
+        assert controller.last_decrease_reason == "memory"
+
+    @pytest.mark.asyncio
+    async def test_latency_inflation_backs_off(self):
+        controller = _controller(initial_limit=4, latency_smoothing=1.0)
+        await controller.record_success(0.1)
+        await controller.record_success(1.0)
+        assert controller.limit == 2
+        assert controller.last_decrease_reason == "latency"
+
+
+class TestSlots:
+    @pytest.mark.asyncio
+    async def test_in_flight_never_exceeds_limit(self):
+        controller = _controller(cores=3)
+        active = 0
+        peak = 0
+
+        async def work():
+            nonlocal active, peak
+            async with controller.slot():
+                active += 1
+                peak = max(peak, active)
+                assert active <= controller.limit
+                await asyncio.sleep(0.01)
+                active -= 1
+                await controller.record_success(0.01)
+
+        await asyncio.gather(*(work() for _ in range(20)))
+
+        assert controller.in_flight == 0
+        assert peak == controller.max_limit == 3
@@ -0,0 +1,192 @@
+"""
+Tests for the buffered, level-gated tracer.
+"""
+
+import json
+import threading
+
+import pytest
+
+from tapps_agents.core import tracing
+from tapps_agents.core.debug_logger import write_debug_log
+from tapps_agents.core.tracing import (
+    NOOP_SPAN,
+    TraceLevel,
+    Tracer,
+    configure_tracing,
+    get_tracer,
+    parse_trace_level,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def restore_tracer():
+    previous = tracing._tracer
+    yield
+    if tracing._tracer is not None and tracing._tracer is not previous:
+        tracing._tracer.shutdown()
+    tracing._tracer = previous
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestTraceLevel:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, TraceLevel.OFF),
+            ("", TraceLevel.OFF),
+            ("bogus", TraceLevel.OFF),
+            ("1", TraceLevel.DEBUG),
+            ("true", TraceLevel.DEBUG),
+            ("info", TraceLevel.INFO),
+            ("TRACE", TraceLevel.TRACE),
+            ("3", TraceLevel.TRACE),
+            ("9", TraceLevel.TRACE),
+        ],
+    )
+    def test_parse(self, value, expected):
+        assert parse_trace_level(value) is expected
+
+    def test_env_configures_singleton(self, monkeypatch, restore_tracer):
+        monkeypatch.setenv("TAPPS_AGENTS_TRACE", "info")
+        tracing._tracer = None
+        tracer = get_tracer()
+        assert tracer.enabled(TraceLevel.INFO)
+        assert not tracer.enabled(TraceLevel.DEBUG)
+
+
+class TestDisabledTracer:
+    def test_no_work_when_off(self, tmp_path):
+        tracer = Tracer(level=TraceLevel.OFF, log_path=tmp_path / "debug.log")
+        assert tracer.span("op", size=1) is NOOP_SPAN
+        with tracer.span("op") as span:
+            span.set(result=1)
+        tracer.event("something", {"a": 1})
+        assert tracer.flush() == 0
+        assert tracer._writer is None
+        assert not (tmp_path / "debug.log").exists()
+
+    def test_level_filtering(self, tmp_path):
+        tracer = Tracer(level=TraceLevel.INFO, log_path=tmp_path / "debug.log")
+        assert tracer.span("fine", level=TraceLevel.TRACE) is NOOP_SPAN
+        tracer.event("fine", level=TraceLevel.DEBUG)
+        tracer.event("coarse", level=TraceLevel.INFO)
+        assert tracer.flush() == 1
+        assert [r["message"] for r in _read_jsonl(tmp_path / "debug.log")] == ["coarse"]
+
+    def test_write_debug_log_is_noop_when_off(self, tmp_path, restore_tracer):
+        configure_tracing(TraceLevel.OFF, log_path=tmp_path / "debug.log")
+        assert write_debug_log({"message": "x"}, project_root=tmp_path) is False
+        assert not (tmp_path / "debug.log").exists()
+
+
+class TestEnabledTracer:
+    def test_span_records_start_end_and_attrs(self, tmp_path):
+        tracer = Tracer(level=TraceLevel.DEBUG, log_path=tmp_path / "debug.log")
+        with tracer.span("context7.lookup", library="react") as span:
+            span.set(hit=True)
+        tracer.flush()
+
+        (record,) = _read_jsonl(tmp_path / "debug.log")
+        assert record["type"] == "span"
+        assert record["message"] == "context7.lookup"
+        assert record["data"] == {"library": "react", "hit": True}
+        assert record["end"] >= record["start"]
+        assert record["duration_ms"] >= 0
+
+    def test_span_marks_errors(self, tmp_path):
+        tracer = Tracer(level=TraceLevel.DEBUG, log_path=tmp_path / "debug.log")
+        with pytest.raises(ValueError), tracer.span("op"):
+            raise ValueError("boom")
+        tracer.flush()
+        assert _read_jsonl(tmp_path / "debug.log")[0]["data"]["error"] == "ValueError"
+
+    def test_background_writer_batches(self, tmp_path):
+        tracer = Tracer(
+            level=TraceLevel.DEBUG, log_path=tmp_path / "debug.log", flush_interval=0.05
+        )
+        for i in range(20):
+            tracer.event("tick", {"i": i})
+        assert tracer._writer is not None
+
+        tracer._stop.wait(0.5)
+        tracer.shutdown()
+        records = _read_jsonl(tmp_path / "debug.log")
+        assert [r["data"]["i"] for r in records] == list(range(20))
+
+    def test_concurrent_spans(self, tmp_path):
+        tracer = Tracer(level=TraceLevel.DEBUG, log_path=tmp_path / "debug.log")
+
+        def work(n):
+            for _ in range(50):
+                with tracer.span("work", n=n):
+                    pass
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        tracer.shutdown()
+        assert len(_read_jsonl(tmp_path / "debug.log")) == 200
+
+    def test_write_debug_log_keeps_record_shape(self, tmp_path, restore_tracer):
+        tracer = configure_tracing("debug", log_path=tmp_path / "debug.log")
+        assert write_debug_log(
+            {"sessionId": "s", "message": "hello", "data": {"k": 1}},
+            location="module.py:1",
+        )
+        tracer.flush()
+
+        (record,) = _read_jsonl(tmp_path / "debug.log")
+        assert record["sessionId"] == "s"
+        assert record["message"] == "hello"
+        assert record["location"] == "module.py:1"
+        assert "timestamp" in record and "iso_timestamp" in record
+
+
+class TestChromeTraceExport:
+    def test_export_format(self, tmp_path):
+        tracer = Tracer(level=TraceLevel.DEBUG, log_path=tmp_path / "debug.log")
+        with tracer.span("outer", step=1):
+            tracer.event("inside", {"x": 1}, location="here.py:1")
+
+        path = tracer.export_chrome_trace(tmp_path / "trace.json")
+        events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+        by_phase = {e["ph"]: e for e in events}
+
+        instant, complete = by_phase["i"], by_phase["X"]
+        assert instant["name"] == "inside"
+        assert instant["args"] == {"location": "here.py:1", "x": 1}
+        assert complete["name"] == "outer"
+        assert complete["args"] == {"step": 1}
+        assert complete["ts"] <= instant["ts"] <= complete["ts"] + complete["dur"]
+        assert {"pid", "tid"} <= complete.keys()
+        tracer.shutdown()
+
+    def test_shutdown_exports_when_configured(self, tmp_path):
+        tracer = Tracer(
+            level=TraceLevel.INFO,
+            log_path=tmp_path / "debug.log",
+            chrome_trace_path=tmp_path / "out" / "trace.json",
+        )
+        with tracer.span("workflow", level=TraceLevel.INFO):
+            pass
+        tracer.shutdown()
+        data = json.loads((tmp_path / "out" / "trace.json").read_text(encoding="utf-8"))
+        assert [e["name"] for e in data["traceEvents"]] == ["workflow"]
+
+    def test_event_buffer_is_bounded(self, tmp_path):
+        tracer = Tracer(
+            level=TraceLevel.DEBUG, log_path=tmp_path / "debug.log", max_events=10
+        )
+        for i in range(25):
+            tracer.event("e", {"i": i})
+        tracer.flush()
+        assert len(tracer._trace_events) == 10
+        assert len(_read_jsonl(tmp_path / "debug.log")) == 25
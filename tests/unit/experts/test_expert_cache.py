@@ -0,0 +1,197 @@
+"""
+Unit tests for the similarity-keyed expert consultation cache.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from tapps_agents.experts.cache import ExpertCache, normalize_query
+from tapps_agents.experts.rag_embedder import Embedder
+
+pytestmark = pytest.mark.unit
+
+SYNONYMS = {"secure": "protect", "safeguard": "protect", "apis": "api"}
+
+
+class FakeEmbedder(Embedder):
+    """Bag-of-words embedder over hashed buckets, with a few synonyms."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed(self, texts):
+        self.calls += len(texts)
+        vectors = []
+        for text in texts:
+            vector = [0.0] * 32
+            for word in text.split():
+                word = SYNONYMS.get(word, word)
+                vector[sum(map(ord, word)) % 32] += 1.0
+            vectors.append(vector)
+        return vectors
+
+    def get_embedding_dim(self):
+        return 32
+
+    def get_model_name(self):
+        return "fake"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExpertCache(cache_dir=tmp_path, embedder=FakeEmbedder(), similarity_threshold=0.9)
+
+
+class TestLookup:
+    def test_normalized_exact_hit(self, cache):
+        cache.put("How do I secure my API?", "security", {"answer": "use auth"}, ["expert-security"])
+
+        hit = cache.get("  how do i SECURE my api ", "security")
+
+        assert hit is not None
+        assert hit.response == {"answer": "use auth"}
+        assert cache.get_stats()["similar_hits"] == 0
+
+    def test_rephrased_query_hits_by_similarity(self, cache):
+        cache.put("how do I secure my apis", "security", "use auth", ["expert-security"])
+
+        hit = cache.get("how do I safeguard my api", "security")
+
+        assert hit is not None
+        assert hit.response == "use auth"
+        assert cache.get_stats()["similar_hits"] == 1
+
+    def test_dissimilar_query_misses(self, cache):
+        cache.put("how do I secure my api", "security", "use auth", ["expert-security"])
+
+        assert cache.get("which database index type for range scans", "security") is None
+
+    def test_domains_are_isolated(self, cache):
+        cache.put("how do I secure my api", "security", "use auth", ["expert-security"])
+
+        assert cache.get("how do I secure my api", "api-design") is None
+
+    def test_without_embeddings_only_normalized_match(self, tmp_path):
+        cache = ExpertCache(cache_dir=tmp_path, use_embeddings=False)
+        cache.put("How do I secure my API?", "security", "use auth", [])
+
+        assert cache.get("how do i secure my api", "security") is not None
+        assert cache.get("how do I safeguard my api", "security") is None
+
+    def test_expired_entry_misses(self, cache):
+        cached = cache.put("q", "security", "a", [])
+        stale = datetime.now() - timedelta(hours=cache.ttl_hours + 1)
+        cached.timestamp = stale
+        cache._index[cached.query_hash].timestamp = stale
+
+        assert cache.get("q", "security") is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_similarities_use_domain_matrix(self, cache):
+        np = pytest.importorskip("numpy")
+        cache.put("how do I secure my apis", "security", "use auth", [])
+        cache.put("how do I rotate tokens", "security", "short ttl", [])
+
+        assert cache.get("how do I safeguard my api", "security").response == "use auth"
+        model, _keys, matrix = cache._matrices["security"]
+        assert model == "fake"
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (2, 32)
+        assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+
+        cache.put("how do I protect my api keys", "security", "vault", [])
+        assert "security" not in cache._matrices
+        cache.get("how do I safeguard my api", "security")
+        assert len(cache._matrices["security"][1]) == 3
+
+
+class TestTiers:
+    def test_memory_tier_is_lru_bounded(self, tmp_path):
+        cache = ExpertCache(cache_dir=tmp_path, use_embeddings=False, max_memory_entries=2)
+        cache.put("one", "d", 1, [])
+        cache.put("two", "d", 2, [])
+        cache.get("one", "d")
+        cache.put("three", "d", 3, [])
+
+        assert list(cache._memory_cache) == [
+            cache._hash_query("one", "d"),
+            cache._hash_query("three", "d"),
+        ]
+        # Evicted entries are still served from disk
+        assert cache.get("two", "d").response == 2
+
+    def test_memory_only_cache_drops_evicted_entries(self, tmp_path):
+        cache = ExpertCache(
+            cache_dir=tmp_path, enable_disk_cache=False, use_embeddings=False, max_memory_entries=1
+        )
+        cache.put("one", "d", 1, [])
+        cache.put("two", "d", 2, [])
+
+        assert cache.get("one", "d") is None
+        assert cache.get("two", "d").response == 2
+
+    def test_single_store_survives_restart(self, tmp_path):
+        first = ExpertCache(cache_dir=tmp_path, embedder=FakeEmbedder(), similarity_threshold=0.9)
+        first.put("how do I secure my apis", "security", "use auth", ["expert-security"])
+
+        second = ExpertCache(cache_dir=tmp_path, embedder=FakeEmbedder(), similarity_threshold=0.9)
+        hit = second.get("how do I safeguard my api", "security")
+
+        assert hit is not None
+        assert hit.experts_consulted == ["expert-security"]
+        assert [p.name for p in tmp_path.iterdir()] == ["responses.jsonl"]
+
+    def test_store_is_compacted(self, tmp_path):
+        cache = ExpertCache(cache_dir=tmp_path, use_embeddings=False)
+        for i in range(200):
+            cache.put("same question", "d", i, [])
+
+        lines = cache.store_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) <= 65
+        assert cache.get("same question", "d").response == 199
+        assert ExpertCache(cache_dir=tmp_path, use_embeddings=False).get("same question", "d").response == 199
+
+
+class TestInvalidation:
+    def test_fingerprint_change_invalidates_domain(self, cache):
+        cache.put("q1", "security", "old", [], knowledge_fingerprint="v1")
+        cache.put("q1", "performance", "kept", [], knowledge_fingerprint="p1")
+
+        assert cache.get("q1", "security", knowledge_fingerprint="v1").response == "old"
+        assert cache.get("q1", "security", knowledge_fingerprint="v2") is None
+        assert cache.get("q1", "performance", knowledge_fingerprint="p1").response == "kept"
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_fingerprint_invalidation_persists(self, tmp_path):
+        cache = ExpertCache(cache_dir=tmp_path, use_embeddings=False)
+        cache.put("q1", "security", "old", [], knowledge_fingerprint="v1")
+        cache.invalidate_domain("security", "v2")
+
+        reopened = ExpertCache(cache_dir=tmp_path, use_embeddings=False)
+        assert reopened.get("q1", "security") is None
+
+
+class TestStats:
+    def test_hit_rate_per_domain(self, cache):
+        cache.put("q", "security", "a", [])
+        cache.get("q", "security")
+        cache.get("other", "security")
+        cache.get("q", "performance")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["domains"]["security"]["hit_rate_percentage"] == 50
+        assert stats["domains"]["performance"]["hit_rate_percentage"] == 0
+
+    def test_clear_all(self, cache):
+        cache.put("q", "security", "a", [])
+        cache.clear_all()
+
+        assert cache.get("q", "security") is None
+        assert not cache.store_path.exists()
+
+
+def test_normalize_query():
+    assert normalize_query("  What's the BEST   way?\n") == "what s the best way"
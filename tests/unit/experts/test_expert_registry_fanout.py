@@ -0,0 +1,132 @@
+"""
+Tests for concurrent expert fan-out in ExpertRegistry.consult.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from tapps_agents.experts import performance_tracker
+from tapps_agents.experts.base_expert import BaseExpert
+from tapps_agents.experts.expert_registry import ExpertRegistry
+
+pytestmark = pytest.mark.unit
+
+
+class SlowExperts:
+    """Installs fake `run` methods and tracks how many run at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled: list[str] = []
+
+    def install(self, expert: BaseExpert, delay: float, answer: str) -> None:
+        async def run(command, **kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(expert.expert_id)
+                raise
+            finally:
+                self.in_flight -= 1
+            return {"answer": answer, "confidence": 0.8, "sources": []}
+
+        expert.run = run
+
+
+@pytest.fixture
+def writers(monkeypatch):
+    monkeypatch.setattr(performance_tracker, "_writers", {})
+
+
+def make_registry(tmp_path, fake: SlowExperts, delays: list[float], answer="use event sourcing"):
+    registry = ExpertRegistry(load_builtin=False, project_root=tmp_path)
+    for i, delay in enumerate(delays):
+        expert = BaseExpert(
+            expert_id=f"expert-retail-{i}",
+            expert_name=f"Retail Expert {i}",
+            primary_domain="retail",
+        )
+        fake.install(expert, delay, answer)
+        registry.register_expert(expert)
+    return registry
+
+
+@pytest.mark.usefixtures("writers")
+class TestConsultFanOut:
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, tmp_path):
+        fake = SlowExperts()
+        registry = make_registry(tmp_path, fake, [0.05] * 6)
+
+        start = time.monotonic()
+        result = await registry.consult("Which pattern?", "retail", max_concurrency=3)
+
+        assert fake.max_in_flight == 3
+        assert time.monotonic() - start < 0.25  # two waves, not six sequential calls
+        assert [r["expert_id"] for r in result.responses] == [
+            f"expert-retail-{i}" for i in range(6)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_responses_keep_consultation_order(self, tmp_path):
+        fake = SlowExperts()
+        registry = make_registry(tmp_path, fake, [0.06, 0.0, 0.03])
+
+        result = await registry.consult("Which pattern?", "retail")
+
+        assert [r["expert_id"] for r in result.responses] == [
+            "expert-retail-0",
+            "expert-retail-1",
+            "expert-retail-2",
+        ]
+        assert result.primary_expert == "expert-retail-0"
+
+    @pytest.mark.asyncio
+    async def test_slow_expert_times_out(self, tmp_path):
+        fake = SlowExperts()
+        registry = make_registry(tmp_path, fake, [0.0, 5.0])
+
+        result = await registry.consult("Which pattern?", "retail", expert_timeout=0.05)
+
+        assert "error" not in result.responses[0]
+        assert result.responses[1]["expert_id"] == "expert-retail-1"
+        assert "timed out" in result.responses[1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_on_quorum_agreement(self, tmp_path):
+        fake = SlowExperts()
+        registry = make_registry(tmp_path, fake, [0.0, 0.01, 0.02, 5.0])
+
+        start = time.monotonic()
+        result = await registry.consult("Which pattern?", "retail", early_exit=True)
+
+        assert time.monotonic() - start < 1.0
+        assert len(result.responses) == 3
+        assert fake.cancelled == ["expert-retail-3"]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_waits_for_primary(self, tmp_path):
+        fake = SlowExperts()
+        registry = make_registry(tmp_path, fake, [0.05, 0.0, 0.0, 0.0])
+
+        result = await registry.consult("Which pattern?", "retail", early_exit=True)
+
+        assert result.responses[0]["expert_id"] == "expert-retail-0"
+        assert fake.cancelled == []
+
+    @pytest.mark.asyncio
+    async def test_consultations_tracked_through_shared_writer(self, tmp_path):
+        fake = SlowExperts()
+        registry = make_registry(tmp_path, fake, [0.0, 0.0])
+
+        await registry.consult("Which pattern?", "retail")
+
+        writer = performance_tracker.get_consultation_writer(tmp_path)
+        writer.flush()
+        lines = writer.performance_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
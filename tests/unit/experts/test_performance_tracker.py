@@ -7,7 +7,12 @@ from pathlib import Path
 import pytest
 
 from tapps_agents.core.outcome_tracker import OutcomeTracker
-from tapps_agents.experts.performance_tracker import ExpertPerformanceTracker
+from tapps_agents.experts import performance_tracker
+from tapps_agents.experts.performance_tracker import (
+    ConsultationWriter,
+    ExpertPerformanceTracker,
+    get_consultation_writer,
+)
 
 
 @pytest.fixture
@@ -78,3 +83,32 @@ def test_get_all_performance(tracker):
     all_performance = tracker.get_all_performance(days=30)
     
     assert len(all_performance) >= 0  # May be 0 if no outcomes
+
+
+def test_consultation_writer_batches_records(tmp_path, monkeypatch):
+    """Test that the shared writer buffers records until flushed."""
+    monkeypatch.setattr(performance_tracker, "_writers", {})
+    writer = get_consultation_writer(tmp_path)
+    writer.flush_interval = 3600.0
+
+    for i in range(3):
+        writer.record(f"expert-{i}", "security", 0.8, "query")
+
+    assert get_consultation_writer(tmp_path) is writer
+    assert not writer.performance_file.exists()
+
+    # Readers flush pending records first
+    tracker = ExpertPerformanceTracker(project_root=tmp_path)
+    assert tracker._get_all_expert_ids(days=1) == {"expert-0", "expert-1", "expert-2"}
+    assert len(writer.performance_file.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_consultation_writer_flushes_when_full(tmp_path):
+    """Test that a full buffer is appended without waiting for the interval."""
+    writer = ConsultationWriter(tmp_path / "perf.jsonl", flush_interval=3600.0, max_pending=2)
+
+    writer.record("expert-1", "security", 0.8)
+    assert not writer.performance_file.exists()
+    writer.record("expert-2", "security", 0.9)
+
+    assert len(writer.performance_file.read_text(encoding="utf-8").splitlines()) == 2
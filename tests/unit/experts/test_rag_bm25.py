@@ -0,0 +1,197 @@
+"""
+Unit tests for the BM25 keyword index behind SimpleKnowledgeBase.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from tapps_agents.experts import rag_bm25
+from tapps_agents.experts.rag_bm25 import (
+    INDEX_FILENAME,
+    BM25Index,
+    fingerprint,
+    line_weights,
+    load_or_build_index,
+    split_sections,
+    tokenize,
+)
+from tapps_agents.experts.simple_rag import SimpleKnowledgeBase
+
+pytestmark = pytest.mark.unit
+
+GUIDE = """# Security Guide
+
+Overview of the guide.
+
+## Authentication
+Use OAuth flows for user sign-in.
+
+```python
+# Not a header: comment inside code
+def verify_token(token):
+    return jwt.decode(token)
+```
+
+## Sessions
+- Rotate session identifiers after authentication
+- Expire idle sessions
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_index_cache(monkeypatch):
+    monkeypatch.setattr(rag_bm25, "_indexes", OrderedDict())
+
+
+@pytest.fixture
+def knowledge_dir(tmp_path):
+    knowledge = tmp_path / "knowledge"
+    knowledge.mkdir()
+    (knowledge / "security.md").write_text(GUIDE, encoding="utf-8")
+    (knowledge / "testing.md").write_text(
+        "# Testing\n\nWrite unit tests for token verification.\n", encoding="utf-8"
+    )
+    return knowledge
+
+
+class TestChunking:
+    def test_sections_start_at_headers_outside_code(self):
+        lines = GUIDE.split("\n")
+        _, headers = line_weights(lines)
+
+        starts = [start for start, _, _ in split_sections(lines, headers)]
+
+        assert [lines[i] for i in starts] == [
+            "# Security Guide",
+            "## Authentication",
+            "## Sessions",
+        ]
+
+    def test_long_sections_split_at_blank_lines(self):
+        lines = ["# Title", *[f"line {i}" if i % 10 else "" for i in range(1, 100)]]
+        _, headers = line_weights(lines)
+
+        chunks = split_sections(lines, headers, max_lines=40)
+
+        assert all(end - start <= 40 for start, end, _ in chunks)
+        assert all(header == 0 for _, _, header in chunks)
+        assert [start for start, _, _ in chunks][1:] == [31, 71]
+
+    def test_field_weights(self):
+        weights, _ = line_weights(["# H1", "### H3", "- item", "```", "code", "```", "text"])
+        assert weights == [1.8, 1.4, 1.2, 1.4, 1.4, 1.4, 1.0]
+
+    def test_tokenize_splits_identifiers(self):
+        assert tokenize("bcrypt.hashpw(password_hash) a") == ["bcrypt", "hashpw", "password", "hash"]
+
+
+class TestBM25Ranking:
+    def test_header_match_outranks_body_match(self):
+        index = BM25Index.build(
+            {
+                "a.md": "# Intro\n\nSee the caching notes below.\n",
+                "b.md": "# Caching\n\nHow entries expire.\n",
+            }
+        )
+
+        results = index.search(["caching"])
+
+        assert [span.source for span, _ in results] == ["b.md", "a.md"]
+        assert results[0][1] == 1.0
+
+    def test_prefix_terms_match_longer_words(self):
+        index = BM25Index.build({"a.md": "# Guide\n\nAuthentication flows.\n"})
+
+        assert index.search(["auth"])
+        assert index.search(["authentication"])[0][1] == 1.0
+
+    def test_partial_matches_score_lower(self):
+        index = BM25Index.build(
+            {
+                "a.md": "# One\n\nzigbee mesh networking\n",
+                "b.md": "# Two\n\nzigbee lights\n",
+            }
+        )
+
+        scores = dict((span.source, score) for span, score in index.search(["zigbee", "mesh"]))
+
+        assert scores["a.md"] == 1.0
+        assert 0.0 < scores["b.md"] < 0.5
+
+    def test_terms_missing_from_corpus_do_not_lower_scores(self):
+        index = BM25Index.build({"a.md": "# Guide\n\nzigbee mesh networking\n"})
+
+        assert index.search(["zigbee", "protocol", "configuration"])[0][1] == 1.0
+
+    def test_unknown_terms_return_nothing(self):
+        index = BM25Index.build({"a.md": "# Guide\n\ncontent\n"})
+        assert index.search(["nonexistent"]) == []
+
+
+class TestPersistence:
+    def test_index_saved_and_reloaded(self, knowledge_dir, tmp_path, monkeypatch):
+        index_dir = tmp_path / "index"
+        kb = SimpleKnowledgeBase(knowledge_dir, index_dir=index_dir)
+        expected = kb.search("token verification")
+        assert (index_dir / INDEX_FILENAME).exists()
+
+        def fail_build(*args, **kwargs):
+            raise AssertionError("index should load from disk")
+
+        monkeypatch.setattr(rag_bm25, "_indexes", OrderedDict())
+        monkeypatch.setattr(BM25Index, "build", fail_build)
+        fresh = SimpleKnowledgeBase(knowledge_dir, index_dir=index_dir)
+
+        assert fresh.search("token verification") == expected
+
+    def test_index_is_lazy(self, knowledge_dir, tmp_path):
+        index_dir = tmp_path / "index"
+        SimpleKnowledgeBase(knowledge_dir, index_dir=index_dir)
+        assert not (index_dir / INDEX_FILENAME).exists()
+
+    def test_changed_files_rebuild_index(self, knowledge_dir, tmp_path):
+        index_dir = tmp_path / "index"
+        assert SimpleKnowledgeBase(knowledge_dir, index_dir=index_dir).search("kubernetes") == []
+
+        (knowledge_dir / "deploy.md").write_text("# Kubernetes\n\nDeploy pods.\n", encoding="utf-8")
+        results = SimpleKnowledgeBase(knowledge_dir, index_dir=index_dir).search("kubernetes")
+
+        assert [r.source_file.name for r in results] == ["deploy.md"]
+
+    def test_stale_file_on_disk_is_ignored(self, tmp_path):
+        path = tmp_path / INDEX_FILENAME
+        BM25Index.build({"a.md": "# A\n\nalpha\n"}, "old").save(path)
+
+        documents = {"a.md": "# A\n\nbeta\n"}
+        index = load_or_build_index(documents, path)
+
+        assert index.fingerprint == fingerprint(documents)
+        assert index.search(["beta"])
+        assert BM25Index.load(path, fingerprint(documents)) is not None
+
+    def test_knowledge_bases_share_index_in_process(self, knowledge_dir, tmp_path):
+        first = SimpleKnowledgeBase(knowledge_dir, index_dir=tmp_path / "a")
+        second = SimpleKnowledgeBase(knowledge_dir, index_dir=tmp_path / "b")
+        first.search("token")
+        second.search("token")
+        assert first._index is second._index
+
+
+class TestSimpleKnowledgeBaseSearch:
+    def test_code_comment_is_not_a_section(self, knowledge_dir, tmp_path):
+        kb = SimpleKnowledgeBase(knowledge_dir, index_dir=tmp_path / "index")
+
+        results = kb.search("jwt decode", context_lines=20)
+
+        assert results[0].content.startswith("## Authentication")
+        assert results[0].content.endswith("```")
+
+    def test_results_keep_line_numbers(self, knowledge_dir, tmp_path):
+        kb = SimpleKnowledgeBase(knowledge_dir, index_dir=tmp_path / "index")
+
+        chunk = kb.search("rotate identifiers", context_lines=0)[0]
+
+        lines = GUIDE.split("\n")
+        assert chunk.content == "\n".join(lines[chunk.line_start - 1 : chunk.line_end])
+        assert chunk.content == "- Rotate session identifiers after authentication"
@@ -0,0 +1,163 @@
+"""
+Unit tests for the memory-mapped RAG chunk store.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from tapps_agents.experts.rag_chunk_store import CHUNK_STORE_FILENAME, ChunkStore
+from tapps_agents.experts.rag_chunker import Chunk
+from tapps_agents.experts.rag_embedder import Embedder
+from tapps_agents.experts.rag_index import FAISS_AVAILABLE, LEGACY_CHUNKS_FILENAME
+
+pytestmark = pytest.mark.unit
+
+
+def make_chunk(source: str, n: int, content: str | None = None) -> Chunk:
+    return Chunk(
+        content=content or f"{source} chunk {n}",
+        source_file=Path(source),
+        line_start=n * 10 + 1,
+        line_end=n * 10 + 9,
+        chunk_id=f"{source}-{n}",
+        token_count=n + 3,
+    )
+
+
+class WordEmbedder(Embedder):
+    """Deterministic bag-of-words embedder."""
+
+    def embed(self, texts):
+        import numpy as np
+
+        vectors = np.zeros((len(texts), 32), dtype="float32")
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, sum(map(ord, word)) % 32] += 1.0
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+    def get_embedding_dim(self):
+        return 32
+
+    def get_model_name(self):
+        return "words"
+
+
+@pytest.fixture
+def chunks():
+    return [
+        make_chunk("zigbee.md", 0),
+        make_chunk("zigbee.md", 1, "Zigbee → Thread migration ✓"),
+        make_chunk("zwave.md", 0),
+    ]
+
+
+class TestChunkStore:
+    def test_round_trip(self, tmp_path, chunks):
+        path = tmp_path / CHUNK_STORE_FILENAME
+        ChunkStore.write(path, chunks, [4, 7, 9])
+
+        store = ChunkStore(path)
+
+        assert len(store) == 3
+        assert list(store) == chunks
+        assert store[-1] == chunks[-1]
+        assert store[1:] == chunks[1:]
+        assert store.ids() == [4, 7, 9]
+        assert store.source_files() == ["zigbee.md", "zigbee.md", "zwave.md"]
+        store.close()
+
+    def test_chunks_are_decoded_on_access(self, tmp_path, chunks):
+        path = tmp_path / CHUNK_STORE_FILENAME
+        ChunkStore.write(path, chunks, [0, 1, 2])
+
+        store = ChunkStore(path)
+
+        assert store[1] is not store[1]
+        assert store[0].source_file is store[1].source_file
+        with pytest.raises(IndexError):
+            store[3]
+
+    def test_empty_store(self, tmp_path):
+        path = tmp_path / CHUNK_STORE_FILENAME
+        ChunkStore.write(path, [], [])
+
+        store = ChunkStore(path)
+
+        assert len(store) == 0
+        assert store.ids() == []
+        assert store.source_files() == []
+
+    def test_smaller_than_json(self, tmp_path):
+        chunks = [make_chunk(f"file{i % 20}.md", i, "x" * 200) for i in range(200)]
+        path = tmp_path / CHUNK_STORE_FILENAME
+        ChunkStore.write(path, chunks, range(200))
+
+        as_json = json.dumps([{"id": i, **c.to_dict()} for i, c in enumerate(chunks)], indent=2)
+
+        assert path.stat().st_size < len(as_json) * 0.7
+
+    def test_mismatched_ids_rejected(self, tmp_path, chunks):
+        with pytest.raises(ValueError, match="chunk IDs"):
+            ChunkStore.write(tmp_path / CHUNK_STORE_FILENAME, chunks, [0, 1])
+
+    def test_foreign_file_rejected(self, tmp_path):
+        path = tmp_path / CHUNK_STORE_FILENAME
+        path.write_bytes(b"[{}]" + b"\0" * 32)
+
+        with pytest.raises(ValueError, match="Unsupported chunk store"):
+            ChunkStore(path)
+
+
+@pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not available")
+class TestVectorIndexPersistence:
+    @pytest.fixture
+    def built_index(self, chunks):
+        from tapps_agents.experts.rag_index import VectorIndex
+
+        index = VectorIndex(embedder=WordEmbedder())
+        index.build(chunks)
+        return index
+
+    def test_save_writes_chunk_store(self, tmp_path, built_index, chunks):
+        from tapps_agents.experts.rag_index import VectorIndex
+
+        (tmp_path / LEGACY_CHUNKS_FILENAME).write_text("[]", encoding="utf-8")
+        built_index.save(tmp_path)
+
+        loaded = VectorIndex.load(tmp_path, embedder=built_index.embedder)
+
+        assert (tmp_path / CHUNK_STORE_FILENAME).exists()
+        assert not (tmp_path / LEGACY_CHUNKS_FILENAME).exists()
+        assert isinstance(loaded.chunks, ChunkStore)
+        results = loaded.search("zwave.md chunk 0", top_k=1, similarity_threshold=0.0)
+        assert results[0][0] == chunks[2]
+
+    def test_update_after_load_rewrites_store(self, tmp_path, built_index):
+        from tapps_agents.experts.rag_index import VectorIndex
+
+        built_index.save(tmp_path)
+        loaded = VectorIndex.load(tmp_path, embedder=built_index.embedder)
+
+        loaded.update_files({"thread.md": [make_chunk("thread.md", 0)]}, removed_files=["zwave.md"])
+        loaded.save(tmp_path)
+        reloaded = VectorIndex.load(tmp_path, embedder=built_index.embedder)
+
+        assert reloaded.chunk_ids == [0, 1, 3]
+        assert [c.chunk_id for c in reloaded.chunks] == ["zigbee.md-0", "zigbee.md-1", "thread.md-0"]
+        assert reloaded.metadata.source_files == ["thread.md", "zigbee.md"]
+
+    def test_legacy_json_chunks_load(self, tmp_path, built_index, chunks):
+        from tapps_agents.experts.rag_index import VectorIndex
+
+        built_index.save(tmp_path)
+        (tmp_path / CHUNK_STORE_FILENAME).unlink()
+        legacy = [{"id": i, **c.to_dict()} for i, c in enumerate(chunks)]
+        (tmp_path / LEGACY_CHUNKS_FILENAME).write_text(json.dumps(legacy), encoding="utf-8")
+
+        loaded = VectorIndex.load(tmp_path, embedder=built_index.embedder)
+
+        assert list(loaded.chunks) == chunks
+        assert loaded.chunk_ids == [0, 1, 2]
@@ -0,0 +1,145 @@
+"""
+Unit tests for the process-wide shared embedder.
+"""
+
+import threading
+import time
+
+import pytest
+
+from tapps_agents.experts import rag_embedder
+from tapps_agents.experts.rag_embedder import (
+    Embedder,
+    SharedEmbedder,
+    create_embedder,
+    get_shared_embedder,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeModel(Embedder):
+    """Embeds each text as [len(text), index-in-call]; records calls."""
+
+    loads = 0
+
+    def __init__(self, model_name: str):
+        FakeModel.loads += 1
+        self.model_name = model_name
+        self.calls: list[list[str]] = []
+        self.gate: threading.Event | None = None
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        if self.gate is not None:
+            self.gate.wait(5)
+        if any(text == "boom" for text in texts):
+            raise RuntimeError("encode failed")
+        return [[float(len(text)), float(i)] for i, text in enumerate(texts)]
+
+    def get_embedding_dim(self):
+        return 2
+
+    def get_model_name(self):
+        return self.model_name
+
+
+@pytest.fixture(autouse=True)
+def reset_fake(monkeypatch):
+    FakeModel.loads = 0
+    monkeypatch.setattr(rag_embedder, "_shared_embedders", {})
+
+
+class TestSharedEmbedder:
+    def test_model_loaded_lazily_once(self):
+        embedder = SharedEmbedder("fake", factory=FakeModel)
+        assert FakeModel.loads == 0
+
+        embedder.embed(["a"])
+        embedder.embed(["bb"])
+
+        assert FakeModel.loads == 1
+        assert embedder.get_embedding_dim() == 2
+
+    def test_concurrent_requests_are_batched(self):
+        embedder = SharedEmbedder("fake", factory=FakeModel, max_wait=0.05)
+        model = embedder.load()
+        model.gate = threading.Event()
+        results: dict[int, list] = {}
+
+        def worker(i):
+            results[i] = embedder.embed(["x" * i, "y" * i])
+
+        # The first batch blocks in the model while the rest queue up
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 9)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            queued = sum(len(call) for call in model.calls) + embedder._pending_texts
+            if queued == 16:
+                break
+            time.sleep(0.001)
+        model.gate.set()
+        for t in threads:
+            t.join()
+
+        # At most one batch in flight plus one for everyone who queued behind it
+        assert len(model.calls) <= 2
+        assert sum(len(call) for call in model.calls) == 16
+        for i, vectors in results.items():
+            assert [v[0] for v in vectors] == [float(i), float(i)]
+
+    def test_batch_error_reaches_every_caller(self):
+        embedder = SharedEmbedder("fake", factory=FakeModel)
+        with pytest.raises(RuntimeError, match="encode failed"):
+            embedder.embed(["ok", "boom"])
+        # Later batches are unaffected
+        assert embedder.embed(["ok"]) == [[2.0, 0.0]]
+
+    def test_query_embeddings_are_cached(self):
+        embedder = SharedEmbedder("fake", factory=FakeModel, cache_size=2)
+        model = embedder.load()
+
+        first = embedder.embed_query("auth")
+        assert embedder.embed_query("auth") is first
+        embedder.embed_query("tokens")
+        embedder.embed_query("sessions")  # evicts "auth"
+        embedder.embed_query("auth")
+
+        assert len(model.calls) == 4
+        assert (embedder.cache_hits, embedder.cache_misses) == (1, 4)
+
+    def test_load_failure_is_remembered(self):
+        attempts = []
+
+        def failing_factory(name):
+            attempts.append(name)
+            raise OSError("model download failed")
+
+        embedder = SharedEmbedder("fake", factory=failing_factory)
+        for _ in range(3):
+            with pytest.raises(RuntimeError, match="model download failed"):
+                embedder.embed(["x"])
+        assert attempts == ["fake"]
+
+
+class TestCreateEmbedder:
+    def test_experts_share_one_model(self, monkeypatch):
+        monkeypatch.setattr(rag_embedder, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(rag_embedder, "SentenceTransformerEmbedder", FakeModel)
+
+        embedders = [create_embedder("all-MiniLM-L6-v2") for _ in range(15)]
+
+        assert all(e is embedders[0] for e in embedders)
+        assert FakeModel.loads == 1
+        assert get_shared_embedder("other-model") is not embedders[0]
+
+    def test_returns_none_when_model_fails(self, monkeypatch):
+        def failing_factory(name):
+            raise OSError("no model")
+
+        monkeypatch.setattr(rag_embedder, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+        monkeypatch.setattr(rag_embedder, "SentenceTransformerEmbedder", failing_factory)
+
+        assert create_embedder() is None
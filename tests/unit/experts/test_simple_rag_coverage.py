@@ -95,81 +95,52 @@ Hi
         # Cleanup
         shutil.rmtree(temp_dir)
 
-    def test_extract_relevant_chunks_no_matches(self, temp_knowledge_dir):
-        """Test _extract_relevant_chunks with no keyword matches."""
+    def test_search_chunks_no_matches(self, temp_knowledge_dir):
+        """Test indexed search with no keyword matches."""
         kb = SimpleKnowledgeBase(temp_knowledge_dir)
-        test_file = temp_knowledge_dir / "test-complex.md"
-        content = test_file.read_text(encoding="utf-8")
 
-        # Search for keywords that don't exist
-        chunks = kb._extract_relevant_chunks(
-            test_file, content, query_keywords={"nonexistent", "xyz123"}, context_lines=10
-        )
+        chunks = kb.search("nonexistent xyz123", max_results=5)
 
         assert len(chunks) == 0
 
-    def test_extract_relevant_chunks_single_match(self, temp_knowledge_dir):
-        """Test _extract_relevant_chunks with single keyword match."""
+    def test_search_chunks_single_match(self, temp_knowledge_dir):
+        """Test indexed search with single keyword match."""
         kb = SimpleKnowledgeBase(temp_knowledge_dir)
-        test_file = temp_knowledge_dir / "test-complex.md"
-        content = test_file.read_text(encoding="utf-8")
 
-        chunks = kb._extract_relevant_chunks(
-            test_file, content, query_keywords={"testing"}, context_lines=5
-        )
+        chunks = kb.search("testing", max_results=5, context_lines=5)
 
         assert len(chunks) > 0
         assert all("testing" in chunk.content.lower() for chunk in chunks)
 
-    def test_extract_relevant_chunks_header_boost(self, temp_knowledge_dir):
-        """Test that headers get score boost in _extract_relevant_chunks."""
+    def test_search_chunks_header_boost(self, temp_knowledge_dir):
+        """Test that header matches rank chunks first."""
         kb = SimpleKnowledgeBase(temp_knowledge_dir)
-        headers_file = temp_knowledge_dir / "headers.md"
-        content = headers_file.read_text(encoding="utf-8")
 
-        chunks = kb._extract_relevant_chunks(
-            headers_file, content, query_keywords={"header"}, context_lines=5
-        )
+        chunks = kb.search("header", max_results=5, context_lines=5)
 
-        # Headers should appear in results
         assert len(chunks) > 0
-        # Check that headers (lines starting with #) are included
-        header_chunks = [c for c in chunks if any(line.strip().startswith("#") for line in c.content.split("\n"))]
-        assert len(header_chunks) > 0
+        # Level 1 header outweighs deeper levels
+        assert chunks[0].content.startswith("# Level 1 Header")
 
-    def test_extract_relevant_chunks_context_lines(self, temp_knowledge_dir):
-        """Test _extract_relevant_chunks with different context_lines values."""
+    def test_search_chunks_context_lines(self, temp_knowledge_dir):
+        """Test indexed search with different context_lines values."""
         kb = SimpleKnowledgeBase(temp_knowledge_dir)
-        test_file = temp_knowledge_dir / "test-complex.md"
-        content = test_file.read_text(encoding="utf-8")
 
-        # Test with small context
-        chunks_small = kb._extract_relevant_chunks(
-            test_file, content, query_keywords={"testing"}, context_lines=2
-        )
-
-        # Test with large context
-        chunks_large = kb._extract_relevant_chunks(
-            test_file, content, query_keywords={"testing"}, context_lines=20
-        )
+        chunks_small = kb.search("testing", max_results=1, context_lines=0)
+        chunks_large = kb.search("testing", max_results=1, context_lines=20)
 
         # Larger context should produce chunks with more content
-        if chunks_small and chunks_large:
-            assert chunks_large[0].line_end - chunks_large[0].line_start >= chunks_small[0].line_end - chunks_small[0].line_start
+        assert chunks_large[0].line_end - chunks_large[0].line_start > chunks_small[0].line_end - chunks_small[0].line_start
+        assert chunks_small[0].content == "Some content here about testing."
 
-    def test_extract_relevant_chunks_consecutive_matches(self, temp_knowledge_dir):
-        """Test _extract_relevant_chunks with consecutive matching lines."""
+    def test_search_chunks_stay_within_section(self, temp_knowledge_dir):
+        """Test that context does not extend past the matching section."""
         kb = SimpleKnowledgeBase(temp_knowledge_dir)
-        test_file = temp_knowledge_dir / "test-complex.md"
-        content = test_file.read_text(encoding="utf-8")
 
-        # Search for word that appears multiple times
-        chunks = kb._extract_relevant_chunks(
-            test_file, content, query_keywords={"section"}, context_lines=5
-        )
+        chunks = kb.search("final", max_results=5, context_lines=50)
 
-        # Should group consecutive matches into chunks
-        assert len(chunks) > 0
+        assert len(chunks) == 1
+        assert chunks[0].content == "## Section Three\n\nFinal section."
 
     def test_create_chunk_from_lines_empty_content(self, temp_knowledge_dir):
         """Test _create_chunk_from_lines with empty content."""
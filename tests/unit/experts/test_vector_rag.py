@@ -4,6 +4,7 @@ Tests for Vector Knowledge Base RAG system.
 Tests FAISS-based semantic search with fallback to SimpleKnowledgeBase.
 """
 
+import importlib.util
 import shutil
 import tempfile
 from pathlib import Path
@@ -11,18 +12,15 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from tapps_agents.experts.rag_embedder import Embedder
+from tapps_agents.experts.rag_index import IndexMetadata, file_fingerprint
 from tapps_agents.experts.simple_rag import KnowledgeChunk, SimpleKnowledgeBase
 from tapps_agents.experts.vector_rag import VectorKnowledgeBase
 
 pytestmark = pytest.mark.unit
 
 # Check if FAISS is available
-try:
-    import faiss
-
-    FAISS_AVAILABLE = True
-except ImportError:
-    FAISS_AVAILABLE = False
+FAISS_AVAILABLE = importlib.util.find_spec("faiss") is not None
 
 
 class TestVectorKnowledgeBase:
@@ -203,8 +201,35 @@ Smart thermostats optimize HVAC systems.
         kb = VectorKnowledgeBase(temp_knowledge_dir, similarity_threshold=0.9)
         results = kb.search("Zigbee protocol", max_results=5)
 
-        # All results should meet similarity threshold
-        assert all(r.score >= 0.9 for r in results)
+        if kb.get_backend_type() == "vector":
+            # Semantic results should meet similarity threshold
+            assert all(r.score >= 0.9 for r in results)
+        else:
+            # Keyword fallback scores are relative to the best match and are
+            # not filtered: the Zigbee section ranks first at 1.0
+            assert results
+            assert "Zigbee Protocol" in results[0].content
+            assert results[0].score == 1.0
+            assert all(0.0 < r.score <= 1.0 for r in results)
+
+    def test_threshold_does_not_filter_keyword_fallback(self, temp_knowledge_dir):
+        """Keyword fallback results are returned regardless of similarity_threshold."""
+        with patch("tapps_agents.experts.vector_rag.FAISS_AVAILABLE", False):
+            kb = VectorKnowledgeBase(temp_knowledge_dir, similarity_threshold=0.65)
+            results = kb.search("zigbee pairing troubleshooting", max_results=5)
+
+            assert results
+            assert "zigbee" in results[0].content.lower()
+
+    def test_get_context_keeps_keyword_fallback_chunks(self, temp_knowledge_dir):
+        """get_context does not drop keyword fallback chunks below similarity_threshold."""
+        with patch("tapps_agents.experts.vector_rag.FAISS_AVAILABLE", False):
+            kb = VectorKnowledgeBase(temp_knowledge_dir, similarity_threshold=0.65)
+            results = kb.search("zigbee lights", max_results=5)
+            context = kb.get_context("zigbee lights")
+
+            assert any(r.score < 0.65 for r in results)
+            assert all(r.content.splitlines()[0] in context for r in results)
 
     def test_safety_handler_integration(self, temp_knowledge_dir):
         """Test that safety handler is initialized."""
@@ -298,15 +323,130 @@ Smart thermostats optimize HVAC systems.
 
     def test_error_handling_in_initialization(self, temp_knowledge_dir):
         """Test error handling during initialization."""
-        with patch("tapps_agents.experts.vector_rag.FAISS_AVAILABLE", True):
-            # Mock create_embedder to raise an exception
-            with patch(
+        # Mock create_embedder to raise an exception
+        with (
+            patch("tapps_agents.experts.vector_rag.FAISS_AVAILABLE", True),
+            patch(
                 "tapps_agents.experts.vector_rag.create_embedder",
                 side_effect=Exception("Embedder failed"),
-            ):
-                kb = VectorKnowledgeBase(temp_knowledge_dir)
-                kb._initialize()
+            ),
+        ):
+            kb = VectorKnowledgeBase(temp_knowledge_dir)
+            kb._initialize()
+
+            # Should fallback to SimpleKnowledgeBase
+            assert kb._backend_type == "simple"
+            assert kb.fallback_kb is not None
+
+
+class HashEmbedder(Embedder):
+    """Deterministic bag-of-words embedder that records what it embeds."""
+
+    def __init__(self):
+        self.embedded: list[str] = []
 
-                # Should fallback to SimpleKnowledgeBase
-                assert kb._backend_type == "simple"
-                assert kb.fallback_kb is not None
+    def embed(self, texts):
+        import numpy as np
+
+        self.embedded.extend(texts)
+        vectors = np.zeros((len(texts), 32), dtype="float32")
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, sum(map(ord, word)) % 32] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-9)
+
+    def get_embedding_dim(self):
+        return 32
+
+    def get_model_name(self):
+        return "all-MiniLM-L6-v2"
+
+
+class TestIncrementalIndex:
+    """Test fingerprint validation and incremental re-indexing."""
+
+    @pytest.fixture
+    def knowledge_dir(self, tmp_path):
+        knowledge = tmp_path / "knowledge"
+        knowledge.mkdir()
+        (knowledge / "zigbee.md").write_text("# Zigbee\n\nZigbee mesh protocol.\n", encoding="utf-8")
+        (knowledge / "zwave.md").write_text("# Z-Wave\n\nZ-Wave range.\n", encoding="utf-8")
+        return knowledge
+
+    def _write_metadata(self, kb, **overrides):
+        import json
+
+        metadata = IndexMetadata(
+            model_name=kb.embedding_model,
+            chunk_params={"target_tokens": kb.chunk_size, "overlap_tokens": kb.overlap},
+        ).to_dict()
+        metadata.update(overrides)
+        kb.index_dir.mkdir(parents=True, exist_ok=True)
+        (kb.index_dir / "metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+
+    def test_index_validity_checks_model_and_chunking(self, knowledge_dir):
+        kb = VectorKnowledgeBase(knowledge_dir)
+        self._write_metadata(kb)
+        assert kb._index_is_valid()
+
+        self._write_metadata(kb, chunk_params={"target_tokens": 1, "overlap_tokens": 0})
+        assert not kb._index_is_valid()
+
+        self._write_metadata(kb, model_name="other-model")
+        assert not kb._index_is_valid()
+
+        self._write_metadata(kb, schema_version="1.0")
+        assert not kb._index_is_valid()
+
+    def test_sync_reembeds_only_changed_files(self, knowledge_dir):
+        kb = VectorKnowledgeBase(knowledge_dir)
+        files = kb._load_knowledge_files()
+        fingerprints = {str(p): file_fingerprint(c) for p, c in files.items()}
+        zigbee, zwave = str(knowledge_dir / "zigbee.md"), str(knowledge_dir / "zwave.md")
+        kb.index = MagicMock()
+        kb.index.metadata = IndexMetadata(
+            file_fingerprints={zigbee: fingerprints[zigbee], zwave: "stale", "gone.md": "x"}
+        )
+
+        kb._sync_index(files, fingerprints)
+
+        file_chunks = kb.index.update_files.call_args.args[0]
+        assert list(file_chunks) == [zwave]
+        assert kb.index.update_files.call_args.kwargs["removed_files"] == ["gone.md"]
+        kb.index.save.assert_called_once_with(kb.index_dir)
+
+    def test_sync_skips_unchanged_index(self, knowledge_dir):
+        kb = VectorKnowledgeBase(knowledge_dir)
+        files = kb._load_knowledge_files()
+        fingerprints = {str(p): file_fingerprint(c) for p, c in files.items()}
+        kb.index = MagicMock()
+        kb.index.metadata = IndexMetadata(file_fingerprints=dict(fingerprints))
+
+        kb._sync_index(files, fingerprints)
+
+        kb.index.update_files.assert_not_called()
+        kb.index.save.assert_not_called()
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not available")
+    def test_added_and_edited_files_update_saved_index(self, knowledge_dir):
+        embedder = HashEmbedder()
+        with patch("tapps_agents.experts.vector_rag.create_embedder", return_value=embedder):
+            kb = VectorKnowledgeBase(knowledge_dir, similarity_threshold=0.0)
+            assert kb.get_backend_type() == "vector"
+            assert len(kb.index.chunks) == 2
+
+            (knowledge_dir / "thread.md").write_text("# Thread\n\nThread border router.\n", encoding="utf-8")
+            (knowledge_dir / "zwave.md").write_text("# Z-Wave\n\nZ-Wave long range.\n", encoding="utf-8")
+            (knowledge_dir / "zigbee.md").unlink()
+            embedder.embedded.clear()
+
+            reloaded = VectorKnowledgeBase(knowledge_dir, similarity_threshold=0.0)
+            reloaded._initialize()
+
+        assert len(embedder.embedded) == 2
+        assert all("Zigbee" not in text for text in embedder.embedded)
+        assert sorted(c.source_file.name for c in reloaded.index.chunks) == ["thread.md", "zwave.md"]
+        assert reloaded.index.index.ntotal == 2
+        results = reloaded.index.search("Thread border router", top_k=1, similarity_threshold=0.0)
+        assert results[0][0].source_file.name == "thread.md"
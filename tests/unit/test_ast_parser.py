@@ -122,3 +122,29 @@ class MyClass:
 
         parser.clear_cache()
         assert len(parser._cache) == 0
+
+    def test_resolve_local_imports(self, parser, tmp_path: Path):
+        """Test resolving absolute, relative and submodule imports to files."""
+        pkg = tmp_path / "pkg"
+        (pkg / "sub").mkdir(parents=True)
+        (pkg / "__init__.py").write_text("")
+        (pkg / "base.py").write_text("X = 1\n")
+        (pkg / "sub" / "__init__.py").write_text("")
+        (pkg / "sub" / "leaf.py").write_text("Y = 2\n")
+        (pkg / "util.py").write_text("Z = 3\n")
+        module = pkg / "sub" / "mod.py"
+        module.write_text(
+            "import os\n"
+            "from pkg.base import X\n"
+            "from . import leaf\n"
+            "from ..util import Z\n"
+        )
+
+        deps = parser.resolve_local_imports(module)
+
+        assert set(deps) == {
+            (pkg / "base.py").resolve(),
+            (pkg / "sub" / "__init__.py").resolve(),
+            (pkg / "sub" / "leaf.py").resolve(),
+            (pkg / "util.py").resolve(),
+        }
@@ -1206,4 +1206,81 @@ class TestRuffIssueGrouping:
 
         # Check summary format
         expected_summary = "UP006 (17), UP045 (10), UP007 (2), F401 (1)"
-        assert result["summary"] == expected_summary
\ No newline at end of file
+        assert result["summary"] == expected_summary
+
+@pytest.mark.unit
+class TestSharedAnalysisContext:
+    """Tests for the single-parse FileAnalysisContext shared across scorers."""
+
+    def test_score_file_parses_source_once(self, tmp_path: Path):
+        """score_file plus issue extraction should parse the source once."""
+        from tapps_agents.agents.reviewer.analysis_context import FileAnalysisContext
+        from tapps_agents.core.language_detector import Language
+
+        scorer = CodeScorer(ruff_enabled=False, mypy_enabled=False, jscpd_enabled=False)
+        test_file = tmp_path / "complex.py"
+        test_file.write_text(COMPLEX_CODE)
+        analysis = FileAnalysisContext(test_file, COMPLEX_CODE, Language.PYTHON)
+
+        with patch("tapps_agents.agents.reviewer.scoring.HAS_BANDIT", False):
+            scorer.has_bandit = False
+            with_context = scorer.score_file(test_file, COMPLEX_CODE, analysis=analysis)
+            scorer.get_maintainability_issues(COMPLEX_CODE, test_file, analysis=analysis)
+            scorer.get_performance_issues(COMPLEX_CODE, test_file, analysis=analysis)
+            without_context = scorer.score_file(test_file, COMPLEX_CODE)
+
+        assert analysis.parse_count == 1
+        for key in ("complexity_score", "maintainability_score", "performance_score"):
+            assert with_context[key] == without_context[key]
+
+    def test_analysis_context_syntax_error(self, tmp_path: Path):
+        """Syntax errors are cached and re-raised like ast.parse."""
+        from tapps_agents.agents.reviewer.analysis_context import FileAnalysisContext
+
+        analysis = FileAnalysisContext(tmp_path / "bad.py", SYNTAX_ERROR_CODE)
+
+        assert analysis.tree is None
+        assert analysis.syntax_error is not None
+        with pytest.raises(SyntaxError):
+            analysis.parse()
+        assert analysis.parse_count == 1
+
+        scorer = CodeScorer()
+        assert scorer._calculate_complexity(SYNTAX_ERROR_CODE, analysis) == 10.0
+
+    def test_registry_run_scorer_passes_context_only_when_accepted(self, tmp_path: Path):
+        """ScorerRegistry.run_scorer keeps legacy two-argument plugins working."""
+        from tapps_agents.agents.reviewer.scorer_registry import ScorerRegistry
+        from tapps_agents.agents.reviewer.scoring import BaseScorer
+        from tapps_agents.core.language_detector import Language
+
+        class LegacyScorer(BaseScorer):
+            def score_file(self, file_path: Path, code: str) -> dict:
+                return {"overall_score": 42.0}
+
+        analysis = ScorerRegistry.create_analysis_context(
+            tmp_path / "x.py", SIMPLE_CODE, Language.PYTHON
+        )
+        result = ScorerRegistry.run_scorer(
+            LegacyScorer(), tmp_path / "x.py", SIMPLE_CODE, analysis
+        )
+
+        assert result == {"overall_score": 42.0}
+        assert ScorerRegistry._scorer_accepts_analysis(CodeScorer) is True
+        assert ScorerRegistry._scorer_accepts_analysis(LegacyScorer) is False
+
+    def test_benchmark_scoring_parses(self, tmp_path: Path):
+        """The parse-count micro-benchmark reports one parse per file after."""
+        from tapps_agents.core.performance_benchmark import benchmark_scoring_parses
+
+        files = []
+        for i, code in enumerate([SIMPLE_CODE, COMPLEX_CODE, MAINTAINABLE_CODE]):
+            path = tmp_path / f"mod_{i}.py"
+            path.write_text(code)
+            files.append(path)
+
+        result = benchmark_scoring_parses(files)
+
+        assert result.files == 3
+        assert result.parses_per_file_after == 1.0
+        assert result.parses_per_file_before > result.parses_per_file_after
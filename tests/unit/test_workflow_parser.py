@@ -149,6 +149,35 @@ class TestWorkflowParser:
         with pytest.raises(ValueError, match="references unknown step id"):
             WorkflowParser.parse(workflow_dict)
 
+    def test_parse_dag_scheduling_and_depends_on(self):
+        """DAG scheduling setting and step 'depends_on' are parsed."""
+        workflow_dict = {
+            "workflow": {
+                "id": "test",
+                "name": "Test",
+                "description": "Test",
+                "version": "1.0.0",
+                "settings": {"scheduling": "dag"},
+                "steps": [
+                    {"id": "step1", "agent": "analyst", "action": "gather"},
+                    {"id": "step2", "agent": "planner", "action": "plan", "depends_on": ["step1"]},
+                ],
+            }
+        }
+
+        workflow = WorkflowParser.parse(workflow_dict)
+        assert workflow.settings.scheduling == "dag"
+        assert workflow.steps[1].depends_on == ["step1"]
+
+        workflow_dict["workflow"]["steps"][1]["depends_on"] = ["missing"]
+        with pytest.raises(ValueError, match="references unknown step id"):
+            WorkflowParser.parse(workflow_dict)
+
+        workflow_dict["workflow"]["steps"][1]["depends_on"] = ["step1"]
+        workflow_dict["workflow"]["settings"]["scheduling"] = "random"
+        with pytest.raises(ValueError, match="scheduling"):
+            WorkflowParser.parse(workflow_dict)
+
     def test_parse_step_with_gate(self):
         """Test parsing step with gate condition."""
         workflow_dict = {
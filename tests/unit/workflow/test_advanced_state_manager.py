@@ -13,6 +13,7 @@ from tapps_agents.workflow.models import WorkflowState
 from tapps_agents.workflow.state_manager import (
     CURRENT_STATE_VERSION,
     AdvancedStateManager,
+    StateDelta,
     StateMigrator,
     StateValidator,
 )
@@ -169,8 +170,8 @@ class TestAdvancedStateManager:
         last_path = temp_dir / "state" / "last.json"
         assert last_path.exists()
 
-        # Check history was created
-        history_files = list((temp_dir / "state" / "history").glob("*.json"))
+        # Check a history pointer was recorded
+        history_files = list((temp_dir / "state" / "history").glob("*.jsonl"))
         assert len(history_files) > 0
 
     def test_load_state(self, state_manager, sample_state, temp_dir):
@@ -232,7 +233,7 @@ class TestAdvancedStateManager:
         state_manager.save_state(sample_state, workflow_path)
 
         # Load with validation
-        loaded_state, metadata = state_manager.load_state(validate=True)
+        loaded_state, _metadata = state_manager.load_state(validate=True)
         assert loaded_state.workflow_id == sample_state.workflow_id
 
     def test_compression(self, temp_dir):
@@ -251,3 +252,127 @@ class TestAdvancedStateManager:
         loaded_state, metadata = compressed_manager.load_state(workflow_id="test")
         assert loaded_state.workflow_id == "test"
         assert metadata.compression is True
+
+
+class TestStateDelta:
+    """Tests for StateDelta."""
+
+    def test_diff_and_apply_round_trip(self):
+        previous = {
+            "status": "running",
+            "completed_steps": ["a"],
+            "variables": {"keep": 1, "change": 1, "drop": 1},
+            "error": None,
+        }
+        current = {
+            "status": "completed",
+            "completed_steps": ["a", "b"],
+            "variables": {"keep": 1, "change": 2, "add": 3},
+        }
+
+        delta = StateDelta.diff(previous, current)
+
+        assert delta == {
+            "set": {"status": "completed"},
+            "append": {"completed_steps": ["b"]},
+            "merge": {"variables": {"change": 2, "add": 3}},
+            "remove": {"variables": ["drop"]},
+            "unset": ["error"],
+        }
+        assert StateDelta.apply(previous, delta) == current
+
+    def test_diff_of_equal_states_is_empty(self):
+        state = {"completed_steps": ["a"], "variables": {"k": [1, 2]}}
+        assert StateDelta.diff(state, {"completed_steps": ["a"], "variables": {"k": [1, 2]}}) == {}
+
+
+class TestStateJournal:
+    """Tests for journaled saves, compaction, replay and history pointers."""
+
+    @staticmethod
+    def advance(state: WorkflowState, step: str) -> None:
+        state.completed_steps.append(step)
+        state.current_step = step
+        state.variables[step] = f"{step}-output"
+
+    @pytest.fixture
+    def state(self):
+        return WorkflowState(
+            workflow_id="wf",
+            started_at=datetime.now(),
+            variables={"large": "x" * 10_000},
+            status="running",
+        )
+
+    def test_saves_append_deltas_and_replay_on_load(self, tmp_path, state):
+        manager = AdvancedStateManager(tmp_path)
+        first = manager.save_state(state)
+        for step in ("s1", "s2", "s3"):
+            self.advance(state, step)
+            assert manager.save_state(state) == first
+
+        segment = manager._segment_path(first.name)
+        assert len(segment.read_text(encoding="utf-8").splitlines()) == 3
+        assert segment.stat().st_size < 10_000
+
+        loaded, metadata = AdvancedStateManager(tmp_path).load_state(workflow_id="wf")
+        assert loaded.completed_steps == ["s1", "s2", "s3"]
+        assert loaded.variables["s3"] == "s3-output"
+        assert metadata.seq == 4
+
+    def test_last_pointer_follows_saves_from_other_managers(self, tmp_path, state):
+        other_state = WorkflowState(workflow_id="other", started_at=datetime.now())
+        first = AdvancedStateManager(tmp_path)
+        second = AdvancedStateManager(tmp_path)
+
+        first.save_state(state)
+        second.save_state(other_state)
+        first.save_state(state)
+
+        loaded, _ = AdvancedStateManager(tmp_path).load_state()
+        assert loaded.workflow_id == "wf"
+
+    def test_unchanged_state_is_not_rewritten(self, tmp_path, state):
+        manager = AdvancedStateManager(tmp_path)
+        path = manager.save_state(state)
+
+        assert manager.save_state(state) == path
+        assert manager._segment_path(path.name).stat().st_size == 0
+
+    def test_journal_is_compacted_into_snapshots(self, tmp_path, state):
+        manager = AdvancedStateManager(tmp_path, snapshot_interval=2)
+        manager.save_state(state)
+        for step in ("s1", "s2", "s3", "s4"):
+            self.advance(state, step)
+            latest = manager.save_state(state)
+
+        assert len(list(tmp_path.glob("wf-*.json"))) == 2
+        loaded, _ = manager.load_state(state_file=latest)
+        assert loaded.completed_steps == ["s1", "s2", "s3", "s4"]
+
+    def test_history_points_into_journal(self, tmp_path, state):
+        manager = AdvancedStateManager(tmp_path)
+        manager.save_state(state)
+        for step in ("s1", "s2"):
+            self.advance(state, step)
+            manager.save_state(state)
+
+        history = manager.list_states(workflow_id="wf")
+        assert sorted(entry["seq"] for entry in history) == [1, 2, 3]
+        assert list((tmp_path / "history").iterdir()) == [tmp_path / "history" / "wf.jsonl"]
+
+        entry = next(entry for entry in history if entry["seq"] == 2)
+        loaded, _ = manager.load_state(state_file=Path(entry["state_file"]), seq=entry["seq"])
+        assert loaded.completed_steps == ["s1"]
+
+    def test_torn_journal_record_is_ignored(self, tmp_path, state):
+        manager = AdvancedStateManager(tmp_path)
+        path = manager.save_state(state)
+        self.advance(state, "s1")
+        manager.save_state(state)
+        with open(manager._segment_path(path.name), "a", encoding="utf-8") as f:
+            f.write('{"seq": 3, "delta": {"set": {"status": "fa')
+
+        loaded, _ = AdvancedStateManager(tmp_path).load_state(workflow_id="wf")
+        assert loaded.completed_steps == ["s1"]
+        assert loaded.status == "running"
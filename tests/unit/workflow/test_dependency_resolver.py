@@ -257,3 +257,42 @@ class TestDependencyResolverBusinessLogic:
         assert execution_order[0] == sorted(execution_order[0]), \
             "Steps should be sorted deterministically"
 
+
+    def test_depends_on_creates_dependency(self):
+        """Declared depends_on edges are honored alongside artifact edges."""
+        steps = [
+            WorkflowStep(id="setup", agent="ops", action="provision"),
+            WorkflowStep(id="build", agent="implementer", action="implement", depends_on=["setup"]),
+        ]
+
+        resolver = DependencyResolver(steps)
+
+        assert resolver.get_dependencies("build") == {"setup"}
+        assert resolver.resolve_execution_order() == [["setup"], ["build"]]
+
+    def test_include_next_false_ignores_next_chain(self):
+        """Without next edges, independent chained steps share a level."""
+        steps = [
+            WorkflowStep(id="step1", agent="analyst", action="gather", next="step2"),
+            WorkflowStep(id="step2", agent="planner", action="plan", next="step3"),
+            WorkflowStep(id="step3", agent="designer", action="design"),
+        ]
+
+        assert len(DependencyResolver(steps).resolve_execution_order()) == 3
+        assert DependencyResolver(steps, include_next=False).resolve_execution_order() == [
+            ["step1", "step2", "step3"]
+        ]
+
+    def test_critical_path_lengths(self):
+        """Critical path counts the steps on the longest chain from each step."""
+        steps = [
+            WorkflowStep(id="a", agent="x", action="x", creates=["a1"]),
+            WorkflowStep(id="b", agent="x", action="x", requires=["a1"], creates=["b1"]),
+            WorkflowStep(id="c", agent="x", action="x", requires=["b1"]),
+            WorkflowStep(id="d", agent="x", action="x", requires=["a1"]),
+            WorkflowStep(id="e", agent="x", action="x"),
+        ]
+
+        lengths = DependencyResolver(steps).critical_path_lengths()
+
+        assert lengths == {"a": 3, "b": 2, "c": 1, "d": 1, "e": 1}
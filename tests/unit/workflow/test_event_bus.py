@@ -19,8 +19,8 @@ pytestmark = pytest.mark.unit
 
 
 @pytest.mark.asyncio
-async def test_event_bus_publish_creates_file(tmp_path: Path):
-    """Test that publishing an event creates a file."""
+async def test_event_bus_publish_appends_to_log(tmp_path: Path):
+    """Test that publishing an event appends it to the event log."""
     event_bus = FileBasedEventBus(project_root=tmp_path)
     
     event = WorkflowEvent(
@@ -34,15 +34,16 @@ async def test_event_bus_publish_creates_file(tmp_path: Path):
     
     await event_bus.publish(event)
     
-    # Check that event file was created
+    # Check that the event landed in one log segment, not a file per event
     events_dir = tmp_path / ".tapps-agents" / "events"
     assert events_dir.exists()
+    assert list(events_dir.glob("*.json")) == []
     
-    event_files = list(events_dir.glob("*.json"))
-    assert len(event_files) == 1
+    segments = list(events_dir.glob("*.log"))
+    assert len(segments) == 1
     
     # Verify event content
-    event_data = json.loads(event_files[0].read_text(encoding="utf-8"))
+    event_data = json.loads(segments[0].read_text(encoding="utf-8"))["data"]
     assert event_data["event_type"] == "step_started"
     assert event_data["workflow_id"] == "test-workflow-123"
     assert event_data["step_id"] == "requirements"
@@ -207,8 +208,29 @@ async def test_event_bus_handles_handler_errors(tmp_path: Path):
     # Should not raise exception
     await event_bus.publish(event)
     
-    # Event file should still be created
+    # Event should still be stored
+    assert len(event_bus.get_events(workflow_id="test-workflow-123")) == 1
+
+
+def test_event_bus_migrates_event_files(tmp_path: Path):
+    """Legacy one-file-per-event directories are moved into the event log."""
     events_dir = tmp_path / ".tapps-agents" / "events"
-    event_files = list(events_dir.glob("*.json"))
-    assert len(event_files) == 1
+    events_dir.mkdir(parents=True)
+    for i, step_id in enumerate(["step-2", "step-1"]):
+        event = WorkflowEvent(
+            event_type=EventType.STEP_STARTED,
+            workflow_id="wf",
+            step_id=step_id,
+            data={},
+            timestamp=__import__("datetime").datetime(2026, 1, 1, 12, 0, 1 - i),
+        )
+        (events_dir / f"wf-{i}-step_started.json").write_text(
+            json.dumps(event.to_dict(), indent=2), encoding="utf-8"
+        )
+
+    event_bus = FileBasedEventBus(project_root=tmp_path)
+
+    assert list(events_dir.glob("*.json")) == []
+    assert [e.step_id for e in event_bus.get_events(workflow_id="wf")] == ["step-2", "step-1"]
+    assert event_bus.get_latest_event("wf").step_id == "step-2"
 
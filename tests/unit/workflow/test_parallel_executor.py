@@ -362,4 +362,82 @@ async def test_cancelled_error_propagation(sample_steps: list[WorkflowStep]) ->
 
     # Should complete successfully
     assert len(results) == 1
-    assert results[0].step_execution.status == "completed"
\ No newline at end of file
+    assert results[0].step_execution.status == "completed"
+
+def test_find_ready_steps_dag_ignores_next_chain() -> None:
+    """DAG mode releases every step whose dependencies are met."""
+    steps = [
+        WorkflowStep(id="plan", agent="planner", action="plan", creates=["spec"], next="a"),
+        WorkflowStep(id="a", agent="implementer", action="implement", requires=["spec"], next="b"),
+        WorkflowStep(id="b", agent="implementer", action="implement", requires=["spec"], next="c"),
+        WorkflowStep(id="c", agent="reviewer", action="review", depends_on=["a", "b"]),
+        WorkflowStep(id="docs", agent="documenter", action="document"),
+    ]
+    executor = ParallelStepExecutor(scheduling="dag")
+
+    ready = executor.find_ready_steps(steps, set(), set(), set())
+    assert [s.id for s in ready] == ["plan", "docs"]
+
+    ready = executor.find_ready_steps(steps, {"plan", "docs"}, {"b"}, {"spec"})
+    assert [s.id for s in ready] == ["a"]
+
+    ready = executor.find_ready_steps(steps, {"plan", "docs", "a"}, set(), {"spec"})
+    assert [s.id for s in ready] == ["b"]
+
+    ready = executor.find_ready_steps(steps, {"plan", "docs", "a", "b"}, set(), {"spec"})
+    assert [s.id for s in ready] == ["c"]
+
+
+def test_find_ready_steps_dag_waits_for_artifacts() -> None:
+    """A completed producer is not enough if its artifact is missing."""
+    steps = [
+        WorkflowStep(id="plan", agent="planner", action="plan", creates=["spec"]),
+        WorkflowStep(id="build", agent="implementer", action="implement", requires=["spec"]),
+    ]
+    executor = ParallelStepExecutor(scheduling="dag")
+
+    assert executor.find_ready_steps(steps, {"plan"}, set(), set()) == []
+
+
+def test_find_ready_steps_dag_priority() -> None:
+    """Longest critical path first, then next-chain position, then order."""
+    steps = [
+        WorkflowStep(id="short", agent="x", action="x", next="tail"),
+        WorkflowStep(id="other", agent="x", action="x"),
+        WorkflowStep(id="long", agent="x", action="x", creates=["l1"], next="short"),
+        WorkflowStep(id="tail", agent="x", action="x", requires=["l1"]),
+    ]
+    executor = ParallelStepExecutor()
+
+    ready = executor.find_ready_steps(steps, set(), set(), set(), scheduling="dag")
+
+    assert [s.id for s in ready] == ["long", "short", "other"]
+
+
+def test_find_ready_steps_sequential_is_default() -> None:
+    """Without DAG scheduling only the next: chain is followed."""
+    steps = [
+        WorkflowStep(id="a", agent="x", action="x", next="b"),
+        WorkflowStep(id="b", agent="x", action="x"),
+        WorkflowStep(id="c", agent="x", action="x"),
+    ]
+
+    ready = ParallelStepExecutor().find_ready_steps(steps, {"a"}, set(), set())
+
+    assert [s.id for s in ready] == ["b"]
+
+
+def test_unknown_scheduling_mode_rejected() -> None:
+    with pytest.raises(ValueError):
+        ParallelStepExecutor(scheduling="random")
+
+
+def test_benchmark_workflow_scheduling() -> None:
+    """The 50-step fan-out/fan-in benchmark runs in 3 rounds under DAG mode."""
+    from tapps_agents.core.performance_benchmark import benchmark_workflow_scheduling
+
+    result = benchmark_workflow_scheduling(steps=50, step_seconds=0.0)
+
+    assert result.steps == 50
+    assert result.sequential_rounds == 50
+    assert result.dag_rounds == 3
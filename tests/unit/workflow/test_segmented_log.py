@@ -0,0 +1,297 @@
+"""
+Unit tests for the segmented event log.
+"""
+
+import json
+import threading
+
+import pytest
+
+from tapps_agents.workflow.durable_state import (
+    EventStore,
+    WorkflowEvent,
+    WorkflowEventType,
+)
+from tapps_agents.workflow.event_log import WorkflowEventLog
+from tapps_agents.workflow.segmented_log import SegmentedEventLog
+
+pytestmark = pytest.mark.unit
+
+
+def fill(log: SegmentedEventLog, count: int = 10) -> None:
+    for i in range(count):
+        log.append(f"wf-{i % 2}", "start" if i % 3 else "finish", {"i": i})
+
+
+class TestSegmentedEventLog:
+    def test_append_assigns_increasing_seq(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        first = log.append("wf", "start", {"a": 1})
+        second = log.append("wf", "finish", {"a": 2})
+
+        assert (first.seq, second.seq) == (1, 2)
+        assert log.last_seq == 2
+
+    def test_read_events_since_seq_with_filters(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        fill(log)
+
+        assert [r.data["i"] for r in log.read_events(since_seq=6)] == [6, 7, 8, 9]
+        assert [r.data["i"] for r in log.read_events(workflow_id="wf-0")] == [0, 2, 4, 6, 8]
+        assert [r.data["i"] for r in log.read_events(workflow_id="wf-0", event_type="finish")] == [0, 6]
+        assert [r.data["i"] for r in log.read_events(since_seq=4, event_type="finish")] == [6, 9]
+
+    def test_tail_reads_newest_first(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        fill(log)
+
+        assert [r.data["i"] for r in log.tail(workflow_id="wf-1", limit=2)] == [9, 7]
+        assert log.latest(event_type="start").data["i"] == 8
+        assert log.latest(workflow_id="missing") is None
+
+    def test_segments_roll_and_reopen(self, tmp_path):
+        log = SegmentedEventLog(tmp_path, max_segment_bytes=200)
+        fill(log, 20)
+
+        assert len(list(tmp_path.glob("*.log"))) > 1
+        assert len(list(tmp_path.glob("*.idx"))) == len(list(tmp_path.glob("*.log")))
+
+        reopened = SegmentedEventLog(tmp_path, max_segment_bytes=200)
+        assert [r.data["i"] for r in reopened.read_events()] == list(range(20))
+        assert reopened.append("wf-0", "start", {}).seq == 21
+
+    def test_sees_records_from_other_writers(self, tmp_path):
+        reader = SegmentedEventLog(tmp_path)
+        writer = SegmentedEventLog(tmp_path)
+        writer.append("wf", "start", {"i": 1})
+
+        assert reader.latest("wf").data == {"i": 1}
+        assert reader.append("wf", "finish", {}).seq == 2
+
+    def test_rebuilds_missing_index_and_drops_torn_record(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        fill(log, 3)
+        (tmp_path / "00000001.idx").unlink()
+        with open(tmp_path / "00000001.log", "a", encoding="utf-8") as f:
+            f.write('{"seq": 4, "workflow_id": "wf-1"')
+
+        reopened = SegmentedEventLog(tmp_path)
+
+        assert [r.data["i"] for r in reopened.read_events()] == [0, 1, 2]
+        assert (tmp_path / "00000001.idx").exists()
+        assert reopened.append("wf-1", "start", {"i": 3}).seq == 4
+        assert [r.data["i"] for r in SegmentedEventLog(tmp_path).read_events()] == [0, 1, 2, 3]
+
+    def test_delete_workflow(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        fill(log, 4)
+
+        assert log.delete_workflow("wf-0") is True
+        assert log.delete_workflow("wf-0") is False
+        log.append("wf-0", "start", {"i": 99})
+
+        reopened = SegmentedEventLog(tmp_path)
+        assert [r.data["i"] for r in reopened.read_events(workflow_id="wf-0")] == [99]
+        assert [r.data["i"] for r in reopened.read_events()] == [1, 3, 99]
+
+    def test_stream_from_position(self, tmp_path):
+        log = SegmentedEventLog(tmp_path, max_segment_bytes=200)
+        fill(log, 12)
+        middle = list(log.stream())[5]
+
+        assert [r.data["i"] for r in log.stream()] == list(range(12))
+        assert [r.data["i"] for r in log.stream(middle.next_position)] == list(range(6, 12))
+        assert [r.data["i"] for r in log.stream(middle.next_position, workflow_id="wf-1")] == [7, 9, 11]
+        assert list(log.stream(log.end_position)) == []
+
+    def test_reverse_reads_newest_first_across_segments(self, tmp_path):
+        log = SegmentedEventLog(tmp_path, max_segment_bytes=200)
+        fill(log, 12)
+        log.delete_workflow("wf-0")
+        log.append("wf-0", "start", {"i": 99})
+
+        assert [r.data["i"] for r in log.reverse()] == [99, 11, 9, 7, 5, 3, 1]
+        assert [r.data["i"] for r in log.reverse(workflow_id="wf-1", event_type="finish")] == [9, 3]
+
+    def test_open_recovers_tail_without_loading_index(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        fill(log, 5)
+        log.delete_workflow("wf-1")
+
+        reopened = SegmentedEventLog(tmp_path)
+
+        assert reopened.last_seq == 6
+        assert reopened.tail()[0].data["i"] == 4
+        assert not reopened._indexed
+        assert reopened.append("wf-1", "start", {}).seq == 7
+
+    def test_filtered_tail_uses_index(self, tmp_path, monkeypatch):
+        log = SegmentedEventLog(tmp_path)
+        fill(log, 10)
+        reopened = SegmentedEventLog(tmp_path)
+        monkeypatch.setattr(
+            reopened, "reverse", lambda *args, **kwargs: pytest.fail("reverse() was used")
+        )
+
+        assert reopened.latest("wf-1", "finish").data["i"] == 9
+        assert [r.data["i"] for r in reopened.tail(workflow_id="wf-0", limit=2)] == [8, 6]
+        assert reopened.tail(workflow_id="missing") == []
+        assert reopened._indexed
+
+    def test_concurrent_writers_get_unique_seqs(self, tmp_path):
+        def write(worker: int) -> None:
+            log = SegmentedEventLog(tmp_path, max_segment_bytes=2000)
+            for i in range(50):
+                log.append(f"wf-{worker}", "start", {"i": i})
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        seqs = [r.seq for r in SegmentedEventLog(tmp_path).read_events()]
+        assert seqs == list(range(1, 201))
+
+    def test_read_only_does_not_repair_or_write(self, tmp_path):
+        log = SegmentedEventLog(tmp_path)
+        fill(log, 3)
+        torn = '{"seq": 4, "workflow_id": "wf-1"'
+        with open(tmp_path / "00000001.log", "a", encoding="utf-8") as f:
+            f.write(torn)
+
+        reader = SegmentedEventLog(tmp_path, read_only=True)
+
+        assert [r.data["i"] for r in reader.tail(limit=None)] == [2, 1, 0]
+        assert (tmp_path / "00000001.log").read_text(encoding="utf-8").endswith(torn)
+        with pytest.raises(PermissionError):
+            reader.append("wf", "start", {})
+        assert not SegmentedEventLog(tmp_path / "missing", read_only=True).log_dir.exists()
+
+
+class TestStoreMigration:
+    def test_workflow_event_log_migrates_jsonl_files(self, tmp_path):
+        legacy = [
+            {"event_type": "workflow_start", "workflow_id": "wf", "seq": 1, "timestamp": "2026-01-01T00:00:00Z"},
+            {"event_type": "step_start", "workflow_id": "wf", "seq": 2, "timestamp": "2026-01-01T00:00:01Z"},
+        ]
+        (tmp_path / "wf.events.jsonl").write_text(
+            "".join(json.dumps(event) + "\n" for event in legacy), encoding="utf-8"
+        )
+
+        event_log = WorkflowEventLog(tmp_path)
+
+        assert not (tmp_path / "wf.events.jsonl").exists()
+        assert json.loads((tmp_path / "wf.tail.json").read_text())["seq"] == 2
+        assert event_log.list_workflows() == ["wf"]
+        assert [e.seq for e in event_log.read_events("wf")] == [1, 2]
+        assert event_log.emit_event("step_finish", "wf").seq == 3
+
+    def test_interrupted_migration_resumes_without_duplicates(self, tmp_path):
+        lines = [
+            json.dumps({"event_type": "step_start", "workflow_id": "wf", "seq": seq,
+                        "timestamp": "2026-01-01T00:00:00Z"}) + "\n"
+            for seq in (1, 2, 3)
+        ]
+        # A crash after importing the first two events left the marker file behind
+        log = SegmentedEventLog(tmp_path)
+        for line in lines[:2]:
+            log.append("wf", "step_start", json.loads(line))
+        (tmp_path / "wf.events.jsonl.migrating").write_text("".join(lines), encoding="utf-8")
+
+        event_log = WorkflowEventLog(tmp_path)
+
+        assert not (tmp_path / "wf.events.jsonl.migrating").exists()
+        assert [e.seq for e in event_log.read_events("wf")] == [1, 2, 3]
+
+    def test_event_store_migrates_workflow_dirs(self, tmp_path):
+        workflow_dir = tmp_path / "wf"
+        workflow_dir.mkdir()
+        event = WorkflowEvent(
+            id="e1",
+            workflow_id="wf",
+            event_type=WorkflowEventType.WORKFLOW_STARTED,
+            timestamp="2026-01-01T00:00:00",
+            sequence_number=1,
+        )
+        (workflow_dir / "events.jsonl").write_text(json.dumps(event.to_dict()) + "\n", encoding="utf-8")
+
+        store = EventStore(tmp_path)
+        # Reopening with an interrupted migration's marker does not duplicate events
+        (workflow_dir / "events.jsonl.migrating").write_text(
+            json.dumps(event.to_dict()) + "\n", encoding="utf-8"
+        )
+        store = EventStore(tmp_path)
+
+        assert not (workflow_dir / "events.jsonl").exists()
+        assert not (workflow_dir / "events.jsonl.migrating").exists()
+        assert store.list_workflows() == ["wf"]
+        assert [e.id for e in store.get_events("wf")] == ["e1"]
+        assert store.delete_workflow("wf") is True
+        assert store.get_events("wf") == []
+
+
+class TestWorkflowEventLogTail:
+    def test_sequence_resumes_from_tail_sidecar(self, tmp_path):
+        event_log = WorkflowEventLog(tmp_path, enable_streaming=False)
+        for _ in range(3):
+            event_log.emit_event("step_start", "wf")
+        event_log.emit_event("step_start", "other")
+
+        assert json.loads((tmp_path / "wf.tail.json").read_text())["seq"] == 3
+        assert WorkflowEventLog(tmp_path).emit_event("step_finish", "wf").seq == 4
+
+        # Events the sidecar missed (e.g. a crash before it was written) are picked up
+        (tmp_path / "wf.tail.json").write_text(
+            json.dumps({"seq": 1, "segment": 1, "offset": 0}), encoding="utf-8"
+        )
+        assert WorkflowEventLog(tmp_path).emit_event("step_finish", "wf").seq == 5
+
+        # An unreadable sidecar falls back to the log index
+        (tmp_path / "wf.tail.json").write_text("{", encoding="utf-8")
+        assert WorkflowEventLog(tmp_path).emit_event("step_finish", "wf").seq == 6
+
+    def test_new_workflow_does_not_read_the_log(self, tmp_path, monkeypatch):
+        event_log = WorkflowEventLog(tmp_path, enable_streaming=False)
+        for _ in range(3):
+            event_log.emit_event("step_start", "wf")
+        reopened = WorkflowEventLog(tmp_path, enable_streaming=False)
+        monkeypatch.setattr(
+            reopened._log, "reverse", lambda *args, **kwargs: pytest.fail("reverse() was used")
+        )
+
+        assert reopened.emit_event("step_start", "new").seq == 1
+        assert not reopened._log._indexed
+
+    def test_first_event_survives_missing_final_sidecar(self, tmp_path, monkeypatch):
+        event_log = WorkflowEventLog(tmp_path, enable_streaming=False)
+        event_log.emit_event("step_start", "other")
+        write_tail = event_log._write_tail
+
+        def crash_after_append(workflow_id, seq, position):
+            if seq:
+                raise OSError("crashed")
+            write_tail(workflow_id, seq, position)
+
+        # Only the start marker written before the first append reaches disk
+        monkeypatch.setattr(event_log, "_write_tail", crash_after_append)
+        event_log.emit_event("step_start", "wf")
+
+        assert json.loads((tmp_path / "wf.tail.json").read_text())["seq"] == 0
+        assert WorkflowEventLog(tmp_path).emit_event("step_finish", "wf").seq == 2
+
+    def test_read_last_events_and_stream(self, tmp_path):
+        event_log = WorkflowEventLog(tmp_path, enable_streaming=False)
+        for step in ("a", "b", "c"):
+            event_log.emit_event("step_start", "wf", step_id=step)
+            event_log.emit_event("step_start", "other", step_id=step)
+
+        assert [e.step_id for e in event_log.read_events("wf", limit=2)] == ["b", "c"]
+        assert [e.step_id for e in event_log.get_latest_events("wf", limit=2)] == ["c", "b"]
+
+        streamed = list(event_log.stream_events("wf"))
+        assert [e.step_id for e, _ in streamed] == ["a", "b", "c"]
+        position = event_log.end_position()
+        event_log.emit_event("step_finish", "wf", step_id="c")
+        assert [e.event_type for e, _ in event_log.stream_events("wf", position)] == ["step_finish"]
+        assert [e.seq for e, _ in event_log.stream_events("wf", streamed[1][1])] == [3, 4]
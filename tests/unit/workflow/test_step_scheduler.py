@@ -0,0 +1,175 @@
+"""
+Unit tests for the incremental StepScheduler.
+"""
+
+import itertools
+
+import pytest
+
+from tapps_agents.core.performance_benchmark import fan_out_fan_in_steps
+from tapps_agents.workflow.models import WorkflowStep
+from tapps_agents.workflow.parallel_executor import ParallelStepExecutor
+from tapps_agents.workflow.step_scheduler import StepScheduler
+
+pytestmark = pytest.mark.unit
+
+
+def chain_steps() -> list[WorkflowStep]:
+    return [
+        WorkflowStep(id="enhance", agent="enhancer", action="enhance", creates=["prompt"], next="plan"),
+        WorkflowStep(id="plan", agent="planner", action="plan", requires=["prompt"], creates=["plan"], next="implement"),
+        WorkflowStep(id="implement", agent="implementer", action="implement", requires=["plan"], next="complete"),
+        WorkflowStep(id="complete", agent="orchestrator", action="finalize"),
+    ]
+
+
+def run_to_completion(scheduler: StepScheduler, artifacts: dict) -> list[list[str]]:
+    """Drive the scheduler like the executors do; return the ids per round."""
+    rounds = []
+    while ready := scheduler.pop_ready():
+        rounds.append([step.id for step in ready])
+        for step in ready:
+            scheduler.completed.add(step.id)
+            scheduler.running.discard(step.id)
+            for name in step.creates:
+                artifacts[name] = object()
+    return rounds
+
+
+class TestSequential:
+    def test_follows_next_chain(self):
+        artifacts: dict = {}
+        scheduler = StepScheduler(chain_steps(), artifacts=artifacts)
+
+        assert run_to_completion(scheduler, artifacts) == [
+            ["enhance"], ["plan"], ["implement"], ["complete"]
+        ]
+
+    def test_waits_for_artifacts_registered_after_completion(self):
+        artifacts: dict = {}
+        scheduler = StepScheduler(chain_steps(), artifacts=artifacts)
+        scheduler.pop_ready()
+        scheduler.completed.add("enhance")
+        scheduler.running.discard("enhance")
+
+        assert scheduler.pop_ready() == []
+
+        artifacts["prompt"] = object()
+        assert [s.id for s in scheduler.pop_ready()] == ["plan"]
+
+    def test_resume_from_completed_steps(self):
+        artifacts = {"prompt": object()}
+        scheduler = StepScheduler(chain_steps(), completed=["enhance"], artifacts=artifacts)
+
+        assert [s.id for s in scheduler.pop_ready()] == ["plan"]
+
+    def test_retry_makes_step_ready_again(self):
+        artifacts: dict = {}
+        scheduler = StepScheduler(chain_steps(), artifacts=artifacts)
+        scheduler.pop_ready()
+        scheduler.running.discard("enhance")
+
+        assert [s.id for s in scheduler.pop_ready()] == ["enhance"]
+
+    def test_uncompleting_step_relocks_next(self):
+        artifacts = {"prompt": object()}
+        scheduler = StepScheduler(chain_steps(), artifacts=artifacts)
+        scheduler.pop_ready()
+        scheduler.completed.add("enhance")
+        scheduler.running.discard("enhance")
+        scheduler.completed.discard("enhance")
+
+        assert [s.id for s in scheduler.pop_ready()] == ["enhance"]
+
+
+class TestDag:
+    def test_fan_out_fan_in_rounds(self):
+        artifacts: dict = {}
+        steps = fan_out_fan_in_steps(10)
+        scheduler = StepScheduler(steps, scheduling="dag", artifacts=artifacts)
+
+        rounds = run_to_completion(scheduler, artifacts)
+
+        assert rounds[0] == ["plan"]
+        assert rounds[1] == [f"part-{i}" for i in range(8)]
+        assert rounds[2] == ["merge"]
+
+    def test_depends_on_and_priority(self):
+        steps = [
+            WorkflowStep(id="short", agent="x", action="x", next="tail"),
+            WorkflowStep(id="other", agent="x", action="x"),
+            WorkflowStep(id="long", agent="x", action="x", next="short"),
+            WorkflowStep(id="tail", agent="x", action="x", depends_on=["long"]),
+        ]
+        scheduler = StepScheduler(steps, scheduling="dag")
+
+        assert [s.id for s in scheduler.pop_ready(limit=2)] == ["long", "short"]
+        assert [s.id for s in scheduler.pop_ready()] == ["other"]
+        scheduler.completed.add("long")
+        assert [s.id for s in scheduler.pop_ready()] == ["tail"]
+
+    def test_external_artifact(self):
+        artifacts: dict = {}
+        steps = [WorkflowStep(id="a", agent="x", action="x", requires=["spec"])]
+        scheduler = StepScheduler(steps, scheduling="dag", artifacts=artifacts)
+
+        assert scheduler.pop_ready() == []
+        artifacts["spec"] = object()
+        assert [s.id for s in scheduler.pop_ready()] == ["a"]
+
+    def test_large_epic_workflow(self):
+        """A 300-step layered workflow schedules every step exactly once."""
+        steps = []
+        for layer in range(30):
+            for i in range(10):
+                steps.append(
+                    WorkflowStep(
+                        id=f"s{layer}-{i}",
+                        agent="x",
+                        action="x",
+                        creates=[f"a{layer}-{i}"],
+                        requires=[f"a{layer - 1}-{j}" for j in range(10)] if layer else [],
+                    )
+                )
+        artifacts: dict = {}
+        scheduler = StepScheduler(steps, scheduling="dag", artifacts=artifacts)
+
+        rounds = run_to_completion(scheduler, artifacts)
+
+        assert len(rounds) == 30
+        assert sorted(itertools.chain.from_iterable(rounds)) == sorted(s.id for s in steps)
+
+
+@pytest.mark.parametrize("scheduling", ["sequential", "dag"])
+def test_matches_find_ready_steps(scheduling: str):
+    """The scheduler and the stateless find_ready_steps agree at each tick."""
+    executor = ParallelStepExecutor()
+    steps = [
+        *chain_steps(),
+        WorkflowStep(id="docs", agent="documenter", action="document", requires=["prompt"]),
+        WorkflowStep(id="lint", agent="reviewer", action="lint", depends_on=["implement"]),
+    ]
+    artifacts: dict = {}
+    scheduler = executor.create_scheduler(steps, available_artifacts=artifacts, scheduling=scheduling)
+
+    while True:
+        expected = executor.find_ready_steps(
+            steps,
+            set(scheduler.completed),
+            set(scheduler.running),
+            set(artifacts),
+            scheduling=scheduling,
+        )
+        ready = scheduler.pop_ready()
+        assert [s.id for s in ready] == [s.id for s in expected]
+        if not ready:
+            break
+        for step in ready:
+            scheduler.completed.add(step.id)
+            scheduler.running.discard(step.id)
+            artifacts.update(dict.fromkeys(step.creates))
+
+
+def test_unknown_scheduling_mode_rejected():
+    with pytest.raises(ValueError):
+        StepScheduler(chain_steps(), scheduling="random")